@@ -23,7 +23,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 477,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -37,7 +37,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 328,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -51,7 +51,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 194,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -65,7 +65,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 1224,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -79,7 +79,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 1224,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -93,7 +93,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 327,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -107,7 +107,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 248,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -121,7 +121,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 248,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -135,7 +135,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 960,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -163,7 +163,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 960,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -177,7 +177,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 960,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -191,7 +191,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 243,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -205,7 +205,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 342,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -219,7 +219,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 2719,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -233,7 +233,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 246,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -247,7 +247,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 246,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -261,7 +261,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 720,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -275,7 +275,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 720,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -289,7 +289,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 772,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -303,7 +303,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 607,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -317,7 +317,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 607,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -345,7 +345,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 1082,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -359,7 +359,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 1939,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -373,7 +373,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 1939,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -387,7 +387,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 1083,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -401,7 +401,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 1083,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -471,7 +471,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 380,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -485,7 +485,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 635,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -499,7 +499,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 1282,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -513,7 +513,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 1282,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -541,7 +541,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 708,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -555,7 +555,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 708,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -569,7 +569,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 662,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -583,7 +583,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 803,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -611,7 +611,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 350,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -625,7 +625,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 517,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -639,7 +639,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 1137,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -653,7 +653,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 645,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -667,7 +667,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 564,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -681,7 +681,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 564,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -709,7 +709,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 583,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -723,7 +723,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 583,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -737,7 +737,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 305,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -751,7 +751,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 641,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -793,7 +793,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 1065,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -807,7 +807,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 1138,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -821,7 +821,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 1138,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -835,7 +835,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 319,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -863,7 +863,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 939,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -877,7 +877,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 939,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -891,7 +891,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 272,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -905,7 +905,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 272,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -919,7 +919,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 268,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -933,7 +933,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 648,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -947,7 +947,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 648,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -961,7 +961,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 582,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -975,7 +975,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 514,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -989,7 +989,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 514,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1003,7 +1003,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 960,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1017,7 +1017,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 475,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1031,7 +1031,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 1297,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1045,7 +1045,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 1089,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1059,7 +1059,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 412,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1073,7 +1073,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 383,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1087,7 +1087,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 920,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1101,7 +1101,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 611,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1129,7 +1129,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 394,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1143,7 +1143,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 394,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1157,7 +1157,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 626,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1171,7 +1171,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 447,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1185,7 +1185,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 447,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1199,7 +1199,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 561,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1213,7 +1213,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 561,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1227,7 +1227,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 344,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1255,7 +1255,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 1562,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1269,7 +1269,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 1562,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1283,7 +1283,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 1971,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1297,7 +1297,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 1971,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1325,7 +1325,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 1174,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1381,7 +1381,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 263,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1395,7 +1395,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 263,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1437,7 +1437,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 402,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1451,7 +1451,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 667,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1465,7 +1465,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 667,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1493,7 +1493,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 418,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1507,7 +1507,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 418,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1521,7 +1521,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 414,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1535,7 +1535,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 654,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1549,7 +1549,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 478,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1563,7 +1563,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 478,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1605,7 +1605,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 692,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1619,7 +1619,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 395,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1633,7 +1633,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 284,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1647,7 +1647,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 771,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1661,7 +1661,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 771,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1675,7 +1675,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 319,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1689,7 +1689,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 319,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1703,7 +1703,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 800,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1717,7 +1717,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 525,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1759,7 +1759,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 457,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1773,7 +1773,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 230,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1787,7 +1787,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 405,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1801,7 +1801,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 405,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1829,7 +1829,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 1378,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1843,7 +1843,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 914,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1857,7 +1857,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 782,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1871,7 +1871,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 903,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1885,7 +1885,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 903,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1899,7 +1899,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 994,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1913,7 +1913,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 521,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1927,7 +1927,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 994,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1941,7 +1941,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 521,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1955,7 +1955,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 1382,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1969,7 +1969,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 1284,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -1983,7 +1983,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 1284,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2011,7 +2011,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 763,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2025,7 +2025,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 687,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2039,7 +2039,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 571,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2053,7 +2053,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 635,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2067,7 +2067,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 635,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2095,7 +2095,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 573,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2109,7 +2109,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 573,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2123,7 +2123,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 777,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2137,7 +2137,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 1344,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2151,7 +2151,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 363,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2165,7 +2165,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 363,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2179,7 +2179,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 790,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2193,7 +2193,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 217,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2207,7 +2207,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 1281,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2221,7 +2221,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 633,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2235,7 +2235,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 633,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2277,7 +2277,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 264,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2291,7 +2291,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 264,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2305,7 +2305,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 264,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2319,7 +2319,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 1279,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2347,7 +2347,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 380,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2361,7 +2361,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 380,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2375,7 +2375,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 200,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2389,7 +2389,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 200,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2403,7 +2403,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 1907,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2417,7 +2417,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 1907,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2431,7 +2431,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 430,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2445,7 +2445,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 541,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2459,7 +2459,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 254,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2473,7 +2473,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 531,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2487,7 +2487,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 531,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2501,7 +2501,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 194,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2515,7 +2515,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 1027,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2529,7 +2529,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 212,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2543,7 +2543,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 479,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2557,7 +2557,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 834,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2571,7 +2571,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 561,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2599,7 +2599,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 403,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2613,7 +2613,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 403,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2641,7 +2641,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 256,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2655,7 +2655,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 1109,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2669,7 +2669,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 640,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2683,7 +2683,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 640,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2697,7 +2697,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 393,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2711,7 +2711,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 501,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2725,7 +2725,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 1353,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2739,7 +2739,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 338,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2753,7 +2753,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 429,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2767,7 +2767,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 494,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2781,7 +2781,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 736,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2795,7 +2795,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 465,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2809,7 +2809,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 740,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2823,7 +2823,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 556,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2851,7 +2851,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 464,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2865,7 +2865,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 635,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2879,7 +2879,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 486,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2921,7 +2921,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 237,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2963,7 +2963,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "General Foods",
         unitPrice: 1491,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -2977,7 +2977,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 530,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3019,7 +3019,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 512,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3033,7 +3033,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 433,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3047,7 +3047,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 642,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3061,7 +3061,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 482,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3075,7 +3075,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 937,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3089,7 +3089,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 335,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3103,7 +3103,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 335,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3117,7 +3117,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 852,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3131,7 +3131,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 354,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3145,7 +3145,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 1119,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3159,7 +3159,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 232,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3173,7 +3173,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 443,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3187,7 +3187,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 338,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3215,7 +3215,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 173,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3229,7 +3229,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 634,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3257,7 +3257,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 492,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3299,7 +3299,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 2084,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3313,7 +3313,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 303,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3327,7 +3327,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 590,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3341,7 +3341,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 590,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3355,7 +3355,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 320,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3369,7 +3369,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 1125,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3411,7 +3411,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 693,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3439,7 +3439,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 416,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3453,7 +3453,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 416,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3467,7 +3467,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Hi-Lo Foods",
         unitPrice: 1219,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3481,7 +3481,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 651,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3495,7 +3495,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 485,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3509,7 +3509,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 516,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3523,7 +3523,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 399,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3537,7 +3537,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 399,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3551,7 +3551,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 215,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3565,7 +3565,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 486,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3579,7 +3579,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 1125,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3593,7 +3593,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 1125,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3607,7 +3607,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 397,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3621,7 +3621,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 397,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3635,7 +3635,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 397,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3649,7 +3649,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 449,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3663,7 +3663,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 845,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3677,7 +3677,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 805,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3691,7 +3691,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 250,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3705,7 +3705,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 250,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3719,7 +3719,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 337,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3733,7 +3733,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 337,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3747,7 +3747,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 305,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3761,7 +3761,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 305,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3775,7 +3775,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 368,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3817,7 +3817,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 509,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3831,7 +3831,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 795,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3845,7 +3845,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 552,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3859,7 +3859,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 354,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3873,7 +3873,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 327,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3887,7 +3887,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 354,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3901,7 +3901,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 672,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3915,7 +3915,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 181,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3929,7 +3929,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 181,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3957,7 +3957,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 465,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3971,7 +3971,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 1200,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3985,7 +3985,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 371,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -3999,7 +3999,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 1024,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4027,7 +4027,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 546,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4055,7 +4055,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 571,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4069,7 +4069,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 664,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4083,7 +4083,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 664,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4097,7 +4097,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 586,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4111,7 +4111,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 416,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4125,7 +4125,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 416,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4139,7 +4139,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 257,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4153,7 +4153,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 257,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4167,7 +4167,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 818,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4181,7 +4181,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 501,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4195,7 +4195,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 897,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4209,7 +4209,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Hi-Lo Foods",
         unitPrice: 498,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4223,7 +4223,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 1076,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4237,7 +4237,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 604,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4251,7 +4251,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 495,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4265,7 +4265,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 495,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4307,7 +4307,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 1115,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4321,7 +4321,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 542,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4335,7 +4335,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 924,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4349,7 +4349,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "MegaMart",
         unitPrice: 465,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4377,7 +4377,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 764,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4391,7 +4391,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 764,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4405,7 +4405,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 630,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4419,7 +4419,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 1078,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4433,7 +4433,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 1254,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4447,7 +4447,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Progressive Grocers",
         unitPrice: 869,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4461,7 +4461,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Hi-Lo Foods",
         unitPrice: 289,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4503,7 +4503,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 563,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4517,7 +4517,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "General Foods",
         unitPrice: 563,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4545,7 +4545,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 1196,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4559,7 +4559,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Progressive Grocers",
         unitPrice: 280,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4573,7 +4573,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "MegaMart",
         unitPrice: 514,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4587,7 +4587,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 543,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4601,7 +4601,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 568,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4615,7 +4615,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 543,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4629,7 +4629,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "General Foods",
+        store: "Fontana Market",
         unitPrice: 700,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4643,7 +4643,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 725,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4657,7 +4657,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 541,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4671,7 +4671,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 541,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4699,7 +4699,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 569,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4713,7 +4713,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 569,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4727,7 +4727,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 713,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4741,7 +4741,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "MegaMart",
         unitPrice: 713,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4769,7 +4769,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Progressive Grocers",
         unitPrice: 407,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4783,7 +4783,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "General Foods",
         unitPrice: 2044,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4797,7 +4797,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "Fontana Market",
         unitPrice: 2681,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4839,7 +4839,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 231,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4853,7 +4853,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Hi-Lo Foods",
+        store: "Fontana Market",
         unitPrice: 635,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4867,7 +4867,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "Progressive Grocers",
         unitPrice: 1628,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4895,7 +4895,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 755,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4909,7 +4909,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Fontana Market",
+        store: "MegaMart",
         unitPrice: 755,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4923,7 +4923,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 517,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4937,7 +4937,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "JM",
       prices: [{
-        store: "Progressive Grocers",
+        store: "General Foods",
         unitPrice: 517,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4951,7 +4951,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 670,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4965,7 +4965,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 670,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4979,7 +4979,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Hi-Lo Foods",
         unitPrice: 853,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -4993,7 +4993,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "JM",
       prices: [{
-        store: "MegaMart",
+        store: "Fontana Market",
         unitPrice: 777,
         currency: "JMD",
         capturedAt: 1736917200000
@@ -5037,7 +5037,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 1.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5051,7 +5051,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5065,7 +5065,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.02,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5079,7 +5079,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.88,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5093,7 +5093,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5107,7 +5107,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5121,7 +5121,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.57,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5135,7 +5135,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 1.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5149,7 +5149,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 1.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5163,7 +5163,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5191,7 +5191,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 5.9,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5219,7 +5219,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5233,7 +5233,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5247,7 +5247,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5261,7 +5261,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 1.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5275,7 +5275,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5289,7 +5289,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 4.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5303,7 +5303,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.75,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5317,7 +5317,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.75,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5331,7 +5331,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5345,7 +5345,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 6.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5373,7 +5373,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 5.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5401,7 +5401,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 8.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5415,7 +5415,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 4.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5429,7 +5429,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 1.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5443,7 +5443,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5457,7 +5457,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5471,7 +5471,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5485,7 +5485,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5499,7 +5499,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5527,7 +5527,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 2.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5541,7 +5541,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5555,7 +5555,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.01,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5569,7 +5569,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.01,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5653,7 +5653,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 6.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5723,7 +5723,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5737,7 +5737,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5751,7 +5751,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5765,7 +5765,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.71,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5779,7 +5779,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.71,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5807,7 +5807,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5849,7 +5849,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5863,7 +5863,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 13.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5877,7 +5877,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 13.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5891,7 +5891,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 14.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5905,7 +5905,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 14.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5919,7 +5919,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5933,7 +5933,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5947,7 +5947,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 3.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -5961,7 +5961,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 3.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6003,7 +6003,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 4.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6017,7 +6017,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 4.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6045,7 +6045,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 7.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6059,7 +6059,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 5.01,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6073,7 +6073,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.06,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6087,7 +6087,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 5.76,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6101,7 +6101,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6115,7 +6115,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6129,7 +6129,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.67,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6143,7 +6143,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 1.51,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6171,7 +6171,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 4.01,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6213,7 +6213,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 7.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6227,7 +6227,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 7.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6241,7 +6241,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 2.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6255,7 +6255,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 10.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6269,7 +6269,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.44,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6283,7 +6283,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.44,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6297,7 +6297,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 3.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6311,7 +6311,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 3.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6325,7 +6325,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6339,7 +6339,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 6.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6353,7 +6353,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 6.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6367,7 +6367,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 3.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6395,7 +6395,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6409,7 +6409,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 8.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6423,7 +6423,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 8.33,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6437,7 +6437,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 5.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6451,7 +6451,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 13.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6465,7 +6465,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 9.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6479,7 +6479,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 9.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6493,7 +6493,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 1.72,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6535,7 +6535,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6549,7 +6549,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6563,7 +6563,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 7.54,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6619,7 +6619,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 6.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6633,7 +6633,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6647,7 +6647,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6661,7 +6661,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6675,7 +6675,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.44,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6717,7 +6717,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 7.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6731,7 +6731,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 1.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6745,7 +6745,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 6.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6773,7 +6773,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 1.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6829,7 +6829,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6843,7 +6843,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 7.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6857,7 +6857,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 7.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6871,7 +6871,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6885,7 +6885,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6899,7 +6899,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 1.72,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6913,7 +6913,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6927,7 +6927,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 15.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6941,7 +6941,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6955,7 +6955,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6969,7 +6969,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 2.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6983,7 +6983,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -6997,7 +6997,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7011,7 +7011,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 1.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7025,7 +7025,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 4.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7039,7 +7039,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 4.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7081,7 +7081,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 1.95,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7109,7 +7109,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7123,7 +7123,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7137,7 +7137,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7151,7 +7151,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7165,7 +7165,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7179,7 +7179,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 3.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7193,7 +7193,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7207,7 +7207,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7235,7 +7235,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7249,7 +7249,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7291,7 +7291,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 8.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7305,7 +7305,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 8.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7319,7 +7319,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 7.88,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7333,7 +7333,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 7.88,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7347,7 +7347,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7361,7 +7361,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7375,7 +7375,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7403,7 +7403,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 2.82,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7417,7 +7417,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 2.82,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7431,7 +7431,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 3.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7445,7 +7445,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 4.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7459,7 +7459,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7473,7 +7473,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7487,7 +7487,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7515,7 +7515,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 5.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7529,7 +7529,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7543,7 +7543,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 6.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7557,7 +7557,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 6.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7571,7 +7571,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 5.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7585,7 +7585,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 6.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7599,7 +7599,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.82,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7613,7 +7613,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 7.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7641,7 +7641,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 5.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7655,7 +7655,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 5.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7669,7 +7669,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7683,7 +7683,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7711,7 +7711,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 8.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7725,7 +7725,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.12,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7739,7 +7739,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7753,7 +7753,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7767,7 +7767,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7809,7 +7809,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 12.69,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7823,7 +7823,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 12.69,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7837,7 +7837,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 1.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7851,7 +7851,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 1.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7907,7 +7907,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 1.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7921,7 +7921,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 1.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7935,7 +7935,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 4.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7949,7 +7949,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7963,7 +7963,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7977,7 +7977,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.76,
         currency: "USD",
         capturedAt: 1736917200000
@@ -7991,7 +7991,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8005,7 +8005,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8019,7 +8019,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 4.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8033,7 +8033,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.53,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8047,7 +8047,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.53,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8061,7 +8061,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8075,7 +8075,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 3.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8089,7 +8089,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 1.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8103,7 +8103,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8117,7 +8117,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8131,7 +8131,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8145,7 +8145,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8159,7 +8159,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 8.76,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8173,7 +8173,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 8.76,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8187,7 +8187,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 17.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8201,7 +8201,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 17.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8215,7 +8215,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 12.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8229,7 +8229,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 12.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8243,7 +8243,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.51,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8257,7 +8257,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 7.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8271,7 +8271,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 4.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8285,7 +8285,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8299,7 +8299,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 8.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8313,7 +8313,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 8.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8327,7 +8327,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 5.22,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8341,7 +8341,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 1.63,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8355,7 +8355,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8369,7 +8369,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8411,7 +8411,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.11,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8425,7 +8425,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8439,7 +8439,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 6.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8453,7 +8453,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 8.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8467,7 +8467,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 8.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8481,7 +8481,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8495,7 +8495,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8509,7 +8509,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8523,7 +8523,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 8.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8537,7 +8537,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 8.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8565,7 +8565,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 4.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8579,7 +8579,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 8.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8593,7 +8593,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 8.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8607,7 +8607,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 7.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8621,7 +8621,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8635,7 +8635,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8649,7 +8649,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.63,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8663,7 +8663,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 2.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8677,7 +8677,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 2.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8691,7 +8691,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8705,7 +8705,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen-to-bake)", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 8.84,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8719,7 +8719,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 6.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8733,7 +8733,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 6.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8747,7 +8747,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8761,7 +8761,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8775,7 +8775,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8789,7 +8789,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8803,7 +8803,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 8.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8817,7 +8817,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 8.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8845,7 +8845,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 16.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8859,7 +8859,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 1.25,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8873,7 +8873,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8887,7 +8887,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8929,7 +8929,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8943,7 +8943,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8957,7 +8957,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 6.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8971,7 +8971,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8985,7 +8985,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -8999,7 +8999,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9013,7 +9013,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 6.1,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9027,7 +9027,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 6.1,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9069,7 +9069,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 13.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9083,7 +9083,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 13.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9097,7 +9097,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9111,7 +9111,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9153,7 +9153,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9167,7 +9167,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.53,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9195,7 +9195,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.11,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9209,7 +9209,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.11,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9223,7 +9223,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 5.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9265,7 +9265,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9279,7 +9279,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9293,7 +9293,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 5.34,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9307,7 +9307,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9321,7 +9321,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9335,7 +9335,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9349,7 +9349,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 7.33,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9363,7 +9363,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9377,7 +9377,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9391,7 +9391,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.54,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9405,7 +9405,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.54,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9419,7 +9419,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.54,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9447,7 +9447,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 5.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9503,7 +9503,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9517,7 +9517,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9545,7 +9545,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 15.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9559,7 +9559,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 4.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9573,7 +9573,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 4.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9587,7 +9587,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 7.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9601,7 +9601,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 7.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9615,7 +9615,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9629,7 +9629,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 16.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9643,7 +9643,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 4.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9657,7 +9657,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 4.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9671,7 +9671,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 4.02,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9685,7 +9685,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.71,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9699,7 +9699,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9727,7 +9727,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 1.72,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9769,7 +9769,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.33,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9783,7 +9783,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9797,7 +9797,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9839,7 +9839,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9853,7 +9853,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 2.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9867,7 +9867,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9881,7 +9881,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 2.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9895,7 +9895,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 6.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9909,7 +9909,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 6.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9923,7 +9923,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9937,7 +9937,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9951,7 +9951,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9965,7 +9965,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 3.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -9993,7 +9993,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 7.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10007,7 +10007,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10049,7 +10049,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 3.95,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10063,7 +10063,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10077,7 +10077,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 8.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10091,7 +10091,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 6.53,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10105,7 +10105,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 6.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10119,7 +10119,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 6.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10133,7 +10133,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 1.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10147,7 +10147,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10189,7 +10189,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.45,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10203,7 +10203,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.45,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10217,7 +10217,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 2.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10231,7 +10231,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 8.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10245,7 +10245,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 8.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10259,7 +10259,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 3.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10273,7 +10273,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 1.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10287,7 +10287,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10301,7 +10301,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10315,7 +10315,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.91,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10357,7 +10357,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10371,7 +10371,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 6.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10399,7 +10399,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.8,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10413,7 +10413,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10427,7 +10427,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10441,7 +10441,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10455,7 +10455,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10469,7 +10469,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10483,7 +10483,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.92,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10497,7 +10497,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10511,7 +10511,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10525,7 +10525,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10539,7 +10539,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10553,7 +10553,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10567,7 +10567,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 6.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10595,7 +10595,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 1.66,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10609,7 +10609,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 2.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10623,7 +10623,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 1.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10637,7 +10637,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10651,7 +10651,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10665,7 +10665,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10679,7 +10679,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 1.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10693,7 +10693,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 7.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10707,7 +10707,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 7.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10721,7 +10721,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10735,7 +10735,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 3.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10749,7 +10749,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 5.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10763,7 +10763,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10777,7 +10777,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10791,7 +10791,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 8.88,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10805,7 +10805,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 6.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10819,7 +10819,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 6.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10833,7 +10833,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 6.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10847,7 +10847,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 6.67,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10889,7 +10889,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 6.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10903,7 +10903,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 6.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10917,7 +10917,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10931,7 +10931,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10945,7 +10945,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.47,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10959,7 +10959,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.47,
         currency: "USD",
         capturedAt: 1736917200000
@@ -10973,7 +10973,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 7.02,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11015,7 +11015,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11029,7 +11029,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11085,7 +11085,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11141,7 +11141,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 2.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11155,7 +11155,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 2.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11197,7 +11197,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11211,7 +11211,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 2.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11239,7 +11239,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11253,7 +11253,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 8.9,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11267,7 +11267,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 9.14,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11281,7 +11281,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 9.14,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11295,7 +11295,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 7.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11309,7 +11309,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 6.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11323,7 +11323,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.02,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11337,7 +11337,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.34,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11351,7 +11351,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 4.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11365,7 +11365,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 5.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11379,7 +11379,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 5.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11393,7 +11393,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.92,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11407,7 +11407,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 1.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11421,7 +11421,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 1.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11435,7 +11435,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 1.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11449,7 +11449,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 1.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11463,7 +11463,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.44,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11477,7 +11477,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.44,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11491,7 +11491,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11505,7 +11505,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11533,7 +11533,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 2.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11547,7 +11547,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11561,7 +11561,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11575,7 +11575,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.62,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11589,7 +11589,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 8.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11603,7 +11603,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.45,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11617,7 +11617,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11631,7 +11631,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11645,7 +11645,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 5.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11673,7 +11673,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.72,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11687,7 +11687,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 5.88,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11701,7 +11701,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 4.06,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11715,7 +11715,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11729,7 +11729,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11743,7 +11743,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 5.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11757,7 +11757,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 6.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11771,7 +11771,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11785,7 +11785,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11813,7 +11813,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11827,7 +11827,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 4.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11841,7 +11841,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 15.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11855,7 +11855,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11869,7 +11869,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11883,7 +11883,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 14.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11897,7 +11897,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11939,7 +11939,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11953,7 +11953,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 5.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11967,7 +11967,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 1.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11981,7 +11981,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 6.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -11995,7 +11995,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 7.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12009,7 +12009,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 6.21,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12023,7 +12023,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 10.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12037,7 +12037,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 6.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12051,7 +12051,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 2.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12065,7 +12065,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12079,7 +12079,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 1.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12093,7 +12093,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 1.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12107,7 +12107,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12121,7 +12121,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12135,7 +12135,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12149,7 +12149,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12163,7 +12163,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12177,7 +12177,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 8.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12191,7 +12191,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 6.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12205,7 +12205,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12219,7 +12219,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12233,7 +12233,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 1.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12247,7 +12247,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 1.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12261,7 +12261,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 3.22,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12275,7 +12275,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 3.22,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12303,7 +12303,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12317,7 +12317,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12331,7 +12331,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 7.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12345,7 +12345,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 7.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12373,7 +12373,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 1.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12387,7 +12387,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 1.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12401,7 +12401,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12415,7 +12415,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12429,7 +12429,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12457,7 +12457,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 8.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12471,7 +12471,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 6.06,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12485,7 +12485,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12499,7 +12499,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 6.85,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12513,7 +12513,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 5.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12527,7 +12527,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 5.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12541,7 +12541,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 7.45,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12555,7 +12555,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.66,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12569,7 +12569,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12597,7 +12597,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 3.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12611,7 +12611,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.66,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12625,7 +12625,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 1.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12639,7 +12639,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 5.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12653,7 +12653,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12667,7 +12667,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12681,7 +12681,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 8.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12695,7 +12695,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 5.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12709,7 +12709,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 3.85,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12723,7 +12723,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 3.85,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12751,7 +12751,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12765,7 +12765,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12779,7 +12779,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12793,7 +12793,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 13.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12807,7 +12807,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 2.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12821,7 +12821,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 2.39,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12849,7 +12849,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 1.63,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12863,7 +12863,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12891,7 +12891,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 2.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12919,7 +12919,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 5.33,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12933,7 +12933,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12947,7 +12947,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 3.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12961,7 +12961,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12975,7 +12975,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -12989,7 +12989,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13003,7 +13003,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 1.62,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13017,7 +13017,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13031,7 +13031,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13045,7 +13045,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13059,7 +13059,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13073,7 +13073,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 2.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13087,7 +13087,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 2.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13101,7 +13101,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 2.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13129,7 +13129,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13143,7 +13143,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 9.92,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13157,7 +13157,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 9.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13171,7 +13171,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13185,7 +13185,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.92,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13199,7 +13199,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13255,7 +13255,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 6.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13269,7 +13269,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 15.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13283,7 +13283,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 11.84,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13297,7 +13297,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 11.84,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13325,7 +13325,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13339,7 +13339,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 5.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13367,7 +13367,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 4.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13395,7 +13395,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.69,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13409,7 +13409,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 2.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13423,7 +13423,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13451,7 +13451,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.31,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13465,7 +13465,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 4.25,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13479,7 +13479,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13493,7 +13493,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.8,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13507,7 +13507,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.8,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13521,7 +13521,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.8,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13535,7 +13535,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.8,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13549,7 +13549,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 6.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13563,7 +13563,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.92,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13605,7 +13605,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 1.62,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13633,7 +13633,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.54,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13675,7 +13675,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13703,7 +13703,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 4.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13717,7 +13717,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 1.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13731,7 +13731,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13745,7 +13745,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13773,7 +13773,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 6.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13787,7 +13787,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 7.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13801,7 +13801,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.91,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13815,7 +13815,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 3.91,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13829,7 +13829,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 8.22,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13857,7 +13857,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13885,7 +13885,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 7.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13913,7 +13913,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.57,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13927,7 +13927,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.57,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13941,7 +13941,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 1.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13955,7 +13955,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 1.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13969,7 +13969,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13983,7 +13983,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 4.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -13997,7 +13997,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14025,7 +14025,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 6.12,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14039,7 +14039,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 3.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14053,7 +14053,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 3.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14067,7 +14067,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 8.95,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14081,7 +14081,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 8.95,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14095,7 +14095,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.75,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14137,7 +14137,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.33,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14151,7 +14151,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 4.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14165,7 +14165,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14179,7 +14179,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14193,7 +14193,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14207,7 +14207,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14221,7 +14221,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14235,7 +14235,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14277,7 +14277,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14291,7 +14291,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14305,7 +14305,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 6.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14319,7 +14319,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 6.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14361,7 +14361,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 15.22,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14375,7 +14375,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14389,7 +14389,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14487,7 +14487,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14501,7 +14501,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14543,7 +14543,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14557,7 +14557,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14571,7 +14571,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14585,7 +14585,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 4.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14599,7 +14599,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 4.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14613,7 +14613,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 4.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14627,7 +14627,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 4.96,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14655,7 +14655,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 17.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14669,7 +14669,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 16.14,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14683,7 +14683,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 6.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14697,7 +14697,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 8.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14711,7 +14711,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14725,7 +14725,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14739,7 +14739,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 4.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14753,7 +14753,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 8.62,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14767,7 +14767,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14781,7 +14781,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 1.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14795,7 +14795,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 1.36,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14809,7 +14809,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14823,7 +14823,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14837,7 +14837,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 4.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14851,7 +14851,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14865,7 +14865,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 5.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14879,7 +14879,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 2.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14893,7 +14893,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 2.64,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14907,7 +14907,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 1.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14921,7 +14921,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 1.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14977,7 +14977,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 2.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -14991,7 +14991,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 2.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15005,7 +15005,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15019,7 +15019,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 7.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15033,7 +15033,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 6.76,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15075,7 +15075,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15089,7 +15089,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15103,7 +15103,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.63,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15117,7 +15117,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15131,7 +15131,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15145,7 +15145,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 1.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15159,7 +15159,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 1.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15173,7 +15173,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15187,7 +15187,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 2.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15201,7 +15201,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 4.44,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15215,7 +15215,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15229,7 +15229,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 8.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15243,7 +15243,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.37,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15271,7 +15271,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 4.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15299,7 +15299,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.53,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15313,7 +15313,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 6.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15327,7 +15327,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15341,7 +15341,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15383,7 +15383,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 8.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15397,7 +15397,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 8.19,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15411,7 +15411,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15425,7 +15425,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15439,7 +15439,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.38,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15453,7 +15453,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15467,7 +15467,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 5.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15495,7 +15495,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 1.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15509,7 +15509,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 1.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15551,7 +15551,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 1.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15565,7 +15565,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 3.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15579,7 +15579,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 5.91,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15593,7 +15593,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 2.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15607,7 +15607,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 2.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15621,7 +15621,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15635,7 +15635,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15677,7 +15677,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15719,7 +15719,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 2.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15733,7 +15733,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.69,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15747,7 +15747,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.69,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15761,7 +15761,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 8.9,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15775,7 +15775,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 1.7,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15789,7 +15789,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 1.7,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15803,7 +15803,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 4.01,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15817,7 +15817,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 1.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15831,7 +15831,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 1.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15845,7 +15845,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 1.16,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15859,7 +15859,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 15.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15873,7 +15873,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 15.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15887,7 +15887,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 2.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15901,7 +15901,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 11.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15915,7 +15915,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 11.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15929,7 +15929,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15943,7 +15943,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 7.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15957,7 +15957,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15971,7 +15971,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15985,7 +15985,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -15999,7 +15999,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16013,7 +16013,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16027,7 +16027,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 3.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16041,7 +16041,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.23,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16055,7 +16055,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "gravy", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16069,7 +16069,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16083,7 +16083,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16097,7 +16097,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 3.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16111,7 +16111,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 6.78,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16125,7 +16125,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 1.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16139,7 +16139,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 1.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16153,7 +16153,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 6.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16167,7 +16167,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16181,7 +16181,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 4.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16195,7 +16195,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 7.01,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16209,7 +16209,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 6.12,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16223,7 +16223,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 8.82,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16237,7 +16237,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16265,7 +16265,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 3.03,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16279,7 +16279,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.34,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16293,7 +16293,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 8.34,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16307,7 +16307,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 8.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16321,7 +16321,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 6.72,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16335,7 +16335,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 4.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16349,7 +16349,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16363,7 +16363,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.46,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16377,7 +16377,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.02,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16391,7 +16391,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.02,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16405,7 +16405,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 1.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16433,7 +16433,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 6.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16447,7 +16447,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 2.9,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16461,7 +16461,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 18.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16475,7 +16475,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 5.71,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16489,7 +16489,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 5.71,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16503,7 +16503,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16517,7 +16517,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16531,7 +16531,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 4.0,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16545,7 +16545,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 1.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16587,7 +16587,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16601,7 +16601,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16615,7 +16615,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 6.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16629,7 +16629,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 6.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16643,7 +16643,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 6.99,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16657,7 +16657,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 1.89,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16671,7 +16671,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 7.63,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16685,7 +16685,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 5.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16699,7 +16699,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 1.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16713,7 +16713,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 1.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16727,7 +16727,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16741,7 +16741,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 3.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16755,7 +16755,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16769,7 +16769,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 5.85,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16783,7 +16783,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 8.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16797,7 +16797,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 7.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16839,7 +16839,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned)", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 8.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16853,7 +16853,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16867,7 +16867,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 2.98,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16881,7 +16881,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 2.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16895,7 +16895,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16909,7 +16909,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16923,7 +16923,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 8.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16937,7 +16937,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 1.7,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16951,7 +16951,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 17.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16965,7 +16965,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 11.56,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16979,7 +16979,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -16993,7 +16993,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 6.75,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17007,7 +17007,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17021,7 +17021,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 12.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17035,7 +17035,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 12.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17049,7 +17049,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 6.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17063,7 +17063,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 3.29,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17077,7 +17077,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17091,7 +17091,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17105,7 +17105,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 10.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17119,7 +17119,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 3.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17133,7 +17133,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17147,7 +17147,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17161,7 +17161,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 12.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17175,7 +17175,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 1.47,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17203,7 +17203,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.53,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17217,7 +17217,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 2.3,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17231,7 +17231,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 1.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17245,7 +17245,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 3.82,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17287,7 +17287,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 8.06,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17315,7 +17315,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17329,7 +17329,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17343,7 +17343,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17357,7 +17357,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 3.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17371,7 +17371,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 4.28,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17385,7 +17385,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 1.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17399,7 +17399,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 1.87,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17413,7 +17413,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17427,7 +17427,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 3.35,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17441,7 +17441,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17455,7 +17455,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17497,7 +17497,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17511,7 +17511,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 2.81,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17525,7 +17525,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 4.32,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17539,7 +17539,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17553,7 +17553,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 4.07,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17567,7 +17567,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.4,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17581,7 +17581,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 4.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17595,7 +17595,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 4.08,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17609,7 +17609,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 4.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17623,7 +17623,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 4.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17651,7 +17651,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 13.8,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17665,7 +17665,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 13.41,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17679,7 +17679,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 7.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17693,7 +17693,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 7.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17707,7 +17707,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 7.76,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17763,7 +17763,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 5.47,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17777,7 +17777,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17791,7 +17791,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 2.58,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17805,7 +17805,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 7.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17819,7 +17819,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 3.54,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17833,7 +17833,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 6.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17847,7 +17847,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 6.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17861,7 +17861,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 5.65,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17875,7 +17875,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 1.11,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17889,7 +17889,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 1.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17903,7 +17903,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 1.86,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17917,7 +17917,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 5.43,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17931,7 +17931,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 4.06,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17959,7 +17959,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 5.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17973,7 +17973,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 6.6,
         currency: "USD",
         capturedAt: 1736917200000
@@ -17987,7 +17987,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.12,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18001,7 +18001,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 2.27,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18015,7 +18015,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 8.11,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18043,7 +18043,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18057,7 +18057,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 1.83,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18071,7 +18071,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 4.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18085,7 +18085,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 5.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18099,7 +18099,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 5.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18113,7 +18113,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 3.94,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18127,7 +18127,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 3.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18141,7 +18141,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "US Foods",
         unitPrice: 1.55,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18155,7 +18155,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 3.84,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18169,7 +18169,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 8.04,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18211,7 +18211,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 8.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18225,7 +18225,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 6.95,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18239,7 +18239,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.45,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18253,7 +18253,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 4.45,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18295,7 +18295,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 8.91,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18337,7 +18337,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 3.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18379,7 +18379,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18393,7 +18393,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 4.17,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18421,7 +18421,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 8.59,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18435,7 +18435,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "US Foods",
         unitPrice: 3.24,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18505,7 +18505,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 2.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18519,7 +18519,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Whole Foods",
         unitPrice: 2.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18561,7 +18561,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 3.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18575,7 +18575,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 3.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18589,7 +18589,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 2.72,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18603,7 +18603,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "US Foods",
         unitPrice: 13.91,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18659,7 +18659,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned)", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 4.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18673,7 +18673,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 10.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18687,7 +18687,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 10.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18701,7 +18701,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 7.42,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18715,7 +18715,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Safeway",
         unitPrice: 3.67,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18729,7 +18729,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 12.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18743,7 +18743,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Sysco",
         unitPrice: 12.26,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18757,7 +18757,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 7.34,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18827,7 +18827,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 3.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18855,7 +18855,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.73,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18869,7 +18869,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.7,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18883,7 +18883,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 2.7,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18897,7 +18897,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "US Foods",
         unitPrice: 4.05,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18911,7 +18911,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Sysco",
         unitPrice: 8.49,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18925,7 +18925,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 4.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18939,7 +18939,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Trader Joe's",
         unitPrice: 4.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18953,7 +18953,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 6.13,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18967,7 +18967,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18981,7 +18981,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 4.15,
         currency: "USD",
         capturedAt: 1736917200000
@@ -18995,7 +18995,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 8.93,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19009,7 +19009,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 6.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19023,7 +19023,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Sysco",
         unitPrice: 6.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19037,7 +19037,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.85,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19079,7 +19079,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Safeway",
         unitPrice: 3.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19149,7 +19149,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.9,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19163,7 +19163,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 2.9,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19177,7 +19177,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 3.97,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19219,7 +19219,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19233,7 +19233,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Whole Foods",
         unitPrice: 5.18,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19247,7 +19247,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 7.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19261,7 +19261,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 7.68,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19275,7 +19275,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 5.79,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19289,7 +19289,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Safeway",
         unitPrice: 2.52,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19303,7 +19303,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 1.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19317,7 +19317,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Trader Joe's",
         unitPrice: 1.74,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19331,7 +19331,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 4.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19345,7 +19345,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Whole Foods",
+        store: "Safeway",
         unitPrice: 4.5,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19359,7 +19359,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 4.48,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19373,7 +19373,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "US Foods",
+        store: "Trader Joe's",
         unitPrice: 2.09,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19387,7 +19387,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 4.67,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19401,7 +19401,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Trader Joe's",
         unitPrice: 4.67,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19415,7 +19415,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 6.61,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19429,7 +19429,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "US",
       prices: [{
-        store: "Safeway",
+        store: "Sysco",
         unitPrice: 6.77,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19443,7 +19443,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.1,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19457,7 +19457,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Sysco",
+        store: "Whole Foods",
         unitPrice: 2.1,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19471,7 +19471,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "US",
       prices: [{
-        store: "Trader Joe's",
+        store: "Whole Foods",
         unitPrice: 1.2,
         currency: "USD",
         capturedAt: 1736917200000
@@ -19515,7 +19515,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 64.31,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19529,7 +19529,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 11.5,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19543,7 +19543,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 11.5,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19557,7 +19557,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 48.85,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19571,7 +19571,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 101.96,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19585,7 +19585,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 16.04,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19599,7 +19599,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 21.63,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19613,7 +19613,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 33.12,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19641,7 +19641,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 49.94,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19655,7 +19655,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 28.69,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19669,7 +19669,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 19.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19683,7 +19683,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 19.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19697,7 +19697,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 30.38,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19767,7 +19767,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 34.15,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19781,7 +19781,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 57.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19795,7 +19795,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 57.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19809,7 +19809,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 26.96,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19823,7 +19823,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 26.96,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19837,7 +19837,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 30.21,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19851,7 +19851,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 51.34,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19865,7 +19865,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 42.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19879,7 +19879,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 66.63,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19893,7 +19893,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Hema Fresh",
         unitPrice: 22.96,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19907,7 +19907,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 13.75,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19921,7 +19921,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 13.75,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19935,7 +19935,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 40.14,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19949,7 +19949,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 40.14,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19963,7 +19963,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 16.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19977,7 +19977,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 16.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -19991,7 +19991,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 49.5,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20005,7 +20005,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 49.5,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20019,7 +20019,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 15.5,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20033,7 +20033,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 28.64,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20047,7 +20047,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 13.66,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20061,7 +20061,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 63.56,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20075,7 +20075,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 22.55,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20103,7 +20103,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 28.38,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20117,7 +20117,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 28.38,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20131,7 +20131,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 74.51,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20145,7 +20145,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 74.51,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20159,7 +20159,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 32.04,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20173,7 +20173,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 12.55,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20187,7 +20187,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 43.45,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20201,7 +20201,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 43.45,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20215,7 +20215,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 64.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20229,7 +20229,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat & poultry", "meat_seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 64.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20243,7 +20243,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 13.99,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20271,7 +20271,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 57.56,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20285,7 +20285,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 16.42,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20299,7 +20299,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Ole Supermarket",
         unitPrice: 43.83,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20313,7 +20313,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 23.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20327,7 +20327,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 25.66,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20341,7 +20341,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 25.66,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20355,7 +20355,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 11.02,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20369,7 +20369,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 11.02,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20383,7 +20383,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Hema Fresh",
         unitPrice: 47.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20425,7 +20425,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 26.32,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20467,7 +20467,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 27.95,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20481,7 +20481,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 27.95,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20495,7 +20495,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 23.74,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20509,7 +20509,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 23.74,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20523,7 +20523,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 54.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20537,7 +20537,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 16.26,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20565,7 +20565,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 14.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20621,7 +20621,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 58.75,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20635,7 +20635,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 58.75,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20649,7 +20649,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 14.97,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20663,7 +20663,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 14.97,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20677,7 +20677,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 23.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20691,7 +20691,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 23.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20705,7 +20705,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 64.37,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20719,7 +20719,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Ole Supermarket",
         unitPrice: 55.88,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20761,7 +20761,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 20.69,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20775,7 +20775,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 20.69,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20789,7 +20789,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 31.71,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20803,7 +20803,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 28.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20845,7 +20845,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 26.64,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20859,7 +20859,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 13.85,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20873,7 +20873,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 34.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20887,7 +20887,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 34.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20929,7 +20929,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 46.26,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20943,7 +20943,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 49.66,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20957,7 +20957,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Metro China",
         unitPrice: 38.67,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20971,7 +20971,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Metro China",
         unitPrice: 38.67,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20985,7 +20985,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 31.04,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -20999,7 +20999,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 31.04,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21041,7 +21041,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 51.94,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21083,7 +21083,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Metro China",
         unitPrice: 25.72,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21097,7 +21097,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Metro China",
         unitPrice: 25.72,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21111,7 +21111,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 15.78,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21125,7 +21125,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 15.78,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21139,7 +21139,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 50.85,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21153,7 +21153,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 17.12,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21167,7 +21167,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 51.23,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21181,7 +21181,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 22.13,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21195,7 +21195,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "sweets & desserts", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 22.13,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21209,7 +21209,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 8.26,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21223,7 +21223,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 8.26,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21237,7 +21237,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 16.37,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21251,7 +21251,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned & jarred", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 53.83,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21279,7 +21279,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 23.05,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21293,7 +21293,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Ole Supermarket",
         unitPrice: 43.12,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21307,7 +21307,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 42.71,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21321,7 +21321,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 42.71,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21349,7 +21349,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 32.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21377,7 +21377,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 89.59,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21391,7 +21391,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 54.21,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21405,7 +21405,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 12.37,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21475,7 +21475,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 30.69,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21489,7 +21489,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 30.69,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21503,7 +21503,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 23.6,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21517,7 +21517,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 27.93,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21531,7 +21531,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 27.93,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21545,7 +21545,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 17.99,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21559,7 +21559,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 17.99,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21573,7 +21573,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 23.65,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21587,7 +21587,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 27.57,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21601,7 +21601,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 27.57,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21615,7 +21615,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 30.78,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21657,7 +21657,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Carrefour China",
         unitPrice: 70.2,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21671,7 +21671,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 20.2,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21685,7 +21685,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 92.31,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21699,7 +21699,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 92.31,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21727,7 +21727,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 12.94,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21741,7 +21741,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Hema Fresh",
         unitPrice: 28.62,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21755,7 +21755,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 18.56,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21769,7 +21769,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 41.83,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21783,7 +21783,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Hema Fresh",
         unitPrice: 25.55,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21797,7 +21797,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 46.53,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21811,7 +21811,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 46.53,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21825,7 +21825,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "deli & prepared", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 44.42,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21839,7 +21839,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 18.71,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21853,7 +21853,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "dairy", "dairy & eggs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 18.71,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21867,7 +21867,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 26.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21881,7 +21881,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 11.66,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21895,7 +21895,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 41.88,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21909,7 +21909,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 24.1,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21923,7 +21923,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 22.7,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21937,7 +21937,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 96.81,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21951,7 +21951,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 9.66,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21965,7 +21965,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 18.84,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -21979,7 +21979,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 18.84,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22007,7 +22007,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 73.9,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22021,7 +22021,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen", "frozen foods", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 73.9,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22035,7 +22035,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 58.64,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22049,7 +22049,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["breakfast & cereal", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 58.64,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22063,7 +22063,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 18.27,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22077,7 +22077,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 18.27,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22091,7 +22091,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 11.09,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22105,7 +22105,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 11.09,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22119,7 +22119,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 50.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22133,7 +22133,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "spices & seasonings", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 50.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22147,7 +22147,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 104.68,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22161,7 +22161,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs & aromatics", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 28.81,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22175,7 +22175,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "herbs", "produce", "produce>herbs", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 28.81,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22245,7 +22245,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 19.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22259,7 +22259,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 58.8,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22273,7 +22273,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 42.48,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22287,7 +22287,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 30.26,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22301,7 +22301,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 29.52,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22315,7 +22315,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 44.8,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22329,7 +22329,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 25.12,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22343,7 +22343,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 25.12,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22357,7 +22357,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts, seeds & dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Metro China",
         unitPrice: 31.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22371,7 +22371,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "nuts/seeds/dried fruit", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Metro China",
         unitPrice: 31.61,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22385,7 +22385,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "Hema Fresh",
         unitPrice: 24.69,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22399,7 +22399,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "City Shop",
         unitPrice: 27.88,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22413,7 +22413,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains, rice & pasta", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 54.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22427,7 +22427,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "grains", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 54.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22441,7 +22441,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 22.81,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22483,7 +22483,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 15.18,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22497,7 +22497,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "oils & vinegars", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 15.18,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22511,7 +22511,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["cheese", "culinary", "dairy", "dairy>cheese", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 17.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22525,7 +22525,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 65.98,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22539,7 +22539,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Carrefour China",
         unitPrice: 65.98,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22553,7 +22553,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 60.37,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22567,7 +22567,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned", "culinary", "meat_seafood", "seafood", "seafood>canned", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 124.45,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22595,7 +22595,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 41.82,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22609,7 +22609,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 25.57,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22623,7 +22623,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 25.57,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22637,7 +22637,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 19.15,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22651,7 +22651,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 49.23,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22665,7 +22665,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["baking supplies", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Metro China",
         unitPrice: 52.91,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22693,7 +22693,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 129.32,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22707,7 +22707,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 129.32,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22721,7 +22721,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "snacks", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 19.84,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22735,7 +22735,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 24.72,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22749,7 +22749,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Hema Fresh",
         unitPrice: 24.72,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22763,7 +22763,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 17.07,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22777,7 +22777,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 17.07,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22791,7 +22791,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "frozen entrées", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 54.85,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22819,7 +22819,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Hema Fresh",
         unitPrice: 31.23,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22833,7 +22833,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Hema Fresh",
         unitPrice: 31.23,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22847,7 +22847,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 15.3,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22861,7 +22861,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "City Shop",
         unitPrice: 15.3,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22875,7 +22875,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 14.73,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22889,7 +22889,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Ole Supermarket",
         unitPrice: 14.73,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22903,7 +22903,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "pantry", "ready meals", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Metro China",
         unitPrice: 49.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22917,7 +22917,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 11.11,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22931,7 +22931,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Carrefour China",
         unitPrice: 11.11,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22945,7 +22945,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 11.85,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22959,7 +22959,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 17.82,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -22973,7 +22973,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 17.82,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23001,7 +23001,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 19.18,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23015,7 +23015,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["beverages", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 19.18,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23029,7 +23029,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "fruits", "produce", "produce>fruits", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 17.96,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23043,7 +23043,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 21.77,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23057,7 +23057,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments & sauces", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Metro China",
         unitPrice: 21.77,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23085,7 +23085,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 123.79,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23099,7 +23099,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "meat_seafood", "seafood", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 123.79,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23113,7 +23113,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned)", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "City Shop",
         unitPrice: 40.04,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23127,7 +23127,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["canned)", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "City Shop",
+        store: "Ole Supermarket",
         unitPrice: 14.1,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23141,7 +23141,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["condiments", "culinary", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Metro China",
+        store: "City Shop",
         unitPrice: 48.75,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23183,7 +23183,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 36.51,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23197,7 +23197,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["bakery", "culinary", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Ole Supermarket",
+        store: "Hema Fresh",
         unitPrice: 36.51,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23225,7 +23225,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "international & latin", "pantry", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Hema Fresh",
+        store: "Carrefour China",
         unitPrice: 23.39,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23239,7 +23239,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 15.11,
         currency: "CNY",
         capturedAt: 1736917200000
@@ -23253,7 +23253,7 @@ export const westernSharedCatalog: WesternSharedCatalog = {
       tags: ["culinary", "produce", "produce>vegetables", "vegetables", "western-shared"],
       region: "CN",
       prices: [{
-        store: "Carrefour China",
+        store: "Ole Supermarket",
         unitPrice: 15.11,
         currency: "CNY",
         capturedAt: 1736917200000
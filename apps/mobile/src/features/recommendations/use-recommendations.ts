@@ -20,20 +20,71 @@ type RecommendationResponse = {
   modelVersion?: string;
 };
 
+type StreamEvent = {
+  phase: 'exact' | 'ranked' | 'error';
+  complete: boolean;
+  suggestions?: Recommendation[];
+  detail?: string;
+};
+
 type RecommendationsState = {
   data: Recommendation[];
   loading: boolean;
+  // False while a streamed request has only sent its early exact matches.
+  complete: boolean;
   error?: string;
 };
 
 const INITIAL_STATE: RecommendationsState = {
   data: [],
-  loading: false
+  loading: false,
+  complete: true
 };
 
-export function useRecommendations(request: RecommendationRequest | null, opts?: { enabled?: boolean }) {
+// React Native's fetch cannot read a body incrementally, so streamed
+// suggestions are read from XMLHttpRequest progress events, one NDJSON line
+// per event.
+function streamSuggestions(url: string, body: string, onEvent: (event: StreamEvent) => void) {
+  const xhr = new XMLHttpRequest();
+  let offset = 0;
+  const flush = () => {
+    const text = xhr.responseText;
+    let newline = text.indexOf('\n', offset);
+    while (newline !== -1) {
+      const line = text.slice(offset, newline).trim();
+      offset = newline + 1;
+      if (line) {
+        onEvent(JSON.parse(line) as StreamEvent);
+      }
+      newline = text.indexOf('\n', offset);
+    }
+  };
+  const done = new Promise<void>((resolve, reject) => {
+    xhr.onprogress = flush;
+    xhr.onload = () => {
+      if (xhr.status < 200 || xhr.status >= 300) {
+        reject(new Error(`Service responded with ${xhr.status}`));
+        return;
+      }
+      flush();
+      resolve();
+    };
+    xhr.onerror = () => reject(new Error('Unable to fetch recommendations.'));
+  });
+  xhr.open('POST', url);
+  xhr.setRequestHeader('Content-Type', 'application/json');
+  xhr.setRequestHeader('Accept', 'application/x-ndjson');
+  xhr.send(body);
+  return { done, abort: () => xhr.abort() };
+}
+
+export function useRecommendations(
+  request: RecommendationRequest | null,
+  opts?: { enabled?: boolean; stream?: boolean }
+) {
   const [state, setState] = useState<RecommendationsState>(INITIAL_STATE);
   const enabled = (opts?.enabled ?? true) && featureFlags.aiSuggestions;
+  const stream = opts?.stream ?? false;
   const serviceUrl = supabaseEnv.recoServiceUrl;
 
   const payload = useMemo(() => {
@@ -49,21 +100,45 @@ export function useRecommendations(request: RecommendationRequest | null, opts?:
 
   useEffect(() => {
     let isMounted = true;
+    let abort: (() => void) | undefined;
 
     if (!enabled || !payload || !serviceUrl) {
       setState((prev) => ({
         ...prev,
         data: [],
         loading: false,
+        complete: true,
         error: !serviceUrl && enabled ? 'Recommendation service unavailable.' : undefined
       }));
       return;
     }
 
     async function fetchRecommendations() {
-      setState((prev) => ({ ...prev, loading: true, error: undefined }));
+      setState((prev) => ({ ...prev, loading: true, complete: false, error: undefined }));
+      const baseUrl = serviceUrl.replace(/\/$/, '');
       try {
-        const response = await fetch(`${serviceUrl.replace(/\/$/, '')}/suggest`, {
+        if (stream) {
+          const streamed = streamSuggestions(`${baseUrl}/suggest/stream`, JSON.stringify(payload), (event) => {
+            if (!isMounted) {
+              return;
+            }
+            if (event.phase === 'error') {
+              setState((prev) => ({ ...prev, loading: false, complete: true, error: event.detail }));
+              return;
+            }
+            setState({
+              data: event.suggestions ?? [],
+              loading: !event.complete,
+              complete: event.complete,
+              error: undefined
+            });
+          });
+          abort = streamed.abort;
+          await streamed.done;
+          return;
+        }
+
+        const response = await fetch(`${baseUrl}/suggest`, {
           method: 'POST',
           headers: {
             'Content-Type': 'application/json'
@@ -82,6 +157,7 @@ export function useRecommendations(request: RecommendationRequest | null, opts?:
         setState({
           data: json.suggestions ?? [],
           loading: false,
+          complete: true,
           error: undefined
         });
       } catch (error) {
@@ -91,6 +167,7 @@ export function useRecommendations(request: RecommendationRequest | null, opts?:
         setState({
           data: [],
           loading: false,
+          complete: true,
           error: error instanceof Error ? error.message : 'Unable to fetch recommendations.'
         });
       }
@@ -100,8 +177,9 @@ export function useRecommendations(request: RecommendationRequest | null, opts?:
 
     return () => {
       isMounted = false;
+      abort?.();
     };
-  }, [enabled, payload, serviceUrl]);
+  }, [enabled, payload, serviceUrl, stream]);
 
   const reset = useCallback(() => {
     setState(INITIAL_STATE);
@@ -110,6 +188,7 @@ export function useRecommendations(request: RecommendationRequest | null, opts?:
   return {
     data: state.data,
     loading: state.loading,
+    complete: state.complete,
     error: state.error,
     reset
   };
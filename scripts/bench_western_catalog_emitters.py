@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Compare the western catalog generator's TypeScript emitters on a synthetic catalog.
+
+``joined`` reproduces the earlier writers: every output line is built into a
+list (``format_ts_value`` for every value) and joined into one string before
+the file is written. ``streamed`` is what ``generate_western_catalog.py``
+does now: generator-based emitters with a fixed template for catalog
+records, written in chunks through a buffered file handle.
+
+The synthetic catalog repeats the parsed dictionary ``--scale`` times with
+numbered names (100x is about 100k seeds, 170k catalog records and 2.3M
+lines of TypeScript). Both emitters write into a temporary directory and
+must produce identical bytes. The records themselves are built before
+measuring, so the reported peak is the emitters' own working memory.
+
+Reported per emitter and output:
+- MiB: size of the written file
+- peak_mib: tracemalloc peak while emitting and writing
+- s: wall time without tracing
+
+Run:
+  python scripts/bench_western_catalog_emitters.py
+  python scripts/bench_western_catalog_emitters.py --scale 10,100
+"""
+
+import argparse
+import filecmp
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from generate_western_catalog import (
+    build_catalog_records,
+    dictionary_seed,
+    format_ts_value,
+    parse_csv_tables,
+    parse_markdown,
+    write_catalog_ts,
+    write_dictionary_ts,
+)
+
+
+def joined_dictionary_ts(items: List[Dict], path: Path):
+    lines = ["import type { ExpandableSeed } from './food-dictionary-types.ts';", "", "export const westernPart1Seeds: ExpandableSeed[] = ["]
+    for item in items:
+        lines.append("  {")
+        for key, value in dictionary_seed(item).items():
+            lines.append(f"    {key}: {format_ts_value(value, 4)},")
+        lines.append("  },")
+    lines.append("];")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def joined_catalog_ts(by_region: Dict[str, List[Dict]], path: Path):
+    header = [
+        "import type { CatalogRecord } from '../types';",
+        "",
+        "export type WesternSharedCatalog = {",
+        "  jm: CatalogRecord[];",
+        "  us: CatalogRecord[];",
+        "  cn: CatalogRecord[];",
+        "};",
+        "",
+        "export const WESTERN_SHARED_VERSION = '2025.11.12-v0.2';",
+        "export const WESTERN_SHARED_COUNT = {",
+        f"  jm: {len(by_region['jm'])},",
+        f"  us: {len(by_region['us'])},",
+        f"  cn: {len(by_region['cn'])},",
+        "};",
+        "",
+        "export const westernSharedCatalog: WesternSharedCatalog = {",
+    ]
+    body = []
+    for region in ("jm", "us", "cn"):
+        body.append(f"  {region}: [")
+        for record in by_region[region]:
+            body.append("    {")
+            for key, value in record.items():
+                body.append(f"      {key}: {format_ts_value(value, 6)},")
+            body.append("    },")
+        body.append("  ],")
+    path.write_text("\n".join(header + body + ["};"]) + "\n", encoding="utf-8")
+
+
+def synthesize(items: List[Dict], scale: int) -> List[Dict]:
+    if scale == 1:
+        return items
+    return [{**item, "name": f"{item['name']} {copy}"} for copy in range(1, scale + 1) for item in items]
+
+
+def measure(write: Callable[[Path], object], path: Path) -> Dict[str, float]:
+    if path.exists():
+        path.unlink()
+    start = time.perf_counter()
+    write(path)
+    seconds = time.perf_counter() - start
+    path.unlink()
+
+    tracemalloc.start()
+    try:
+        write(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"mib": path.stat().st_size / 2**20, "peak_mib": peak / 2**20, "s": seconds}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="1,100", help="comma-separated catalog size multipliers")
+    args = parser.parse_args()
+
+    base = parse_markdown() + parse_csv_tables()
+    print(f"dictionary items: {len(base)}")
+    print(f"{'scale':>5} {'output':<10} {'emitter':<9} {'MiB':>7} {'peak_mib':>9} {'s':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        for scale in (int(value) for value in args.scale.split(",")):
+            items = synthesize(base, scale)
+            catalog = build_catalog_records(items)
+            outputs = {
+                "dictionary": (
+                    lambda path: joined_dictionary_ts(items, path),
+                    lambda path: write_dictionary_ts(items, path),
+                ),
+                "catalog": (
+                    lambda path: joined_catalog_ts(catalog, path),
+                    lambda path: write_catalog_ts(catalog, path),
+                ),
+            }
+            for output, (joined, streamed) in outputs.items():
+                joined_path, streamed_path = root / f"{output}-joined.ts", root / f"{output}-streamed.ts"
+                for emitter, write, path in (("joined", joined, joined_path), ("streamed", streamed, streamed_path)):
+                    row = measure(write, path)
+                    print(f"{scale:>5} {output:<10} {emitter:<9} {row['mib']:>7.1f} {row['peak_mib']:>9.1f} {row['s']:>7.2f}")
+                if not filecmp.cmp(joined_path, streamed_path, shallow=False):
+                    raise AssertionError(f"{output} emitters differ at scale {scale}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
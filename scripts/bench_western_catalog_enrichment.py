@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Compare the western catalog generator's enrichment stage on a synthetic catalog.
+
+``looped`` reproduces the earlier enrichment: ``determine_regions`` scans the
+JM and CN keyword lists (duplicates included) with one substring check per
+keyword, ``packaging_to_unit`` does the same over ``PACKAGING_TOKEN_MAP``, and
+every item is SHA-1 hashed from scratch for its region draw, for each
+region's price and for each region's store, and the records are grouped
+and stably sorted by name with the garbage collector running throughout. ``compiled`` is what ``generate_western_catalog.py``
+does now: one prefix-factored regex per region keyword list, packaging
+phrases matched once each, the name hashed once with every per-region
+hash continuing a copy of that state, and no collection passes while the
+records are built.
+
+The synthetic catalog repeats the parsed dictionary ``--scale`` times with
+numbered names, as in ``bench_western_catalog_emitters.py``. Both stages must
+produce identical records, and since ``looped`` keeps its own copy of the
+earlier grouping, a change to the generator's record order fails the run.
+
+Reported per stage and step:
+- regions: ``determine_regions`` for every item
+- packaging: ``packaging_to_unit`` for every item
+- records: ``catalog_records_for`` for every item
+- build: ``build_catalog_records`` (records grouped and sorted by region)
+- us/item: best wall time of ``--rounds`` passes, per item
+
+Run:
+  python scripts/bench_western_catalog_enrichment.py
+  python scripts/bench_western_catalog_enrichment.py --scale 1,10,100
+"""
+
+import argparse
+import hashlib
+import time
+from typing import Callable, Dict, List, Tuple
+
+from bench_western_catalog_emitters import synthesize
+from generate_western_catalog import (
+    CURRENCY,
+    FX,
+    PACKAGING_TOKEN_MAP,
+    PRICE_RANGES,
+    REGION_KEYWORDS_CN,
+    REGION_KEYWORDS_JM,
+    STORE_BY_REGION,
+    build_catalog_records,
+    catalog_captured_at,
+    catalog_records_for,
+    determine_regions,
+    packaging_to_unit,
+    parse_csv_tables,
+    parse_markdown,
+)
+
+
+def looped_regions(name: str, aliases: List[str], category: str) -> List[str]:
+    text = f"{name} {' '.join(aliases)}".lower()
+    regions = set()
+    for marker in REGION_KEYWORDS_JM:
+        if marker in text:
+            regions.add("jm")
+            break
+    for marker in REGION_KEYWORDS_CN:
+        if marker in text:
+            regions.add("cn")
+            break
+    chooser = int(hashlib.sha1(name.encode("utf-8")).hexdigest(), 16) % 10
+    if chooser < 5:
+        regions.add("us")
+    elif chooser < 8:
+        regions.add("jm")
+    else:
+        regions.add("cn")
+    regions.add("us")
+    return sorted(regions)
+
+
+def looped_price(name: str, category: str, region: str) -> float:
+    low, high = PRICE_RANGES.get(category, (2.0, 8.0))
+    hashed = int(hashlib.sha1((name + region).encode("utf-8")).hexdigest()[:8], 16)
+    regional_price = (low + (high - low) * ((hashed % 1000) / 999)) * FX[region]
+    return round(regional_price) if region == "jm" else round(regional_price, 2)
+
+
+def looped_unit(packaging: List[str]) -> str:
+    for pkg in packaging:
+        token = pkg.lower()
+        for needle, unit in PACKAGING_TOKEN_MAP:
+            if needle in token:
+                return unit
+    return "ea"
+
+
+def looped_records(item: Dict, captured_at: int) -> List[Tuple[str, Dict]]:
+    records = []
+    base_unit = looped_unit(item["packaging"])
+    tags = sorted(set(item["tags"] + ["western-shared", "culinary", item["category"]]))
+    for region in looped_regions(item["name"], item["aliases"], item["category"]):
+        store_list = STORE_BY_REGION[region]
+        store_hash = int(hashlib.sha1(f"{item['name']}|{region}|store".encode("utf-8")).hexdigest()[:8], 16)
+        record = {
+            "name": item["name"],
+            "category": item["category"],
+            "sizeValue": 1,
+            "sizeUnit": base_unit,
+            "tags": tags,
+            "region": region.upper(),
+            "prices": [
+                {
+                    "store": store_list[store_hash % len(store_list)],
+                    "unitPrice": looped_price(item["name"], item["category"], region),
+                    "currency": CURRENCY[region],
+                    "capturedAt": captured_at,
+                }
+            ],
+        }
+        records.append((region, record))
+    return records
+
+
+def looped_group(records: List[Tuple[str, Dict]]) -> Dict[str, List[Dict]]:
+    by_region: Dict[str, List[Dict]] = {"jm": [], "us": [], "cn": []}
+    for region, record in records:
+        by_region[region].append(record)
+    for region in by_region:
+        by_region[region] = sorted(by_region[region], key=lambda rec: rec["name"])
+    return by_region
+
+
+def best_of(run: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="1,10,100", help="comma-separated catalog size multipliers")
+    parser.add_argument("--rounds", type=int, default=3, help="passes per measurement; the fastest is reported")
+    args = parser.parse_args()
+
+    base = parse_markdown() + parse_csv_tables()
+    captured_at = catalog_captured_at()
+    print(f"dictionary items: {len(base)}")
+    print(f"{'scale':>5} {'step':<10} {'looped_us':>10} {'compiled_us':>12} {'speedup':>8}")
+    for scale in (int(value) for value in args.scale.split(",")):
+        items = synthesize(base, scale)
+        steps = {
+            "regions": (
+                lambda: [looped_regions(item["name"], item["aliases"], item["category"]) for item in items],
+                lambda: [determine_regions(item["name"], item["aliases"], item["category"]) for item in items],
+            ),
+            "packaging": (
+                lambda: [looped_unit(item["packaging"]) for item in items],
+                lambda: [packaging_to_unit(item["packaging"]) for item in items],
+            ),
+            "records": (
+                lambda: [looped_records(item, captured_at) for item in items],
+                lambda: [catalog_records_for(item, captured_at) for item in items],
+            ),
+            "build": (
+                lambda: looped_group([pair for item in items for pair in looped_records(item, captured_at)]),
+                lambda: build_catalog_records(items),
+            ),
+        }
+        for step, (looped, compiled) in steps.items():
+            if looped() != compiled():
+                raise AssertionError(f"{step} differs at scale {scale}")
+            looped_us = best_of(looped, args.rounds) / len(items) * 1e6
+            compiled_us = best_of(compiled, args.rounds) / len(items) * 1e6
+            print(f"{scale:>5} {step:<10} {looped_us:>10.2f} {compiled_us:>12.2f} {looped_us / compiled_us:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
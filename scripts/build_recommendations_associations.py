@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Build the recommendations service item association matrix from list history.
+
+Reads shopping-list items from a local export of Supabase ``list_items``,
+either a CSV file with ``list_id`` and ``label`` columns (other columns are
+ignored) or a SQLite database with a ``list_items`` table, and resolves each
+label to a catalog item the same way the service resolves ``context_items``:
+the normalized label must be an item's name or one of its aliases. Each
+list becomes one basket of distinct items.
+
+Item pairs that share at least ``--min-support`` lists are scored by
+normalized PMI (log lift scaled to (0, 1]); every item keeps its
+``--top-n`` strongest neighbors. The matrix is written as CSR arrays, keyed
+by item name so it survives catalog regeneration, in the same mmap-able
+format as the index snapshot. Point the service at it with
+RECO_ASSOCIATIONS (and rebuild the index snapshot, which embeds it).
+
+Usage:
+  python scripts/build_recommendations_associations.py HISTORY [--output PATH]
+      [--top-n 20] [--min-support 3] [--table list_items]
+"""
+
+import argparse
+import csv
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+SERVICE_ROOT = ROOT / "services" / "recommendations"
+DEFAULT_OUTPUT = SERVICE_ROOT / "data" / "associations.bin"
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+sys.path.insert(0, str(SERVICE_ROOT))
+
+from app.arrays import StringTable  # noqa: E402
+from app.associations import MIN_SUPPORT, TOP_NEIGHBORS, AssociationMatrix  # noqa: E402
+from app.catalog import load_catalog  # noqa: E402
+from app.config import Settings  # noqa: E402
+from app.index import SuggestionIndex  # noqa: E402
+from app.snapshot import save_associations  # noqa: E402
+from app.text import normalize  # noqa: E402
+
+
+def read_rows(path: Path, table: str) -> Iterator[Tuple[str, str]]:
+    """``(list_id, label)`` pairs from a CSV export or a SQLite ``list_items`` table."""
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            # The table name cannot be a bound parameter; quote it as an identifier.
+            quoted = '"' + table.replace('"', '""') + '"'
+            for list_id, label in connection.execute(f"SELECT list_id, label FROM {quoted}"):
+                yield str(list_id), label or ""
+        finally:
+            connection.close()
+        return
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        missing = {"list_id", "label"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path} is missing column(s): {', '.join(sorted(missing))}")
+        for row in reader:
+            yield row["list_id"], row["label"] or ""
+
+
+def build_baskets(rows: Iterator[Tuple[str, str]], index: SuggestionIndex) -> Tuple[List[np.ndarray], Dict[str, int]]:
+    labels_by_list: Dict[str, Set[str]] = defaultdict(set)
+    count = 0
+    for list_id, label in rows:
+        count += 1
+        normalized = normalize(label)
+        if normalized:
+            labels_by_list[list_id].add(normalized)
+
+    # Resolve every distinct label once.
+    distinct = {label for labels in labels_by_list.values() for label in labels}
+    resolved = {label: index.resolve(label) for label in distinct}
+    resolved = {label: item_id for label, item_id in resolved.items() if item_id >= 0}
+    baskets = [
+        np.array([resolved[label] for label in labels if label in resolved], dtype=np.int64)
+        for labels in labels_by_list.values()
+    ]
+    stats = {
+        "rows": count,
+        "lists": len(labels_by_list),
+        "labels": len(distinct),
+        "resolved_labels": len(resolved),
+    }
+    return baskets, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("history", type=Path, help="list_items export (.csv, or .db/.sqlite/.sqlite3)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"matrix path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--top-n", type=int, default=TOP_NEIGHBORS, help="neighbors kept per item")
+    parser.add_argument("--min-support", type=int, default=MIN_SUPPORT, help="minimum lists a pair must share")
+    parser.add_argument("--table", default="list_items", help="SQLite table to read (default: list_items)")
+    args = parser.parse_args()
+
+    if not args.history.exists():
+        print(f"{args.history} not found", file=sys.stderr)
+        return 1
+
+    settings = Settings.from_env()
+    start = time.perf_counter()
+    catalog = load_catalog(settings.catalog_path, settings.dictionary_path)
+    index = SuggestionIndex(catalog, max_distance=settings.fuzzy_max_distance)
+    baskets, stats = build_baskets(read_rows(args.history, args.table), index)
+    matrix = AssociationMatrix.from_baskets(baskets, len(catalog), top_n=args.top_n, min_support=args.min_support)
+    matrix.names = StringTable.from_strings(item.name for item in catalog.items)
+    build_s = time.perf_counter() - start
+
+    meta = {
+        **stats,
+        "top_n": args.top_n,
+        "min_support": args.min_support,
+        "catalog_version": catalog.version,
+        "source": args.history.name,
+    }
+    size = save_associations(args.output, matrix, meta)
+    rows_with_neighbors = int(np.count_nonzero(np.diff(matrix.ptr)))
+    print(
+        f"Wrote {args.output} ({size / 1024:.1f} KiB): {stats['lists']} lists, "
+        f"{stats['resolved_labels']}/{stats['labels']} labels resolved, {len(matrix)} pairs over "
+        f"{rows_with_neighbors} items; {build_s:.2f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
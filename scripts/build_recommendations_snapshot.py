@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Build the recommendations service index snapshot.
+
+Loads the shared catalog, builds the suggestion index shards (shared plus one
+per region, unless RECO_LOCALE_SHARDS=0), the autocomplete index and the
+columnar price store and writes them as one mmap-able binary file. The
+association matrix named by RECO_ASSOCIATIONS, if any, is aligned to each
+shard and embedded, and so is the /classify dictionary classifier built from
+the food dictionary. Point the service at it with RECO_INDEX_SNAPSHOT so every
+worker maps the same read-only pages at startup instead of rebuilding the
+index from the TypeScript catalog.
+
+Usage:
+  python scripts/build_recommendations_snapshot.py [--output PATH]
+
+Catalog inputs and index knobs come from the same RECO_* environment
+variables the service reads (see services/recommendations/README.md).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SERVICE_ROOT = ROOT / "services" / "recommendations"
+DEFAULT_OUTPUT = SERVICE_ROOT / "data" / "suggestion-index.bin"
+
+sys.path.insert(0, str(SERVICE_ROOT))
+
+from app.config import Settings  # noqa: E402
+from app.reload import build_catalog_indexes  # noqa: E402
+from app.snapshot import load_indexes, save_indexes  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"snapshot path (default: {DEFAULT_OUTPUT})")
+    args = parser.parse_args()
+
+    settings = Settings.from_env()
+    start = time.perf_counter()
+    shards, prefixes, prices = build_catalog_indexes(settings)
+    build_s = time.perf_counter() - start
+
+    size = save_indexes(args.output, shards, prefixes, prices)
+
+    start = time.perf_counter()
+    loaded, _, loaded_prices = load_indexes(args.output)
+    load_ms = (time.perf_counter() - start) * 1000
+    classifier_stats = shards.classifier.stats() if shards.classifier is not None else None
+    loaded_classifier_stats = loaded.classifier.stats() if loaded.classifier is not None else None
+    price_stats = prices.stats() if prices is not None else None
+    loaded_price_stats = loaded_prices.stats() if loaded_prices is not None else None
+    if (
+        loaded.stats() != shards.stats()
+        or loaded.version != shards.version
+        or loaded_classifier_stats != classifier_stats
+        or loaded_price_stats != price_stats
+    ):
+        print(f"Snapshot verification failed for {args.output}", file=sys.stderr)
+        return 1
+
+    print(
+        f"Wrote {args.output} ({size / 1024:.1f} KiB, shards {shards.stats()}, classifier {classifier_stats}, "
+        f"prices {price_stats}, "
+        f"catalog {shards.version}); "
+        f"build {build_s:.2f}s, mmap load {load_ms:.1f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""
+Streaming reader for the CSV blocks of the western food dictionary.
+
+`docs/data/food-dictionary-western-part{2,3,4}.md` hold one CSV table under
+each `## <Section> (CSV)` heading. A block starts at an `Item,` header line
+and ends at the next blank line, `---` rule or heading. Each file is read
+line by line and every table line is tokenized once, into:
+
+- `CsvBlock`: a table header, with its section and line number
+- `CsvRow`: one data row, with its block and line number
+
+`scripts/generate_western_catalog.py` and
+`scripts/validate_food_dictionary_csv.py` both read the parts through this
+module. `read_parts` reads several parts in parallel, one file per process,
+once they are large enough to be worth the process start-up.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CSV_PARTS = [
+    ROOT / "docs" / "data" / "food-dictionary-western-part2.md",
+    ROOT / "docs" / "data" / "food-dictionary-western-part3.md",
+    ROOT / "docs" / "data" / "food-dictionary-western-part4.md",
+]
+
+EXPECTED_HEADER = [
+    "Item",
+    "Category",
+    "JM",
+    "TT",
+    "PR",
+    "DO",
+    "HT",
+    "US",
+    "CA",
+    "MX",
+    "BR",
+    "CO",
+    "Variants",
+    "Packaging",
+]
+
+# Below this many bytes in total, parts are read in-process: starting the
+# worker processes costs more than the parsing.
+PARALLEL_MIN_BYTES = 512 * 1024
+
+
+@dataclass(frozen=True)
+class CsvBlock:
+    path: Path
+    line_no: int
+    section: str
+    header: tuple[str, ...]
+    raw_line: str
+
+
+@dataclass(frozen=True)
+class CsvRow:
+    block: CsvBlock
+    line_no: int
+    fields: tuple[str, ...]
+    raw_line: str
+
+    def get(self, column: str) -> Optional[str]:
+        """The field under ``column``, or ``None`` when the row is too short or the header has no such column."""
+        try:
+            index = self.block.header.index(column)
+        except ValueError:
+            return None
+        return self.fields[index] if index < len(self.fields) else None
+
+
+CsvRecord = Union[CsvBlock, CsvRow]
+
+
+def _tokenize(line: str) -> tuple[str, ...]:
+    return tuple(next(csv.reader((line,)), ()))
+
+
+def iter_part(path: Path) -> Iterator[CsvRecord]:
+    """Every block header and data row of one part, in file order."""
+    block: Optional[CsvBlock] = None
+    section = ""
+    with path.open(encoding="utf-8", newline="") as handle:
+        for line_no, raw in enumerate(handle, start=1):
+            line = raw.rstrip("\r\n")
+            if line_no == 1:
+                line = line.lstrip("\ufeff")
+            stripped = line.strip()
+            if stripped.startswith("## "):
+                block = None
+                section = stripped[3:].split("(")[0].strip()
+            elif not stripped or stripped.startswith(("---", "#")):
+                block = None
+            elif stripped.startswith("Item,"):
+                block = CsvBlock(path=path, line_no=line_no, section=section, header=_tokenize(line), raw_line=line)
+                yield block
+            elif block is not None:
+                yield CsvRow(block=block, line_no=line_no, fields=_tokenize(line), raw_line=line)
+
+
+def read_part(path: Path) -> list[CsvRecord]:
+    return list(iter_part(path))
+
+
+def read_parts(paths: Sequence[Path], workers: Optional[int] = None) -> list[list[CsvRecord]]:
+    """The records of every part, in order of ``paths``.
+
+    With more than one worker each file is read in its own process. By
+    default parts are read in parallel, up to one process per core, only
+    once they add up to ``PARALLEL_MIN_BYTES``.
+    """
+    if workers is None:
+        size = sum(path.stat().st_size for path in paths)
+        workers = min(len(paths), os.cpu_count() or 1) if size >= PARALLEL_MIN_BYTES else 1
+    if workers <= 1 or len(paths) <= 1:
+        return [read_part(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(read_part, paths))
@@ -1,12 +1,53 @@
 #!/usr/bin/env python3
-import csv
+"""
+Generate the shared western food dictionary and catalog from docs/data/*.
+
+Writes the Supabase dictionary seeds
+(supabase/functions/_shared/food-dictionary-western-part1.ts) and the Expo
+catalog bundle (apps/mobile/src/catalog/data/western-shared.ts).
+
+Builds are incremental: parsed items and their catalog records are cached
+per source part under .cache/western-catalog/, keyed by the SHA-256 of the
+part and of the generator itself (code, tables and capture timestamp), so
+only edited parts are re-parsed. Outputs are rewritten only when their bytes
+change, and a run whose inputs and outputs all match the last build returns
+without rendering anything.
+
+The CSV parts are read through scripts/food_dictionary_csv.py, the reader
+the validator uses; stale parts are read in parallel, one per process, once
+they are large enough.
+
+With --format shards (or both) the catalog is also, or instead, written as
+compact JSON shards, one per region (or per region and category with
+--shard-by-category), next to a manifest.json with the catalog version,
+per-region counts and each shard's record count, size and SHA-256, so
+consumers can load only the regions they need. With --delta, a catalog that
+changed since the previous shards also gets a compact delta under deltas/
+(records added, removed and changed, field by field, keyed on name and
+region), listed in the manifest so clients can patch instead of reloading.
+
+Usage:
+  python scripts/generate_western_catalog.py [--force] [--cache-dir PATH] [--workers N]
+      [--format ts|shards|both] [--shard-dir PATH] [--shard-by-category]
+      [--delta] [--keep-deltas N]
+"""
+import argparse
+import functools
+import gc
 import hashlib
+import itertools
 import json
 import math
+import os
 import re
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import food_dictionary_csv
+from food_dictionary_csv import CsvRecord, CsvRow, read_part, read_parts
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_PART1 = ROOT / "docs" / "data" / "food-dictionary-western-part1.md"
@@ -15,6 +56,17 @@ DATA_PART3 = ROOT / "docs" / "data" / "food-dictionary-western-part3.md"
 DATA_PART4 = ROOT / "docs" / "data" / "food-dictionary-western-part4.md"
 DICT_TS_PATH = ROOT / "supabase" / "functions" / "_shared" / "food-dictionary-western-part1.ts"
 CATALOG_TS_PATH = ROOT / "apps" / "mobile" / "src" / "catalog" / "data" / "western-shared.ts"
+CATALOG_SHARD_DIR = ROOT / "apps" / "mobile" / "src" / "catalog" / "data" / "western-shared"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+DELTA_DIR = "deltas"
+WESTERN_SHARED_VERSION = "2025.11.12-v0.2"
+CATALOG_REGIONS = ("jm", "us", "cn")
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "western-catalog"
+CACHE_FILE = "build-cache.json"
+# Bump when the cache layout changes.
+CACHE_VERSION = 1
+WRITE_BUFFER_BYTES = 1 << 20
 
 CATEGORY_MAP: Dict[str, str] = {
     "Baking Supplies": "pantry",
@@ -151,19 +203,50 @@ def clean_alias_text(value: str) -> str:
     return cleaned
 
 
-def determine_regions(name: str, aliases: List[str], category: str) -> List[str]:
+def _keyword_pattern(trie: Dict[str, Dict]) -> str:
+    branches = [re.escape(char) + _keyword_pattern(child) for char, child in sorted(trie.items()) if char]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    return f"(?:{pattern})?" if "" in trie else pattern
+
+
+def keyword_matcher(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """One compiled regex that finds any of ``keywords`` in a text.
+
+    Duplicates are dropped and the keywords are factored by shared prefix
+    ("bok", "bok choy", "bok choi" become ``bok(?: cho(?:i|y))?``), so a
+    search tries one branch per character instead of every keyword in turn.
+    """
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return re.compile(_keyword_pattern(trie))
+
+
+REGION_MATCHERS = {"jm": keyword_matcher(REGION_KEYWORDS_JM), "cn": keyword_matcher(REGION_KEYWORDS_CN)}
+
+
+def name_digest(name: str) -> "hashlib._Hash":
+    """SHA-1 state after the item name: the region draw, price and store hashes all start with it."""
+    return hashlib.sha1(name.encode("utf-8"))
+
+
+def _prefix_hash(digest: "hashlib._Hash", suffix: str) -> int:
+    """First 32 bits of the SHA-1 of the name plus ``suffix``."""
+    digest = digest.copy()
+    digest.update(suffix.encode("utf-8"))
+    return int.from_bytes(digest.digest()[:4], "big")
+
+
+def determine_regions(name: str, aliases: List[str], category: str, digest: Optional["hashlib._Hash"] = None) -> List[str]:
     text = f"{name} {' '.join(aliases)}".lower()
-    regions = set()
-    for marker in REGION_KEYWORDS_JM:
-        if marker in text:
-            regions.add("jm")
-            break
-    for marker in REGION_KEYWORDS_CN:
-        if marker in text:
-            regions.add("cn")
-            break
+    regions = {region for region, matcher in REGION_MATCHERS.items() if matcher.search(text)}
     # baseline hashed assignment to balance coverage
-    hashed = int(hashlib.sha1(name.encode("utf-8")).hexdigest(), 16)
+    hashed = int.from_bytes((digest or name_digest(name)).digest(), "big")
     chooser = hashed % 10
     if chooser < 5:
         regions.add("us")
@@ -176,9 +259,9 @@ def determine_regions(name: str, aliases: List[str], category: str) -> List[str]
     return sorted(regions)
 
 
-def price_for_item(name: str, category: str, region: str) -> float:
+def price_for_item(name: str, category: str, region: str, digest: Optional["hashlib._Hash"] = None) -> float:
     low, high = PRICE_RANGES.get(category, (2.0, 8.0))
-    hashed = int(hashlib.sha1((name + region).encode("utf-8")).hexdigest()[:8], 16)
+    hashed = _prefix_hash(digest or name_digest(name), region)
     scale = (hashed % 1000) / 999
     usd_price = low + (high - low) * scale
     regional_price = usd_price * FX[region]
@@ -187,20 +270,28 @@ def price_for_item(name: str, category: str, region: str) -> float:
     return round(regional_price, 2)
 
 
+@functools.lru_cache(maxsize=None)
+def _packaging_unit(token: str) -> Optional[str]:
+    for needle, unit in PACKAGING_TOKEN_MAP:
+        if needle in token:
+            return unit
+    return None
+
+
 def packaging_to_unit(packaging: List[str]) -> str:
+    # The dictionary uses a few dozen packaging phrases, so each is matched once.
     for pkg in packaging:
-        token = pkg.lower()
-        for needle, unit in PACKAGING_TOKEN_MAP:
-            if needle in token:
-                return unit
+        unit = _packaging_unit(pkg.lower())
+        if unit:
+            return unit
     return "ea"
 
 
-def parse_markdown() -> List[Dict]:
+def parse_markdown(path: Path = DATA_PART1) -> List[Dict]:
     items = []
-    if not DATA_PART1.exists():
+    if not path.exists():
         return items
-    with DATA_PART1.open(encoding="utf-8") as handle:
+    with path.open(encoding="utf-8") as handle:
         for line in handle:
             stripped = line.strip()
             if not stripped.startswith("* **"):
@@ -240,64 +331,110 @@ def parse_markdown() -> List[Dict]:
 CSV_DATA_FILES = [DATA_PART2, DATA_PART3, DATA_PART4]
 
 
-def parse_csv_tables() -> List[Dict]:
-    items: List[Dict] = []
+def parse_csv_tables(workers: Optional[int] = None) -> List[Dict]:
+    paths = [path for path in CSV_DATA_FILES if path.exists()]
+    return [item for records in read_parts(paths, workers) for item in csv_items(records)]
+
+
+def parse_csv_file(csv_path: Path) -> List[Dict]:
+    return csv_items(read_part(csv_path)) if csv_path.exists() else []
 
-    def flush_table(buffer: List[str], section: str):
-        if not buffer:
-            return
-        reader = csv.DictReader(buffer)
-        for row in reader:
-            name = (row.get("Item") or "").strip()
-            if not name:
-                continue
-            raw_category = (row.get("Category") or section or "Pantry").strip()
-            category, tags = map_category(raw_category)
-            alias_values = []
-            for col in REGION_COLUMNS:
-                alias = clean_alias_text(row.get(col, ""))
-                if alias:
-                    alias_values.append(alias)
-            variants = parse_variants(row.get("Variants", ""))
-            packaging = split_multi(row.get("Packaging", ""))
-            items.append({
-                "name": name,
-                "raw_category": raw_category,
-                "category": category,
-                "aliases": alias_values,
-                "variants": variants,
-                "packaging": packaging,
-                "tags": tags + [raw_category.lower()],
-                "source_tag": "western-v0.2",
-            })
 
-    for csv_path in CSV_DATA_FILES:
-        if not csv_path.exists():
+def region_fields(row: CsvRow) -> Optional[Dict[str, str]]:
+    """The region-column values of ``row``, or None if they cannot be attributed to a region.
+
+    Most rows wider than their header carry surplus empty placeholders
+    among the region columns ("Coffee (Ground),Beverages,,,,,,,coffee,..."
+    has six empty Caribbean fields for five columns). Such a row is read
+    between the Category column and the trailing Variants and Packaging
+    columns, provided every way of dropping the surplus empty fields gives
+    the same values. Narrower rows, rows whose item name was split on a
+    comma, and rows whose surplus could sit in more than one place are left
+    out.
+    """
+    header_width = len(row.block.header)
+    if len(row.fields) == header_width:
+        return {col: row.get(col) or "" for col in REGION_COLUMNS}
+    name = row.fields[0]
+    if len(row.fields) < header_width or name.count("(") != name.count(")"):
+        return None
+    values = row.fields[2:-2]
+    surplus = len(values) - len(REGION_COLUMNS)
+    empty = [position for position, value in enumerate(values) if not value.strip()]
+    readings = {
+        tuple(value for position, value in enumerate(values) if position not in dropped)
+        for dropped in itertools.combinations(empty, surplus)
+    }
+    if len(readings) != 1:
+        return None
+    return dict(zip(REGION_COLUMNS, readings.pop()))
+
+
+def csv_items(records: Sequence[CsvRecord]) -> List[Dict]:
+    """Dictionary items from the rows of one CSV part, as read by `food_dictionary_csv`."""
+    items: List[Dict] = []
+    for row in records:
+        if not isinstance(row, CsvRow):
             continue
-        current_section = ""
-        table_lines: List[str] = []
-        with csv_path.open(encoding="utf-8") as handle:
-            for raw in handle:
-                stripped = raw.strip()
-                if stripped.startswith("## "):
-                    flush_table(table_lines, current_section)
-                    table_lines = []
-                    current_section = stripped[3:].split("(")[0].strip()
-                    continue
-                if not stripped or stripped.startswith("---"):
-                    flush_table(table_lines, current_section)
-                    table_lines = []
-                    continue
-                if stripped.startswith("Item,"):
-                    flush_table(table_lines, current_section)
-                    table_lines = [raw]
-                    continue
-                if table_lines:
-                    table_lines.append(raw)
-            flush_table(table_lines, current_section)
+        name = (row.get("Item") or "").strip()
+        if not name:
+            continue
+        raw_category = (row.get("Category") or row.block.section or "Pantry").strip()
+        category, tags = map_category(raw_category)
+        alias_values = []
+        for col in REGION_COLUMNS:
+            alias = clean_alias_text(row.get(col))
+            if alias:
+                alias_values.append(alias)
+        regions = region_fields(row)
+        regional_aliases = {}
+        for col, value in (regions or {}).items():
+            alias = clean_alias_text(value)
+            if alias:
+                regional_aliases[col] = alias
+        variants = parse_variants(row.get("Variants"))
+        packaging = split_multi(row.get("Packaging"))
+        item = {
+            "name": name,
+            "raw_category": raw_category,
+            "category": category,
+            "aliases": alias_values,
+            "regional_aliases": regional_aliases,
+            "variants": variants,
+            "packaging": packaging,
+            "tags": tags + [raw_category.lower()],
+            "source_tag": "western-v0.2",
+        }
+        if regions is None:
+            location = row.block.path.relative_to(ROOT) if row.block.path.is_relative_to(ROOT) else row.block.path
+            item["misaligned_row"] = {
+                "location": f"{location}:{row.line_no}",
+                "message": f"field count mismatch: got {len(row.fields)} expected {len(row.block.header)}",
+                "raw_line": row.raw_line,
+            }
+        items.append(item)
     return items
 
 
+def report_misaligned_rows(items: Sequence[Dict], max_rows: int = 60) -> None:
+    """List the CSV rows whose regionalAliases were left out, in the validator's format."""
+    rows = [item["misaligned_row"] for item in items if "misaligned_row" in item]
+    if not rows:
+        return
+    print(
+        f"{len(rows)} CSV rows could not be aligned with their header; their regionalAliases were left out:",
+        file=sys.stderr,
+    )
+    for row in rows[:max_rows]:
+        print(f"- {row['location']}: {row['message']}", file=sys.stderr)
+        print(f"  {row['raw_line']}", file=sys.stderr)
+    if len(rows) > max_rows:
+        print(f"... plus {len(rows) - max_rows} more rows.", file=sys.stderr)
+
+
+SOURCE_PARTS = [DATA_PART1, *CSV_DATA_FILES]
+
+
 def format_ts_value(value, indent=0):
     space = " " * indent
     if isinstance(value, str):
@@ -325,121 +462,615 @@ def format_ts_value(value, indent=0):
     raise TypeError(f"Unsupported type: {type(value)}")
 
 
-def write_dictionary_ts(items: List[Dict]):
-    seeds = []
+def _matches(path: Path, chunks: Iterable[str]) -> bool:
+    """Whether ``path`` holds exactly the UTF-8 bytes of ``chunks``, compared chunk by chunk."""
+    if not path.exists():
+        return False
+    with path.open("rb") as handle:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            if handle.read(len(data)) != data:
+                return False
+        return not handle.read(1)
+
+
+def write_if_changed(path: Path, emit: Callable[[], Iterable[str]]) -> bool:
+    """Stream ``emit()`` to ``path`` unless the file already holds exactly those bytes.
+
+    The existing file is compared against a first pass of the emitter
+    without writing anything. Only when it differs is a second pass written
+    through a buffered temporary file next to it and moved into place, so
+    memory stays flat however large the output is and readers never see a
+    partial file.
+    """
+    if _matches(path, emit()):
+        return False
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("w", encoding="utf-8", newline="\n", buffering=WRITE_BUFFER_BYTES) as handle:
+        handle.writelines(emit())
+    os.replace(temporary, path)
+    return True
+
+
+def dictionary_seed(item: Dict) -> Dict:
+    seed = {
+        "category": item["category"],
+        "product": item["name"],
+        "aliases": item["aliases"],
+        "regionalAliases": item.get("regional_aliases") or None,
+        "variants": item["variants"] or None,
+        "packaging": item["packaging"] or None,
+        "tags": sorted(
+            set(
+                item["tags"]
+                + [item.get("source_tag", "western-shared")]
+                + [v.lower() for v in item["variants"]]
+            )
+        ),
+    }
+    # Remove None fields
+    return {k: v for k, v in seed.items() if v}
+
+
+def iter_dictionary_ts(items: Iterable[Dict]) -> Iterator[str]:
+    yield "import type { ExpandableSeed } from './food-dictionary-types.ts';\n\nexport const westernPart1Seeds: ExpandableSeed[] = [\n"
     for item in items:
-        seed = {
+        fields = "".join(f"    {key}: {format_ts_value(value, 4)},\n" for key, value in dictionary_seed(item).items())
+        yield f"  {{\n{fields}  }},\n"
+    yield "];\n"
+
+
+def write_dictionary_ts(items: List[Dict], path: Path = DICT_TS_PATH) -> bool:
+    return write_if_changed(path, lambda: iter_dictionary_ts(items))
+
+
+def catalog_captured_at() -> int:
+    return int(datetime(2025, 1, 15).timestamp()) * 1000
+
+
+def catalog_records_for(item: Dict, captured_at: int) -> List[Tuple[str, Dict]]:
+    """``(region, record)`` for every region ``item`` is sold in."""
+    records = []
+    digest = name_digest(item["name"])
+    regions = determine_regions(item["name"], item["aliases"], item["category"], digest)
+    base_unit = packaging_to_unit(item["packaging"])
+    tags = sorted(set(item["tags"] + ["western-shared", "culinary", item["category"]]))
+    for region in regions:
+        store_list = STORE_BY_REGION[region]
+        # NOTE: Do not use Python's built-in `hash()` here. Since Python 3.3 it is
+        # randomized per-process (PYTHONHASHSEED) which would make this script's
+        # output non-deterministic across runs/machines.
+        store_index = _prefix_hash(digest, f"|{region}|store") % len(store_list)
+        record = {
+            "name": item["name"],
             "category": item["category"],
-            "product": item["name"],
-            "aliases": item["aliases"],
-            "variants": item["variants"] or None,
-            "packaging": item["packaging"] or None,
-            "tags": sorted(
-                set(
-                    item["tags"]
-                    + [item.get("source_tag", "western-shared")]
-                    + [v.lower() for v in item["variants"]]
-                )
-            ),
+            "sizeValue": 1,
+            "sizeUnit": base_unit,
+            "tags": tags,
+            "region": region.upper(),
+            "prices": [
+                {
+                    "store": store_list[store_index],
+                    "unitPrice": price_for_item(item["name"], item["category"], region, digest),
+                    "currency": CURRENCY[region],
+                    "capturedAt": captured_at,
+                }
+            ],
         }
-        # Remove None fields
-        seed = {k: v for k, v in seed.items() if v}
-        seeds.append(seed)
-    lines = ["import type { ExpandableSeed } from './food-dictionary-types.ts';", "", "export const westernPart1Seeds: ExpandableSeed[] = ["]
-    for seed in seeds:
-        lines.append("  {")
-        for key, value in seed.items():
-            ts_value = format_ts_value(value, 4)
-            lines.append(f"    {key}: {ts_value},")
-        lines.append("  },")
-    lines.append("];")
-    DICT_TS_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        records.append((region, record))
+    return records
 
 
-def build_catalog_records(items: List[Dict]):
-    captured_at = int(datetime(2025, 1, 15).timestamp()) * 1000
-    by_region = {"jm": [], "us": [], "cn": []}
-    for item in items:
-        regions = determine_regions(item["name"], item["aliases"], item["category"])
-        base_unit = packaging_to_unit(item["packaging"])
-        tags = sorted(set(item["tags"] + ["western-shared", "culinary", item["category"]]))
-        for region in regions:
-            store_list = STORE_BY_REGION[region]
-            # NOTE: Do not use Python's built-in `hash()` here. Since Python 3.3 it is
-            # randomized per-process (PYTHONHASHSEED) which would make this script's
-            # output non-deterministic across runs/machines.
-            store_hash = int(
-                hashlib.sha1(f"{item['name']}|{region}|store".encode("utf-8")).hexdigest()[:8],
-                16,
-            )
-            store_index = store_hash % len(store_list)
-            record = {
-                "name": item["name"],
-                "category": item["category"],
-                "sizeValue": 1,
-                "sizeUnit": base_unit,
-                "tags": tags,
-                "region": region.upper(),
-                "prices": [
-                    {
-                        "store": store_list[store_index],
-                        "unitPrice": price_for_item(item["name"], item["category"], region),
-                        "currency": CURRENCY[region],
-                        "capturedAt": captured_at,
-                    }
-                ],
-            }
-            by_region[region].append(record)
+def group_catalog_records(records: List[Tuple[str, Dict]]) -> Dict[str, List[Dict]]:
+    by_region: Dict[str, List[Dict]] = {"jm": [], "us": [], "cn": []}
+    for region, record in records:
+        by_region[region].append(record)
     # sort for determinism
     for region in by_region:
         by_region[region] = sorted(by_region[region], key=lambda rec: rec["name"])
     return by_region
 
 
-def write_catalog_ts(by_region: Dict[str, List[Dict]]):
-    header = [
-        "import type { CatalogRecord } from '../types';",
-        "",
-        "export type WesternSharedCatalog = {",
-        "  jm: CatalogRecord[];",
-        "  us: CatalogRecord[];",
-        "  cn: CatalogRecord[];",
-        "};",
-        "",
-        "export const WESTERN_SHARED_VERSION = '2025.11.12-v0.2';",
-        "export const WESTERN_SHARED_COUNT = {",
-        f"  jm: {len(by_region['jm'])},",
-        f"  us: {len(by_region['us'])},",
-        f"  cn: {len(by_region['cn'])},",
-        "};",
-        "",
-        "export const westernSharedCatalog: WesternSharedCatalog = {",
-    ]
-    body = []
-    for region in ("jm", "us", "cn"):
-        body.append(f"  {region}: [")
+def build_catalog_records(items: List[Dict]):
+    captured_at = catalog_captured_at()
+    # Every record is a fresh, acyclic dict that lives until the outputs are
+    # written; collection passes over them only grow with the catalog.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return group_catalog_records([pair for item in items for pair in catalog_records_for(item, captured_at)])
+    finally:
+        if enabled:
+            gc.enable()
+
+
+CATALOG_RECORD_KEYS = ("name", "category", "sizeValue", "sizeUnit", "tags", "region", "prices")
+CATALOG_PRICE_KEYS = ("store", "unitPrice", "currency", "capturedAt")
+
+
+def catalog_record_ts(record: Dict) -> str:
+    """One catalog record as its lines in `western-shared.ts`.
+
+    Records of the shape `catalog_records_for` builds (one price) are filled
+    into a fixed template; anything else goes through `format_ts_value`.
+    Both produce the same text.
+    """
+    prices = record.get("prices")
+    if (
+        tuple(record) != CATALOG_RECORD_KEYS
+        or not isinstance(prices, list)
+        or len(prices) != 1
+        or not isinstance(prices[0], dict)
+        or tuple(prices[0]) != CATALOG_PRICE_KEYS
+    ):
+        fields = "".join(f"      {key}: {format_ts_value(value, 6)},\n" for key, value in record.items())
+        return f"    {{\n{fields}    }},\n"
+    price = prices[0]
+    return (
+        "    {\n"
+        f"      name: {format_ts_value(record['name'])},\n"
+        f"      category: {format_ts_value(record['category'])},\n"
+        f"      sizeValue: {format_ts_value(record['sizeValue'])},\n"
+        f"      sizeUnit: {format_ts_value(record['sizeUnit'])},\n"
+        f"      tags: {format_ts_value(record['tags'])},\n"
+        f"      region: {format_ts_value(record['region'])},\n"
+        "      prices: [{\n"
+        f"        store: {format_ts_value(price['store'])},\n"
+        f"        unitPrice: {format_ts_value(price['unitPrice'])},\n"
+        f"        currency: {format_ts_value(price['currency'])},\n"
+        f"        capturedAt: {format_ts_value(price['capturedAt'])}\n"
+        "      }],\n"
+        "    },\n"
+    )
+
+
+def iter_catalog_ts(by_region: Dict[str, List[Dict]]) -> Iterator[str]:
+    yield (
+        "import type { CatalogRecord } from '../types';\n"
+        "\n"
+        "export type WesternSharedCatalog = {\n"
+        "  jm: CatalogRecord[];\n"
+        "  us: CatalogRecord[];\n"
+        "  cn: CatalogRecord[];\n"
+        "};\n"
+        "\n"
+        f"export const WESTERN_SHARED_VERSION = '{WESTERN_SHARED_VERSION}';\n"
+        "export const WESTERN_SHARED_COUNT = {\n"
+        f"  jm: {len(by_region['jm'])},\n"
+        f"  us: {len(by_region['us'])},\n"
+        f"  cn: {len(by_region['cn'])},\n"
+        "};\n"
+        "\n"
+        "export const westernSharedCatalog: WesternSharedCatalog = {\n"
+    )
+    for region in CATALOG_REGIONS:
+        yield f"  {region}: [\n"
         for record in by_region[region]:
-            body.append("    {")
-            for key, value in record.items():
-                ts_value = format_ts_value(value, 6)
-                body.append(f"      {key}: {ts_value},")
-            body.append("    },")
-        body.append("  ],")
-    footer = ["};"]
-    CATALOG_TS_PATH.write_text("\n".join(header + body + footer) + "\n", encoding="utf-8")
+            yield catalog_record_ts(record)
+        yield "  ],\n"
+    yield "};\n"
+
+
+def write_catalog_ts(by_region: Dict[str, List[Dict]], path: Path = CATALOG_TS_PATH) -> bool:
+    return write_if_changed(path, lambda: iter_catalog_ts(by_region))
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(WRITE_BUFFER_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def generator_fingerprint(captured_at: int) -> str:
+    """Hash of everything besides the source parts that shapes the outputs.
+
+    The bytes of this script and of the CSV reader cover the code and tables;
+    the capture timestamp depends on the local timezone, so it is part of the
+    key too.
+    """
+    sources = b"".join(Path(module.__file__).read_bytes() for module in (sys.modules[__name__], food_dictionary_csv))
+    return sha256_hex(f"{CACHE_VERSION}|{captured_at}|".encode("utf-8") + sources)
+
+
+def load_cache(path: Path, fingerprint: str) -> Dict:
+    """The cache at ``path``, or an empty one if it is missing, unreadable or from another generator."""
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) and cache.get("fingerprint") == fingerprint else {}
+
+
+def save_cache(path: Path, cache: Dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def iter_shard_json(records: Iterable[Dict]) -> Iterator[str]:
+    """A JSON array of ``records``, compact, one chunk per record."""
+    separator = "["
+    for record in records:
+        yield separator + json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        separator = ","
+    yield "[]\n" if separator == "[" else "]\n"
+
+
+def catalog_shards(by_region: Dict[str, List[Dict]], by_category: bool) -> Dict[str, Tuple[str, Optional[str], List[Dict]]]:
+    """``relative path -> (region, category, records)`` for every non-empty shard, in catalog order."""
+    shards: Dict[str, Tuple[str, Optional[str], List[Dict]]] = {}
+    for region in CATALOG_REGIONS:
+        records = by_region[region]
+        if not by_category:
+            shards[f"{region}.json"] = (region, None, records)
+            continue
+        for category in sorted({record["category"] for record in records}):
+            shards[f"{region}/{category}.json"] = (
+                region,
+                category,
+                [record for record in records if record["category"] == category],
+            )
+    return shards
+
+
+def shard_order(by_region: Dict[str, List[Dict]], by_category: bool) -> Dict[str, List[Dict]]:
+    """The catalog as a reader puts it back together from its shards.
+
+    Each region's shards are concatenated in manifest order and sorted by
+    name, as ``group_catalog_records`` sorts them. Region shards give back
+    the generator order; with ``by_category``, records that share a name
+    but not a category follow their shards' order instead.
+    """
+    by_shards: Dict[str, List[Dict]] = {region: [] for region in CATALOG_REGIONS}
+    for region, _, records in catalog_shards(by_region, by_category).values():
+        by_shards[region].extend(records)
+    for records in by_shards.values():
+        records.sort(key=lambda rec: rec["name"])
+    return by_shards
+
+
+def catalog_digest(by_region: Dict[str, List[Dict]]) -> str:
+    """SHA-256 of the catalog's content, whatever its shard layout and the order of records sharing a name."""
+    digest = hashlib.sha256()
+    for region in CATALOG_REGIONS:
+        digest.update(f"{region}\n".encode("utf-8"))
+        records = by_region.get(region, ())
+        lines = sorted(json.dumps(record, ensure_ascii=False, separators=(",", ":")) for record in records)
+        digest.update("".join(f"{line}\n" for line in lines).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def keyed_records(records: Iterable[Dict]) -> Dict[Tuple[str, int], Dict]:
+    """Records of one region by ``(name, occurrence)``; a name can repeat within a region."""
+    keyed: Dict[Tuple[str, int], Dict] = {}
+    seen: Dict[str, int] = {}
+    for record in records:
+        occurrence = seen.get(record["name"], 0)
+        seen[record["name"]] = occurrence + 1
+        keyed[(record["name"], occurrence)] = record
+    return keyed
+
+
+def _patched(record: Dict, change: Dict) -> Dict:
+    if "record" in change:
+        return change["record"]
+    patched = {**record, **change.get("set", {})}
+    for field in change.get("unset", ()):
+        patched.pop(field, None)
+    return patched
+
+
+def catalog_delta(previous: Dict[str, List[Dict]], current: Dict[str, List[Dict]]) -> Dict:
+    """Records added, removed and changed between two catalogs, keyed on name and region.
+
+    A changed record lists only the fields that differ (``set``, ``unset``);
+    when that would not rebuild its exact field order the whole record is
+    sent instead (``record``). ``index`` tells apart records that share a
+    name within a region.
+    """
+    added: List[Dict] = []
+    removed: List[Dict] = []
+    changed: List[Dict] = []
+    for region in CATALOG_REGIONS:
+        before = keyed_records(previous.get(region, ()))
+        after = keyed_records(current.get(region, ()))
+        for (name, index), record in after.items():
+            old = before.get((name, index))
+            if old is None:
+                added.append({"region": region, "index": index, "record": record})
+                continue
+            if list(old.items()) == list(record.items()):
+                continue
+            change: Dict = {"region": region, "name": name, "index": index}
+            updates = {field: value for field, value in record.items() if field not in old or old[field] != value}
+            if updates:
+                change["set"] = updates
+            missing = [field for field in old if field not in record]
+            if missing:
+                change["unset"] = missing
+            if list(_patched(old, change).items()) != list(record.items()):
+                change = {"region": region, "name": name, "index": index, "record": record}
+            changed.append(change)
+        removed.extend(
+            {"region": region, "name": name, "index": index} for name, index in before if (name, index) not in after
+        )
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def apply_catalog_delta(previous: Dict[str, List[Dict]], delta: Dict) -> Dict[str, List[Dict]]:
+    """The catalog ``delta`` turns ``previous`` into, in the order of the catalog it was taken against."""
+    keyed = {region: keyed_records(previous.get(region, ())) for region in CATALOG_REGIONS}
+    for entry in delta["removed"]:
+        del keyed[entry["region"]][(entry["name"], entry["index"])]
+    for entry in delta["changed"]:
+        key = (entry["name"], entry["index"])
+        keyed[entry["region"]][key] = _patched(keyed[entry["region"]][key], entry)
+    for entry in delta["added"]:
+        keyed[entry["region"]][(entry["record"]["name"], entry["index"])] = entry["record"]
+    # Occurrences of a name are numbered in catalog order, so (name, occurrence) restores it.
+    return {region: [records[key] for key in sorted(records)] for region, records in keyed.items()}
+
+
+def read_manifest(directory: Path) -> Optional[Dict]:
+    try:
+        manifest = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) and isinstance(manifest.get("shards"), list) else None
+
+
+def read_catalog_shards(directory: Path, manifest: Dict) -> Optional[Dict[str, List[Dict]]]:
+    """The catalog a manifest describes, or ``None`` if a shard is missing or does not match its hash.
+
+    Records come back in ``shard_order``, as services/recommendations reads them.
+    """
+    by_region: Dict[str, List[Dict]] = {region: [] for region in CATALOG_REGIONS}
+    for shard in manifest["shards"]:
+        path = directory / shard["path"]
+        if not path.is_file() or file_sha256(path) != shard["sha256"]:
+            return None
+        by_region.setdefault(shard["region"], []).extend(json.loads(path.read_text(encoding="utf-8")))
+    for records in by_region.values():
+        records.sort(key=lambda rec: rec["name"])
+    return by_region
+
+
+def write_catalog_delta(
+    previous: Dict[str, List[Dict]],
+    current: Dict[str, List[Dict]],
+    directory: Path,
+    from_digest: str,
+    to_digest: str,
+) -> Dict:
+    """Write the delta between two catalogs under ``deltas/`` and return its manifest entry."""
+    delta = catalog_delta(previous, current)
+    if apply_catalog_delta(previous, delta) != current:
+        raise AssertionError("catalog delta does not reproduce the new catalog")
+    relative = f"{DELTA_DIR}/{from_digest[:12]}-{to_digest[:12]}.json"
+    path = directory / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "format": MANIFEST_FORMAT,
+        "from": from_digest,
+        "to": to_digest,
+        "version": WESTERN_SHARED_VERSION,
+        **delta,
+    }
+    text = json.dumps(document, ensure_ascii=False, separators=(",", ":")) + "\n"
+    write_if_changed(path, lambda: iter((text,)))
+    return {
+        "path": relative,
+        "from": from_digest,
+        "to": to_digest,
+        "added": len(delta["added"]),
+        "removed": len(delta["removed"]),
+        "changed": len(delta["changed"]),
+        "bytes": path.stat().st_size,
+        "sha256": file_sha256(path),
+    }
+
+
+def _remove_stale(directory: Path, previous: Iterable[str], current: Iterable[str]):
+    """Delete files listed in the previous manifest that the new one no longer lists."""
+    keep = set(current)
+    for relative in previous:
+        stale = directory / relative
+        if relative not in keep and stale.is_file() and stale.resolve().is_relative_to(directory.resolve()):
+            stale.unlink()
+            if stale.parent != directory and not any(stale.parent.iterdir()):
+                stale.parent.rmdir()
+
+
+def write_catalog_shards(
+    by_region: Dict[str, List[Dict]],
+    directory: Path,
+    by_category: bool = False,
+    keep_deltas: Optional[int] = None,
+) -> Tuple[int, List[Path]]:
+    """Write the catalog as compact JSON shards plus a manifest; returns (files rewritten, files written).
+
+    One shard per region (``jm.json``), or per region and category
+    (``jm/pantry.json``) with ``by_category``. The manifest lists every
+    shard with its region, category, record count, size and SHA-256, plus
+    the catalog version, content digest and per-region counts, so a consumer
+    can load only the shards it needs and check them. Shards listed in the
+    previous manifest that are no longer produced are removed.
+
+    With ``keep_deltas``, a catalog whose content changed since the previous
+    manifest also gets a delta from the previous catalog (see
+    ``catalog_delta``), and the manifest keeps the newest ``keep_deltas``
+    of them, oldest first, so a client can chain the ones after the digest
+    it has instead of reloading every shard. Without it the previous
+    manifest's deltas are carried over as they are.
+    """
+    previous_manifest = read_manifest(directory) or {}
+    previous_shards = [shard["path"] for shard in previous_manifest.get("shards", [])]
+    deltas: List[Dict] = list(previous_manifest.get("deltas", []))
+    digest = catalog_digest(by_region)
+    previous_digest = previous_manifest.get("sha256")
+
+    # The previous shards are read before they are overwritten.
+    if keep_deltas and previous_digest and previous_digest != digest:
+        previous = read_catalog_shards(directory, previous_manifest)
+        if previous is None:
+            print(f"Skipping the catalog delta: {directory / MANIFEST_NAME} does not match its shards.")
+        else:
+            current = shard_order(by_region, by_category)
+            deltas.append(write_catalog_delta(previous, current, directory, previous_digest, digest))
+    if keep_deltas:
+        deltas = deltas[-keep_deltas:]
+
+    written = 0
+    entries = []
+    paths: List[Path] = []
+    for relative, (region, category, records) in catalog_shards(by_region, by_category).items():
+        path = directory / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written += write_if_changed(path, lambda records=records: iter_shard_json(records))
+        entries.append(
+            {
+                "path": relative,
+                "region": region,
+                "category": category,
+                "count": len(records),
+                "bytes": path.stat().st_size,
+                "sha256": file_sha256(path),
+            }
+        )
+        paths.append(path)
+    _remove_stale(
+        directory,
+        [*previous_shards, *(delta["path"] for delta in previous_manifest.get("deltas", []))],
+        [*(entry["path"] for entry in entries), *(delta["path"] for delta in deltas)],
+    )
+
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": WESTERN_SHARED_VERSION,
+        "sha256": digest,
+        "shardBy": "category" if by_category else "region",
+        "counts": {region: len(by_region[region]) for region in CATALOG_REGIONS},
+        "shards": entries,
+        "deltas": deltas,
+    }
+    text = json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
+    manifest_path = directory / MANIFEST_NAME
+    written += write_if_changed(manifest_path, lambda: iter((text,)))
+    return written, [*paths, *(directory / delta["path"] for delta in deltas), manifest_path]
+
+
+def output_digests(paths: Iterable[Path]) -> Dict[str, Optional[str]]:
+    """SHA-256 of every output by repo-relative path (absolute outside the repo)."""
+    digests: Dict[str, Optional[str]] = {}
+    for path in paths:
+        key = str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+        digests[key] = file_sha256(path) if path.exists() else None
+    return digests
 
 
 def main():
-    items = parse_markdown() + parse_csv_tables()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="ignore the build cache and re-parse every part")
+    parser.add_argument(
+        "--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help=f"build cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="processes reading the CSV parts (default: one per part on large inputs)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("ts", "shards", "both"),
+        default="ts",
+        help="catalog output: the western-shared.ts module, JSON shards with a manifest, or both (default: ts)",
+    )
+    parser.add_argument(
+        "--shard-dir", type=Path, default=CATALOG_SHARD_DIR, help=f"JSON shard directory (default: {CATALOG_SHARD_DIR})"
+    )
+    parser.add_argument("--shard-by-category", action="store_true", help="split each region's shard by category")
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="also write a delta from the previous shards when the catalog changed (needs --format shards or both)",
+    )
+    parser.add_argument("--keep-deltas", type=int, default=10, help="deltas kept in the manifest with --delta (default: 10)")
+    args = parser.parse_args()
+    if args.delta and args.format == "ts":
+        parser.error("--delta needs --format shards or both")
+    shard_dir = args.shard_dir.resolve()
+
+    start = time.perf_counter()
+    captured_at = catalog_captured_at()
+    fingerprint = generator_fingerprint(captured_at)
+    cache_path = args.cache_dir / CACHE_FILE
+    cache = {} if args.force else load_cache(cache_path, fingerprint)
+    cached_parts = cache.get("parts", {})
+
+    digests = {path: file_sha256(path) for path in SOURCE_PARTS if path.exists()}
+    stale = [path for path, digest in digests.items() if cached_parts.get(path.name, {}).get("sha256") != digest]
+    stale_csv = [path for path in stale if path in CSV_DATA_FILES]
+    csv_records = dict(zip(stale_csv, read_parts(stale_csv, args.workers)))
+
+    parts: Dict[str, Dict] = {}
+    for path, digest in digests.items():
+        if path not in stale:
+            parts[path.name] = cached_parts[path.name]
+            continue
+        items = parse_markdown(path) if path == DATA_PART1 else csv_items(csv_records[path])
+        records = [[region, record] for item in items for region, record in catalog_records_for(item, captured_at)]
+        parts[path.name] = {"sha256": digest, "items": items, "records": records}
+    reused = len(parts) - len(stale)
+
+    items = [item for part in parts.values() for item in part["items"]]
+    options = f"{args.format}:{shard_dir}:{args.shard_by_category}:{args.delta and args.keep_deltas}"
+    inputs = sha256_hex(
+        "|".join([fingerprint, options, *(f"{name}:{part['sha256']}" for name, part in parts.items())]).encode()
+    )
+    previous = cache.get("outputs", {})
+    files = previous.get("files")
+    if previous.get("inputs") == inputs and files and files == output_digests(ROOT / name for name in files):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Up to date: {len(items)} dictionary seeds and {previous['records']} catalog records ({elapsed_ms:.0f} ms).")
+        report_misaligned_rows(items)
+        return
+
     if len(items) < 800:
         raise ValueError(f"Expected >=800 combined items, found {len(items)}")
-    write_dictionary_ts(items)
-    catalog = build_catalog_records(items)
+    catalog = group_catalog_records([(region, record) for part in parts.values() for region, record in part["records"]])
     total = sum(len(records) for records in catalog.values())
     if total < 250:
         raise ValueError("Generated catalog below 250 entries")
-    write_catalog_ts(catalog)
-    print(f"Generated {len(items)} dictionary seeds and {total} catalog records.")
+    written = int(write_dictionary_ts(items))
+    outputs = [DICT_TS_PATH]
+    if args.format in ("ts", "both"):
+        written += write_catalog_ts(catalog)
+        outputs.append(CATALOG_TS_PATH)
+    if args.format in ("shards", "both"):
+        shards_written, shard_paths = write_catalog_shards(
+            catalog, shard_dir, args.shard_by_category, args.keep_deltas if args.delta else None
+        )
+        written += shards_written
+        outputs.extend(shard_paths)
+    save_cache(
+        cache_path,
+        {
+            "fingerprint": fingerprint,
+            "parts": parts,
+            "outputs": {"inputs": inputs, "files": output_digests(outputs), "records": total},
+        },
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(
+        f"Generated {len(items)} dictionary seeds and {total} catalog records "
+        f"({reused}/{len(parts)} parts cached, {written} files rewritten, {elapsed_ms:.0f} ms)."
+    )
+    report_misaligned_rows(items)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+import copy
+import json
+
+import pytest
+
+from food_dictionary_csv import EXPECTED_HEADER, CsvBlock, CsvRow
+from generate_western_catalog import (
+    ROOT,
+    apply_catalog_delta,
+    build_catalog_records,
+    catalog_delta,
+    catalog_digest,
+    parse_csv_tables,
+    parse_markdown,
+    read_catalog_shards,
+    read_manifest,
+    region_fields,
+    shard_order,
+    write_catalog_shards,
+)
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return build_catalog_records(parse_markdown() + parse_csv_tables())
+
+
+def edited(catalog):
+    changed = copy.deepcopy(catalog)
+    changed["us"][5]["sizeUnit"] = "kg"
+    del changed["us"][5]["tags"]
+    del changed["jm"][3]
+    changed["cn"].insert(0, dict(changed["cn"][0], name="Aaa New Item"))
+    return changed
+
+
+def test_delta_round_trip(catalog):
+    changed = edited(catalog)
+    delta = catalog_delta(catalog, changed)
+    assert apply_catalog_delta(catalog, delta) == changed
+    assert apply_catalog_delta(changed, catalog_delta(changed, catalog)) == catalog
+    assert catalog_delta(catalog, catalog) == {"added": [], "removed": [], "changed": []}
+    assert [entry["record"]["name"] for entry in delta["added"]] == ["Aaa New Item"]
+    assert [entry["region"] for entry in delta["removed"]] == ["jm"]
+    assert "us" in {entry["region"] for entry in delta["changed"]}
+
+
+@pytest.mark.parametrize("by_category", [False, True])
+def test_shards_and_deltas_round_trip(catalog, tmp_path, by_category):
+    write_catalog_shards(catalog, tmp_path, by_category, keep_deltas=5)
+    manifest = read_manifest(tmp_path)
+    before = read_catalog_shards(tmp_path, manifest)
+    assert before == shard_order(catalog, by_category)
+    if not by_category:
+        assert before == catalog
+    assert manifest["sha256"] == catalog_digest(catalog) == catalog_digest(before)
+
+    changed = edited(catalog)
+    write_catalog_shards(changed, tmp_path, by_category, keep_deltas=5)
+    manifest = read_manifest(tmp_path)
+    entry = manifest["deltas"][-1]
+    assert (entry["from"], entry["to"]) == (catalog_digest(catalog), catalog_digest(changed))
+    delta = json.loads((tmp_path / entry["path"]).read_text(encoding="utf-8"))
+    assert apply_catalog_delta(before, delta) == read_catalog_shards(tmp_path, manifest)
+
+
+def row(line: str) -> CsvRow:
+    block = CsvBlock(path=ROOT / "part.md", line_no=1, section="", header=tuple(EXPECTED_HEADER), raw_line="")
+    return CsvRow(block=block, line_no=2, fields=tuple(line.split(",")), raw_line=line)
+
+
+def test_region_fields_of_an_aligned_row():
+    fields = region_fields(row("Bammy,Bakery,bammy,,,,,,,,,arepa de yuca,Traditional,pack"))
+    assert fields["JM"] == "bammy"
+    assert fields["CO"] == "arepa de yuca"
+
+
+def test_region_fields_drop_surplus_empty_placeholders():
+    fields = region_fields(row("Lemonade,Beverages,,,,,,,lemonade,lemonade,limonada,limonada,limonada,Still,bottle"))
+    assert fields == {
+        "JM": "", "TT": "", "PR": "", "DO": "", "HT": "",
+        "US": "lemonade", "CA": "lemonade", "MX": "limonada", "BR": "limonada", "CO": "limonada",
+    }
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "Bagel,Bakery,,,,,,,bagel,bagel,bagel,Plain,bag",
+        "Salmon (Pink, Canned),Seafood,,,,,,,pink salmon,pink salmon,salmón,salmão,salmón,Boneless,can",
+        "Sauce,Condiments,,,,,,,buffalo,buffalo,salsa,,salsa,Mild,bottle",
+    ],
+)
+def test_region_fields_leave_out_rows_they_cannot_align(line):
+    assert region_fields(row(line)) is None
@@ -12,41 +12,23 @@ This script is intentionally strict and reports:
 - unexpected/missing headers
 - per-row field-count mismatches with file + line numbers
 
+The parts are read through `scripts/food_dictionary_csv.py`, the same
+streaming reader the generator uses, so both agree on where blocks start and
+end.
+
 Run:
-  python3 scripts/validate_food_dictionary_csv.py
+  python3 scripts/validate_food_dictionary_csv.py [--workers N]
 """
 
 from __future__ import annotations
 
-import csv
+import argparse
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Sequence
 
-
-ROOT = Path(__file__).resolve().parents[1]
-CSV_PARTS = [
-    ROOT / "docs" / "data" / "food-dictionary-western-part2.md",
-    ROOT / "docs" / "data" / "food-dictionary-western-part3.md",
-    ROOT / "docs" / "data" / "food-dictionary-western-part4.md",
-]
-
-EXPECTED_HEADER = [
-    "Item",
-    "Category",
-    "JM",
-    "TT",
-    "PR",
-    "DO",
-    "HT",
-    "US",
-    "CA",
-    "MX",
-    "BR",
-    "CO",
-    "Variants",
-    "Packaging",
-]
+from food_dictionary_csv import CSV_PARTS, EXPECTED_HEADER, ROOT, CsvBlock, CsvRecord, read_part, read_parts
 
 
 @dataclass(frozen=True)
@@ -57,91 +39,77 @@ class CsvIssue:
     raw_line: str
 
 
-def iter_csv_blocks(lines: list[str]) -> list[tuple[int, list[str]]]:
-    blocks: list[tuple[int, list[str]]] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].lstrip("\ufeff")
-        if line.startswith("Item,Category,"):
-            start_line_no = i + 1
-            block = [line]
-            i += 1
-            while i < len(lines):
-                next_line = lines[i]
-                if not next_line.strip():
-                    break
-                if next_line.startswith("---") or next_line.startswith("#"):
-                    break
-                if next_line.startswith("## "):
-                    break
-                block.append(next_line)
-                i += 1
-            blocks.append((start_line_no, block))
-        else:
-            i += 1
-    return blocks
-
-
-def validate_file(path: Path) -> tuple[int, int, list[CsvIssue]]:
-    if not path.exists():
-        return 0, 0, [CsvIssue(path=path, line_no=0, message="missing file", raw_line="")]
-
-    lines = path.read_text(encoding="utf-8").splitlines()
-    blocks = iter_csv_blocks(lines)
+def check_records(path: Path, records: Sequence[CsvRecord]) -> tuple[int, int, list[CsvIssue]]:
+    """Block count, row count and issues of one part's records (see `food_dictionary_csv`)."""
     issues: list[CsvIssue] = []
-
+    total_blocks = 0
     total_rows = 0
-    for start_line_no, block_lines in blocks:
-        reader = csv.reader(block_lines)
-        header = next(reader, None)
-        if not header:
-            issues.append(
-                CsvIssue(
-                    path=path,
-                    line_no=start_line_no,
-                    message="empty CSV header",
-                    raw_line=block_lines[0] if block_lines else "",
+    for record in records:
+        if isinstance(record, CsvBlock):
+            total_blocks += 1
+            if not record.header:
+                issues.append(CsvIssue(path=path, line_no=record.line_no, message="empty CSV header", raw_line=record.raw_line))
+            elif list(record.header) != EXPECTED_HEADER:
+                issues.append(
+                    CsvIssue(
+                        path=path,
+                        line_no=record.line_no,
+                        message=f"unexpected header: got {list(record.header)} expected {EXPECTED_HEADER}",
+                        raw_line=record.raw_line,
+                    )
                 )
-            )
             continue
 
-        if header != EXPECTED_HEADER:
+        # Rows of a block without a header have nothing to be checked against.
+        if not record.block.header:
+            continue
+        total_rows += 1
+        expected_len = len(record.block.header)
+        if len(record.fields) != expected_len:
             issues.append(
                 CsvIssue(
                     path=path,
-                    line_no=start_line_no,
-                    message=f"unexpected header: got {header} expected {EXPECTED_HEADER}",
-                    raw_line=block_lines[0],
+                    line_no=record.line_no,
+                    message=f"field count mismatch: got {len(record.fields)} expected {expected_len}",
+                    raw_line=record.raw_line,
                 )
             )
 
-        expected_len = len(header)
-        for offset, row in enumerate(reader, start=1):
-            total_rows += 1
-            if len(row) != expected_len:
-                raw_line = block_lines[offset] if offset < len(block_lines) else ""
-                issues.append(
-                    CsvIssue(
-                        path=path,
-                        line_no=start_line_no + offset,
-                        message=f"field count mismatch: got {len(row)} expected {expected_len}",
-                        raw_line=raw_line,
-                    )
-                )
+    return total_blocks, total_rows, issues
+
 
-    return len(blocks), total_rows, issues
+def validate_file(path: Path) -> tuple[int, int, list[CsvIssue]]:
+    if not path.exists():
+        return 0, 0, [CsvIssue(path=path, line_no=0, message="missing file", raw_line="")]
+    return check_records(path, read_part(path))
 
 
-def main() -> int:
+def validate_parts(paths: Sequence[Path], workers: Optional[int] = None) -> tuple[int, int, list[CsvIssue]]:
+    """`validate_file` over every part, reading the existing ones in parallel (see `read_parts`)."""
+    existing = [path for path in paths if path.exists()]
+    results = dict(zip(existing, read_parts(existing, workers)))
     total_blocks = 0
     total_rows = 0
     all_issues: list[CsvIssue] = []
-
-    for path in CSV_PARTS:
-        blocks, rows, issues = validate_file(path)
+    for path in paths:
+        if path not in results:
+            all_issues.append(CsvIssue(path=path, line_no=0, message="missing file", raw_line=""))
+            continue
+        blocks, rows, issues = check_records(path, results[path])
         total_blocks += blocks
         total_rows += rows
         all_issues.extend(issues)
+    return total_blocks, total_rows, all_issues
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="processes reading the parts (default: one per part on large inputs)"
+    )
+    args = parser.parse_args()
+
+    total_blocks, total_rows, all_issues = validate_parts(CSV_PARTS, args.workers)
 
     if not all_issues:
         print(f"Food dictionary CSV validation: OK ({total_blocks} blocks, {total_rows} rows).")
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import zlib
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+
+def key_hash(value: str) -> int:
+    """Stable 63-bit hash (``hash()`` is salted per process and cannot be persisted).
+
+    Lookups always verify the string, so collisions only cost an extra compare.
+    """
+    return _bytes_hash(value.encode("utf-8"))
+
+
+def _bytes_hash(data: bytes) -> int:
+    return (zlib.crc32(data) & 0x7FFFFFFF) << 32 | zlib.adler32(data)
+
+
+def csr_from_lists(rows: Sequence[Sequence[int]], dtype=np.int32) -> Dict[str, np.ndarray]:
+    lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    ptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=ptr[1:])
+    values = np.fromiter((value for row in rows for value in row), dtype=dtype, count=int(ptr[-1]))
+    return {"ptr": ptr, "values": values}
+
+
+def gather_slices(ptr: np.ndarray, rows: np.ndarray, cap: int = 0) -> np.ndarray:
+    """Positions of every value in the CSR rows ``rows`` (each truncated to ``cap`` when set)."""
+    starts = ptr[rows]
+    lengths = ptr[rows + 1] - starts
+    if cap:
+        lengths = np.minimum(lengths, cap)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+
+
+class StringTable:
+    """Immutable list of strings stored as one UTF-8 blob plus offsets.
+
+    ``find`` looks a string up through a sorted array of stable hashes with
+    ``np.searchsorted``, so tables loaded from a memory-mapped snapshot answer
+    lookups without building a per-process ``dict``.
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray, hashes: np.ndarray, order: np.ndarray):
+        self._blob = blob
+        self._view = memoryview(blob)
+        self._offsets = offsets
+        self._hashes = hashes
+        self._order = order
+
+    @classmethod
+    def from_strings(cls, values: Iterable[str]) -> "StringTable":
+        encoded: List[bytes] = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8) if encoded else np.zeros(0, dtype=np.uint8)
+        hashes = np.fromiter((_bytes_hash(value) for value in encoded), dtype=np.int64, count=len(encoded))
+        order = np.argsort(hashes, kind="stable").astype(np.int32)
+        return cls(blob, offsets, hashes[order], order)
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], prefix: str) -> "StringTable":
+        return cls(
+            arrays[f"{prefix}.blob"],
+            arrays[f"{prefix}.offsets"],
+            arrays[f"{prefix}.hashes"],
+            arrays[f"{prefix}.order"],
+        )
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        return {
+            f"{prefix}.blob": self._blob,
+            f"{prefix}.offsets": self._offsets,
+            f"{prefix}.hashes": self._hashes,
+            f"{prefix}.order": self._order,
+        }
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        start = int(self._offsets[position])
+        end = int(self._offsets[position + 1])
+        return str(self._view[start:end], "utf-8")
+
+    def take(self, positions: np.ndarray) -> List[str]:
+        """Decode several strings at once (one offsets gather instead of one per string)."""
+        view = self._view
+        starts = self._offsets[positions].tolist()
+        ends = self._offsets[positions + 1].tolist()
+        return [str(view[start:end], "utf-8") for start, end in zip(starts, ends)]
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def find(self, value: str) -> int:
+        """Position of ``value`` in the table, or ``-1``."""
+        target = key_hash(value)
+        slot = int(np.searchsorted(self._hashes, target))
+        while slot < len(self._hashes) and int(self._hashes[slot]) == target:
+            position = int(self._order[slot])
+            if self[position] == value:
+                return position
+            slot += 1
+        return -1
+
+    def find_many(self, values: Sequence[str]) -> List[int]:
+        """Positions of several strings (``-1`` for missing) with one ``searchsorted`` call."""
+        targets = np.fromiter((key_hash(value) for value in values), dtype=np.int64, count=len(values))
+        slots = np.searchsorted(self._hashes, targets).tolist()
+        hashes = self._hashes
+        positions: List[int] = []
+        for value, target, slot in zip(values, targets.tolist(), slots):
+            position = -1
+            while slot < len(hashes) and int(hashes[slot]) == target:
+                if self[int(self._order[slot])] == value:
+                    position = int(self._order[slot])
+                    break
+                slot += 1
+            positions.append(position)
+        return positions
+
+    def bisect_left(self, value: str, lo: int = 0) -> int:
+        """Binary search over a table whose strings were added in sorted order."""
+        hi = len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .arrays import StringTable, gather_slices
+
+# Neighbors kept per item; scoring cost is O(context items × TOP_NEIGHBORS).
+TOP_NEIGHBORS = 20
+# Pairs seen on fewer lists than this are noise, however high their lift.
+MIN_SUPPORT = 3
+# Pending pair codes are folded into the running counts past this many.
+_PAIR_CHUNK = 4_000_000
+
+
+class AssociationMatrix:
+    """Item–item association scores from shopping-list co-occurrence, as CSR rows.
+
+    Row ``i`` lists the items most often bought with item ``i``, best first,
+    scored by normalized pointwise mutual information: the log lift of the
+    pair divided by ``-log P(pair)``, in ``(0, 1]``. Only positive
+    associations with at least ``min_support`` co-occurrences are kept, and
+    each row is truncated to its ``top_n`` neighbors.
+
+    A matrix built offline carries the item ``names`` of its rows so it can
+    be aligned with another catalog (or a locale shard) by :meth:`align`;
+    the aligned copy an index serves is keyed by that index's item ids.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        ptr: np.ndarray,
+        neighbors: np.ndarray,
+        scores: np.ndarray,
+        names: Optional[StringTable] = None,
+    ):
+        self.size = size
+        self.ptr = ptr
+        self.neighbors = neighbors
+        self.scores = scores
+        self.names = names
+
+    @classmethod
+    def empty(cls, size: int) -> "AssociationMatrix":
+        return cls(size, np.zeros(size + 1, dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))
+
+    @classmethod
+    def from_baskets(
+        cls,
+        baskets: Iterable[np.ndarray],
+        size: int,
+        top_n: int = TOP_NEIGHBORS,
+        min_support: int = MIN_SUPPORT,
+    ) -> "AssociationMatrix":
+        """Count co-occurrences over baskets of distinct item ids (one per shopping list)."""
+        item_counts = np.zeros(size, dtype=np.int64)
+        codes = np.zeros(0, dtype=np.int64)
+        counts = np.zeros(0, dtype=np.int64)
+        pending: List[np.ndarray] = []
+        pending_pairs = 0
+        lists = 0
+        for basket in baskets:
+            basket = np.unique(np.asarray(basket, dtype=np.int64))
+            if basket.size == 0:
+                continue
+            lists += 1
+            item_counts[basket] += 1
+            if basket.size < 2:
+                continue
+            first, second = np.triu_indices(basket.size, 1)
+            pending.append(basket[first] * size + basket[second])
+            pending_pairs += first.size
+            if pending_pairs >= _PAIR_CHUNK:
+                codes, counts = _fold(codes, counts, pending)
+                pending, pending_pairs = [], 0
+        codes, counts = _fold(codes, counts, pending)
+
+        keep = counts >= min_support
+        codes, counts = codes[keep], counts[keep].astype(np.float64)
+        if codes.size == 0:
+            return cls.empty(size)
+        first, second = codes // size, codes % size
+        joint = counts / lists
+        lift = joint / ((item_counts[first] / lists) * (item_counts[second] / lists))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            npmi = np.where(joint < 1.0, np.log(lift) / -np.log(joint), 1.0)
+        positive = npmi > 0
+        first, second, npmi = first[positive], second[positive], npmi[positive]
+
+        # Associations are symmetric; store both directions, then keep each row's best.
+        rows = np.concatenate((first, second))
+        neighbors = np.concatenate((second, first))
+        scores = np.concatenate((npmi, npmi)).astype(np.float32)
+        return cls._from_coordinates(size, rows, neighbors, scores, top_n)
+
+    @classmethod
+    def _from_coordinates(
+        cls, size: int, rows: np.ndarray, neighbors: np.ndarray, scores: np.ndarray, top_n: Optional[int] = None
+    ) -> "AssociationMatrix":
+        order = np.lexsort((neighbors, -scores, rows))
+        rows, neighbors, scores = rows[order], neighbors[order], scores[order]
+        ptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=size), out=ptr[1:])
+        if top_n is not None:
+            keep = np.arange(rows.size) - ptr[rows] < top_n
+            rows, neighbors, scores = rows[keep], neighbors[keep], scores[keep]
+            np.cumsum(np.bincount(rows, minlength=size), out=ptr[1:])
+        return cls(size, ptr, neighbors.astype(np.int32), scores.astype(np.float32))
+
+    @classmethod
+    def from_arrays(cls, size: int, arrays: Dict[str, np.ndarray]) -> "AssociationMatrix":
+        names = StringTable.from_arrays(arrays, "associations.names") if "associations.names.blob" in arrays else None
+        return cls(
+            size,
+            arrays["associations.ptr"],
+            arrays["associations.neighbors"],
+            arrays["associations.scores"],
+            names,
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = self.names.to_arrays("associations.names") if self.names is not None else {}
+        arrays.update({
+            "associations.ptr": self.ptr,
+            "associations.neighbors": self.neighbors,
+            "associations.scores": self.scores,
+        })
+        return arrays
+
+    def __len__(self) -> int:
+        """Number of stored (item, neighbor) pairs."""
+        return int(self.ptr[-1])
+
+    def align(self, names: Sequence[str]) -> "AssociationMatrix":
+        """Re-key the rows by position in ``names``, dropping items that are not in it."""
+        if self.names is None:
+            raise ValueError("only a matrix built with item names can be aligned")
+        target = StringTable.from_strings(names)
+        mapping = np.array(target.find_many(list(self.names)), dtype=np.int64)
+        rows = mapping[np.repeat(np.arange(self.size), np.diff(self.ptr))]
+        neighbors = mapping[self.neighbors]
+        keep = (rows >= 0) & (neighbors >= 0)
+        return self._from_coordinates(len(names), rows[keep], neighbors[keep], self.scores[keep])
+
+    def affinity(self, item_ids: np.ndarray) -> Optional[np.ndarray]:
+        """Strongest association of every item with any of ``item_ids``, or ``None`` if there is none."""
+        if item_ids.size == 0 or not len(self):
+            return None
+        positions = gather_slices(self.ptr, item_ids)
+        if positions.size == 0:
+            return None
+        scores = np.zeros(self.size, dtype=np.float32)
+        np.maximum.at(scores, self.neighbors[positions], self.scores[positions])
+        return scores
+
+    def neighbors_of(self, item_id: int) -> List[Tuple[int, float]]:
+        start, end = self.ptr[item_id:item_id + 2].tolist()
+        return list(zip(self.neighbors[start:end].tolist(), self.scores[start:end].tolist()))
+
+
+def _fold(codes: np.ndarray, counts: np.ndarray, pending: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    if not pending:
+        return codes, counts
+    merged = np.concatenate([codes, *pending])
+    weights = np.concatenate([counts, np.ones(merged.size - codes.size, dtype=np.int64)])
+    unique, inverse = np.unique(merged, return_inverse=True)
+    return unique, np.bincount(inverse, weights=weights, minlength=unique.size).astype(np.int64)
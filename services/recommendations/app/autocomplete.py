@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .arrays import StringTable, csr_from_lists
+from .catalog import Catalog, CatalogItem
+from .text import normalize, tokens
+
+DEFAULT_TOP_K = 10
+# Prefixes longer than this are answered from the sorted key array instead of
+# the prefix table; by then the matching range is only a handful of keys.
+MAX_TRIE_DEPTH = 12
+
+Rank = Tuple[int, int, int, str]
+
+
+def static_rank(item: CatalogItem, key: str, is_alias: bool, is_word_start: bool) -> Rank:
+    """Lower sorts first: names over aliases, term starts over mid-term words, broader regional availability, shorter keys."""
+    return (
+        int(is_alias) * 2 + int(not is_word_start),
+        -len(item.regions),
+        len(key),
+        item.name.lower(),
+    )
+
+
+class PrefixIndex:
+    """Flattened trie over catalog names and aliases with a precomputed top-k per prefix.
+
+    Every word suffix of a term is inserted ("coconut milk" is reachable from
+    both "coc" and "mil"). Keys are inserted in static rank order, so each
+    prefix's top list is simply the first ``top_k`` distinct items to pass
+    through it and a lookup is one hashed probe with no scoring.
+
+    The trie nodes are stored as a :class:`StringTable` of prefixes plus a CSR
+    array of item ids, so the structure can be written to and mapped from an
+    index snapshot like :class:`~app.index.SuggestionIndex`.
+    """
+
+    def __init__(self, catalog: Catalog, top_k: int = DEFAULT_TOP_K, max_depth: int = MAX_TRIE_DEPTH):
+        entries: List[Tuple[Rank, str, int]] = []
+        for item in catalog.items:
+            seen = set()
+            for position, raw in enumerate((item.name, *item.aliases)):
+                term = normalize(raw)
+                if not term or term in seen:
+                    continue
+                seen.add(term)
+                words = tokens(term)
+                for offset in range(len(words)):
+                    key = " ".join(words[offset:])
+                    rank = static_rank(item, key, position > 0, offset == 0)
+                    entries.append((rank, key, item.item_id))
+        entries.sort()
+
+        top: Dict[str, List[int]] = {}
+        for _, key, item_id in entries:
+            for depth in range(1, min(len(key), max_depth) + 1):
+                node = top.setdefault(key[:depth], [])
+                if len(node) < top_k and item_id not in node:
+                    node.append(item_id)
+
+        prefixes = list(top)
+        top_csr = csr_from_lists([top[prefix] for prefix in prefixes])
+        # Keys sorted for range scans; the rank is the entry's global position.
+        by_key = sorted(range(len(entries)), key=lambda position: entries[position][1])
+        self._attach(
+            items=catalog.items,
+            top_k=top_k,
+            max_depth=max_depth,
+            prefixes=StringTable.from_strings(prefixes),
+            top_ptr=top_csr["ptr"],
+            top_items=top_csr["values"],
+            keys=StringTable.from_strings(entries[position][1] for position in by_key),
+            key_item=np.array([entries[position][2] for position in by_key], dtype=np.int32),
+            key_rank=np.array(by_key, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls, arrays: Dict[str, np.ndarray], meta: dict, items: Sequence[CatalogItem]
+    ) -> "PrefixIndex":
+        index = cls.__new__(cls)
+        index._attach(
+            items=items,
+            top_k=meta["top_k"],
+            max_depth=meta["max_depth"],
+            prefixes=StringTable.from_arrays(arrays, "autocomplete.prefixes"),
+            top_ptr=arrays["autocomplete.top_ptr"],
+            top_items=arrays["autocomplete.top_items"],
+            keys=StringTable.from_arrays(arrays, "autocomplete.keys"),
+            key_item=arrays["autocomplete.key_item"],
+            key_rank=arrays["autocomplete.key_rank"],
+        )
+        return index
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        arrays = self._prefixes.to_arrays("autocomplete.prefixes")
+        arrays.update(self._keys.to_arrays("autocomplete.keys"))
+        arrays.update({
+            "autocomplete.top_ptr": self._top_ptr,
+            "autocomplete.top_items": self._top_items,
+            "autocomplete.key_item": self._key_item,
+            "autocomplete.key_rank": self._key_rank,
+        })
+        return arrays, {"top_k": self.top_k, "max_depth": self.max_depth}
+
+    def _attach(
+        self,
+        items: Sequence[CatalogItem],
+        top_k: int,
+        max_depth: int,
+        prefixes: StringTable,
+        top_ptr: np.ndarray,
+        top_items: np.ndarray,
+        keys: StringTable,
+        key_item: np.ndarray,
+        key_rank: np.ndarray,
+    ) -> None:
+        self.items = items
+        self.top_k = top_k
+        self.max_depth = max_depth
+        self._prefixes = prefixes
+        self._top_ptr = top_ptr
+        self._top_items = top_items
+        self._keys = keys
+        self._key_item = key_item
+        self._key_rank = key_rank
+
+    def complete(self, prefix: str, limit: int = DEFAULT_TOP_K) -> List[CatalogItem]:
+        normalized = normalize(prefix)
+        if not normalized:
+            return []
+        if len(normalized) <= self.max_depth:
+            node = self._prefixes.find(normalized)
+            if node < 0:
+                return []
+            start = int(self._top_ptr[node])
+            end = min(int(self._top_ptr[node + 1]), start + limit)
+            item_ids = self._top_items[start:end].tolist()
+        else:
+            item_ids = self._complete_long(normalized, limit)
+        return [self.items[item_id] for item_id in item_ids]
+
+    def _complete_long(self, normalized: str, limit: int) -> List[int]:
+        start = self._keys.bisect_left(normalized)
+        end = self._keys.bisect_left(normalized + "\uffff", lo=start)
+        best: Dict[int, int] = {}
+        for item_id, rank in zip(self._key_item[start:end].tolist(), self._key_rank[start:end].tolist()):
+            if item_id not in best or rank < best[item_id]:
+                best[item_id] = rank
+        return heapq.nsmallest(limit, best, key=best.__getitem__)
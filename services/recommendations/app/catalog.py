@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .arrays import StringTable, csr_from_lists
+
+logger = logging.getLogger(__name__)
+
+# Used only when the generated catalog files are not available (e.g. the
+# Docker image, which is built from this directory and does not ship the
+# mobile/Supabase sources).
+SEED_CATALOG = [
+    "whole wheat bread",
+    "white bread",
+    "multigrain bread",
+    "almond milk",
+    "oat milk",
+    "cheddar cheese",
+    "gouda cheese",
+    "organic eggs",
+    "brown eggs",
+    "plantain chips",
+]
+
+_BARE_KEY = re.compile(r"^(\s*)([A-Za-z_][A-Za-z0-9_]*):", re.MULTILINE)
+_TRAILING_COMMA = re.compile(r",(\s*\n\s*[}\]])")
+# A double- or single-quoted TS string; only single-quoted ones (group 1) are rewritten.
+_TS_STRING = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'((?:[^\'\\\n]|\\.)*)\'')
+# Items materialized from an ItemTable that are kept per process; the hot
+# set (popular suggestions and completions) is far smaller than the catalog.
+MATERIALIZED_ITEMS = 4096
+
+
+@dataclass(frozen=True)
+class CatalogItem:
+    item_id: int
+    name: str
+    label: str
+    category: str
+    aliases: Tuple[str, ...]
+    regions: Tuple[str, ...]
+    tags: Tuple[str, ...]
+    source: str
+    # (region, local name) pairs from the dictionary's region columns, region lowercased.
+    regional_aliases: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class Catalog:
+    items: Sequence[CatalogItem]
+    version: str
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def parse_ts_literal(source: str, export_name: str, exported: bool = True):
+    """Extract the literal assigned to ``export const <export_name>`` from a generated TS module.
+
+    The generator (``scripts/generate_western_catalog.py``) emits JSON-encoded
+    strings with bare object keys and trailing commas, so quoting the keys and
+    dropping the trailing commas is enough to hand the literal to ``json``.
+    Hand-written modules also use single-quoted strings, which are re-quoted;
+    ``exported=False`` reads a module-private ``const``.
+    """
+    prefix = "export const" if exported else "const"
+    match = re.search(rf"^{prefix} {re.escape(export_name)}\b[^=]*=\s*", source, re.MULTILINE)
+    if not match:
+        raise ValueError(f"{prefix} {export_name!r} not found")
+    body = source[match.end():]
+    opener = body[:1]
+    closer = {"[": "]", "{": "}"}.get(opener)
+    if closer is None:
+        raise ValueError(f"{prefix} {export_name!r} is not an array or object literal")
+    end = body.find(f"\n{closer};")
+    if end == -1:
+        raise ValueError(f"unterminated literal for {export_name!r}")
+    literal = body[: end + 2]
+    literal = _TS_STRING.sub(_json_string, literal)
+    literal = _BARE_KEY.sub(r'\1"\2":', literal)
+    literal = _TRAILING_COMMA.sub(r"\1", literal)
+    return json.loads(literal)
+
+
+def _json_string(match: "re.Match[str]") -> str:
+    if match.group(1) is None:
+        return match.group(0)
+    return json.dumps(re.sub(r"\\(.)", r"\1", match.group(1)), ensure_ascii=False)
+
+
+def _parse_ts_string(source: str, export_name: str) -> str:
+    match = re.search(rf"export const {re.escape(export_name)}\s*=\s*'([^']*)'", source)
+    return match.group(1) if match else "unknown"
+
+
+def _dedupe(values: Iterable[str]) -> Tuple[str, ...]:
+    seen: Dict[str, str] = {}
+    for value in values:
+        if value and value.lower() not in seen:
+            seen[value.lower()] = value
+    return tuple(seen.values())
+
+
+def display_label(name: str) -> str:
+    """Title-case lowercase names once at load time; generated names are already display-cased."""
+    return name.title() if name == name.lower() else name
+
+
+def load_dictionary_seeds(dictionary_path: Path) -> List[dict]:
+    """The ``westernPart1Seeds`` records written by ``write_dictionary_ts``."""
+    return parse_ts_literal(dictionary_path.read_text(encoding="utf-8"), "westernPart1Seeds")
+
+
+def food_dictionary_seeds(core_path: Path, western_seeds: Sequence[dict]) -> List[dict]:
+    """Every seed ``foodDictionary`` in food-dictionary.ts expands, in ``dictionarySeeds`` order.
+
+    The hand-written seed arrays are read from ``core_path``; the generated
+    ``westernPart1Seeds`` it spreads last are the already loaded ``western_seeds``.
+    """
+    source = core_path.read_text(encoding="utf-8")
+    listing = source[source.index("const dictionarySeeds") :]
+    listing = listing[: listing.index("\n];")]
+    seeds: List[dict] = []
+    for name in re.findall(r"\.\.\.(\w+)", listing):
+        seeds.extend(western_seeds if name == "westernPart1Seeds" else parse_ts_literal(source, name, exported=False))
+    return seeds
+
+
+def load_catalog_shards(manifest_path: Path, regions: Optional[Sequence[str]] = None) -> Tuple[Dict[str, List[dict]], str]:
+    """Records of the JSON shards listed in a generator ``manifest.json``, by region, and the catalog version.
+
+    Only the shards of ``regions`` are read, when given. Every shard read is
+    checked against its manifest hash. Each region is stably sorted by name,
+    the generator's record order, so region shards load exactly as written;
+    a region split by category is put back in name order, with records that
+    share a name in shard order (``shard_order`` in the generator).
+    """
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    wanted = {region.lower() for region in regions} if regions else None
+    by_region: Dict[str, List[dict]] = {}
+    for shard in manifest["shards"]:
+        region = shard["region"]
+        if wanted is not None and region not in wanted:
+            continue
+        data = (manifest_path.parent / shard["path"]).read_bytes()
+        if hashlib.sha256(data).hexdigest() != shard["sha256"]:
+            raise ValueError(f"catalog shard {shard['path']} does not match {manifest_path.name}")
+        by_region.setdefault(region, []).extend(json.loads(data))
+    for region, records in by_region.items():
+        records.sort(key=lambda record: record["name"])
+    return by_region, manifest.get("version", "unknown")
+
+
+def load_catalog_records(
+    catalog_path: Path, regions: Optional[Sequence[str]] = None
+) -> Tuple[Dict[str, List[dict]], str]:
+    """The generated ``westernSharedCatalog`` records by region, and the catalog version.
+
+    ``catalog_path`` is either the ``western-shared.ts`` module or the
+    ``manifest.json`` of its JSON shards (``--format shards``); ``regions``
+    limits the records to those regions.
+    """
+    if catalog_path.suffix == ".json":
+        return load_catalog_shards(catalog_path, regions)
+    source = catalog_path.read_text(encoding="utf-8")
+    by_region = parse_ts_literal(source, "westernSharedCatalog")
+    if regions:
+        wanted = {region.lower() for region in regions}
+        by_region = {region: records for region, records in by_region.items() if region in wanted}
+    return by_region, _parse_ts_string(source, "WESTERN_SHARED_VERSION")
+
+
+def load_catalog(catalog_path: Path, dictionary_path: Path, regions: Optional[Sequence[str]] = None) -> Catalog:
+    """Merge the western-shared catalog and the food dictionary into one item per product name."""
+    if not catalog_path.exists():
+        logger.warning("catalog %s not found; falling back to the seed catalog", catalog_path)
+        return seed_catalog()
+    seeds = None
+    if dictionary_path.exists():
+        seeds = load_dictionary_seeds(dictionary_path)
+    else:
+        logger.warning("dictionary %s not found; indexing catalog names only", dictionary_path)
+    by_region, version = load_catalog_records(catalog_path, regions)
+    return merge_catalog(by_region, version, seeds)
+
+
+def merge_catalog(by_region: Dict[str, List[dict]], version: str, seeds: Optional[Sequence[dict]] = None) -> Catalog:
+    """One item per product name from already loaded catalog records and dictionary seeds."""
+    merged: Dict[str, dict] = {}
+
+    def entry_for(name: str, category: str) -> dict:
+        key = name.strip().lower()
+        if key not in merged:
+            merged[key] = {
+                "name": name.strip(),
+                "category": category,
+                "aliases": [],
+                "regional_aliases": [],
+                "regions": [],
+                "tags": [],
+            }
+        return merged[key]
+
+    for region, records in by_region.items():
+        for record in records:
+            entry = entry_for(record["name"], record["category"])
+            entry["regions"].append(region)
+            entry["tags"].extend(record.get("tags", []))
+
+    for seed in seeds or ():
+        entry = entry_for(seed["product"], seed["category"])
+        entry["aliases"].extend(seed.get("aliases", []))
+        entry["regional_aliases"].extend(
+            (region.lower(), alias) for region, alias in seed.get("regionalAliases", {}).items() if alias
+        )
+        entry["tags"].extend(seed.get("tags", []))
+
+    items = tuple(
+        CatalogItem(
+            item_id=item_id,
+            name=entry["name"],
+            label=display_label(entry["name"]),
+            category=entry["category"],
+            aliases=_dedupe(entry["aliases"]),
+            regions=tuple(sorted(set(entry["regions"]))),
+            tags=tuple(sorted(set(entry["tags"]))),
+            source="catalog",
+            regional_aliases=tuple(dict.fromkeys(entry["regional_aliases"])),
+        )
+        for item_id, entry in enumerate(sorted(merged.values(), key=lambda e: e["name"].lower()))
+    )
+    return Catalog(items=items, version=version)
+
+
+def seed_catalog() -> Catalog:
+    items = tuple(
+        CatalogItem(
+            item_id=item_id,
+            name=name,
+            label=display_label(name),
+            category="pantry",
+            aliases=(),
+            regions=(),
+            tags=(),
+            source="seed",
+        )
+        for item_id, name in enumerate(SEED_CATALOG)
+    )
+    return Catalog(items=items, version="baseline-v0")
+
+
+class ItemTable(Sequence):
+    """Array-backed, read-only view of catalog items.
+
+    Strings live in :class:`StringTable` blobs and categories/regions/tags are
+    dictionary-encoded, so a table mapped from a snapshot costs no per-item
+    Python objects; a :class:`CatalogItem` is materialized only when indexed
+    and the first ``MATERIALIZED_ITEMS`` of those are kept for reuse.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: dict):
+        self._names = StringTable.from_arrays(arrays, "catalog.name")
+        self._labels = StringTable.from_arrays(arrays, "catalog.label")
+        self._aliases = StringTable.from_arrays(arrays, "catalog.alias")
+        self._alias_ptr = arrays["catalog.alias_ptr"]
+        self._category = arrays["catalog.category"]
+        self._source = arrays["catalog.source"]
+        self._region_ptr = arrays["catalog.region_ptr"]
+        self._region = arrays["catalog.region"]
+        self._tag_ptr = arrays["catalog.tag_ptr"]
+        self._tag = arrays["catalog.tag"]
+        self._regional = StringTable.from_arrays(arrays, "catalog.regional")
+        self._regional_ptr = arrays["catalog.regional_ptr"]
+        self._regional_region = arrays["catalog.regional_region"]
+        self._categories: List[str] = meta["categories"]
+        self._sources: List[str] = meta["sources"]
+        self._regions: List[str] = meta["regions"]
+        self._tags: List[str] = meta["tags"]
+        self._alias_regions: List[str] = meta["alias_regions"]
+        self._materialized: Dict[int, CatalogItem] = {}
+
+    @staticmethod
+    def encode(items: Sequence[CatalogItem]) -> Tuple[Dict[str, np.ndarray], dict]:
+        categories = sorted({item.category for item in items})
+        sources = sorted({item.source for item in items})
+        regions = sorted({region for item in items for region in item.regions})
+        tags = sorted({tag for item in items for tag in item.tags})
+        alias_regions = sorted({region for item in items for region, _ in item.regional_aliases})
+        category_code = {value: code for code, value in enumerate(categories)}
+        source_code = {value: code for code, value in enumerate(sources)}
+        region_code = {value: code for code, value in enumerate(regions)}
+        tag_code = {value: code for code, value in enumerate(tags)}
+        alias_region_code = {value: code for code, value in enumerate(alias_regions)}
+
+        alias_csr = csr_from_lists([range(len(item.aliases)) for item in items])
+        region_csr = csr_from_lists([[region_code[r] for r in item.regions] for item in items], dtype=np.uint8)
+        tag_csr = csr_from_lists([[tag_code[t] for t in item.tags] for item in items], dtype=np.uint16)
+        regional_csr = csr_from_lists(
+            [[alias_region_code[region] for region, _ in item.regional_aliases] for item in items], dtype=np.uint8
+        )
+        arrays: Dict[str, np.ndarray] = {}
+        arrays.update(StringTable.from_strings(item.name for item in items).to_arrays("catalog.name"))
+        arrays.update(StringTable.from_strings(item.label for item in items).to_arrays("catalog.label"))
+        arrays.update(
+            StringTable.from_strings(alias for item in items for alias in item.aliases).to_arrays("catalog.alias")
+        )
+        arrays["catalog.alias_ptr"] = alias_csr["ptr"]
+        arrays["catalog.category"] = np.array([category_code[item.category] for item in items], dtype=np.uint8)
+        arrays["catalog.source"] = np.array([source_code[item.source] for item in items], dtype=np.uint8)
+        arrays["catalog.region_ptr"] = region_csr["ptr"]
+        arrays["catalog.region"] = region_csr["values"]
+        arrays["catalog.tag_ptr"] = tag_csr["ptr"]
+        arrays["catalog.tag"] = tag_csr["values"]
+        arrays.update(
+            StringTable.from_strings(
+                alias for item in items for _, alias in item.regional_aliases
+            ).to_arrays("catalog.regional")
+        )
+        arrays["catalog.regional_ptr"] = regional_csr["ptr"]
+        arrays["catalog.regional_region"] = regional_csr["values"]
+        meta = {
+            "categories": categories,
+            "sources": sources,
+            "regions": regions,
+            "tags": tags,
+            "alias_regions": alias_regions,
+        }
+        return arrays, meta
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, item_id):
+        if isinstance(item_id, slice):
+            return [self[position] for position in range(*item_id.indices(len(self)))]
+        item = self._materialized.get(item_id)
+        if item is None:
+            item = self._materialize(item_id)
+            if len(self._materialized) < MATERIALIZED_ITEMS:
+                self._materialized[item_id] = item
+        return item
+
+    def _materialize(self, item_id: int) -> CatalogItem:
+        alias_start, alias_end = self._alias_ptr[item_id:item_id + 2].tolist()
+        region_start, region_end = self._region_ptr[item_id:item_id + 2].tolist()
+        tag_start, tag_end = self._tag_ptr[item_id:item_id + 2].tolist()
+        regional_start, regional_end = self._regional_ptr[item_id:item_id + 2].tolist()
+        return CatalogItem(
+            item_id=item_id,
+            name=self._names[item_id],
+            label=self._labels[item_id],
+            category=self._categories[self._category[item_id]],
+            aliases=tuple(self._aliases[position] for position in range(alias_start, alias_end)),
+            regions=tuple(self._regions[code] for code in self._region[region_start:region_end].tolist()),
+            tags=tuple(self._tags[code] for code in self._tag[tag_start:tag_end].tolist()),
+            source=self._sources[self._source[item_id]],
+            regional_aliases=tuple(
+                (self._alias_regions[code], self._regional[position])
+                for position, code in zip(
+                    range(regional_start, regional_end), self._regional_region[regional_start:regional_end].tolist()
+                )
+            ),
+        )
@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import math
+import unicodedata
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .arrays import StringTable, csr_from_lists, gather_slices
+from .fuzzy import levenshtein
+from .metrics import StageTimer
+from .text import normalize, tokens
+
+# Words hybrid-classifier.ts drops from product names before matching.
+STOP_WORDS = frozenset({
+    "the", "brand", "fresh", "quality", "premium", "new", "extra", "choice", "product",
+    "jamaican", "flavour", "flavor", "original", "best", "select", "size", "pack",
+})
+# Words food-dictionary.ts leaves singular when it adds plural aliases.
+_PLURAL_STOP_WORDS = frozenset({"pack", "pkt", "pkg", "original", "brand", "fresh", "jamaican"})
+
+DEFAULT_LIMIT = 4
+DEFAULT_MIN_CONFIDENCE = 0.28
+EXACT_CONFIDENCE = 0.97
+# Best alias score (token Jaccard × 0.6 + edit similarity × 0.4) an entry needs to be a fuzzy match.
+FUZZY_MIN_SCORE = 0.45
+# Candidates are pruned on an upper bound of the score before it is rounded to four places.
+_FUZZY_BOUND = FUZZY_MIN_SCORE - 0.00005
+# Queries up to one machine word long get the bit-parallel edit distance.
+_WORD_BITS = 64
+# ICU's root collation orders common ASCII punctuation like this, before digits and letters.
+_PUNCTUATION = "_-,;:!?.'\"()[]{}@*/\\&#%`^+<=>|~$"
+
+FALLBACK = {
+    "category": "pantry",
+    "canonicalName": "Pantry Staple",
+    "confidence": 0.2,
+    "source": "fallback",
+    "explanation": "Defaulted to pantry staples",
+}
+
+
+class DictionaryEntry(NamedTuple):
+    canonical_name: str
+    category: str
+    aliases: Tuple[str, ...]
+
+
+def singularize(token: str) -> str:
+    if token.endswith("ies"):
+        return f"{token[:-3]}y"
+    if token.endswith("oes") or token.endswith("ses"):
+        return token[:-2]
+    if token.endswith("s") and len(token) > 3:
+        return token[:-1]
+    return token
+
+
+def normalize_product_name(value: str) -> str:
+    """``normalizeProductName`` from hybrid-classifier.ts: normalized, singular, without stop words."""
+    if not value:
+        return ""
+    words = (singularize(token) for token in tokens(normalize(value.replace("&", " and "))))
+    return " ".join(word for word in words if word and word not in STOP_WORDS)
+
+
+def to_fixed(value: float, digits: int) -> str:
+    """JavaScript's ``Number.prototype.toFixed``: the exact binary value rounded half up."""
+    return str(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+
+def _pluralize(token: str) -> str:
+    if token.endswith("y") and len(token) > 3:
+        return f"{token[:-1]}ies"
+    if token.endswith("s"):
+        return token
+    if token.endswith("sh") or token.endswith("ch"):
+        return f"{token}es"
+    return f"{token}s"
+
+
+def _collation_key(name: str) -> tuple:
+    """Approximates ``localeCompare`` (ICU root collation), which orders the TS dictionary."""
+    primary = []
+    for char in name:
+        base = unicodedata.normalize("NFKD", char.lower())[:1] or char
+        if char.isspace():
+            primary.append((0, 0))
+        elif base.isdigit():
+            primary.append((2, ord(base)))
+        elif base.isalpha():
+            primary.append((3, ord(base)))
+        else:
+            rank = _PUNCTUATION.find(char)
+            primary.append((1, rank if rank >= 0 else len(_PUNCTUATION) + ord(char)))
+    return primary, [char.isupper() for char in name], name
+
+
+def expand_seeds(seeds: Iterable[dict]) -> List[DictionaryEntry]:
+    """``expandSeeds`` from food-dictionary.ts: one entry per brand/variant/product/size combination."""
+    by_canonical: Dict[str, Tuple[str, Dict[str, None]]] = {}
+    for seed in seeds:
+        product = seed["product"]
+        brand = seed.get("brand")
+        for variant in seed.get("variants") or [None]:
+            for size in seed.get("sizes") or [None]:
+                parts = (part.strip() for part in (brand, variant, product, size) if part and part.strip())
+                canonical_name = " ".join(" ".join(parts).split())
+                if not canonical_name:
+                    continue
+                alias_set = [normalize(product)]
+                if brand:
+                    alias_set.append(normalize(f"{brand} {product}"))
+                if variant:
+                    alias_set.append(normalize(f"{variant} {product}"))
+                if size:
+                    alias_set.append(normalize(f"{product} {size}"))
+                alias_set.extend(normalize(alias) for alias in seed.get("aliases") or ())
+                aliases: Dict[str, None] = {}
+                for alias in dict.fromkeys(alias_set):
+                    if not alias:
+                        continue
+                    aliases[alias] = None
+                    plural = " ".join(
+                        word if word in _PLURAL_STOP_WORDS else _pluralize(word) for word in alias.split(" ")
+                    )
+                    aliases[plural] = None
+                if canonical_name in by_canonical:
+                    by_canonical[canonical_name][1].update(aliases)
+                else:
+                    by_canonical[canonical_name] = (seed["category"], aliases)
+    return [
+        DictionaryEntry(name, category, tuple(aliases))
+        for name, (category, aliases) in sorted(by_canonical.items(), key=lambda pair: _collation_key(pair[0]))
+    ]
+
+
+def _bit_parallel_distances(
+    queries: Sequence[str], pair_query: np.ndarray, codes: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    """Levenshtein distances of many (query, alias) pairs at once (Myers/Hyyrö bit vectors).
+
+    Every paired query is at most ``_WORD_BITS`` ASCII characters (longer
+    ones in ``queries`` are ignored); ``codes`` holds the paired aliases as
+    zero-padded byte rows. The recurrence advances one alias
+    character per step across all pairs, so the cost is a few vector
+    operations per character of the longest alias.
+    """
+    one = np.uint64(1)
+    peq = np.zeros((len(queries), 128), dtype=np.uint64)
+    sizes = [len(query) if len(query) <= _WORD_BITS else 1 for query in queries]
+    for row, query in enumerate(queries):
+        if len(query) > _WORD_BITS:
+            continue
+        for position, char in enumerate(query.encode("ascii")):
+            peq[row, char] |= np.uint64(1 << position)
+    mask = np.array([(1 << size) - 1 for size in sizes], dtype=np.uint64)[pair_query]
+    high = np.array([1 << (size - 1) for size in sizes], dtype=np.uint64)[pair_query]
+    score = np.array(sizes, dtype=np.int64)[pair_query]
+    pv = mask.copy()
+    mv = np.zeros_like(pv)
+    for column in range(int(lengths.max(initial=0))):
+        active = lengths > column
+        eq = peq[pair_query, codes[:, column]]
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        score += active & ((ph & high) != 0)
+        score -= active & ((mh & high) != 0)
+        ph = (ph << one) | one
+        mh = mh << one
+        pv = np.where(active, (mh | ~(xv | ph)) & mask, pv)
+        mv = np.where(active, ph & xv & mask, mv)
+    return score
+
+
+class ProductClassifier:
+    """Batch port of ``classifyProductName`` from supabase/functions/_shared/hybrid-classifier.ts.
+
+    A product name is matched three ways, as in the TS classifier: exactly
+    against every normalized dictionary alias, fuzzily (best alias by token
+    Jaccard and edit similarity) and by cosine similarity of canonical-name
+    token vectors, and the results are merged with the same confidences,
+    sources and explanations.
+
+    The TS version compares each name against the whole dictionary. Here the
+    alias sets, their token postings and the canonical token vectors are
+    precomputed as flat arrays (stored in the index snapshot), so a name only
+    scores the aliases and entries that share one of its tokens, which are the
+    only ones that can clear the fuzzy threshold or have non-zero cosine.
+    Edit distances for a whole batch of names are computed together.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self._names = StringTable.from_arrays(arrays, "classifier.names")
+        self._categories = StringTable.from_arrays(arrays, "classifier.categories")
+        self._keys = StringTable.from_arrays(arrays, "classifier.keys")
+        self._vocabulary = StringTable.from_arrays(arrays, "classifier.tokens")
+        self._arrays = arrays
+        self._entry_ptr = arrays["classifier.entry_ptr"]
+        self._entry_keys = arrays["classifier.entry_keys"]
+        self._key_ptr = arrays["classifier.key_ptr"]
+        self._key_entries = arrays["classifier.key_entries"]
+        self._key_lengths = arrays["classifier.key_lengths"]
+        self._key_codes = arrays["classifier.key_codes"]
+        self._key_token_count = arrays["classifier.key_token_count"]
+        self._token_ptr = arrays["classifier.token_ptr"]
+        self._token_keys = arrays["classifier.token_keys"]
+        self._vector_ptr = arrays["classifier.vector_ptr"]
+        self._vector_entries = arrays["classifier.vector_entries"]
+        self._vector_weights = arrays["classifier.vector_weights"]
+        self._entry_norms = arrays["classifier.entry_norms"]
+
+    @classmethod
+    def build(cls, seeds: Iterable[dict]) -> "ProductClassifier":
+        return cls(cls.encode(expand_seeds(seeds)))
+
+    @staticmethod
+    def encode(entries: Sequence[DictionaryEntry]) -> Dict[str, np.ndarray]:
+        key_ids: Dict[str, int] = {}
+        key_entries: List[List[int]] = []
+        entry_keys: List[List[int]] = []
+        vocabulary: Dict[str, int] = {}
+        vector_postings: List[List[Tuple[int, float]]] = []
+        norms = np.zeros(len(entries), dtype=np.float64)
+
+        for entry_id, entry in enumerate(entries):
+            canonical = normalize_product_name(entry.canonical_name)
+            row = []
+            for alias in dict.fromkeys([canonical, *map(normalize_product_name, entry.aliases)]):
+                if not alias:
+                    continue
+                if alias not in key_ids:
+                    key_ids[alias] = len(key_ids)
+                    key_entries.append([])
+                key_entries[key_ids[alias]].append(entry_id)
+                row.append(key_ids[alias])
+            entry_keys.append(row)
+
+            weights = _token_vector(canonical)
+            for token, weight in weights.items():
+                if token not in vocabulary:
+                    vocabulary[token] = len(vocabulary)
+                    vector_postings.append([])
+                vector_postings[vocabulary[token]].append((entry_id, weight))
+            norm = 0.0
+            for weight in weights.values():
+                norm += weight * weight
+            norms[entry_id] = math.sqrt(norm)
+
+        keys = list(key_ids)
+        token_keys: List[List[int]] = [[] for _ in vocabulary]
+        key_token_count = np.zeros(len(keys), dtype=np.int32)
+        for key_id, key in enumerate(keys):
+            distinct = dict.fromkeys(tokens(key))
+            key_token_count[key_id] = len(distinct)
+            for token in distinct:
+                if token not in vocabulary:
+                    vocabulary[token] = len(vocabulary)
+                    token_keys.append([])
+                    vector_postings.append([])
+                token_keys[vocabulary[token]].append(key_id)
+
+        key_lengths = np.fromiter((len(key) for key in keys), dtype=np.int32, count=len(keys))
+        key_codes = np.zeros((len(keys), int(key_lengths.max(initial=0))), dtype=np.uint8)
+        for key_id, key in enumerate(keys):
+            key_codes[key_id, :len(key)] = np.frombuffer(key.encode("ascii"), dtype=np.uint8)
+
+        vectors = csr_from_lists([[entry for entry, _ in posting] for posting in vector_postings])
+        arrays: Dict[str, np.ndarray] = {}
+        arrays.update(StringTable.from_strings(entry.canonical_name for entry in entries).to_arrays("classifier.names"))
+        arrays.update(StringTable.from_strings(entry.category for entry in entries).to_arrays("classifier.categories"))
+        arrays.update(StringTable.from_strings(keys).to_arrays("classifier.keys"))
+        arrays.update(StringTable.from_strings(vocabulary).to_arrays("classifier.tokens"))
+        entry_csr = csr_from_lists(entry_keys)
+        key_csr = csr_from_lists(key_entries)
+        token_csr = csr_from_lists(token_keys)
+        arrays.update({
+            "classifier.entry_ptr": entry_csr["ptr"],
+            "classifier.entry_keys": entry_csr["values"],
+            "classifier.key_ptr": key_csr["ptr"],
+            "classifier.key_entries": key_csr["values"],
+            "classifier.token_ptr": token_csr["ptr"],
+            "classifier.token_keys": token_csr["values"],
+            "classifier.key_lengths": key_lengths,
+            "classifier.key_codes": key_codes,
+            "classifier.key_token_count": key_token_count,
+            "classifier.vector_ptr": vectors["ptr"],
+            "classifier.vector_entries": vectors["values"],
+            "classifier.vector_weights": np.fromiter(
+                (weight for posting in vector_postings for _, weight in posting),
+                dtype=np.float64,
+                count=len(vectors["values"]),
+            ),
+            "classifier.entry_norms": norms,
+        })
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "ProductClassifier":
+        return cls({name: array for name, array in arrays.items() if name.startswith("classifier.")})
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return dict(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._names), "aliases": len(self._keys), "tokens": len(self._vocabulary)}
+
+    def classify_many(
+        self,
+        names: Sequence[str],
+        limit: int = DEFAULT_LIMIT,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+        timer: Optional[StageTimer] = None,
+    ) -> List[List[dict]]:
+        """Classifications for every name, best first, as ``classifyProductName`` returns them.
+
+        Names that normalize to nothing (only stop words or punctuation) get
+        no classifications; repeated names are classified once.
+        """
+        timer = timer or StageTimer()
+        normalized = [normalize_product_name(name) for name in names]
+        queries = [query for query in dict.fromkeys(normalized) if query]
+        timer.lap("normalize")
+        pair_query, pair_key, pair_jaccard = self._fuzzy_candidates(queries)
+        timer.lap("retrieve")
+        alias_scores = self._alias_scores(queries, pair_query, pair_key, pair_jaccard)
+        results: Dict[str, List[dict]] = {}
+        for position, query in enumerate(queries):
+            matches = self._match_exact(query)
+            for candidate in self._rank_fuzzy(alias_scores[position], limit):
+                if len(matches) >= limit:
+                    break
+                _add_unique(matches, candidate)
+            if len(matches) < limit:
+                for candidate in self._rank_vector(query, limit, min_confidence):
+                    if len(matches) >= limit:
+                        break
+                    _add_unique(matches, candidate)
+            results[query] = matches[:limit] if matches else [dict(FALLBACK)]
+        timer.lap("score")
+        return [results[query] if query else [] for query in normalized]
+
+    def _entry(self, entry_id: int) -> Tuple[str, str]:
+        return self._categories[entry_id], self._names[entry_id]
+
+    def _match_exact(self, query: str) -> List[dict]:
+        key_id = self._keys.find(query)
+        if key_id < 0:
+            return []
+        matches = []
+        for entry_id in self._key_entries[self._key_ptr[key_id]:self._key_ptr[key_id + 1]].tolist():
+            category, name = self._entry(entry_id)
+            matches.append({
+                "category": category,
+                "canonicalName": name,
+                "confidence": EXACT_CONFIDENCE,
+                "source": "dictionary",
+                "matchedAlias": query,
+                "explanation": "Dictionary exact match",
+            })
+        return matches
+
+    def _fuzzy_candidates(self, queries: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(query, alias, token Jaccard) for every alias that could reach ``FUZZY_MIN_SCORE``.
+
+        An alias without a token in common scores at most 0.4; otherwise the
+        edit similarity is bounded by the length difference, which prunes most
+        pairs before any edit distance is computed.
+        """
+        pair_query: List[np.ndarray] = []
+        pair_key: List[np.ndarray] = []
+        pair_jaccard: List[np.ndarray] = []
+        for position, query in enumerate(queries):
+            query_tokens = list(dict.fromkeys(tokens(query)))
+            token_ids = np.array([token for token in self._vocabulary.find_many(query_tokens) if token >= 0])
+            if token_ids.size == 0:
+                continue
+            keys, shared = np.unique(self._token_keys[gather_slices(self._token_ptr, token_ids)], return_counts=True)
+            jaccard = shared / (self._key_token_count[keys] + len(query_tokens) - shared)
+            lengths = self._key_lengths[keys]
+            longest = np.maximum(np.maximum(lengths, len(query)), 1)
+            bound = jaccard * 0.6 + (1 - np.abs(lengths - len(query)) / longest) * 0.4
+            keep = bound >= _FUZZY_BOUND
+            pair_query.append(np.full(int(keep.sum()), position, dtype=np.int64))
+            pair_key.append(keys[keep])
+            pair_jaccard.append(jaccard[keep])
+        if not pair_query:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        return np.concatenate(pair_query), np.concatenate(pair_key), np.concatenate(pair_jaccard)
+
+    def _alias_scores(
+        self, queries: Sequence[str], pair_query: np.ndarray, pair_key: np.ndarray, pair_jaccard: np.ndarray
+    ) -> List[Dict[int, float]]:
+        """Rounded fuzzy score of every candidate alias that can reach ``FUZZY_MIN_SCORE``, per query."""
+        distances = np.zeros(pair_query.size, dtype=np.int64)
+        short = np.array([len(query) <= _WORD_BITS for query in queries], dtype=bool)[pair_query]
+        if short.any():
+            distances[short] = _bit_parallel_distances(
+                queries, pair_query[short], self._key_codes[pair_key[short]], self._key_lengths[pair_key[short]]
+            )
+        for pair in np.flatnonzero(~short).tolist():
+            distances[pair] = levenshtein(self._keys[int(pair_key[pair])], queries[int(pair_query[pair])])
+
+        query_lengths = np.array([len(query) for query in queries], dtype=np.int64)[pair_query]
+        longest = np.maximum(np.maximum(self._key_lengths[pair_key], query_lengths), 1)
+        combined = pair_jaccard * 0.6 + (1 - distances / longest) * 0.4
+        # Aliases that cannot round up to FUZZY_MIN_SCORE never decide a match.
+        keep = combined >= _FUZZY_BOUND
+        scores: List[Dict[int, float]] = [{} for _ in queries]
+        for position, key_id, score in zip(pair_query[keep].tolist(), pair_key[keep].tolist(), combined[keep].tolist()):
+            scores[position][key_id] = float(to_fixed(score, 4))
+        return scores
+
+    def _rank_fuzzy(self, alias_scores: Dict[int, float], limit: int) -> List[dict]:
+        matched = np.array([key_id for key_id, score in alias_scores.items() if score >= FUZZY_MIN_SCORE], dtype=np.int64)
+        if matched.size == 0:
+            return []
+        scored = []
+        for entry_id in np.unique(self._key_entries[gather_slices(self._key_ptr, matched)]).tolist():
+            # The entry's first alias with its best score, as the TS loop picks it.
+            best, best_key = 0.0, -1
+            for key_id in self._entry_keys[self._entry_ptr[entry_id]:self._entry_ptr[entry_id + 1]].tolist():
+                score = alias_scores.get(key_id, 0.0)
+                if score > best:
+                    best, best_key = score, key_id
+            scored.append((best, entry_id, best_key))
+        scored.sort(key=lambda row: -row[0])
+        matches = []
+        for score, entry_id, key_id in scored[:limit]:
+            category, name = self._entry(entry_id)
+            matches.append({
+                "category": category,
+                "canonicalName": name,
+                "confidence": float(to_fixed(min(0.88, max(0.4, score)), 3)),
+                "source": "fuzzy",
+                "matchedAlias": self._keys[key_id],
+                "explanation": f"Fuzzy match {to_fixed(score * 100, 1)}%",
+            })
+        return matches
+
+    def _rank_vector(self, query: str, limit: int, min_confidence: float) -> List[dict]:
+        weights = _token_vector(query)
+        norm = 0.0
+        for weight in weights.values():
+            norm += weight * weight
+        dot = np.zeros(len(self._names), dtype=np.float64)
+        touched: List[np.ndarray] = []
+        for token_id, weight in zip(self._vocabulary.find_many(list(weights)), weights.values()):
+            if token_id < 0:
+                continue
+            start, end = int(self._vector_ptr[token_id]), int(self._vector_ptr[token_id + 1])
+            entries = self._vector_entries[start:end]
+            dot[entries] += weight * self._vector_weights[start:end]
+            touched.append(entries)
+        if not touched:
+            return []
+        entries = np.unique(np.concatenate(touched))
+        scores = dot[entries] / (math.sqrt(norm) * self._entry_norms[entries])
+        keep = scores >= min_confidence
+        entries, scores = entries[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")[:limit]
+        matches = []
+        for entry_id, score in zip(entries[order].tolist(), scores[order].tolist()):
+            category, name = self._entry(entry_id)
+            matches.append({
+                "category": category,
+                "canonicalName": name,
+                "confidence": float(to_fixed(min(0.75, max(min_confidence, score)), 3)),
+                "source": "ml",
+                "explanation": f"Vector similarity {to_fixed(score * 100, 1)}%",
+            })
+        return matches
+
+
+def _token_vector(normalized: str) -> Dict[str, float]:
+    vector: Dict[str, float] = {}
+    for token in tokens(normalized):
+        vector[token] = vector.get(token, 0) + (1.3 if len(token) > 5 else 1)
+    return vector
+
+
+def _add_unique(matches: List[dict], candidate: dict) -> None:
+    if not any(match["canonicalName"] == candidate["canonicalName"] for match in matches):
+        matches.append(candidate)
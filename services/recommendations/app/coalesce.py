@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[V]):
+    """Shares one in-flight computation among concurrent requests for the same key.
+
+    The first request for a key (the leader) starts the computation; requests
+    for the same key that arrive before it finishes (followers) await the
+    same result, or the same exception, instead of recomputing it. The
+    computation runs as its own task and is awaited through
+    :func:`asyncio.shield`, so a leader whose client disconnects does not
+    cancel it for the followers. Keys are forgotten as soon as their result
+    is ready; caching finished results is :class:`~app.cache.TTLCache`'s job.
+    Everything runs on the event loop, so no locking is needed.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def run_many(
+        self,
+        keys: Sequence[Hashable],
+        compute: Callable[[List[Hashable]], Awaitable[Tuple[List[V], T]]],
+    ) -> Tuple[Dict[Hashable, V], Optional[T]]:
+        """Values for distinct ``keys``, computing only those no other request is already computing.
+
+        ``compute`` receives the keys this call leads and returns their values
+        in order plus one extra result (e.g. worker stage timings), which is
+        returned as the second element; it is ``None`` if every key was
+        already in flight.
+        """
+        if not self.enabled:
+            values, extra = await compute(list(keys))
+            return dict(zip(keys, values)), extra
+
+        waiting = {key: self._flights[key] for key in keys if key in self._flights}
+        leading = [key for key in keys if key not in waiting]
+        self.followers += len(waiting)
+        self.leaders += len(leading)
+
+        task = None
+        if leading:
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(compute(leading))
+            futures = {key: loop.create_future() for key in leading}
+            self._flights.update(futures)
+            task.add_done_callback(lambda done: self._settle(done, futures))
+            waiting.update(futures)
+
+        values = {key: await asyncio.shield(future) for key, future in waiting.items()}
+        extra = (await asyncio.shield(task))[1] if task is not None else None
+        return values, extra
+
+    def _settle(self, task: asyncio.Future, futures: Dict[Hashable, asyncio.Future]) -> None:
+        for position, (key, future) in enumerate(futures.items()):
+            if self._flights.get(key) is future:
+                del self._flights[key]
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+                # Waiters re-raise it themselves; mark it retrieved in case none is left.
+                future.exception()
+            else:
+                future.set_result(task.result()[0][position])
+
+    def stats(self) -> Dict[str, object]:
+        requests = self.leaders + self.followers
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._flights),
+            "leaders": self.leaders,
+            "coalesced": self.followers,
+            "coalesced_ratio": round(self.followers / requests, 4) if requests else 0.0,
+        }
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_CATALOG_PATH = REPO_ROOT / "apps" / "mobile" / "src" / "catalog" / "data" / "western-shared.ts"
+DEFAULT_DICTIONARY_PATH = REPO_ROOT / "supabase" / "functions" / "_shared" / "food-dictionary-western-part1.ts"
+DEFAULT_CORE_DICTIONARY_PATH = REPO_ROOT / "supabase" / "functions" / "_shared" / "food-dictionary.ts"
+
+
+def _env_path(name: str, default: Path) -> Path:
+    value = os.getenv(name)
+    return Path(value) if value else default
+
+
+def _optional_env_path(name: str) -> Optional[Path]:
+    value = os.getenv(name)
+    return Path(value) if value else None
+
+
+def _optional_env_list(name: str) -> Optional[Tuple[str, ...]]:
+    values = tuple(value.strip().lower() for value in os.getenv(name, "").split(",") if value.strip())
+    return values or None
+
+
+@dataclass(frozen=True)
+class Settings:
+    catalog_path: Path
+    dictionary_path: Path
+    core_dictionary_path: Path = DEFAULT_CORE_DICTIONARY_PATH
+    catalog_regions: Optional[Tuple[str, ...]] = None
+    max_suggestions: int = 8
+    fuzzy_max_distance: int = 2
+    autocomplete_top_k: int = 10
+    cache_max_entries: int = 4096
+    cache_ttl_seconds: float = 300.0
+    coalesce: bool = True
+    execution_mode: str = "thread"
+    execution_workers: Optional[int] = None
+    execution_max_queue: int = 256
+    index_snapshot_path: Optional[Path] = None
+    associations_path: Optional[Path] = None
+    locale_shards: bool = True
+    reload_interval_seconds: float = 0.0
+    admin_token: Optional[str] = None
+    profile_dir: Optional[Path] = None
+    profile_interval_ms: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            catalog_path=_env_path("RECO_CATALOG_PATH", DEFAULT_CATALOG_PATH),
+            dictionary_path=_env_path("RECO_DICTIONARY_PATH", DEFAULT_DICTIONARY_PATH),
+            core_dictionary_path=_env_path("RECO_CORE_DICTIONARY_PATH", DEFAULT_CORE_DICTIONARY_PATH),
+            catalog_regions=_optional_env_list("RECO_CATALOG_REGIONS"),
+            max_suggestions=int(os.getenv("RECO_MAX_SUGGESTIONS", "8")),
+            fuzzy_max_distance=int(os.getenv("RECO_FUZZY_MAX_DISTANCE", "2")),
+            autocomplete_top_k=int(os.getenv("RECO_AUTOCOMPLETE_TOP_K", "10")),
+            cache_max_entries=int(os.getenv("RECO_CACHE_MAX_ENTRIES", "4096")),
+            cache_ttl_seconds=float(os.getenv("RECO_CACHE_TTL_SECONDS", "300")),
+            coalesce=os.getenv("RECO_COALESCE", "1").lower() not in ("0", "false", "no", "off"),
+            execution_mode=os.getenv("RECO_EXECUTION_MODE", "thread"),
+            execution_workers=int(os.environ["RECO_EXECUTION_WORKERS"]) if os.getenv("RECO_EXECUTION_WORKERS") else None,
+            execution_max_queue=int(os.getenv("RECO_EXECUTION_MAX_QUEUE", "256")),
+            index_snapshot_path=_optional_env_path("RECO_INDEX_SNAPSHOT"),
+            associations_path=_optional_env_path("RECO_ASSOCIATIONS"),
+            locale_shards=os.getenv("RECO_LOCALE_SHARDS", "1").lower() not in ("0", "false", "no", "off"),
+            reload_interval_seconds=float(os.getenv("RECO_RELOAD_INTERVAL_SECONDS", "0")),
+            admin_token=os.getenv("RECO_ADMIN_TOKEN") or None,
+            profile_dir=_optional_env_path("RECO_PROFILE_DIR"),
+            profile_interval_ms=float(os.getenv("RECO_PROFILE_INTERVAL_MS", "1")),
+        )
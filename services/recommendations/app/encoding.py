@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+
+from .catalog import MATERIALIZED_ITEMS, CatalogItem
+
+_METADATA = b',"metadata":{"locale":'
+_CLOSE = b"}}"
+_MATCH = {"exact": b'"exact"', "fuzzy": b'"fuzzy"'}
+_GLOBAL = b'"global"'
+
+
+def _encode_locale(locale: Optional[str]) -> bytes:
+    return orjson.dumps(locale) if locale else _GLOBAL
+
+
+class SuggestionFragments:
+    """Pre-encoded JSON for the static fields of every catalog item's suggestion.
+
+    A suggestion serializes as::
+
+        {"label":…,"type":"product","confidence":<c>,"metadata":{"locale":<l>,"source":…,"category":…,"match":<m>}}
+
+    Everything except the confidence, locale and match is fixed per item, so
+    each item stores a *head* (up to the confidence value) and a *tail* (from
+    ``source`` up to the match value) in one byte blob at index-build time.
+    Encoding a ranked suggestion is then a join of a few byte strings, with
+    the same key order and bytes that the ``Suggestion`` model produces. Like
+    :class:`~app.catalog.ItemTable`, the head/tail pair of the first
+    ``MATERIALIZED_ITEMS`` items used is kept as ``bytes`` for reuse.
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        # Item i's head is offsets[2i]:offsets[2i+1], its tail offsets[2i+1]:offsets[2i+2].
+        self._offsets = offsets
+        self._pieces: Dict[int, Tuple[bytes, bytes]] = {}
+
+    @classmethod
+    def build(cls, items: Sequence[CatalogItem]) -> "SuggestionFragments":
+        parts: List[bytes] = []
+        for item in items:
+            parts.append(b'{"label":' + orjson.dumps(item.label) + b',"type":"product","confidence":')
+            parts.append(
+                b',"source":' + orjson.dumps(item.source) + b',"category":' + orjson.dumps(item.category) + b',"match":'
+            )
+        offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+        np.cumsum([len(part) for part in parts], out=offsets[1:])
+        blob = np.frombuffer(b"".join(parts), dtype=np.uint8) if parts else np.zeros(0, dtype=np.uint8)
+        return cls(blob, offsets)
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "SuggestionFragments":
+        return cls(arrays["fragments.blob"], arrays["fragments.offsets"])
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {"fragments.blob": self._blob, "fragments.offsets": self._offsets}
+
+    def pieces(self, item_id: int) -> Tuple[bytes, bytes]:
+        pieces = self._pieces.get(item_id)
+        if pieces is None:
+            start, middle, end = self._offsets[2 * item_id:2 * item_id + 3].tolist()
+            pieces = (self._blob[start:middle].tobytes(), self._blob[middle:end].tobytes())
+            if len(self._pieces) < MATERIALIZED_ITEMS:
+                self._pieces[item_id] = pieces
+        return pieces
+
+    def encode(self, item_id: int, confidence: float, locale: bytes, match: str) -> bytes:
+        head, tail = self.pieces(item_id)
+        return b"".join((head, orjson.dumps(confidence), _METADATA, locale, tail, _MATCH[match], _CLOSE))
+
+    def encode_list(self, ranked: Iterable[Tuple[int, float, str]], locale: Optional[str]) -> bytes:
+        """JSON array of ``(item_id, confidence, match)`` suggestions, in order."""
+        locale_json = _encode_locale(locale)
+        encoded = (self.encode(item_id, confidence, locale_json, match) for item_id, confidence, match in ranked)
+        return b"[" + b",".join(encoded) + b"]"
+
+
+def encode_merged(
+    ranked: Iterable[Tuple[SuggestionFragments, Tuple[int, float, str]]], locale: Optional[str]
+) -> bytes:
+    """JSON array of suggestions drawn from several indexes, each hit encoded by its own index's fragments."""
+    locale_json = _encode_locale(locale)
+    encoded = (
+        fragments.encode(item_id, confidence, locale_json, match)
+        for fragments, (item_id, confidence, match) in ranked
+    )
+    return b"[" + b",".join(encoded) + b"]"
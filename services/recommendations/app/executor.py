@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+MODES = ("inline", "thread", "process")
+
+# Set in each worker process; with the fork start method the parent's index
+# pages are inherited copy-on-write instead of being pickled per task.
+_WORKER_INDEX: Any = None
+
+
+def _install_index(index: Any) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _run_in_worker(fn: Callable[..., Any], args: tuple) -> Any:
+    return fn(_WORKER_INDEX, *args)
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised when the scoring queue is already at ``max_queue`` waiters."""
+
+
+class ScoringExecutor:
+    """Runs CPU-bound scoring off the event loop with bounded concurrency.
+
+    ``inline`` scores on the calling coroutine, ``thread`` uses a dedicated
+    thread pool (so Starlette's shared pool stays free for cheap endpoints),
+    and ``process`` uses a process pool whose workers hold the index
+    read-only and sidestep the GIL. At most ``workers`` jobs run at once, at
+    most ``max_queue`` wait for a slot, and anything beyond that is rejected.
+    Submitted callables take the index (the generation's
+    :class:`~app.shards.IndexShards`) as their first argument.
+    """
+
+    def __init__(self, index: Any, mode: str = "thread", workers: Optional[int] = None, max_queue: int = 256):
+        if mode not in MODES:
+            raise ValueError(f"unknown execution mode {mode!r}; expected one of {', '.join(MODES)}")
+        self.index = index
+        self.mode = mode
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_queue = max_queue
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pool: Optional[Executor] = None
+        if mode == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reco-score")
+        elif mode == "process":
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_install_index,
+                initargs=(index,),
+            )
+        self.queued = 0
+        self.peak_queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        if not self._slots.locked():
+            await self._slots.acquire()
+        else:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise ExecutorSaturated(f"{self.queued} scoring jobs already queued")
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            try:
+                await self._slots.acquire()
+            finally:
+                self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            if self._pool is None:
+                return fn(self.index, *args)
+            loop = asyncio.get_running_loop()
+            if self.mode == "thread":
+                return await loop.run_in_executor(self._pool, partial(fn, self.index, *args))
+            return await loop.run_in_executor(self._pool, _run_in_worker, fn, args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
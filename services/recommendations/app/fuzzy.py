@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .arrays import StringTable, csr_from_lists
+
+# Deletes are only generated for the first PREFIX_LENGTH characters of a word
+# (as in SymSpell); longer words are verified against the full string.
+PREFIX_LENGTH = 7
+
+
+def bounded_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal-string-alignment distance, or ``max_distance + 1`` once it is exceeded."""
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Plain Levenshtein distance (insertions, deletions and substitutions only)."""
+    if a == b:
+        return 0
+    if not a or not b:
+        return len(a) or len(b)
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other)))
+        previous = current
+    return previous[-1]
+
+
+def allowed_distance(word: str, max_distance: int) -> int:
+    """Scale the edit budget with word length so short words are not over-corrected."""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 5:
+        return min(1, max_distance)
+    return max_distance
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    results: Set[str] = set()
+    frontier = {word[:PREFIX_LENGTH]}
+    for _ in range(distance):
+        next_frontier = set()
+        for candidate in frontier:
+            if len(candidate) <= 1:
+                continue
+            for i in range(len(candidate)):
+                next_frontier.add(candidate[:i] + candidate[i + 1:])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class DeletionIndex:
+    """SymSpell-style symmetric deletion index over a word vocabulary.
+
+    Every vocabulary word is stored under each string obtainable by deleting
+    up to ``max_distance`` characters from its prefix. A lookup generates the
+    same deletes for the query word and only verifies the words sharing one of
+    them, instead of computing an edit distance against the whole vocabulary.
+    Delete keys and their word lists are flat arrays (see :mod:`.arrays`).
+    """
+
+    def __init__(self, words: StringTable, keys: StringTable, ptr: np.ndarray, values: np.ndarray, max_distance: int):
+        self.words = words
+        self.max_distance = max_distance
+        self._keys = keys
+        self._ptr = ptr
+        self._values = values
+
+    @classmethod
+    def build(cls, words: StringTable, max_distance: int = 2) -> "DeletionIndex":
+        buckets: Dict[str, List[int]] = {}
+        for word_id, word in enumerate(words):
+            buckets.setdefault(word[:PREFIX_LENGTH], []).append(word_id)
+            for deleted in _deletes(word, max_distance):
+                buckets.setdefault(deleted, []).append(word_id)
+        keys = list(buckets)
+        csr = csr_from_lists([buckets[key] for key in keys])
+        return cls(words, StringTable.from_strings(keys), csr["ptr"], csr["values"], max_distance)
+
+    @classmethod
+    def from_arrays(cls, words: StringTable, arrays: Dict[str, np.ndarray], max_distance: int) -> "DeletionIndex":
+        keys = StringTable.from_arrays(arrays, "fuzzy.keys")
+        return cls(words, keys, arrays["fuzzy.ptr"], arrays["fuzzy.values"], max_distance)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = self._keys.to_arrays("fuzzy.keys")
+        arrays["fuzzy.ptr"] = self._ptr
+        arrays["fuzzy.values"] = self._values
+        return arrays
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> List[Tuple[int, int]]:
+        """``(word_id, distance)`` for vocabulary words within the allowed distance, closest first.
+
+        A word that is already in the vocabulary is returned as-is without
+        looking for corrections.
+        """
+        known = self.words.find(word)
+        if known >= 0:
+            return [(known, 0)]
+        budget = allowed_distance(word, self.max_distance if max_distance is None else max_distance)
+        budget = min(budget, self.max_distance)
+        if budget == 0:
+            return []
+
+        found: Dict[int, int] = {}
+        keys = [word[:PREFIX_LENGTH], *_deletes(word, budget)]
+        for position in self._keys.find_many(keys):
+            if position < 0:
+                continue
+            start, end = int(self._ptr[position]), int(self._ptr[position + 1])
+            for word_id in self._values[start:end].tolist():
+                if word_id in found:
+                    continue
+                candidate = self.words[word_id]
+                distance = bounded_distance(word, candidate, budget)
+                # Never "correct" into very short words such as "oz" or "tea".
+                if distance <= budget and len(candidate) > 3:
+                    found[word_id] = distance
+        return sorted(found.items(), key=lambda pair: (pair[1], pair[0]))
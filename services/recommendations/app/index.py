@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .arrays import StringTable, csr_from_lists, gather_slices
+from .associations import AssociationMatrix
+from .catalog import Catalog, CatalogItem, ItemTable
+from .encoding import SuggestionFragments
+from .fuzzy import DeletionIndex
+from .text import normalize, tokens, trigrams
+from .vectors import ContextVectors
+
+# A candidate must share at least this fraction of the query's trigrams.
+MIN_OVERLAP = 0.5
+# Upper bound on terms read from a single posting list. Postings are ordered
+# shortest-term first, so very common grams ("mil") still surface the
+# tightest matches while keeping the per-query cost bounded.
+MAX_POSTINGS_PER_GRAM = 2048
+# Similarity scores at or above this come from exact or substring hits.
+EXACT_SIMILARITY = 0.85
+
+
+class Candidate(NamedTuple):
+    """Lightweight scoring record; only the final top k become response models."""
+
+    item_id: int
+    similarity: float
+    term_id: int
+    match: str
+
+
+class SuggestionIndex:
+    """Trigram inverted index over catalog names and aliases.
+
+    Every searchable term (a name or an alias) is split into padded character
+    trigrams. A query only scores the terms that appear in the postings of its
+    rarest trigrams (prefix filtering), and each posting walk is capped, so
+    the cost depends on how selective the query is rather than on the
+    catalog size.
+
+    Misspelled words ("chedar", "almnd") are corrected through a
+    :class:`DeletionIndex` over the term vocabulary and scored per token.
+
+    Context items are scored twice: by token overlap (:class:`ContextVectors`)
+    and, when list history is available, by how often shoppers put each item
+    on the same list (:class:`AssociationMatrix`, aligned to this catalog).
+
+    Postings, vocabularies and catalog rows are flat NumPy arrays, so an index
+    built in memory and one mapped from a snapshot (:meth:`to_arrays` /
+    :meth:`from_arrays`) share the same query path.
+    """
+
+    def __init__(
+        self,
+        catalog: Catalog,
+        max_postings: int = MAX_POSTINGS_PER_GRAM,
+        max_distance: int = 2,
+        associations: Optional[AssociationMatrix] = None,
+    ):
+        term_text: List[str] = []
+        term_item: List[int] = []
+        term_grams: List[List[str]] = []
+        term_token_count: List[int] = []
+        postings: Dict[str, List[int]] = {}
+        token_postings: Dict[str, List[int]] = {}
+
+        for item in catalog.items:
+            seen = set()
+            for raw in (item.name, *item.aliases):
+                term = normalize(raw)
+                if not term or term in seen:
+                    continue
+                seen.add(term)
+                term_id = len(term_text)
+                grams = trigrams(term)
+                term_text.append(term)
+                term_item.append(item.item_id)
+                term_grams.append(sorted(grams))
+                term_tokens = set(tokens(term))
+                term_token_count.append(len(term_tokens))
+                keys = set(grams)
+                # Leading bigrams let single-character queries reach word starts.
+                keys.update(f" {token[0]}" for token in term_tokens)
+                for key in keys:
+                    postings.setdefault(key, []).append(term_id)
+                for token in term_tokens:
+                    token_postings.setdefault(token, []).append(term_id)
+
+        for table in (postings, token_postings):
+            for term_ids in table.values():
+                term_ids.sort(key=lambda term_id: (len(term_text[term_id]), term_id))
+
+        gram_keys = list(postings)
+        gram_ids = {gram: position for position, gram in enumerate(gram_keys)}
+        token_keys = list(token_postings)
+        gram_csr = csr_from_lists([postings[gram] for gram in gram_keys])
+        term_gram_csr = csr_from_lists([[gram_ids[gram] for gram in grams] for grams in term_grams])
+        token_csr = csr_from_lists([token_postings[token] for token in token_keys])
+        vocabulary = StringTable.from_strings(token_keys)
+
+        self._attach(
+            items=catalog.items,
+            version=catalog.version,
+            max_postings=max_postings,
+            terms=StringTable.from_strings(term_text),
+            term_item=np.array(term_item, dtype=np.int32),
+            term_token_count=np.array(term_token_count, dtype=np.int16),
+            term_gram_ptr=term_gram_csr["ptr"],
+            term_gram_ids=term_gram_csr["values"],
+            grams=StringTable.from_strings(gram_keys),
+            gram_ptr=gram_csr["ptr"],
+            gram_terms=gram_csr["values"],
+            vocabulary=vocabulary,
+            token_ptr=token_csr["ptr"],
+            token_terms=token_csr["values"],
+            fuzzy=DeletionIndex.build(vocabulary, max_distance=max_distance),
+            context=ContextVectors.build(catalog),
+            associations=(
+                associations.align([item.name for item in catalog.items])
+                if associations is not None
+                else AssociationMatrix.empty(len(catalog))
+            ),
+            fragments=SuggestionFragments.build(catalog.items),
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: dict) -> "SuggestionIndex":
+        """Rebuild an index around arrays produced by :meth:`to_arrays` (e.g. an mmap'd snapshot)."""
+        index = cls.__new__(cls)
+        items = ItemTable(arrays, meta["catalog"])
+        vocabulary = StringTable.from_arrays(arrays, "index.tokens")
+        index._attach(
+            items=items,
+            version=meta["catalog_version"],
+            max_postings=meta["max_postings"],
+            terms=StringTable.from_arrays(arrays, "index.terms"),
+            term_item=arrays["index.term_item"],
+            term_token_count=arrays["index.term_token_count"],
+            term_gram_ptr=arrays["index.term_gram_ptr"],
+            term_gram_ids=arrays["index.term_gram_ids"],
+            grams=StringTable.from_arrays(arrays, "index.grams"),
+            gram_ptr=arrays["index.gram_ptr"],
+            gram_terms=arrays["index.gram_terms"],
+            vocabulary=vocabulary,
+            token_ptr=arrays["index.token_ptr"],
+            token_terms=arrays["index.token_terms"],
+            fuzzy=DeletionIndex.from_arrays(vocabulary, arrays, meta["max_distance"]),
+            context=ContextVectors.from_arrays(len(items), arrays),
+            associations=AssociationMatrix.from_arrays(len(items), arrays),
+            fragments=SuggestionFragments.from_arrays(arrays),
+        )
+        return index
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        arrays, item_meta = ItemTable.encode(self.items)
+        arrays.update(self._terms.to_arrays("index.terms"))
+        arrays.update(self._grams.to_arrays("index.grams"))
+        arrays.update(self._vocabulary.to_arrays("index.tokens"))
+        arrays.update({
+            "index.term_item": self._term_item,
+            "index.term_token_count": self._term_token_count,
+            "index.term_gram_ptr": self._term_gram_ptr,
+            "index.term_gram_ids": self._term_gram_ids,
+            "index.gram_ptr": self._gram_ptr,
+            "index.gram_terms": self._gram_terms,
+            "index.token_ptr": self._token_ptr,
+            "index.token_terms": self._token_terms,
+        })
+        arrays.update(self._fuzzy.to_arrays())
+        arrays.update(self.context.to_arrays())
+        arrays.update(self.associations.to_arrays())
+        arrays.update(self.fragments.to_arrays())
+        meta = {
+            "catalog": item_meta,
+            "catalog_version": self.version,
+            "max_postings": self.max_postings,
+            "max_distance": self._fuzzy.max_distance,
+        }
+        return arrays, meta
+
+    def _attach(
+        self,
+        items: Sequence[CatalogItem],
+        version: str,
+        max_postings: int,
+        terms: StringTable,
+        term_item: np.ndarray,
+        term_token_count: np.ndarray,
+        term_gram_ptr: np.ndarray,
+        term_gram_ids: np.ndarray,
+        grams: StringTable,
+        gram_ptr: np.ndarray,
+        gram_terms: np.ndarray,
+        vocabulary: StringTable,
+        token_ptr: np.ndarray,
+        token_terms: np.ndarray,
+        fuzzy: DeletionIndex,
+        context: ContextVectors,
+        associations: AssociationMatrix,
+        fragments: SuggestionFragments,
+    ) -> None:
+        self.items = items
+        self.version = version
+        self.max_postings = max_postings
+        self.context = context
+        self.associations = associations
+        self.fragments = fragments
+        self._terms = terms
+        self._term_item = term_item
+        self._term_token_count = term_token_count
+        self._term_gram_ptr = term_gram_ptr
+        self._term_gram_ids = term_gram_ids
+        self._grams = grams
+        self._gram_ptr = gram_ptr
+        self._gram_terms = gram_terms
+        self._vocabulary = vocabulary
+        self._token_ptr = token_ptr
+        self._token_terms = token_terms
+        self._fuzzy = fuzzy
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def item(self, item_id: int) -> CatalogItem:
+        return self.items[item_id]
+
+    def term(self, term_id: int) -> str:
+        return self._terms[term_id]
+
+    def resolve(self, normalized_label: str) -> int:
+        """Item whose name or alias is exactly ``normalized_label``, or ``-1``."""
+        term_id = self._terms.find(normalized_label)
+        return int(self._term_item[term_id]) if term_id >= 0 else -1
+
+    def resolve_many(self, normalized_labels: Sequence[str]) -> np.ndarray:
+        """Distinct item ids of the labels that are exactly a name or alias; others are skipped."""
+        if not normalized_labels:
+            return np.empty(0, dtype=np.int64)
+        term_ids = np.array(self._terms.find_many(list(normalized_labels)), dtype=np.int64)
+        return np.unique(self._term_item[term_ids[term_ids >= 0]]).astype(np.int64)
+
+    def resolve_each(self, normalized_labels: Sequence[str]) -> np.ndarray:
+        """Item id of every label, in order: what :meth:`resolve` returns for each."""
+        if not normalized_labels:
+            return np.empty(0, dtype=np.int64)
+        term_ids = np.array(self._terms.find_many(list(normalized_labels)), dtype=np.int64)
+        return np.where(term_ids >= 0, self._term_item[np.maximum(term_ids, 0)], -1).astype(np.int64)
+
+    def search(self, normalized_query: str, fuzzy: bool = True) -> List[Candidate]:
+        """Return the best-matching term per item for an already-normalized query.
+
+        ``fuzzy=False`` skips typo correction and returns only the trigram and
+        substring hits, which is what streaming responses send first.
+        """
+        if not normalized_query:
+            return []
+        grams = trigrams(normalized_query, partial=True)
+        word_start_only = not grams
+        if word_start_only:
+            grams = {f" {normalized_query[0]}"}
+
+        known = np.array(
+            [gram_id for gram_id in self._grams.find_many(list(grams)) if gram_id >= 0], dtype=np.int64
+        )
+        required = max(1, math.ceil(len(grams) * MIN_OVERLAP))
+        # Unknown grams have empty postings, so they are the rarest and use up
+        # prefix-filter slots without contributing candidates.
+        budget = len(grams) - required + 1 - (len(grams) - known.size)
+
+        parts: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        if budget > 0 and known.size:
+            lengths = self._gram_ptr[known + 1] - self._gram_ptr[known]
+            rarest = known[np.argsort(lengths, kind="stable")[:budget]]
+            if rarest.size == 1:
+                # A single posting list is already duplicate-free.
+                start = int(self._gram_ptr[rarest[0]])
+                end = min(int(self._gram_ptr[rarest[0] + 1]), start + self.max_postings)
+                candidates = self._gram_terms[start:end].astype(np.int64)
+            else:
+                positions = gather_slices(self._gram_ptr, rarest, cap=self.max_postings)
+                candidates = np.unique(self._gram_terms[positions]).astype(np.int64)
+            if word_start_only:
+                parts.append(self._score_substrings(normalized_query, candidates))
+            else:
+                parts.append(self._score_overlap(normalized_query, len(grams), known, candidates))
+
+        corrected = self._fuzzy_terms(normalized_query) if fuzzy else None
+        if corrected is not None:
+            parts.append(corrected)
+
+        if not parts:
+            return []
+        term_ids = np.concatenate([part[0] for part in parts])
+        if term_ids.size == 0:
+            return []
+        similarity = np.concatenate([part[1] for part in parts])
+        exact = np.concatenate([part[2] for part in parts])
+
+        # Best term per item: order by item, then by descending similarity.
+        item_ids = self._term_item[term_ids]
+        order = np.lexsort((-similarity, item_ids))
+        grouped = item_ids[order]
+        best = order[np.flatnonzero(np.concatenate(([True], grouped[1:] != grouped[:-1])))]
+        return [
+            Candidate(item_id, score, term_id, "exact" if is_exact else "fuzzy")
+            for item_id, score, term_id, is_exact in zip(
+                item_ids[best].tolist(),
+                similarity[best].tolist(),
+                term_ids[best].tolist(),
+                exact[best].tolist(),
+            )
+        ]
+
+    def _score_substrings(self, query: str, candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        similarity = np.array(
+            [self._substring_similarity(query, term) for term in self._terms.take(candidates)],
+            dtype=np.float64,
+        )
+        keep = similarity > 0
+        return candidates[keep], similarity[keep], similarity[keep] >= EXACT_SIMILARITY
+
+    def _score_overlap(
+        self, query: str, gram_count: int, known: np.ndarray, candidates: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        term_lengths = self._term_gram_ptr[candidates + 1] - self._term_gram_ptr[candidates]
+        query_grams = np.zeros(len(self._grams), dtype=bool)
+        query_grams[known] = True
+        hits = query_grams[self._term_gram_ids[gather_slices(self._term_gram_ptr, candidates)]]
+        owner = np.repeat(np.arange(candidates.size), term_lengths)
+        overlap = np.bincount(owner, weights=hits, minlength=candidates.size)
+
+        containment = overlap / gram_count
+        similarity = 0.8 * containment * (0.75 + 0.25 * overlap / np.maximum(term_lengths, 1))
+        similarity[containment < MIN_OVERLAP] = 0.0
+        # A term containing the query as a substring misses at most the
+        # query's leading-pad gram, so only those terms are decoded.
+        positions = np.flatnonzero(overlap >= gram_count - 1)
+        for position, term in zip(positions.tolist(), self._terms.take(candidates[positions])):
+            substring = self._substring_similarity(query, term)
+            if substring:
+                similarity[position] = substring
+        keep = similarity > 0
+        return candidates[keep], similarity[keep], similarity[keep] >= EXACT_SIMILARITY
+
+    @staticmethod
+    def _substring_similarity(query: str, term: str) -> float:
+        if query == term:
+            return 1.0
+        if query in term:
+            # Substring hits rank above gram overlap; shorter terms rank higher.
+            return 0.85 + 0.1 * len(query) / len(term)
+        return 0.0
+
+    def needs_fuzzy(self, normalized_query: str) -> bool:
+        """Whether :meth:`search` would try typo correction for this query."""
+        query_tokens = tokens(normalized_query)
+        # A known single word is fully covered by the trigram substring path.
+        return bool(query_tokens) and not (len(query_tokens) == 1 and self._vocabulary.find(query_tokens[0]) >= 0)
+
+    def _fuzzy_terms(self, normalized_query: str) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Score terms whose words are within edit distance of the query words."""
+        if not self.needs_fuzzy(normalized_query):
+            return None
+        query_tokens = tokens(normalized_query)
+        word_ids: List[int] = []
+        slots: List[int] = []
+        token_scores: List[float] = []
+        for position, token in enumerate(query_tokens):
+            for word_id, distance in self._fuzzy.lookup(token):
+                word = self._vocabulary[word_id]
+                word_ids.append(word_id)
+                slots.append(position)
+                token_scores.append(1.0 - distance / max(len(word), len(token)))
+        if not word_ids:
+            return None
+
+        words = np.array(word_ids, dtype=np.int64)
+        lengths = np.minimum(self._token_ptr[words + 1] - self._token_ptr[words], self.max_postings)
+        term_ids = self._token_terms[gather_slices(self._token_ptr, words, cap=self.max_postings)].astype(np.int64)
+        slot = np.repeat(np.array(slots, dtype=np.int64), lengths)
+        score = np.repeat(np.array(token_scores, dtype=np.float64), lengths)
+
+        # Keep the best score per (term, query token), then aggregate per term.
+        order = np.lexsort((-score, slot, term_ids))
+        pair = term_ids[order] * len(query_tokens) + slot[order]
+        keep = order[np.concatenate(([True], pair[1:] != pair[:-1]))]
+        terms, owner = np.unique(term_ids[keep], return_inverse=True)
+        covered = np.bincount(owner, minlength=terms.size)
+        coverage = np.bincount(owner, weights=score[keep], minlength=terms.size) / len(query_tokens)
+
+        passing = covered >= len(query_tokens) * MIN_OVERLAP
+        terms, covered, coverage = terms[passing], covered[passing], coverage[passing]
+        specificity = covered / np.maximum(self._term_token_count[terms], 1)
+        return terms, 0.8 * coverage * (0.75 + 0.25 * specificity), coverage == 1.0
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import resource
+import secrets
+import sys
 import time
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from operator import attrgetter
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI
+import numpy as np
+import orjson
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
+
+from .cache import TTLCache, context_fingerprint
+from .classifier import DEFAULT_LIMIT, DEFAULT_MIN_CONFIDENCE
+from .coalesce import SingleFlight
+from .config import Settings
+from .encoding import encode_merged
+from .executor import ExecutorSaturated, ScoringExecutor
+from .index import SuggestionIndex
+from .metrics import CONTENT_TYPE, Metrics, StageTimer
+from .profiling import PROFILE_HEADER, SamplingProfiler
+from .reload import Generation, IndexReloader
+from .shards import IndexShards
+from .text import normalize
+from .vectors import top_k_indices
 
 
 class ContextItem(BaseModel):
@@ -28,57 +53,756 @@ class Suggestion(BaseModel):
 
 class SuggestResponse(BaseModel):
     suggestions: List[Suggestion]
-    latency_ms: int
+    latency_ms: float
     model_version: str = "baseline-v0"
 
 
-app = FastAPI(title="Smart Shopper Recommendations", version="0.1.0")
+class Completion(BaseModel):
+    label: str
+    type: str = Field(default="product")
+    category: str
 
 
-@app.get("/health", tags=["meta"])
-def health() -> dict:
-    return {"status": "ok"}
+class AutocompleteResponse(BaseModel):
+    prefix: str
+    completions: List[Completion]
+    latency_ms: float
+    model_version: str = "baseline-v0"
 
 
-@app.post("/suggest", response_model=SuggestResponse, tags=["recommendations"])
-def suggest(request: SuggestRequest) -> SuggestResponse:
+class BatchSuggestRequest(BaseModel):
+    queries: List[SuggestRequest] = Field(..., min_length=1, max_length=200)
+
+
+class BatchSuggestResult(BaseModel):
+    query: str
+    suggestions: List[Suggestion]
+
+
+class BatchSuggestResponse(BaseModel):
+    results: List[BatchSuggestResult]
+    latency_ms: float
+    model_version: str = "baseline-v0"
+
+
+class ClassifyRequest(BaseModel):
+    items: List[str] = Field(..., min_length=1, max_length=500)
+    limit: int = Field(DEFAULT_LIMIT, ge=1, le=20)
+    min_confidence: float = Field(DEFAULT_MIN_CONFIDENCE, gt=0, le=1)
+
+
+class Classification(BaseModel):
+    """``HybridClassification`` from supabase/functions/_shared/hybrid-classifier.ts."""
+
+    category: str
+    canonical_name: str = Field(alias="canonicalName")
+    confidence: float = Field(ge=0, le=1)
+    source: str
+    matched_alias: Optional[str] = Field(default=None, alias="matchedAlias")
+    explanation: Optional[str] = None
+
+
+class ClassifyResult(BaseModel):
+    item: str
+    classifications: List[Classification]
+
+
+class ClassifyResponse(BaseModel):
+    results: List[ClassifyResult]
+    latency_ms: float
+    model_version: str = "baseline-v0"
+
+
+class PriceRequest(BaseModel):
+    items: List[str] = Field(..., min_length=1, max_length=500)
+    region: str = Field(..., min_length=2, max_length=2)
+    store: Optional[str] = None
+
+
+class Price(BaseModel):
+    store: str
+    unit_price: float
+    currency: str
+    captured_at: int
+
+
+class PriceResult(BaseModel):
+    item: str
+    name: Optional[str] = None
+    best: Optional[Price] = None
+
+
+class PriceResponse(BaseModel):
+    region: str
+    results: List[PriceResult]
+    latency_ms: float
+    model_version: str = "baseline-v0"
+
+
+class ReloadResponse(BaseModel):
+    previous_version: str
+    catalog_version: str
+    generation: int
+    source: str
+    build_ms: float
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     start = time.perf_counter()
-    normalized_query = request.query.lower().strip()
-
-    seed_catalog = [
-        "whole wheat bread",
-        "white bread",
-        "multigrain bread",
-        "almond milk",
-        "oat milk",
-        "cheddar cheese",
-        "gouda cheese",
-        "organic eggs",
-        "brown eggs",
-        "plantain chips"
+    settings = Settings.from_env()
+    app.state.settings = settings
+    app.state.reloader = IndexReloader(settings)
+    app.state.suggest_cache = TTLCache(settings.cache_max_entries, settings.cache_ttl_seconds)
+    app.state.flights = SingleFlight(settings.coalesce)
+    app.state.metrics = Metrics()
+    app.state.startup_ms = (time.perf_counter() - start) * 1000
+    watcher = None
+    if settings.reload_interval_seconds > 0:
+        watcher = asyncio.create_task(app.state.reloader.watch(settings.reload_interval_seconds))
+    yield
+    if watcher is not None:
+        watcher.cancel()
+    app.state.reloader.shutdown()
+
+
+app = FastAPI(
+    title="Smart Shopper Recommendations",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+
+async def get_generation(http_request: Request) -> AsyncIterator[Generation]:
+    """Lease the serving generation for the whole request, so a reload never swaps it mid-flight."""
+    reloader: IndexReloader = http_request.app.state.reloader
+    generation = reloader.acquire()
+    try:
+        yield generation
+    finally:
+        reloader.release(generation)
+
+
+def get_reloader(http_request: Request) -> IndexReloader:
+    return http_request.app.state.reloader
+
+
+def get_suggest_cache(http_request: Request) -> TTLCache:
+    return http_request.app.state.suggest_cache
+
+
+def get_flights(http_request: Request) -> SingleFlight:
+    return http_request.app.state.flights
+
+
+def get_settings(http_request: Request) -> Settings:
+    return http_request.app.state.settings
+
+
+def get_metrics(http_request: Request) -> Metrics:
+    return http_request.app.state.metrics
+
+
+async def get_request_timer(
+    http_request: Request, settings: Settings = Depends(get_settings)
+) -> AsyncIterator[StageTimer]:
+    """Stage timer for one request; also starts the sampling profiler when asked to via ``X-Reco-Profile``."""
+    timer = StageTimer()
+    if settings.profile_dir is not None and http_request.headers.get(PROFILE_HEADER):
+        timer.profiler = SamplingProfiler(settings.profile_interval_ms / 1000)
+        timer.profiler.start()
+    try:
+        yield timer
+    finally:
+        if timer.profiler is not None:
+            timer.profiler.stop()
+
+
+def timed_response(
+    endpoint: str, payload: dict, timer: StageTimer, metrics: Metrics, settings: Settings
+) -> Response:
+    """Serialize ``payload`` and attach the request's ``Server-Timing`` (and profile report) headers.
+
+    ``payload`` follows the endpoint's response model; ranked suggestions are
+    spliced in as pre-encoded ``orjson.Fragment`` arrays rather than models.
+    """
+    body = orjson.dumps(payload)
+    timer.lap("serialize")
+    metrics.observe(endpoint, timer)
+    headers = {"Server-Timing": timer.server_timing()}
+    if timer.profiler is not None:
+        headers[PROFILE_HEADER] = timer.profiler.finish(settings.profile_dir, endpoint)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def resident_memory_mb() -> float:
+    """Current RSS of this worker process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB elsewhere.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@app.get("/health", tags=["meta"])
+async def health(
+    http_request: Request,
+    generation: Generation = Depends(get_generation),
+    reloader: IndexReloader = Depends(get_reloader),
+    cache: TTLCache = Depends(get_suggest_cache),
+    flights: SingleFlight = Depends(get_flights),
+) -> dict:
+    return {
+        "status": "ok",
+        "catalog_items": len(generation.index),
+        "shards": generation.shards.stats(),
+        "classifier": generation.shards.classifier.stats() if generation.shards.classifier is not None else None,
+        "prices": generation.prices.stats() if generation.prices is not None else None,
+        "catalog_version": generation.version,
+        "index_source": generation.source,
+        "startup_ms": round(http_request.app.state.startup_ms, 1),
+        "rss_mb": resident_memory_mb(),
+        "reload": reloader.stats(),
+        "cache": cache.stats(),
+        "coalescing": flights.stats(),
+        "executor": generation.executor.stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["meta"])
+async def metrics_endpoint(
+    generation: Generation = Depends(get_generation),
+    reloader: IndexReloader = Depends(get_reloader),
+    cache: TTLCache = Depends(get_suggest_cache),
+    flights: SingleFlight = Depends(get_flights),
+    metrics: Metrics = Depends(get_metrics),
+) -> Response:
+    """Prometheus text exposition of request/stage latency histograms and service counters."""
+    cache_stats = cache.stats()
+    flight_stats = flights.stats()
+    executor_stats = generation.executor.stats()
+    reload_stats = reloader.stats()
+    families = [
+        ("reco_catalog_items", "gauge", "Items in the serving catalog.",
+         [({"version": generation.version, "source": generation.source}, len(generation.index))]),
+        ("reco_shard_items", "gauge", "Items in each locale shard.",
+         [({"shard": shard}, items) for shard, items in generation.shards.stats().items()]),
+        ("reco_cache_entries", "gauge", "Entries in the suggestion cache.", [({}, cache_stats["entries"])]),
+        ("reco_cache_hits_total", "counter", "Suggestion cache hits.", [({}, cache_stats["hits"])]),
+        ("reco_cache_misses_total", "counter", "Suggestion cache misses.", [({}, cache_stats["misses"])]),
+        ("reco_cache_evictions_total", "counter", "Suggestion cache LRU evictions.", [({}, cache_stats["evictions"])]),
+        ("reco_coalesce_leaders_total", "counter", "Rankings computed for a query key no other request was computing.",
+         [({}, flight_stats["leaders"])]),
+        ("reco_coalesced_total", "counter", "Rankings shared with a concurrent request for the same query key.",
+         [({}, flight_stats["coalesced"])]),
+        ("reco_coalesce_in_flight", "gauge", "Query keys being ranked right now.", [({}, flight_stats["in_flight"])]),
+        ("reco_executor_queued", "gauge", "Scoring jobs waiting for a worker.", [({}, executor_stats["queued"])]),
+        ("reco_executor_in_flight", "gauge", "Scoring jobs running.", [({}, executor_stats["in_flight"])]),
+        ("reco_executor_rejected_total", "counter", "Scoring jobs rejected with 503.", [({}, executor_stats["rejected"])]),
+        ("reco_reloads_total", "counter", "Successful catalog reloads.", [({}, reload_stats["reloads"])]),
+        ("reco_reload_failures_total", "counter", "Failed catalog reloads.", [({}, reload_stats["failures"])]),
     ]
+    return Response(metrics.render(families), media_type=CONTENT_TYPE)
+
+
+def normalize_context(context_items: List[ContextItem]) -> Tuple[str, ...]:
+    labels = (normalize(ctx.label) for ctx in context_items)
+    return tuple(label for label in labels if label)
+
+
+def rank_candidates(
+    index: SuggestionIndex,
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    limit: int,
+    timer: StageTimer,
+    exact_only: bool = False,
+) -> List[Tuple[int, float, str]]:
+    """Top ``limit`` ``(item_id, confidence, match)`` results for a query, best first.
+
+    ``exact_only`` skips typo correction and keeps only ``exact`` hits
+    (similarity of at least ``EXACT_SIMILARITY``), dropping partial trigram
+    overlaps.
+    """
+    candidates = index.search(normalized_query, fuzzy=not exact_only)
+    if exact_only:
+        candidates = [candidate for candidate in candidates if candidate.match == "exact"]
+    timer.lap("retrieve")
+    if context_labels and candidates:
+        # One sparse mat-vec for the context, one gather of the context items'
+        # association rows, then argpartition for the top k.
+        relevance = index.context.relevance(context_labels)
+        affinity = index.associations.affinity(index.resolve_many(context_labels))
+        count = len(candidates)
+        item_ids = np.fromiter((c.item_id for c in candidates), dtype=np.int64, count=count)
+        similarity = np.fromiter((c.similarity for c in candidates), dtype=np.float64, count=count)
+        scores = 0.4 + 0.4 * similarity + 0.15 * relevance[item_ids]
+        if affinity is not None:
+            scores += 0.15 * affinity[item_ids]
+        scores = np.minimum(scores, 0.99)
+        timer.lap("score")
+        ranked = [
+            (candidates[position].item_id, float(scores[position]), candidates[position].match)
+            for position in top_k_indices(scores, limit).tolist()
+        ]
+    else:
+        winners = heapq.nlargest(limit, candidates, key=attrgetter("similarity"))
+        ranked = [
+            (candidate.item_id, min(0.4 + 0.4 * candidate.similarity, 0.99), candidate.match)
+            for candidate in winners
+        ]
+    timer.lap("top_k")
+    return ranked
+
+
+def rank_routed(
+    shards: IndexShards,
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    locale: Optional[str],
+    limit: int,
+    timer: StageTimer,
+    exact_only: bool = False,
+) -> bytes:
+    """Encoded suggestions from the locale's shard, topped up from the shared shard.
+
+    A region shard only holds the items sold in that region, so when it has
+    fewer than ``limit`` hits the shared shard's hits for products the region
+    shard did not return join them. The two lists are merged by confidence
+    (a regional hit stays ahead of a shared hit with the same confidence) and
+    cut to ``limit``.
+    """
+    index = shards.route(locale)
+    ranked = rank_candidates(index, normalized_query, context_labels, limit, timer, exact_only)
+    if len(ranked) >= limit or index is shards.shared:
+        encoded = index.fragments.encode_list(ranked, locale)
+        timer.lap("serialize")
+        return encoded
+    shared = shards.shared
+    names = {index.item(item_id).name for item_id, _, _ in ranked}
+    fallback = rank_candidates(shared, normalized_query, context_labels, limit, timer, exact_only)
+    merged = [(index.fragments, hit) for hit in ranked]
+    merged.extend((shared.fragments, hit) for hit in fallback if shared.item(hit[0]).name not in names)
+    # sort() is stable, so regional hits win ties.
+    merged.sort(key=lambda pair: pair[1][1], reverse=True)
+    encoded = encode_merged(merged[:limit], locale)
+    timer.lap("serialize")
+    return encoded
+
+
+def rank_timed(
+    shards: IndexShards,
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    locale: Optional[str],
+    limit: int,
+) -> Tuple[bytes, Dict[str, int]]:
+    """Executor entry point: the encoded suggestions for the locale plus the stages timed in the worker."""
+    timer = StageTimer()
+    return rank_routed(shards, normalized_query, context_labels, locale, limit, timer), timer.stages
+
+
+def rank_exact(
+    shards: IndexShards,
+    normalized_query: str,
+    locale: Optional[str],
+    limit: int,
+) -> Tuple[bytes, Dict[str, int]]:
+    """Executor entry point for the first streamed result: exact and substring hits only, no typo or context scoring."""
+    timer = StageTimer()
+    return rank_routed(shards, normalized_query, (), locale, limit, timer, exact_only=True), timer.stages
+
+
+def rank_many(
+    shards: IndexShards,
+    queries: List[Tuple[str, Tuple[str, ...], Optional[str]]],
+    limit: int,
+) -> Tuple[List[bytes], Dict[str, int]]:
+    timer = StageTimer()
+    ranked = [rank_routed(shards, query, context, locale, limit, timer) for query, context, locale in queries]
+    return ranked, timer.stages
 
-    matches: List[Suggestion] = []
-    for item in seed_catalog:
-        score = 0.4
-        if normalized_query in item:
-            score += 0.4
-        if any(ctx.label.lower() in item for ctx in request.context_items):
-            score += 0.15
-        matches.append(
-            Suggestion(
-              label=item.title(),
-              type="product",
-              confidence=min(score, 0.99),
-              metadata={
-                "locale": request.locale or "global",
-                "source": "seed"
-              }
-            )
+
+def suggestion_cache_key(
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    locale: Optional[str],
+    limit: int,
+) -> Tuple[str, Optional[str], str, int]:
+    return (normalized_query, locale, context_fingerprint(context_labels), limit)
+
+
+async def run_scoring(executor: ScoringExecutor, fn, *args):
+    try:
+        return await executor.run(fn, *args)
+    except ExecutorSaturated as exc:
+        raise HTTPException(status_code=503, detail="Scoring queue is full; retry shortly.") from exc
+
+
+async def rank_coalesced(
+    generation: Generation,
+    flights: SingleFlight,
+    cache: TTLCache,
+    key: tuple,
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    locale: Optional[str],
+    limit: int,
+) -> Tuple[bytes, Optional[Dict[str, int]]]:
+    """Rank one query, sharing the work with identical concurrent requests.
+
+    Returns the encoded suggestions and the worker stages, which are ``None``
+    when another request computed the result.
+    """
+
+    async def score(_: List[tuple]) -> Tuple[List[bytes], Dict[str, int]]:
+        ranked, stages = await run_scoring(
+            generation.executor, rank_timed, normalized_query, context_labels, locale, limit
         )
+        cache.put(key, ranked, generation.cache_scope)
+        return [ranked], stages
+
+    flight = (generation.cache_scope, key)
+    values, stages = await flights.run_many([flight], score)
+    return values[flight], stages
+
+
+def merge_stages(timer: StageTimer, stages: Optional[Dict[str, int]]) -> None:
+    """Fold in worker stages, or charge the wait to ``coalesce`` when another request did the work."""
+    if stages is None:
+        timer.lap("coalesce")
+    else:
+        timer.merge(stages)
+
+
+@app.post("/suggest", response_model=SuggestResponse, tags=["recommendations"])
+async def suggest(
+    request: SuggestRequest,
+    generation: Generation = Depends(get_generation),
+    cache: TTLCache = Depends(get_suggest_cache),
+    flights: SingleFlight = Depends(get_flights),
+    settings: Settings = Depends(get_settings),
+    metrics: Metrics = Depends(get_metrics),
+    timer: StageTimer = Depends(get_request_timer),
+) -> Response:
+    timer.lap("validate")
+    normalized_query = normalize(request.query)
+    context_labels = normalize_context(request.context_items)
+    timer.lap("normalize")
+    key = suggestion_cache_key(normalized_query, context_labels, request.locale, settings.max_suggestions)
+    top_matches = cache.get(key, generation.cache_scope)
+    timer.lap("cache")
+    if top_matches is None:
+        top_matches, stages = await rank_coalesced(
+            generation,
+            flights,
+            cache,
+            key,
+            normalized_query,
+            context_labels,
+            request.locale,
+            settings.max_suggestions,
+        )
+        merge_stages(timer, stages)
+
+    payload = {
+        "suggestions": orjson.Fragment(top_matches),
+        "latency_ms": timer.latency_ms(),
+        "model_version": generation.version,
+    }
+    return timed_response("suggest", payload, timer, metrics, settings)
+
+
+@app.post("/suggest/batch", response_model=BatchSuggestResponse, tags=["recommendations"])
+async def suggest_batch(
+    request: BatchSuggestRequest,
+    generation: Generation = Depends(get_generation),
+    cache: TTLCache = Depends(get_suggest_cache),
+    flights: SingleFlight = Depends(get_flights),
+    settings: Settings = Depends(get_settings),
+    metrics: Metrics = Depends(get_metrics),
+    timer: StageTimer = Depends(get_request_timer),
+) -> Response:
+    """Score many queries in one round trip.
+
+    Context lists are normalized once per distinct list (smart-add batches
+    usually share one), repeated (query, locale, context) combinations are
+    ranked once, cache misses another request is already ranking are shared,
+    and the rest are scored in a single executor job.
+    """
+    timer.lap("validate")
+    limit = settings.max_suggestions
+    context_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    resolved: Dict[tuple, bytes] = {}
+    missing: Dict[tuple, Tuple[str, Tuple[str, ...], Optional[str]]] = {}
+    entries: List[Tuple[str, tuple]] = []
+
+    for query in request.queries:
+        raw_context = tuple(ctx.label for ctx in query.context_items)
+        context_labels = context_cache.get(raw_context)
+        if context_labels is None:
+            context_labels = normalize_context(query.context_items)
+            context_cache[raw_context] = context_labels
+
+        normalized_query = normalize(query.query)
+        timer.lap("normalize")
+        key = suggestion_cache_key(normalized_query, context_labels, query.locale, limit)
+        entries.append((query.query, key))
+        if key in resolved or key in missing:
+            continue
+        cached = cache.get(key, generation.cache_scope)
+        if cached is None:
+            missing[key] = (normalized_query, context_labels, query.locale)
+        else:
+            resolved[key] = cached
+        timer.lap("cache")
+
+    if missing:
+        scope = generation.cache_scope
+
+        async def score(flights_led: List[tuple]) -> Tuple[List[bytes], Dict[str, int]]:
+            keys = [key for _, key in flights_led]
+            ranked, stages = await run_scoring(generation.executor, rank_many, [missing[key] for key in keys], limit)
+            for key, suggestions in zip(keys, ranked):
+                cache.put(key, suggestions, scope)
+            return ranked, stages
+
+        shared, stages = await flights.run_many([(scope, key) for key in missing], score)
+        merge_stages(timer, stages)
+        for (_, key), suggestions in shared.items():
+            resolved[key] = suggestions
+
+    results = [{"query": text, "suggestions": orjson.Fragment(resolved[key])} for text, key in entries]
+    payload = {"results": results, "latency_ms": timer.latency_ms(), "model_version": generation.version}
+    return timed_response("suggest_batch", payload, timer, metrics, settings)
+
+
+def stream_event(
+    phase: str, suggestions: bytes, complete: bool, timer: StageTimer, model_version: str, sse: bool
+) -> bytes:
+    """One ``/suggest/stream`` event, framed as an NDJSON line or a server-sent event."""
+    body = orjson.dumps({
+        "phase": phase,
+        "complete": complete,
+        "suggestions": orjson.Fragment(suggestions),
+        "latency_ms": timer.latency_ms(),
+        "model_version": model_version,
+    })
+    timer.lap("serialize")
+    if sse:
+        return b"event: " + phase.encode("ascii") + b"\ndata: " + body + b"\n\n"
+    return body + b"\n"
+
+
+@app.post("/suggest/stream", tags=["recommendations"])
+async def suggest_stream(
+    request: SuggestRequest,
+    http_request: Request,
+    reloader: IndexReloader = Depends(get_reloader),
+    cache: TTLCache = Depends(get_suggest_cache),
+    flights: SingleFlight = Depends(get_flights),
+    settings: Settings = Depends(get_settings),
+    metrics: Metrics = Depends(get_metrics),
+) -> StreamingResponse:
+    """Stream the ``/suggest`` ranking in phases instead of waiting for all of it.
+
+    When typo correction or context scoring has work to do, an ``exact``
+    event with the exact and substring hits goes out first, before that
+    work starts. The last event is always ``ranked`` with ``complete: true``
+    and carries exactly what ``/suggest`` returns. Events are NDJSON lines,
+    or server-sent events when the request accepts ``text/event-stream``.
+    """
+    timer = StageTimer()
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    limit = settings.max_suggestions
+    # The stream outlives dependency teardown, so the generation is leased
+    # here and released by the response's background task.
+    generation = reloader.acquire()
+    try:
+        timer.lap("validate")
+        normalized_query = normalize(request.query)
+        context_labels = normalize_context(request.context_items)
+        timer.lap("normalize")
+        key = suggestion_cache_key(normalized_query, context_labels, request.locale, limit)
+        ranked = cache.get(key, generation.cache_scope)
+        timer.lap("cache")
+        exact = None
+        if ranked is None:
+            index = generation.shards.route(request.locale)
+            if context_labels or index.needs_fuzzy(normalized_query):
+                exact, stages = await run_scoring(
+                    generation.executor, rank_exact, normalized_query, request.locale, limit
+                )
+            else:
+                ranked, stages = await rank_coalesced(
+                    generation, flights, cache, key, normalized_query, context_labels, request.locale, limit
+                )
+            merge_stages(timer, stages)
+    except BaseException:
+        reloader.release(generation)
+        raise
+
+    async def events() -> AsyncIterator[bytes]:
+        final = ranked
+        if exact is not None:
+            yield stream_event("exact", exact, False, timer, generation.version, sse)
+            try:
+                final, stages = await rank_coalesced(
+                    generation, flights, cache, key, normalized_query, context_labels, request.locale, limit
+                )
+            except HTTPException as exc:
+                # Headers are already sent; end the stream with the reason instead of a status.
+                error = orjson.dumps({"phase": "error", "complete": False, "detail": exc.detail})
+                yield b"event: error\ndata: " + error + b"\n\n" if sse else error + b"\n"
+                metrics.observe("suggest_stream", timer)
+                return
+            merge_stages(timer, stages)
+        yield stream_event("ranked", final, True, timer, generation.version, sse)
+        metrics.observe("suggest_stream", timer)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+        background=BackgroundTask(reloader.release, generation),
+    )
+
+
+@app.get("/autocomplete", response_model=AutocompleteResponse, tags=["recommendations"])
+def autocomplete(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(8, ge=1, le=50),
+    generation: Generation = Depends(get_generation),
+    settings: Settings = Depends(get_settings),
+    metrics: Metrics = Depends(get_metrics),
+    timer: StageTimer = Depends(get_request_timer),
+) -> Response:
+    timer.lap("validate")
+    completions = [
+        {"label": item.label, "type": "product", "category": item.category}
+        for item in generation.autocomplete.complete(q, limit)
+    ]
+    timer.lap("retrieve")
+    payload = {
+        "prefix": q,
+        "completions": completions,
+        "latency_ms": timer.latency_ms(),
+        "model_version": generation.version,
+    }
+    return timed_response("autocomplete", payload, timer, metrics, settings)
+
+
+def classify_items(
+    shards: IndexShards, items: List[str], limit: int, min_confidence: float
+) -> Tuple[List[List[dict]], Dict[str, int]]:
+    timer = StageTimer()
+    classified = shards.classifier.classify_many(items, limit, min_confidence, timer)
+    return classified, timer.stages
+
+
+@app.post("/classify", response_model=ClassifyResponse, tags=["classification"])
+async def classify(
+    request: ClassifyRequest,
+    generation: Generation = Depends(get_generation),
+    settings: Settings = Depends(get_settings),
+    metrics: Metrics = Depends(get_metrics),
+    timer: StageTimer = Depends(get_request_timer),
+) -> Response:
+    """Classify receipt item lines against the food dictionary (``foodDictionary``: hand-written and western seeds).
+
+    Each item gets what ``classifyProductName`` in hybrid-classifier.ts
+    returns for it (same categories, confidences, sources and explanations),
+    with the whole batch scored in one executor job.
+    """
+    timer.lap("validate")
+    if generation.shards.classifier is None:
+        raise HTTPException(status_code=503, detail="Food dictionary is not loaded; classification is unavailable.")
+    classified, stages = await run_scoring(
+        generation.executor, classify_items, request.items, request.limit, request.min_confidence
+    )
+    timer.merge(stages)
+    payload = {
+        "results": [
+            {"item": item, "classifications": classifications}
+            for item, classifications in zip(request.items, classified)
+        ],
+        "latency_ms": timer.latency_ms(),
+        "model_version": generation.version,
+    }
+    return timed_response("classify", payload, timer, metrics, settings)
+
+
+@app.post("/prices", response_model=PriceResponse, tags=["prices"])
+def prices(
+    request: PriceRequest,
+    generation: Generation = Depends(get_generation),
+    settings: Settings = Depends(get_settings),
+    metrics: Metrics = Depends(get_metrics),
+    timer: StageTimer = Depends(get_request_timer),
+) -> Response:
+    """Best current price of each item in a region, from the catalog price snapshots.
+
+    Items are matched to catalog products by exact normalized name or alias,
+    like ``context_items``. The best price is the lowest latest unit price
+    among the region's stores, or the latest price at ``store`` when given.
+    """
+    timer.lap("validate")
+    store = generation.prices
+    if store is None:
+        raise HTTPException(status_code=503, detail="Catalog prices are not loaded.")
+    index = generation.index
+    item_ids = index.resolve_each([normalize(item) for item in request.items])
+    timer.lap("normalize")
+    rows = store.best(item_ids, request.region, request.store)
+    timer.lap("retrieve")
+    results = [
+        {
+            "item": item,
+            "name": index.item(item_id).name if item_id >= 0 else None,
+            "best": store.row(row) if row >= 0 else None,
+        }
+        for item, item_id, row in zip(request.items, item_ids.tolist(), rows.tolist())
+    ]
+    payload = {
+        "region": request.region.lower(),
+        "results": results,
+        "latency_ms": timer.latency_ms(),
+        "model_version": generation.version,
+    }
+    return timed_response("prices", payload, timer, metrics, settings)
+
 
-    matches.sort(key=lambda suggestion: suggestion.confidence, reverse=True)
-    top_matches = matches[:8]
+@app.post("/admin/reload", response_model=ReloadResponse, tags=["admin"])
+async def reload_catalog(
+    reloader: IndexReloader = Depends(get_reloader),
+    settings: Settings = Depends(get_settings),
+    x_admin_token: Optional[str] = Header(default=None),
+) -> ReloadResponse:
+    """Rebuild the indexes from the current catalog inputs and swap them in.
 
-    duration_ms = int((time.perf_counter() - start) * 1000)
-    return SuggestResponse(suggestions=top_matches, latency_ms=duration_ms)
+    Requests already running finish on the previous generation; the previous
+    one keeps serving if the rebuild fails. The endpoint is disabled unless
+    ``RECO_ADMIN_TOKEN`` is set, since every call is a full rebuild.
+    """
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Admin reload is disabled; set RECO_ADMIN_TOKEN to enable it.")
+    if not secrets.compare_digest(x_admin_token or "", settings.admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+    previous_version = reloader.current.version
+    try:
+        generation = await reloader.reload()
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Catalog reload failed: {reloader.last_error}") from exc
+    return ReloadResponse(
+        previous_version=previous_version,
+        catalog_version=generation.version,
+        generation=generation.number,
+        source=generation.source,
+        build_ms=round(generation.build_ms, 1),
+    )
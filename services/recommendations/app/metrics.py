@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+# Upper bounds in seconds; most requests finish well under a millisecond, so
+# the low end is resolved to tens of microseconds.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Sample = Tuple[Dict[str, str], float]
+
+
+class StageTimer:
+    """Per-request stage durations in integer nanoseconds.
+
+    Each :meth:`lap` charges the time since the previous lap to the named
+    stage; repeated laps of the same stage (the batch endpoint normalizes and
+    looks up the cache once per query) accumulate. Stages timed in a scoring
+    worker are returned as a plain dict and folded in with :meth:`merge`, so
+    this works the same for thread and process executors.
+    """
+
+    __slots__ = ("stages", "started", "_last", "profiler")
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, int] = {}
+        self.started = self._last = time.perf_counter_ns()
+        self.profiler = None
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter_ns()
+        self.stages[stage] = self.stages.get(stage, 0) + now - self._last
+        self._last = now
+
+    def merge(self, stages: Dict[str, int]) -> None:
+        """Add stages timed by a scoring worker since the last lap.
+
+        Whatever part of that wall time the worker did not account for (waiting
+        for an executor slot, thread hand-off, pickling) is charged to ``queue``.
+        """
+        now = time.perf_counter_ns()
+        for stage, duration in stages.items():
+            self.stages[stage] = self.stages.get(stage, 0) + duration
+        waited = now - self._last - sum(stages.values())
+        self.stages["queue"] = self.stages.get("queue", 0) + max(waited, 0)
+        self._last = now
+
+    def elapsed_ns(self) -> int:
+        return time.perf_counter_ns() - self.started
+
+    def latency_ms(self) -> float:
+        return round(self.elapsed_ns() / 1e6, 3)
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value, durations in ms with microsecond precision."""
+        parts = [f"{stage};dur={duration / 1e6:.3f}" for stage, duration in self.stages.items()]
+        parts.append(f"total;dur={self.elapsed_ns() / 1e6:.3f}")
+        return ", ".join(parts)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition layout."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # One slot per bucket plus +Inf; made cumulative when rendered.
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def samples(self, name: str, labels: Dict[str, str]) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*(repr(b) for b in self.buckets), "+Inf"), self.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {self.total!r}")
+        lines.append(f"{name}_count{_labels(labels)} {self.count}")
+        return lines
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _family(name: str, kind: str, help_text: str, lines: Iterable[str]) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *lines]
+
+
+class Metrics:
+    """In-process request and stage latency histograms.
+
+    Every worker process keeps its own registry; Prometheus scrapes each
+    worker (or sums them) as usual. Observations take one lock per request.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._requests: Dict[str, Histogram] = {}
+        self._stages: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, timer: StageTimer) -> None:
+        elapsed = timer.elapsed_ns() / 1e9
+        with self._lock:
+            histogram = self._requests.get(endpoint)
+            if histogram is None:
+                histogram = self._requests[endpoint] = Histogram(self.buckets)
+            histogram.observe(elapsed)
+            for stage, duration in timer.stages.items():
+                histogram = self._stages.get((endpoint, stage))
+                if histogram is None:
+                    histogram = self._stages[(endpoint, stage)] = Histogram(self.buckets)
+                histogram.observe(duration / 1e9)
+
+    def render(self, families: Iterable[Tuple[str, str, str, List[Sample]]] = ()) -> str:
+        """Prometheus text exposition, plus extra ``(name, type, help, samples)`` families."""
+        with self._lock:
+            requests = [
+                line
+                for endpoint, histogram in sorted(self._requests.items())
+                for line in histogram.samples("reco_request_duration_seconds", {"endpoint": endpoint})
+            ]
+            stages = [
+                line
+                for (endpoint, stage), histogram in sorted(self._stages.items())
+                for line in histogram.samples("reco_stage_duration_seconds", {"endpoint": endpoint, "stage": stage})
+            ]
+        lines = _family(
+            "reco_request_duration_seconds", "histogram", "Handler latency per endpoint.", requests
+        )
+        lines += _family(
+            "reco_stage_duration_seconds", "histogram", "Latency per request stage and endpoint.", stages
+        )
+        for name, kind, help_text, samples in families:
+            lines += _family(name, kind, help_text, (f"{name}{_labels(labels)} {value!r}" for labels, value in samples))
+        return "\n".join(lines) + "\n"
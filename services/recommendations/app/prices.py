@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .arrays import StringTable
+from .catalog import Catalog
+from .text import normalize
+
+
+class PriceStore:
+    """Catalog price snapshots as typed columns, one row per captured price.
+
+    Every row holds the catalog item id (as numbered by the shared shard),
+    region, store and currency codes into small dictionary-encoded string
+    tables, the unit price and ``capturedAt`` (epoch milliseconds), so the
+    whole history is a handful of flat arrays instead of a dict per price.
+
+    Rows are sorted by (item, region, store, newest first). Two indexes sit on
+    top of the columns:
+
+    - ``latest_keys``/``latest_rows``: the newest row of every (item, region,
+      store), keyed by ``(item × regions + region) × stores + store`` and
+      found with ``np.searchsorted``;
+    - ``best_rows``: the cheapest of those newest rows per (item, region),
+      ``-1`` when the item has no price there, so a batch of best-price
+      lookups is a single gather.
+    """
+
+    def __init__(self, size: int, arrays: Dict[str, np.ndarray]):
+        self.size = size
+        self.regions = StringTable.from_arrays(arrays, "prices.regions")
+        self.stores = StringTable.from_arrays(arrays, "prices.stores")
+        self.currencies = StringTable.from_arrays(arrays, "prices.currencies")
+        self._store_keys = StringTable.from_arrays(arrays, "prices.store_keys")
+        self._arrays = arrays
+        self.item = arrays["prices.item"]
+        self.region = arrays["prices.region"]
+        self.store = arrays["prices.store"]
+        self.currency = arrays["prices.currency"]
+        self.unit_price = arrays["prices.unit_price"]
+        self.captured_at = arrays["prices.captured_at"]
+        self._latest_keys = arrays["prices.latest_keys"]
+        self._latest_rows = arrays["prices.latest_rows"]
+        self._best_rows = arrays["prices.best_rows"]
+
+    @classmethod
+    def build(cls, records: Mapping[str, Sequence[dict]], catalog: Catalog) -> "PriceStore":
+        """Columnize the ``prices`` of generated catalog records (``westernSharedCatalog``), by region."""
+        item_ids = {item.name.strip().lower(): item.item_id for item in catalog.items}
+        regions = sorted(region.lower() for region in records)
+        stores = sorted({price["store"] for rows in records.values() for record in rows for price in record["prices"]})
+        currencies = sorted(
+            {price["currency"] for rows in records.values() for record in rows for price in record["prices"]}
+        )
+        region_codes = {region: code for code, region in enumerate(regions)}
+        store_codes = {store: code for code, store in enumerate(stores)}
+        currency_codes = {currency: code for code, currency in enumerate(currencies)}
+
+        columns: Dict[str, List] = {"item": [], "region": [], "store": [], "currency": [], "unit_price": [], "captured_at": []}
+        for region, rows in records.items():
+            for record in rows:
+                item_id = item_ids.get(record["name"].strip().lower())
+                if item_id is None:
+                    continue
+                for price in record["prices"]:
+                    columns["item"].append(item_id)
+                    columns["region"].append(region_codes[region.lower()])
+                    columns["store"].append(store_codes[price["store"]])
+                    columns["currency"].append(currency_codes[price["currency"]])
+                    columns["unit_price"].append(price["unitPrice"])
+                    columns["captured_at"].append(price["capturedAt"])
+
+        arrays: Dict[str, np.ndarray] = {
+            "prices.item": np.array(columns["item"], dtype=np.int32),
+            "prices.region": np.array(columns["region"], dtype=np.uint8),
+            "prices.store": np.array(columns["store"], dtype=np.uint16),
+            "prices.currency": np.array(columns["currency"], dtype=np.uint8),
+            "prices.unit_price": np.array(columns["unit_price"], dtype=np.float64),
+            "prices.captured_at": np.array(columns["captured_at"], dtype=np.int64),
+        }
+        arrays.update(StringTable.from_strings(regions).to_arrays("prices.regions"))
+        arrays.update(StringTable.from_strings(stores).to_arrays("prices.stores"))
+        arrays.update(StringTable.from_strings(currencies).to_arrays("prices.currencies"))
+        arrays.update(StringTable.from_strings(normalize(store) for store in stores).to_arrays("prices.store_keys"))
+        arrays.update(_index(arrays, len(catalog), len(regions), len(stores)))
+        return cls(len(catalog), arrays)
+
+    @classmethod
+    def from_arrays(cls, size: int, arrays: Dict[str, np.ndarray]) -> "PriceStore":
+        return cls(size, {name: array for name, array in arrays.items() if name.startswith("prices.")})
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return dict(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self.item)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rows": len(self),
+            "items": int(np.count_nonzero((self._best_rows >= 0).reshape(self.size, -1).any(axis=1))),
+            "stores": len(self.stores),
+            "bytes": self.nbytes,
+        }
+
+    def best(self, item_ids: np.ndarray, region: str, store: Optional[str] = None) -> np.ndarray:
+        """Row of the best current price of each item in ``region`` (at ``store``, if given), or ``-1``.
+
+        Unknown items (negative ids), regions and stores have no price.
+        """
+        rows = np.full(item_ids.size, -1, dtype=np.int64)
+        region_code = self.regions.find(region.lower())
+        known = item_ids >= 0
+        if region_code < 0 or not known.any():
+            return rows
+        slots = item_ids[known].astype(np.int64) * len(self.regions) + region_code
+        if store is None:
+            rows[known] = self._best_rows[slots]
+            return rows
+        store_code = self._store_keys.find(normalize(store))
+        if store_code < 0 or not len(self._latest_keys):
+            return rows
+        keys = slots * len(self.stores) + store_code
+        found = np.minimum(np.searchsorted(self._latest_keys, keys), len(self._latest_keys) - 1)
+        rows[known] = np.where(self._latest_keys[found] == keys, self._latest_rows[found], -1)
+        return rows
+
+    def row(self, row: int) -> dict:
+        return {
+            "store": self.stores[int(self.store[row])],
+            "unit_price": float(self.unit_price[row]),
+            "currency": self.currencies[int(self.currency[row])],
+            "captured_at": int(self.captured_at[row]),
+        }
+
+
+def _index(arrays: Dict[str, np.ndarray], size: int, regions: int, stores: int) -> Dict[str, np.ndarray]:
+    """Sort the rows (item, region, store, newest first) and build the latest-row and best-row indexes."""
+    item, region, store = arrays["prices.item"], arrays["prices.region"], arrays["prices.store"]
+    unit_price, captured_at = arrays["prices.unit_price"], arrays["prices.captured_at"]
+    order = np.lexsort((unit_price, -captured_at, store, region, item))
+    for name in ("prices.item", "prices.region", "prices.store", "prices.currency", "prices.unit_price", "prices.captured_at"):
+        arrays[name] = arrays[name][order]
+    item, region, store = arrays["prices.item"], arrays["prices.region"], arrays["prices.store"]
+    unit_price = arrays["prices.unit_price"]
+
+    keys = (item.astype(np.int64) * regions + region) * stores + store
+    first = np.ones(keys.size, dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    latest_rows = np.flatnonzero(first)
+    latest_keys = keys[latest_rows]
+
+    # Cheapest current row per (item, region); ties go to the lower store code.
+    slots = latest_keys // stores
+    cheapest = latest_rows[np.lexsort((store[latest_rows], unit_price[latest_rows], slots))]
+    cheapest_slots = keys[cheapest] // stores
+    leading = np.ones(cheapest.size, dtype=bool)
+    leading[1:] = cheapest_slots[1:] != cheapest_slots[:-1]
+    best_rows = np.full(size * regions, -1, dtype=np.int32)
+    best_rows[cheapest_slots[leading]] = cheapest[leading]
+    return {
+        "prices.latest_keys": latest_keys,
+        "prices.latest_rows": latest_rows.astype(np.int32),
+        "prices.best_rows": best_rows,
+    }
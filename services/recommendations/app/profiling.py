@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional
+
+# Request header that turns the profiler on for one request (when
+# RECO_PROFILE_DIR is configured); the response echoes it with the report name.
+PROFILE_HEADER = "X-Reco-Profile"
+
+# Innermost frames of threads that are parked rather than working (event loop
+# polling, idle pool workers); their stacks would drown out the request.
+IDLE_FRAMES = frozenset({
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+})
+
+_switch_lock = threading.Lock()
+_switch_users = 0
+_saved_switch_interval = 0.0
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = Path(code.co_filename)
+    return f"{code.co_name} ({path.parent.name}/{path.name}:{code.co_firstlineno})"
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_FRAMES
+
+
+def _tighten_switch_interval(interval_seconds: float) -> None:
+    # A sampler can only look at other threads when it holds the GIL, which by
+    # default changes hands every 5 ms; shorten that while any profile runs.
+    global _switch_users, _saved_switch_interval
+    with _switch_lock:
+        if _switch_users == 0:
+            _saved_switch_interval = sys.getswitchinterval()
+        _switch_users += 1
+        sys.setswitchinterval(min(_saved_switch_interval, interval_seconds))
+
+
+def _restore_switch_interval() -> None:
+    global _switch_users
+    with _switch_lock:
+        _switch_users -= 1
+        if _switch_users == 0:
+            sys.setswitchinterval(_saved_switch_interval)
+
+
+class SamplingProfiler:
+    """Samples the Python stack of every busy thread every ``interval_seconds``.
+
+    Stacks are aggregated in the folded format (``thread;outer;...;inner
+    count``) read by flamegraph.pl and speedscope. Sampling is process-wide,
+    so concurrent requests show up too, and scoring done in ``process``
+    executor workers is not visible.
+    """
+
+    def __init__(self, interval_seconds: float = 0.001):
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        _tighten_switch_interval(self.interval_seconds)
+        self._thread = threading.Thread(target=self._run, name="reco-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        _restore_switch_interval()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            self._sample(own)
+
+    def _sample(self, own: int) -> None:
+        names: Dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own or _is_idle(frame):
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def finish(self, directory: Path, label: str) -> str:
+        """Stop sampling, write ``<label>-<timestamp>.folded`` and return the response header value."""
+        self.stop()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{label}-{time.time_ns()}.folded"
+        path.write_text(self.folded(), encoding="utf-8")
+        return f"{path.name}; samples={self.samples}"
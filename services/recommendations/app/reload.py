@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .autocomplete import PrefixIndex
+from .catalog import food_dictionary_seeds, load_catalog_records, load_dictionary_seeds, merge_catalog, seed_catalog
+from .classifier import ProductClassifier
+from .config import Settings
+from .executor import ScoringExecutor
+from .index import SuggestionIndex
+from .prices import PriceStore
+from .shards import IndexShards
+from .snapshot import load_associations, load_indexes
+
+logger = logging.getLogger(__name__)
+
+# How often a retired generation checks whether its last request finished.
+DRAIN_POLL_SECONDS = 0.05
+
+
+class Generation:
+    """One immutable catalog build: index shards and price store plus the executor that scores against them.
+
+    Requests lease the generation they started on (see
+    :meth:`IndexReloader.acquire`), so a swap never changes the index under a
+    request that is already running.
+    """
+
+    def __init__(
+        self,
+        number: int,
+        shards: IndexShards,
+        autocomplete: PrefixIndex,
+        prices: Optional[PriceStore],
+        executor: ScoringExecutor,
+        source: str,
+        build_ms: float,
+    ):
+        self.number = number
+        self.shards = shards
+        self.autocomplete = autocomplete
+        self.prices = prices
+        self.executor = executor
+        self.source = source
+        self.build_ms = build_ms
+        self.loaded_at = time.time()
+        self.leases = 0
+
+    @property
+    def index(self) -> SuggestionIndex:
+        """The shared shard: the whole catalog, as served to requests without a regional locale."""
+        return self.shards.shared
+
+    @property
+    def version(self) -> str:
+        return self.shards.version
+
+    @property
+    def cache_scope(self) -> Tuple[int, str]:
+        # Aliases can change without a catalog version bump, so cached results
+        # are scoped to the generation rather than the version alone. Newer
+        # generations have greater numbers, which is what TTLCache orders by.
+        return (self.number, self.version)
+
+
+def build_catalog_indexes(settings: Settings) -> Tuple[IndexShards, PrefixIndex, Optional[PriceStore]]:
+    """Build the index shards, autocomplete index and price store from the catalog sources.
+
+    The catalog records and dictionary seeds are read once and shared by
+    every structure built from them. This is also what
+    ``scripts/build_recommendations_snapshot.py`` writes into a snapshot.
+    """
+    seeds = None
+    if settings.dictionary_path.exists():
+        seeds = load_dictionary_seeds(settings.dictionary_path)
+    else:
+        logger.warning("dictionary %s not found; indexing catalog names only", settings.dictionary_path)
+    by_region: Optional[Dict[str, List[dict]]] = None
+    if settings.catalog_path.exists():
+        by_region, version = load_catalog_records(settings.catalog_path, settings.catalog_regions)
+        catalog = merge_catalog(by_region, version, seeds)
+    else:
+        logger.warning("catalog %s not found; falling back to the seed catalog", settings.catalog_path)
+        catalog = seed_catalog()
+    associations = None
+    if settings.associations_path is not None and settings.associations_path.exists():
+        associations = load_associations(settings.associations_path)
+    classifier = None
+    if seeds is not None:
+        if settings.core_dictionary_path.exists():
+            classifier = ProductClassifier.build(food_dictionary_seeds(settings.core_dictionary_path, seeds))
+        else:
+            logger.warning(
+                "core dictionary %s not found; classifying against the western seeds only", settings.core_dictionary_path
+            )
+            classifier = ProductClassifier.build(seeds)
+    shards = IndexShards.build(
+        catalog,
+        max_distance=settings.fuzzy_max_distance,
+        regional=settings.locale_shards,
+        associations=associations,
+        classifier=classifier,
+    )
+    prices = PriceStore.build(by_region, catalog) if by_region is not None else None
+    return shards, PrefixIndex(catalog, top_k=settings.autocomplete_top_k), prices
+
+
+def build_indexes(settings: Settings) -> Tuple[IndexShards, PrefixIndex, Optional[PriceStore], str]:
+    snapshot = settings.index_snapshot_path
+    if snapshot is not None and snapshot.exists():
+        shards, autocomplete, prices = load_indexes(snapshot)
+        if not settings.locale_shards:
+            shards = IndexShards(shards.shared, {}, shards.classifier)
+        return shards, autocomplete, prices, "snapshot"
+    return (*build_catalog_indexes(settings), "built")
+
+
+def build_generation(settings: Settings, number: int) -> Generation:
+    start = time.perf_counter()
+    shards, autocomplete, prices, source = build_indexes(settings)
+    executor = ScoringExecutor(
+        shards,
+        mode=settings.execution_mode,
+        workers=settings.execution_workers,
+        max_queue=settings.execution_max_queue,
+    )
+    return Generation(number, shards, autocomplete, prices, executor, source, (time.perf_counter() - start) * 1000)
+
+
+def _warm_up(shards: IndexShards) -> int:
+    return sum(len(index.search("a")) for index in shards)
+
+
+class IndexReloader:
+    """Builds replacement generations off the event loop and swaps them in atomically.
+
+    The swap is a single attribute assignment, so new requests see either the
+    old or the new generation, never a mix. The retired generation keeps
+    serving the requests that leased it and its executor is shut down once
+    the last one finishes. Only one reload runs at a time.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.current = build_generation(settings, number=1)
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._retiring: set = set()
+
+    def acquire(self) -> Generation:
+        generation = self.current
+        generation.leases += 1
+        return generation
+
+    def release(self, generation: Generation) -> None:
+        generation.leases -= 1
+
+    async def reload(self) -> Generation:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            previous = self.current
+            try:
+                # Startup falls back to the seed catalog when the catalog is
+                # missing; a reload must never replace a real catalog with it.
+                source = self.watched_paths()[0]
+                if not source.exists():
+                    raise FileNotFoundError(f"{source} not found")
+                generation = await asyncio.to_thread(build_generation, self.settings, previous.number + 1)
+                try:
+                    # Start pool workers and fault in index pages before taking traffic.
+                    await generation.executor.run(_warm_up)
+                except Exception:
+                    generation.executor.shutdown()
+                    raise
+            except Exception as exc:
+                self.failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.exception("Catalog reload failed; still serving generation %s", previous.number)
+                raise
+            self.current = generation
+            self.reloads += 1
+            self.last_error = None
+            task = asyncio.create_task(self._retire(previous))
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+            logger.info(
+                "Serving catalog %s (generation %s, %s in %.0f ms)",
+                generation.version,
+                generation.number,
+                generation.source,
+                generation.build_ms,
+            )
+            return generation
+
+    async def _retire(self, generation: Generation) -> None:
+        while generation.leases or generation.executor.in_flight or generation.executor.queued:
+            await asyncio.sleep(DRAIN_POLL_SECONDS)
+        generation.executor.shutdown()
+
+    def watched_paths(self) -> Tuple[Path, ...]:
+        snapshot = self.settings.index_snapshot_path
+        if snapshot is not None and snapshot.exists():
+            return (snapshot,)
+        paths = (self.settings.catalog_path, self.settings.dictionary_path, self.settings.core_dictionary_path)
+        if self.settings.associations_path is not None:
+            paths += (self.settings.associations_path,)
+        return paths
+
+    def _fingerprint(self) -> Tuple[Optional[float], ...]:
+        stamps = []
+        for path in self.watched_paths():
+            try:
+                stamps.append(path.stat().st_mtime)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    async def watch(self, interval_seconds: float) -> None:
+        """Reload whenever a watched catalog input changes (polled every ``interval_seconds``)."""
+        seen = self._fingerprint()
+        while True:
+            await asyncio.sleep(interval_seconds)
+            stamps = self._fingerprint()
+            if stamps == seen:
+                continue
+            seen = stamps
+            try:
+                await self.reload()
+            except Exception:
+                # Already logged and counted; keep watching for the next change.
+                continue
+
+    def shutdown(self) -> None:
+        for task in self._retiring:
+            task.cancel()
+        self.current.executor.shutdown()
+
+    def stats(self) -> Dict[str, object]:
+        generation = self.current
+        return {
+            "generation": generation.number,
+            "source": generation.source,
+            "build_ms": round(generation.build_ms, 1),
+            "loaded_at": generation.loaded_at,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "retiring": len(self._retiring),
+        }
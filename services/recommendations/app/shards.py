@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+import numpy as np
+
+from .associations import AssociationMatrix
+from .catalog import Catalog, CatalogItem, display_label
+from .classifier import ProductClassifier
+from .index import SuggestionIndex
+from .text import normalize, tokens
+
+SHARED = "shared"
+
+_REGION_SUBTAG = re.compile(r"^[A-Za-z]{2}$")
+_QUALIFIER = re.compile(r"\s*\([^()]*\)$")
+
+
+def region_for_locale(locale: Optional[str]) -> Optional[str]:
+    """Lowercased region subtag of a BCP 47 locale (``en-JM`` → ``jm``), if it has one."""
+    if not locale:
+        return None
+    for subtag in re.split(r"[-_]", locale)[1:]:
+        if _REGION_SUBTAG.match(subtag):
+            return subtag.lower()
+    return None
+
+
+def _stems(text: str) -> Set[str]:
+    return {token[:-1] if token.endswith("s") else token for token in tokens(normalize(text))} - {"and"}
+
+
+def _names_alike(alias: str, name: str) -> bool:
+    """Whether every word of ``alias`` already appears in ``name`` ("Ground Beef" in "Beef (Ground 80/20)")."""
+    return _stems(alias) <= _stems(name)
+
+
+def _local_label(alias: str, label: str) -> str:
+    local = display_label(" ".join(alias.split()))
+    # "Mutton (Goat)" is already qualified; otherwise qualify with the catalog name.
+    return local if _QUALIFIER.search(local) else f"{local} ({_QUALIFIER.sub('', label)})"
+
+
+def localize(catalog: Catalog, region: str) -> Catalog:
+    """The part of ``catalog`` sold in ``region``, named the way shoppers there name it.
+
+    Items keep their relative order and are renumbered from zero. An item's
+    regional alias for ``region`` is indexed first, and aliases that only
+    other regions use ("roucou" in a JM shard) are left out. When the
+    regional name does not appear in the product name the label leads with
+    it, in the catalog's ``Local (Name)`` style: "Pawpaw (Papaya)".
+    """
+    items = []
+    for item in catalog.items:
+        if region not in item.regions:
+            continue
+        local = [alias.strip() for code, alias in item.regional_aliases if code == region]
+        foreign = {normalize(alias) for code, alias in item.regional_aliases if code != region}
+        foreign.difference_update(normalize(alias) for alias in local)
+        aliases = [*local, *(alias for alias in item.aliases if normalize(alias) not in foreign)]
+        label = item.label
+        if local and not _names_alike(local[0], item.name):
+            label = _local_label(local[0], item.label)
+        items.append(
+            CatalogItem(
+                item_id=len(items),
+                name=item.name,
+                label=label,
+                category=item.category,
+                aliases=tuple(dict.fromkeys(aliases)),
+                regions=item.regions,
+                tags=item.tags,
+                source=item.source,
+                regional_aliases=item.regional_aliases,
+            )
+        )
+    return Catalog(items=tuple(items), version=catalog.version)
+
+
+class IndexShards:
+    """A shared index over the whole catalog plus one index per catalog region.
+
+    Queries are routed by the region subtag of their locale; requests without
+    a locale, or for a region with no shard of its own, are served by the
+    shared shard, which is exactly the unsharded index. Executors receive this
+    object and scoring functions pick their index with :meth:`route`, topping
+    a short regional result up from the shared shard. The
+    receipt-line :class:`~app.classifier.ProductClassifier` built from the
+    same food dictionary travels with the shards, when there is one.
+    """
+
+    def __init__(
+        self,
+        shared: SuggestionIndex,
+        regions: Dict[str, SuggestionIndex],
+        classifier: Optional[ProductClassifier] = None,
+    ):
+        self.shared = shared
+        self.regions = regions
+        self.classifier = classifier
+
+    @classmethod
+    def build(
+        cls,
+        catalog: Catalog,
+        max_distance: int = 2,
+        regional: bool = True,
+        associations: Optional[AssociationMatrix] = None,
+        classifier: Optional[ProductClassifier] = None,
+    ) -> "IndexShards":
+        shared = SuggestionIndex(catalog, max_distance=max_distance, associations=associations)
+        regions: Dict[str, SuggestionIndex] = {}
+        if regional:
+            for region in sorted({region for item in catalog.items for region in item.regions}):
+                regions[region] = SuggestionIndex(
+                    localize(catalog, region), max_distance=max_distance, associations=associations
+                )
+        return cls(shared, regions, classifier)
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: dict) -> "IndexShards":
+        shared = SuggestionIndex.from_arrays(arrays, meta[SHARED])
+        regions = {}
+        for region in meta["regions"]:
+            prefix = f"shard.{region}/"
+            shard_arrays = {name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)}
+            regions[region] = SuggestionIndex.from_arrays(shard_arrays, meta[region])
+        classifier = ProductClassifier.from_arrays(arrays) if meta.get("classifier") else None
+        return cls(shared, regions, classifier)
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """Shared-shard arrays under their usual names, region shards under ``shard.<region>/``."""
+        arrays, shared_meta = self.shared.to_arrays()
+        meta = {SHARED: shared_meta, "regions": list(self.regions), "classifier": self.classifier is not None}
+        for region, index in self.regions.items():
+            shard_arrays, meta[region] = index.to_arrays()
+            arrays.update((f"shard.{region}/{name}", array) for name, array in shard_arrays.items())
+        if self.classifier is not None:
+            arrays.update(self.classifier.to_arrays())
+        return arrays, meta
+
+    @property
+    def version(self) -> str:
+        return self.shared.version
+
+    def __len__(self) -> int:
+        return len(self.shared)
+
+    def __iter__(self) -> Iterator[SuggestionIndex]:
+        yield self.shared
+        yield from self.regions.values()
+
+    def route(self, locale: Optional[str]) -> SuggestionIndex:
+        region = region_for_locale(locale)
+        return self.regions.get(region, self.shared) if region else self.shared
+
+    def stats(self) -> Dict[str, int]:
+        return {SHARED: len(self.shared), **{region: len(index) for region, index in self.regions.items()}}
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .associations import AssociationMatrix
+from .autocomplete import PrefixIndex
+from .prices import PriceStore
+from .shards import IndexShards
+
+MAGIC = b"SSRIDX"
+FORMAT_VERSION = 4
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<6sHQ")
+
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_snapshot(path: Path, arrays: Dict[str, np.ndarray], meta: dict) -> int:
+    """Write named arrays plus a JSON header into one aligned, mmap-able file.
+
+    Layout: ``MAGIC | format version | header length | JSON header | arrays``,
+    each array starting on a 64-byte boundary so it can be viewed in place.
+    The file is written next to ``path`` and renamed over it, so a running
+    service never maps a half-written snapshot.
+    """
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({"meta": meta, "arrays": entries}, sort_keys=True).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        handle.write(header)
+        for name, array in arrays.items():
+            handle.seek(data_start + entries[name]["offset"])
+            handle.write(np.ascontiguousarray(array).tobytes())
+        handle.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+    return data_start + offset
+
+
+def read_snapshot(path: Path) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """Map a snapshot read-only; the returned arrays are views into shared page cache."""
+    with path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, header_length = _PREAMBLE.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a suggestion index snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path} has snapshot format {version}; expected {FORMAT_VERSION}")
+    header = json.loads(mapped[_PREAMBLE.size:_PREAMBLE.size + header_length].decode("utf-8"))
+    data_start = _aligned(_PREAMBLE.size + header_length)
+
+    arrays: Dict[str, np.ndarray] = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"])) if entry["shape"] else 1
+        if count == 0:
+            arrays[name] = np.empty(entry["shape"], dtype=dtype)
+            continue
+        array = np.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + entry["offset"])
+        arrays[name] = array.reshape(entry["shape"])
+    return header["meta"], arrays
+
+
+def save_indexes(path: Path, shards: IndexShards, prefixes: PrefixIndex, prices: Optional[PriceStore] = None) -> int:
+    """Write every suggestion index shard, the autocomplete index and the price store into one snapshot file."""
+    arrays, shard_meta = shards.to_arrays()
+    prefix_arrays, prefix_meta = prefixes.to_arrays()
+    arrays.update(prefix_arrays)
+    meta = {"shards": shard_meta, "autocomplete": prefix_meta}
+    if prices is not None:
+        arrays.update(prices.to_arrays())
+        meta["prices"] = {"size": prices.size}
+    return write_snapshot(path, arrays, meta)
+
+
+def load_indexes(path: Path) -> Tuple[IndexShards, PrefixIndex, Optional[PriceStore]]:
+    """Map a snapshot written by :func:`save_indexes`; autocomplete shares the shared shard's catalog rows."""
+    meta, arrays = read_snapshot(path)
+    shards = IndexShards.from_arrays(arrays, meta["shards"])
+    prices = PriceStore.from_arrays(meta["prices"]["size"], arrays) if "prices" in meta else None
+    return shards, PrefixIndex.from_arrays(arrays, meta["autocomplete"], shards.shared.items), prices
+
+
+def save_associations(path: Path, matrix: AssociationMatrix, meta: dict) -> int:
+    """Write an offline association matrix (with the item names of its rows) in the snapshot format."""
+    if matrix.names is None:
+        raise ValueError("association matrices are saved with the item names of their rows")
+    return write_snapshot(path, matrix.to_arrays(), {"associations": {**meta, "size": matrix.size}})
+
+
+def load_associations(path: Path) -> AssociationMatrix:
+    """Map a file written by :func:`save_associations`; align it to a catalog with :meth:`AssociationMatrix.align`."""
+    meta, arrays = read_snapshot(path)
+    if "associations" not in meta:
+        raise ValueError(f"{path} is not an association matrix")
+    return AssociationMatrix.from_arrays(meta["associations"]["size"], arrays)
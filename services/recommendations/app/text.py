@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import List, Set
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(value: str) -> str:
+    """Lowercase, strip diacritics and collapse punctuation to single spaces."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", stripped).strip()
+
+
+def tokens(normalized: str) -> List[str]:
+    return [token for token in normalized.split(" ") if token]
+
+
+def trigrams(normalized: str, partial: bool = False) -> Set[str]:
+    """Character trigrams of a normalized string, padded at word boundaries.
+
+    ``partial`` drops the trailing pad so a query that is still being typed
+    ("mil") matches the prefix grams of the finished word ("milk").
+    """
+    if not normalized:
+        return set()
+    padded = f" {normalized}" if partial else f" {normalized} "
+    if len(padded) < 3:
+        return set()
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .arrays import StringTable, csr_from_lists, gather_slices
+from .catalog import Catalog
+from .text import normalize, tokens
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, best first, without a full sort."""
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if scores.size > k:
+        part = np.argpartition(-scores, k - 1)[:k]
+    else:
+        part = np.arange(scores.size)
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+class ContextVectors:
+    """TF-IDF token vectors for every catalog item, stored column-major (CSC).
+
+    Context labels are folded into a single sparse query vector, so relevance
+    of the whole catalog to a shopper's list is one sparse matrix-vector
+    product: the posting slices of the context tokens are gathered in one
+    pass and summed per item with ``np.bincount``.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        vocabulary: StringTable,
+        idf: np.ndarray,
+        col_ptr: np.ndarray,
+        col_rows: np.ndarray,
+        col_vals: np.ndarray,
+    ):
+        self.size = size
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.col_ptr = col_ptr
+        self.col_rows = col_rows
+        self.col_vals = col_vals
+
+    @classmethod
+    def build(cls, catalog: Catalog) -> "ContextVectors":
+        size = len(catalog)
+        vocabulary: Dict[str, int] = {}
+        columns: List[List[int]] = []
+        column_counts: List[List[float]] = []
+
+        for item in catalog.items:
+            counts: Dict[int, float] = {}
+            for raw in (item.name, *item.aliases):
+                for token in tokens(normalize(raw)):
+                    column = vocabulary.get(token)
+                    if column is None:
+                        column = vocabulary[token] = len(columns)
+                        columns.append([])
+                        column_counts.append([])
+                    counts[column] = counts.get(column, 0.0) + 1.0
+            for column, count in counts.items():
+                columns[column].append(item.item_id)
+                column_counts[column].append(count)
+
+        idf = np.array(
+            [math.log((1 + size) / (1 + len(rows))) + 1.0 for rows in columns],
+            dtype=np.float32,
+        )
+        rows_csr = csr_from_lists(columns)
+        tf = csr_from_lists(column_counts, dtype=np.float32)["values"]
+        col_ptr, col_rows = rows_csr["ptr"], rows_csr["values"]
+        col_vals = tf * np.repeat(idf, np.diff(col_ptr))
+
+        # L2-normalize item rows so relevance is a cosine similarity.
+        norms = np.sqrt(np.bincount(col_rows, weights=col_vals ** 2, minlength=size))
+        norms[norms == 0] = 1.0
+        col_vals = (col_vals / norms[col_rows]).astype(np.float32)
+        return cls(size, StringTable.from_strings(vocabulary), idf, col_ptr, col_rows, col_vals)
+
+    @classmethod
+    def from_arrays(cls, size: int, arrays: Dict[str, np.ndarray]) -> "ContextVectors":
+        return cls(
+            size,
+            StringTable.from_arrays(arrays, "context.vocabulary"),
+            arrays["context.idf"],
+            arrays["context.col_ptr"],
+            arrays["context.col_rows"],
+            arrays["context.col_vals"],
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = self.vocabulary.to_arrays("context.vocabulary")
+        arrays.update({
+            "context.idf": self.idf,
+            "context.col_ptr": self.col_ptr,
+            "context.col_rows": self.col_rows,
+            "context.col_vals": self.col_vals,
+        })
+        return arrays
+
+    def query_vector(self, labels: Iterable[str]) -> Dict[int, float]:
+        """Sum of the unit TF-IDF vectors of each (normalized) context label."""
+        vector: Dict[int, float] = {}
+        for label in set(labels):
+            weights: Dict[int, float] = {}
+            for token in tokens(label):
+                column = self.vocabulary.find(token)
+                if column >= 0:
+                    weights[column] = weights.get(column, 0.0) + float(self.idf[column])
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            for column, weight in weights.items():
+                vector[column] = vector.get(column, 0.0) + weight / norm
+        return vector
+
+    def relevance(self, labels: Iterable[str]) -> np.ndarray:
+        """Context relevance in [0, 1] for every catalog item."""
+        vector = self.query_vector(labels)
+        if not vector:
+            return np.zeros(self.size, dtype=np.float32)
+        columns = np.fromiter(vector.keys(), dtype=np.int64, count=len(vector))
+        weights = np.fromiter(vector.values(), dtype=np.float32, count=len(vector))
+        offsets = gather_slices(self.col_ptr, columns)
+        lengths = self.col_ptr[columns + 1] - self.col_ptr[columns]
+        values = self.col_vals[offsets] * np.repeat(weights, lengths)
+        scores = np.bincount(self.col_rows[offsets], weights=values, minlength=self.size)
+        return np.minimum(scores, 1.0).astype(np.float32)
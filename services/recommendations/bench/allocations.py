@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Compare per-request allocations of the /suggest ranking paths.
+
+``legacy`` reproduces the pre-heap ranking (a pydantic ``Suggestion`` with a
+fresh metadata dict and ``.title()`` call for every candidate, a full sort,
+then ``[:limit]``) on the index the locale routes to. ``current`` is
+``app.main.rank_routed``, the path /suggest serves from: the locale's shard,
+topped up from the shared shard, with the winners encoded from pre-encoded
+JSON fragments without building models. Both run against the same built
+shards, once without a locale and once for ``en-JM``; the response cache is
+bypassed.
+
+Reported per request:
+- models: ``Suggestion`` instances constructed
+- peak_kib: tracemalloc peak above the pre-call baseline
+- us: wall time without tracing
+
+Run (from services/recommendations):
+  python -m bench.allocations
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import Callable, ClassVar, List, Optional, Tuple
+
+from app import main
+from app.config import Settings
+from app.main import Suggestion, rank_routed
+from app.metrics import StageTimer
+from app.reload import build_catalog_indexes
+from app.shards import IndexShards
+from app.text import normalize
+
+QUERIES = ["milk", "bread", "cheese", "rice", "chedar", "plantain", "jerk", "m", "coco", "sauce"]
+LOCALES = [None, "en-JM"]
+
+
+def legacy_rank(
+    shards: IndexShards,
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    locale: Optional[str],
+    limit: int,
+) -> List[Suggestion]:
+    index = shards.route(locale)
+    matches: List[Suggestion] = []
+    for candidate in index.search(normalized_query):
+        item = index.item(candidate.item_id)
+        matches.append(
+            Suggestion(
+                label=item.name.title(),
+                type="product",
+                confidence=min(0.4 + 0.4 * candidate.similarity, 0.99),
+                metadata={
+                    "locale": locale or "global",
+                    "source": item.source,
+                    "category": item.category,
+                    "match": candidate.match,
+                },
+            )
+        )
+    matches.sort(key=lambda suggestion: suggestion.confidence, reverse=True)
+    return matches[:limit]
+
+
+class _CountingSuggestion(Suggestion):
+    constructed: ClassVar[int] = 0
+
+    def __init__(self, **data):
+        type(self).constructed += 1
+        super().__init__(**data)
+
+
+def current_rank(
+    shards: IndexShards,
+    normalized_query: str,
+    context_labels: Tuple[str, ...],
+    locale: Optional[str],
+    limit: int,
+) -> bytes:
+    return rank_routed(shards, normalized_query, context_labels, locale, limit, StageTimer())
+
+
+def measure(rank: Callable, shards: IndexShards, locale: Optional[str], limit: int, rounds: int = 200) -> dict:
+    queries = [normalize(query) for query in QUERIES]
+
+    original = main.Suggestion
+    main.Suggestion = _CountingSuggestion
+    globals()["Suggestion"] = _CountingSuggestion
+    _CountingSuggestion.constructed = 0
+    try:
+        tracemalloc.start()
+        peak = 0
+        for query in queries:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            rank(shards, query, (), locale, limit)
+            _, call_peak = tracemalloc.get_traced_memory()
+            peak += call_peak - baseline
+        tracemalloc.stop()
+        models = _CountingSuggestion.constructed
+    finally:
+        main.Suggestion = original
+        globals()["Suggestion"] = original
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            rank(shards, query, (), locale, limit)
+    elapsed = time.perf_counter() - start
+
+    requests = len(queries)
+    return {
+        "models": models / requests,
+        "peak_kib": peak / requests / 1024,
+        "us": elapsed / (rounds * requests) * 1e6,
+    }
+
+
+def main_cli() -> int:
+    settings = Settings.from_env()
+    shards, _, _ = build_catalog_indexes(settings)
+    print(f"catalog items: {len(shards)}; queries: {len(QUERIES)}; limit: {settings.max_suggestions}")
+    print(f"{'path':<8} {'locale':<7} {'models':>8} {'peak_kib':>9} {'us':>8}")
+    for locale in LOCALES:
+        for name, rank in (("legacy", legacy_rank), ("current", current_rank)):
+            row = measure(rank, shards, locale, settings.max_suggestions)
+            print(f"{name:<8} {locale or '-':<7} {row['models']:>8.1f} {row['peak_kib']:>9.1f} {row['us']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main_cli())
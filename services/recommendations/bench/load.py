@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Reproducible load test for /suggest on synthetic catalogs.
+
+For every catalog size the suite:
+
+1. Writes a deterministic synthetic catalog (``--seed``) in the generated
+   TypeScript format the service loads: real catalog names crossed with
+   modifiers and variants, with aliases, tags and regions.
+2. Builds an index snapshot from it, so both drivers start the same way a
+   deployed worker does (``RECO_INDEX_SNAPSHOT``).
+3. Replays a fixed query mix against ``/suggest``:
+   - ``prefix``: the first 2-5 characters of a word ("mil")
+   - ``typo``: a word with one deletion, swap or substitution ("chedar")
+   - ``exact``: a full product name
+   - ``context``: a word plus 8-20 context items from other products
+4. Records per-request client latency, the server's ``Server-Timing`` total,
+   errors, throughput and resident memory.
+
+Drivers:
+- ``asgi``: calls the ASGI app in-process (no sockets, no HTTP client), so
+  the numbers are the service's own cost.
+- ``uvicorn``: starts ``uvicorn app.main:app`` on a local port and drives it
+  with keep-alive ``http.client`` connections from ``--concurrency`` threads.
+  Memory is the RSS of the uvicorn process tree.
+
+The suggestion cache is off unless ``--cache`` is given, so repeated queries
+still exercise ranking. Results are written as JSON (commit, environment,
+configuration and one row per size and driver). Pass ``--compare`` with an
+earlier file to print the change per row.
+
+Run (from services/recommendations):
+  python -m bench.load
+  python -m bench.load --sizes 1000,10000 --drivers asgi --requests 5000
+  python -m bench.load --compare bench/results/load-<sha>-<time>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+
+from app.autocomplete import PrefixIndex
+from app.catalog import load_catalog
+from app.config import REPO_ROOT, Settings
+from app.shards import IndexShards
+from app.snapshot import save_indexes
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = SERVICE_ROOT / "bench" / "results"
+DEFAULT_WORKDIR = Path(os.getenv("TMPDIR", "/tmp")) / "reco-bench"
+
+SIZES = (1_000, 10_000, 100_000)
+DRIVERS = ("asgi", "uvicorn")
+MIX = {"prefix": 0.35, "typo": 0.25, "exact": 0.2, "context": 0.2}
+REGIONS = ("jm", "us", "cn")
+MODIFIERS = (
+    "Organic", "Frozen", "Low-Fat", "Family Size", "Spicy", "Unsalted", "Smoked", "Fresh", "Reduced Sugar",
+    "Whole Grain", "Gluten-Free", "Extra Virgin", "Mini", "Jumbo", "Sweetened", "Roasted", "Instant", "Premium",
+)
+VARIANTS = (
+    "Classic", "Original", "Vanilla", "Garlic", "Lemon", "Honey", "Light", "Dark", "Hot", "Mild",
+    "Chunky", "Smooth", "Large", "Small", "Value Pack", "Single", "Twin Pack", "Seasoned",
+)
+# Used when the shared catalog is not checked out.
+FALLBACK_BASES = (
+    ("Milk", "dairy"), ("Whole Wheat Bread", "bakery"), ("Cheddar Cheese", "dairy"), ("Almond Milk", "dairy"),
+    ("Plantain Chips", "snacks"), ("Jerk Seasoning", "pantry"), ("Basmati Rice", "pantry"), ("Brown Eggs", "dairy"),
+    ("Coconut Water", "beverages"), ("Chicken Thighs", "meat"), ("Tomato Sauce", "pantry"), ("Green Tea", "beverages"),
+)
+
+Query = Tuple[str, bytes]
+
+
+def _ts_object(record: dict, indent: str) -> List[str]:
+    """One record as the generator writes it: a bare key per line and trailing commas."""
+    lines = [f"{indent}{{"]
+    lines.extend(f"{indent}  {key}: {json.dumps(value, ensure_ascii=False)}," for key, value in record.items())
+    lines.append(f"{indent}}},")
+    return lines
+
+
+def _bases() -> List[Tuple[str, str, Tuple[str, ...]]]:
+    settings = Settings.from_env()
+    if settings.catalog_path.exists():
+        catalog = load_catalog(settings.catalog_path, settings.dictionary_path)
+        return [(item.name, item.category, item.aliases) for item in catalog.items]
+    return [(name, category, ()) for name, category in FALLBACK_BASES]
+
+
+def synthesize_catalog(size: int, seed: int, directory: Path) -> Tuple[Path, Path]:
+    """Write ``size`` unique products as a catalog + dictionary pair in the generated TS format."""
+    directory.mkdir(parents=True, exist_ok=True)
+    catalog_path = directory / f"catalog-{size}-{seed}.ts"
+    dictionary_path = directory / f"dictionary-{size}-{seed}.ts"
+    if catalog_path.exists() and dictionary_path.exists():
+        return catalog_path, dictionary_path
+
+    rng = random.Random(seed)
+    bases = _bases()
+    names = set()
+    by_region: Dict[str, List[dict]] = {region: [] for region in REGIONS}
+    seeds: List[dict] = []
+    while len(names) < size:
+        base, category, aliases = rng.choice(bases)
+        name = base
+        if rng.random() < 0.8:
+            name = f"{rng.choice(MODIFIERS)} {name}"
+        if rng.random() < 0.6:
+            name = f"{name} ({rng.choice(VARIANTS)})"
+        if name.lower() in names:
+            continue
+        names.add(name.lower())
+        tags = sorted({category, rng.choice(MODIFIERS).lower(), "synthetic"})
+        for region in rng.sample(REGIONS, rng.randint(1, len(REGIONS))):
+            by_region[region].append({"name": name, "category": category, "tags": tags, "region": region.upper()})
+        if aliases and rng.random() < 0.3:
+            seeds.append({"category": category, "product": name, "aliases": list(aliases[:2]), "tags": tags})
+
+    version = f"synthetic-{size}-{seed}"
+    lines = [f"export const WESTERN_SHARED_VERSION = '{version}';", "", "export const westernSharedCatalog = {"]
+    for region, records in by_region.items():
+        lines.append(f"  {region}: [")
+        for record in records:
+            lines.extend(_ts_object(record, "    "))
+        lines.append("  ],")
+    lines.append("};")
+    catalog_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    lines = ["export const westernPart1Seeds = ["]
+    for entry in seeds:
+        lines.extend(_ts_object(entry, "  "))
+    lines.append("];")
+    dictionary_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return catalog_path, dictionary_path
+
+
+def build_snapshot(catalog_path: Path, dictionary_path: Path) -> Tuple[Path, float, int]:
+    snapshot = catalog_path.with_suffix(".bin")
+    start = time.perf_counter()
+    catalog = load_catalog(catalog_path, dictionary_path)
+    settings = Settings.from_env()
+    shards = IndexShards.build(catalog, max_distance=settings.fuzzy_max_distance, regional=settings.locale_shards)
+    save_indexes(snapshot, shards, PrefixIndex(catalog, top_k=settings.autocomplete_top_k))
+    return snapshot, time.perf_counter() - start, len(catalog)
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    if len(word) < 4:
+        return word
+    position = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(("delete", "swap", "substitute"))
+    if edit == "delete":
+        return word[:position] + word[position + 1:]
+    if edit == "swap":
+        return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+    return word[:position] + rng.choice("aeiourstln") + word[position + 1:]
+
+
+def build_queries(catalog_path: Path, dictionary_path: Path, count: int, seed: int) -> List[Query]:
+    """``count`` ``(kind, request body)`` pairs drawn from the catalog according to ``MIX``."""
+    rng = random.Random(seed + 1)
+    names = [item.name for item in load_catalog(catalog_path, dictionary_path).items]
+    kinds = list(MIX)
+    weights = [MIX[kind] for kind in kinds]
+    queries: List[Query] = []
+    for kind in rng.choices(kinds, weights=weights, k=count):
+        name = rng.choice(names)
+        words = [word for word in name.lower().replace("(", " ").replace(")", " ").split() if word.isalpha()] or [name]
+        word = rng.choice(words)
+        payload: dict = {"locale": rng.choice(("en-US", "en-JM", None))}
+        if kind == "prefix":
+            payload["query"] = word[: rng.randint(2, 5)]
+        elif kind == "typo":
+            payload["query"] = _typo(max(words, key=len), rng)
+        elif kind == "exact":
+            payload["query"] = name
+        else:
+            payload["query"] = word
+            payload["context_items"] = [{"label": label} for label in rng.sample(names, rng.randint(8, 20))]
+        queries.append((kind, orjson.dumps(payload)))
+    return queries
+
+
+def _server_total_ms(headers: Sequence[Tuple[bytes, bytes]]) -> Optional[float]:
+    for name, value in headers:
+        if name.lower() == b"server-timing":
+            _, _, total = value.decode("latin-1").rpartition("total;dur=")
+            return float(total) if total else None
+    return None
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {kind: [] for kind in MIX}
+        self.server: List[float] = []
+        self.errors = 0
+
+    def record(self, kind: str, seconds: float, status: int, server_ms: Optional[float]) -> None:
+        if status != 200:
+            self.errors += 1
+            return
+        self.latencies[kind].append(seconds * 1000)
+        if server_ms is not None:
+            self.server.append(server_ms)
+
+    def summary(self, elapsed: float) -> dict:
+        every = [value for values in self.latencies.values() for value in values]
+        completed = len(every)
+        return {
+            "requests": completed + self.errors,
+            "errors": self.errors,
+            "throughput_rps": round(completed / elapsed, 1) if elapsed else 0.0,
+            **_percentiles(every),
+            "server": _percentiles(self.server),
+            "by_kind": {kind: {"requests": len(values), **_percentiles(values)} for kind, values in self.latencies.items()},
+        }
+
+
+def _percentiles(values: List[float]) -> dict:
+    if not values:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99]).tolist()
+    return {"p50_ms": round(p50, 3), "p95_ms": round(p95, 3), "p99_ms": round(p99, 3), "max_ms": round(max(values), 3)}
+
+
+@contextmanager
+def service_env(snapshot: Path, catalog_path: Path, dictionary_path: Path, cache: bool) -> Iterator[Dict[str, str]]:
+    overrides = {
+        "RECO_INDEX_SNAPSHOT": str(snapshot),
+        "RECO_CATALOG_PATH": str(catalog_path),
+        "RECO_DICTIONARY_PATH": str(dictionary_path),
+        "RECO_RELOAD_INTERVAL_SECONDS": "0",
+    }
+    if not cache:
+        overrides["RECO_CACHE_MAX_ENTRIES"] = "0"
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield dict(os.environ)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+async def _asgi_post(app, path: str, body: bytes) -> Tuple[int, List[Tuple[bytes, bytes]]]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("ascii"))],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    response: dict = {}
+    done = asyncio.Event()
+    delivered = False
+
+    async def receive() -> dict:
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = message.get("headers", [])
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            done.set()
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"]
+
+
+async def _drive_asgi(warmup: List[Query], queries: List[Query], concurrency: int) -> Tuple[Recorder, float, dict]:
+    from app.main import app, resident_memory_mb
+
+    async with app.router.lifespan_context(app):
+        for _, body in warmup:
+            await _asgi_post(app, "/suggest", body)
+        recorder = Recorder()
+        pending = iter(queries)
+
+        async def worker() -> None:
+            for kind, body in pending:
+                start = time.perf_counter()
+                status, headers = await _asgi_post(app, "/suggest", body)
+                recorder.record(kind, time.perf_counter() - start, status, _server_total_ms(headers))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        extra = {"startup_ms": round(app.state.startup_ms, 1), "rss_mb": resident_memory_mb()}
+    return recorder, elapsed, extra
+
+
+def drive_asgi(warmup: List[Query], queries: List[Query], concurrency: int) -> Tuple[Recorder, float, dict]:
+    return asyncio.run(_drive_asgi(warmup, queries, concurrency))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _process_tree_rss_mb(root: int) -> Optional[float]:
+    """RSS of ``root`` and its descendants (Linux ``/proc``; ``None`` elsewhere)."""
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+    children: Dict[int, List[int]] = {}
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            fields = stat.read_text().rpartition(")")[2].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+    total_kib = 0
+    stack = [root]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, ()))
+        try:
+            for line in (proc / str(pid) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kib += int(line.split()[1])
+        except OSError:
+            continue
+    return round(total_kib / 1024, 1)
+
+
+def drive_uvicorn(
+    warmup: List[Query], queries: List[Query], concurrency: int, env: Dict[str, str], workers: int = 1
+) -> Tuple[Recorder, float, dict]:
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+    ]
+    server = subprocess.Popen(command, cwd=SERVICE_ROOT, env=env)
+    try:
+        startup_ms = _wait_ready(port, server) * 1000
+        lock = threading.Lock()
+        recorder = Recorder()
+
+        def worker(pending: Iterator[Query], record: bool) -> None:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+            try:
+                while True:
+                    with lock:
+                        entry = next(pending, None)
+                    if entry is None:
+                        return
+                    kind, body = entry
+                    start = time.perf_counter()
+                    connection.request("POST", "/suggest", body=body, headers={"Content-Type": "application/json"})
+                    response = connection.getresponse()
+                    response.read()
+                    elapsed = time.perf_counter() - start
+                    if record:
+                        timing = response.getheader("Server-Timing")
+                        headers = [(b"server-timing", timing.encode("latin-1"))] if timing else []
+                        with lock:
+                            recorder.record(kind, elapsed, response.status, _server_total_ms(headers))
+            finally:
+                connection.close()
+
+        def run(batch: List[Query], record: bool) -> float:
+            pending = iter(batch)
+            threads = [threading.Thread(target=worker, args=(pending, record)) for _ in range(concurrency)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            return time.perf_counter() - start
+
+        run(warmup, record=False)
+        elapsed = run(queries, record=True)
+        extra = {"startup_ms": round(startup_ms, 1), "rss_mb": _process_tree_rss_mb(server.pid), "workers": workers}
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    return recorder, elapsed, extra
+
+
+def _wait_ready(port: int, server: subprocess.Popen, timeout: float = 600.0) -> float:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with {server.returncode} before becoming ready")
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                return time.perf_counter() - start
+        except OSError:
+            pass
+        finally:
+            connection.close()
+        time.sleep(0.1)
+    raise RuntimeError(f"uvicorn not ready after {timeout:.0f}s")
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict:
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print the change per (size, driver) row against an earlier results file."""
+    before = {(row["size"], row["driver"]): row for row in baseline["results"]}
+    print(f"\nvs {baseline['environment'].get('commit') or '?'} ({baseline['environment'].get('timestamp')})")
+    print(f"{'size':>7} {'driver':<8} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for row in current["results"]:
+        old = before.get((row["size"], row["driver"]))
+        if old is None:
+            continue
+        cells = [_delta(row["throughput_rps"], old["throughput_rps"])]
+        cells += [_delta(row[key], old[key]) for key in ("p50_ms", "p95_ms", "p99_ms")]
+        print(f"{row['size']:>7} {row['driver']:<8} " + " ".join(f"{cell:>9}" for cell in cells))
+
+
+def _delta(new: Optional[float], old: Optional[float]) -> str:
+    if not new or not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main_cli() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma-separated catalog sizes")
+    parser.add_argument("--drivers", default=",".join(DRIVERS), help="comma-separated drivers (asgi, uvicorn)")
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests per size and driver")
+    parser.add_argument("--warmup", type=int, default=200, help="unmeasured requests sent first")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--seed", type=int, default=7, help="seed for catalogs and query mixes")
+    parser.add_argument("--cache", action="store_true", help="keep the suggestion cache enabled")
+    parser.add_argument("--workdir", type=Path, default=DEFAULT_WORKDIR, help="where synthetic catalogs are kept")
+    parser.add_argument("--output", type=Path, help="results file (default: bench/results/load-<sha>-<time>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    drivers = [driver for driver in args.drivers.split(",") if driver]
+    unknown = set(drivers) - set(DRIVERS)
+    if unknown:
+        parser.error(f"unknown driver(s): {', '.join(sorted(unknown))}")
+
+    env = environment()
+    results = []
+    print(f"{'size':>7} {'driver':<8} {'rps':>9} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'rss_mb':>8} {'errors':>6}")
+    for size in sizes:
+        catalog_path, dictionary_path = synthesize_catalog(size, args.seed, args.workdir)
+        snapshot, build_s, items = build_snapshot(catalog_path, dictionary_path)
+        queries = build_queries(catalog_path, dictionary_path, args.requests + args.warmup, args.seed)
+        warmup, measured = queries[: args.warmup], queries[args.warmup:]
+        for driver in drivers:
+            with service_env(snapshot, catalog_path, dictionary_path, args.cache) as service:
+                if driver == "asgi":
+                    recorder, elapsed, extra = drive_asgi(warmup, measured, args.concurrency)
+                else:
+                    recorder, elapsed, extra = drive_uvicorn(
+                        warmup, measured, args.concurrency, env=service, workers=args.workers
+                    )
+            row = {
+                "size": size,
+                "driver": driver,
+                "items": items,
+                "index_build_s": round(build_s, 2),
+                "snapshot_kib": round(snapshot.stat().st_size / 1024, 1),
+                **extra,
+                **recorder.summary(elapsed),
+            }
+            results.append(row)
+            print(
+                f"{size:>7} {driver:<8} {row['throughput_rps']:>9.1f} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+                f"{row['p99_ms']:>8} {row['rss_mb']!s:>8} {row['errors']:>6}"
+            )
+
+    document = {
+        "environment": env,
+        "config": {
+            "sizes": sizes,
+            "drivers": drivers,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "seed": args.seed,
+            "cache": args.cache,
+            "mix": MIX,
+        },
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        sha = (env["commit"] or "unknown")[:8]
+        output = RESULTS_DIR / f"load-{sha}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+
+    if args.compare is not None:
+        compare(document, json.loads(args.compare.read_text(encoding="utf-8")))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main_cli())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Compare the columnar price store with the dict-of-lists form of the same prices.
+
+``dicts`` is how the generated catalog holds prices: one dict per captured
+price (``store``, ``unitPrice``, ``currency``, ``capturedAt``) in a list per
+(item, region), and a best-price lookup scans that list for the newest
+capture of every store and keeps the cheapest. ``columnar`` is
+``app.prices.PriceStore``: typed columns, dictionary-encoded strings and a
+precomputed best-row index, so a batch lookup is one gather.
+
+The catalog carries a single capture per store; ``--history N`` adds N - 1
+older captures (deterministic, ``--seed``) per price to show how both forms
+grow with snapshot history. Both forms must agree on every lookup.
+
+Reported per form:
+- kib: tracemalloc growth while building it (``columnar`` also reports the
+  arrays' ``nbytes``)
+- us/item: best-price lookup time per item, over every catalog name in
+  every region
+
+Run (from services/recommendations):
+  python -m bench.prices
+  python -m bench.prices --history 1,10,100
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+from app.catalog import Catalog, load_catalog, load_catalog_records
+from app.config import Settings
+from app.prices import PriceStore
+
+DAY_MS = 86_400_000
+
+T = TypeVar("T")
+PriceLists = Dict[Tuple[str, str], List[dict]]
+
+
+def with_history(records: Mapping[str, Sequence[dict]], captures: int, seed: int) -> Dict[str, List[dict]]:
+    """``records`` with ``captures`` prices per store: the real one plus older, slightly different ones."""
+    rng = random.Random(seed)
+    expanded = copy.deepcopy(dict(records))
+    for rows in expanded.values():
+        for record in rows:
+            history = []
+            for price in record["prices"]:
+                history.append(price)
+                for age in range(1, captures):
+                    history.append(
+                        {
+                            **price,
+                            "unitPrice": round(price["unitPrice"] * rng.uniform(0.8, 1.2), 2),
+                            "capturedAt": price["capturedAt"] - age * DAY_MS,
+                        }
+                    )
+            record["prices"] = history
+    return expanded
+
+
+def build_lists(records: Mapping[str, Sequence[dict]]) -> PriceLists:
+    lists: PriceLists = {}
+    for region, rows in records.items():
+        for record in rows:
+            prices = lists.setdefault((record["name"].strip().lower(), region.lower()), [])
+            prices.extend(dict(price) for price in record["prices"])
+    return lists
+
+
+def best_from_lists(lists: PriceLists, names: Sequence[str], region: str) -> List[Optional[float]]:
+    best: List[Optional[float]] = []
+    for name in names:
+        latest: Dict[str, dict] = {}
+        for price in lists.get((name.strip().lower(), region), ()):
+            current = latest.get(price["store"])
+            if current is None or (price["capturedAt"], -price["unitPrice"]) > (
+                current["capturedAt"],
+                -current["unitPrice"],
+            ):
+                latest[price["store"]] = price
+        cheapest = min(latest.values(), key=lambda price: (price["unitPrice"], price["store"]), default=None)
+        best.append(cheapest["unitPrice"] if cheapest is not None else None)
+    return best
+
+
+def best_from_store(
+    store: PriceStore, item_ids: Dict[str, int], names: Sequence[str], region: str
+) -> List[Optional[float]]:
+    ids = np.array([item_ids.get(name.strip().lower(), -1) for name in names], dtype=np.int64)
+    rows = store.best(ids, region)
+    return [float(store.unit_price[row]) if row >= 0 else None for row in rows.tolist()]
+
+
+def traced(build: Callable[[], T]) -> Tuple[T, float]:
+    """``build()`` and the memory it left allocated, in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return value, (after - before) / 1024
+
+
+def timed(lookup: Callable[[str], List[Optional[float]]], regions: Sequence[str], items: int, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for region in regions:
+            lookup(region)
+    return (time.perf_counter() - start) / (rounds * len(regions) * items) * 1e6
+
+
+def measure(records: Mapping[str, Sequence[dict]], catalog: Catalog, rounds: int) -> Tuple[int, Dict[str, dict]]:
+    names = [item.name for item in catalog.items]
+    item_ids = {item.name.strip().lower(): item.item_id for item in catalog.items}
+    regions = sorted(region.lower() for region in records)
+    lists, lists_kib = traced(lambda: build_lists(records))
+    store, store_kib = traced(lambda: PriceStore.build(records, catalog))
+
+    for region in regions:
+        if best_from_lists(lists, names, region) != best_from_store(store, item_ids, names, region):
+            raise AssertionError(f"columnar and dict-of-lists best prices differ in {region}")
+
+    return len(store), {
+        "dicts": {
+            "kib": lists_kib,
+            "us": timed(lambda region: best_from_lists(lists, names, region), regions, len(names), rounds),
+        },
+        "columnar": {
+            "kib": store_kib,
+            "nbytes_kib": store.nbytes / 1024,
+            "us": timed(lambda region: best_from_store(store, item_ids, names, region), regions, len(names), rounds),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", default="1,10", help="comma-separated captures per store price")
+    parser.add_argument("--rounds", type=int, default=5, help="lookup passes over every name and region")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings = Settings.from_env()
+    catalog = load_catalog(settings.catalog_path, settings.dictionary_path)
+    records, _ = load_catalog_records(settings.catalog_path)
+    print(f"catalog items: {len(catalog)}; regions: {', '.join(sorted(records))}")
+    print(f"{'history':>7} {'rows':>8} {'form':<9} {'kib':>9} {'nbytes_kib':>10} {'us/item':>8}")
+    for captures in (int(value) for value in args.history.split(",")):
+        count, rows = measure(with_history(records, captures, args.seed), catalog, args.rounds)
+        for form, row in rows.items():
+            nbytes = f"{row['nbytes_kib']:>10.1f}" if "nbytes_kib" in row else f"{'-':>10}"
+            print(f"{captures:>7} {count:>8} {form:<9} {row['kib']:>9.1f} {nbytes} {row['us']:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Compare per-response serialization cost of the /suggest body.
+
+Every path encodes the same ranked results (top ``RECO_MAX_SUGGESTIONS`` for
+each query, with context), so only the serialization differs:
+
+- ``models+json``: the pre-orjson path. ``Suggestion`` models are built per
+  result, the response model is validated and dumped the way FastAPI does for
+  a ``response_model``, and ``JSONResponse`` encodes it with ``json.dumps``.
+- ``models+orjson``: the same models, dumped with ``orjson`` instead.
+- ``fragments``: the current path. Each item's pre-encoded static fields are
+  joined with its confidence, locale and match, and the envelope is written by
+  ``orjson`` around the resulting ``orjson.Fragment``.
+- ``cached``: a cache hit on the current path, where only the envelope is
+  encoded around the cached suggestion bytes.
+
+Reported per response: ``us`` wall time and ``bytes`` of output. The script
+fails if any path's JSON differs from ``fragments``.
+
+Run (from services/recommendations):
+  python -m bench.serialization
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Callable, Dict, List, Tuple
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.catalog import load_catalog
+from app.config import Settings
+from app.index import SuggestionIndex
+from app.main import Suggestion, SuggestResponse, rank_candidates
+from app.metrics import StageTimer
+from app.text import normalize
+
+QUERIES = ["milk", "bread", "cheese", "rice", "chedar", "plantain", "jerk", "m", "coco", "sauce"]
+CONTEXT = (normalize("pasta"), normalize("tomato sauce"))
+LOCALE = "en-US"
+VERSION = "bench"
+
+Ranked = List[Tuple[int, float, str]]
+
+_RESPONSE = TypeAdapter(SuggestResponse)
+
+
+def _models(index: SuggestionIndex, ranked: Ranked) -> List[Suggestion]:
+    suggestions = []
+    for item_id, confidence, match in ranked:
+        item = index.item(item_id)
+        suggestions.append(
+            Suggestion(
+                label=item.label,
+                type="product",
+                confidence=confidence,
+                metadata={"locale": LOCALE, "source": item.source, "category": item.category, "match": match},
+            )
+        )
+    return suggestions
+
+
+def models_json(index: SuggestionIndex, ranked: Ranked) -> bytes:
+    response = SuggestResponse(suggestions=_models(index, ranked), latency_ms=0.25, model_version=VERSION)
+    content = _RESPONSE.dump_python(_RESPONSE.validate_python(response), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def models_orjson(index: SuggestionIndex, ranked: Ranked) -> bytes:
+    response = SuggestResponse(suggestions=_models(index, ranked), latency_ms=0.25, model_version=VERSION)
+    return orjson.dumps(response.model_dump())
+
+
+def fragments(index: SuggestionIndex, ranked: Ranked) -> bytes:
+    encoded = index.fragments.encode_list(ranked, LOCALE)
+    return orjson.dumps({"suggestions": orjson.Fragment(encoded), "latency_ms": 0.25, "model_version": VERSION})
+
+
+def cached(_: SuggestionIndex, encoded: bytes) -> bytes:
+    return orjson.dumps({"suggestions": orjson.Fragment(encoded), "latency_ms": 0.25, "model_version": VERSION})
+
+
+def measure(encode: Callable, index: SuggestionIndex, inputs: List, rounds: int = 500) -> Dict[str, float]:
+    size = sum(len(encode(index, value)) for value in inputs)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in inputs:
+            encode(index, value)
+    elapsed = time.perf_counter() - start
+    return {"us": elapsed / (rounds * len(inputs)) * 1e6, "bytes": size / len(inputs)}
+
+
+def main_cli() -> int:
+    settings = Settings.from_env()
+    index = SuggestionIndex(load_catalog(settings.catalog_path, settings.dictionary_path))
+    limit = settings.max_suggestions
+    timer = StageTimer()
+    ranked = [rank_candidates(index, normalize(query), CONTEXT, limit, timer) for query in QUERIES]
+    encoded = [index.fragments.encode_list(results, LOCALE) for results in ranked]
+    paths = (
+        ("models+json", models_json, ranked),
+        ("models+orjson", models_orjson, ranked),
+        ("fragments", fragments, ranked),
+        ("cached", cached, encoded),
+    )
+
+    expected = [orjson.loads(fragments(index, results)) for results in ranked]
+    for name, encode, inputs in paths:
+        if [orjson.loads(encode(index, value)) for value in inputs] != expected:
+            print(f"{name} produced different JSON than fragments")
+            return 1
+
+    print(f"catalog items: {len(index)}; queries: {len(QUERIES)}; limit: {limit}")
+    print(f"{'path':<14} {'us':>8} {'bytes':>8}")
+    for name, encode, inputs in paths:
+        row = measure(encode, index, inputs)
+        print(f"{name:<14} {row['us']:>8.1f} {row['bytes']:>8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main_cli())
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+import pytest
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVICE_ROOT))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.autocomplete import PrefixIndex  # noqa: E402
+from app.config import DEFAULT_CATALOG_PATH, DEFAULT_DICTIONARY_PATH, Settings  # noqa: E402
+from app.prices import PriceStore  # noqa: E402
+from app.reload import build_catalog_indexes  # noqa: E402
+from app.shards import IndexShards  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    """Service defaults: the generated catalog and dictionaries checked into the repo."""
+    return Settings(catalog_path=DEFAULT_CATALOG_PATH, dictionary_path=DEFAULT_DICTIONARY_PATH)
+
+
+@pytest.fixture(scope="session")
+def indexes(settings: Settings) -> Tuple[IndexShards, PrefixIndex, Optional[PriceStore]]:
+    return build_catalog_indexes(settings)
+
+
+@pytest.fixture(scope="session")
+def shards(indexes) -> IndexShards:
+    return indexes[0]
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """The app as ``uvicorn app.main:app`` serves it with no ``RECO_*`` variables set."""
+    from app.main import app
+
+    with pytest.MonkeyPatch.context() as patch:
+        for name in [name for name in os.environ if name.startswith("RECO_")]:
+            patch.delenv(name)
+        with TestClient(app) as test_client:
+            yield test_client
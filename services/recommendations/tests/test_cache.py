@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from app.cache import TTLCache, context_fingerprint
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = TTLCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.put("milk", b"[]", (1, "v"))
+    clock.now = 9.9
+    assert cache.get("milk", (1, "v")) == b"[]"
+    clock.now = 10.0
+    assert cache.get("milk", (1, "v")) is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_entries=2, ttl_seconds=10, clock=Clock())
+    cache.put("a", 1, (1, "v"))
+    cache.put("b", 2, (1, "v"))
+    assert cache.get("a", (1, "v")) == 1
+    cache.put("c", 3, (1, "v"))
+    assert cache.get("b", (1, "v")) is None
+    assert cache.get("a", (1, "v")) == 1
+    assert cache.get("c", (1, "v")) == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_newer_scope_drops_older_entries():
+    cache = TTLCache(max_entries=4, ttl_seconds=10, clock=Clock())
+    cache.put("milk", "old", (1, "v"))
+    assert cache.get("milk", (2, "v")) is None
+    cache.put("milk", "new", (2, "v"))
+    assert cache.get("milk", (2, "v")) == "new"
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_older_scope_neither_reads_nor_clears():
+    cache = TTLCache(max_entries=4, ttl_seconds=10, clock=Clock())
+    cache.put("milk", "new", (2, "v"))
+    assert cache.get("milk", (1, "v")) is None
+    cache.put("milk", "old", (1, "v"))
+    cache.put("bread", "old", (1, "v"))
+    assert cache.get("milk", (2, "v")) == "new"
+    assert cache.get("bread", (2, "v")) is None
+    stats = cache.stats()
+    assert stats["stale"] == 3
+    assert stats["invalidations"] == 0
+    assert stats["version"] == (2, "v")
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TTLCache(max_entries=0, ttl_seconds=10)
+    cache.put("milk", "value", (1, "v"))
+    assert cache.get("milk", (1, "v")) is None
+    assert len(cache) == 0
+
+
+def test_context_fingerprint_ignores_order_and_repeats():
+    assert context_fingerprint(["pasta", "bread"]) == context_fingerprint(["bread", "pasta", "bread"])
+    assert context_fingerprint(["pasta"]) != context_fingerprint(["bread"])
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+# Recorded from classifyProductName(item, { limit }) in
+# supabase/functions/_shared/hybrid-classifier.ts over the same foodDictionary;
+# re-record them when the TS classifier or the dictionary changes.
+CASES = json.loads((Path(__file__).parent / "data" / "hybrid-classifier-cases.json").read_text(encoding="utf-8"))
+
+
+def test_classify_matches_hybrid_classifier(client):
+    items = [case["item"] for case in CASES["cases"]]
+    response = client.post("/classify", json={"items": items, "limit": CASES["limit"]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["item"] for result in results] == items
+    for case, result in zip(CASES["cases"], results):
+        assert result["classifications"] == case["classifications"], case["item"]
+
+
+def test_classify_defaults_match_the_ts_defaults(client):
+    response = client.post("/classify", json={"items": ["Grace Baked Beans 300g"]})
+    assert response.status_code == 200
+    expected = next(case for case in CASES["cases"] if case["item"] == "Grace Baked Beans 300g")
+    assert response.json()["results"][0]["classifications"] == expected["classifications"]
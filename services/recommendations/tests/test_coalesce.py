@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.coalesce import SingleFlight
+
+
+def test_concurrent_requests_share_one_computation():
+    flights = SingleFlight()
+    calls: List[List[str]] = []
+
+    async def compute(keys):
+        calls.append(list(keys))
+        await asyncio.sleep(0.01)
+        return [key.upper() for key in keys], {"score": 1}
+
+    async def scenario():
+        return await asyncio.gather(
+            flights.run_many(["milk", "bread"], compute),
+            flights.run_many(["milk"], compute),
+            flights.run_many(["bread", "rice"], compute),
+        )
+
+    first, second, third = asyncio.run(scenario())
+    assert calls == [["milk", "bread"], ["rice"]]
+    assert first == ({"milk": "MILK", "bread": "BREAD"}, {"score": 1})
+    assert second == ({"milk": "MILK"}, None)
+    assert third == ({"bread": "BREAD", "rice": "RICE"}, {"score": 1})
+    assert flights.stats()["coalesced"] == 2
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_kept():
+    flights = SingleFlight()
+    calls = 0
+
+    async def compute(keys):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("scoring failed")
+
+    async def scenario():
+        return await asyncio.gather(
+            flights.run_many(["milk"], compute),
+            flights.run_many(["milk"], compute),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert calls == 1
+    assert [str(result) for result in results] == ["scoring failed", "scoring failed"]
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flights.stats()["in_flight"] == 0
+
+    async def retry():
+        return await flights.run_many(["milk"], compute)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(retry())
+    assert calls == 2
+
+
+def test_disabled_flights_compute_every_request():
+    flights = SingleFlight(enabled=False)
+    calls = 0
+
+    async def compute(keys):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return list(keys), None
+
+    async def scenario():
+        return await asyncio.gather(flights.run_many(["milk"], compute), flights.run_many(["milk"], compute))
+
+    asyncio.run(scenario())
+    assert calls == 2
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.catalog import Catalog, CatalogItem, load_catalog_records
+from app.prices import PriceStore
+
+
+def record(name: str, *prices: tuple) -> dict:
+    return {
+        "name": name,
+        "prices": [
+            {"store": store, "unitPrice": unit_price, "currency": "USD", "capturedAt": captured_at}
+            for store, unit_price, captured_at in prices
+        ],
+    }
+
+
+def store() -> PriceStore:
+    items = [
+        CatalogItem(
+            item_id=item_id, name=name, label=name, category="pantry", aliases=(), regions=("us",), tags=(), source="test"
+        )
+        for item_id, name in enumerate(["Milk (2%)", "Bread (White)", "Rice (Long Grain)"])
+    ]
+    records = {
+        "us": [
+            # A newer capture replaces an older one at the same store, even when it is dearer.
+            record("Milk (2%)", ("Walmart", 3.10, 1), ("Walmart", 3.50, 2), ("Target", 3.20, 1)),
+            record("Bread (White)", ("Target", 2.00, 1), ("Kroger", 2.00, 1)),
+            record("Unknown Item", ("Target", 0.10, 1)),
+        ],
+        "jm": [record("Rice (Long Grain)", ("Hi-Lo", 250.0, 1))],
+    }
+    return PriceStore.build(records, Catalog(items=tuple(items), version="test"))
+
+
+def best(prices: PriceStore, item_ids: List[int], region: str, at: Optional[str] = None) -> List[Optional[Dict]]:
+    rows = prices.best(np.array(item_ids, dtype=np.int64), region, at)
+    return [prices.row(row) if row >= 0 else None for row in rows.tolist()]
+
+
+def test_best_price_is_the_cheapest_latest_price():
+    prices = store()
+    milk, bread, rice = best(prices, [0, 1, 2], "us")
+    assert (milk["store"], milk["unit_price"]) == ("Target", 3.20)
+    # Ties go to the store that sorts first.
+    assert (bread["store"], bread["unit_price"]) == ("Kroger", 2.00)
+    assert rice is None
+    assert best(prices, [2], "JM")[0]["unit_price"] == 250.0
+
+
+def test_store_lookup_returns_that_stores_latest_price():
+    prices = store()
+    assert best(prices, [0], "us", "walmart")[0]["unit_price"] == 3.50
+    assert best(prices, [1], "us", "Walmart") == [None]
+    assert best(prices, [0], "us", "Costco") == [None]
+
+
+def test_unknown_items_and_regions_have_no_price():
+    prices = store()
+    assert best(prices, [-1, 0], "us")[0] is None
+    assert best(prices, [0, 1], "xx") == [None, None]
+    assert prices.stats()["rows"] == 6
+
+
+def test_prices_endpoint_matches_the_catalog_snapshots(client, settings):
+    by_region, _ = load_catalog_records(settings.catalog_path, None)
+    jm = {}
+    for entry in by_region["jm"]:
+        for price in entry["prices"]:
+            jm.setdefault(entry["name"], []).append(price)
+    # The name with the most captured prices (several records share a name).
+    name, captured = max(jm.items(), key=lambda entry: len(entry[1]))
+    cheapest = min(captured, key=lambda price: (price["unitPrice"], price["store"]))
+
+    response = client.post("/prices", json={"items": [name.lower(), "xyzzy"], "region": "JM"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["region"] == "jm"
+    found, missing = body["results"]
+    assert found["name"] == name
+    assert (found["best"]["store"], found["best"]["unit_price"]) == (cheapest["store"], cheapest["unitPrice"])
+    assert missing == {"item": "xyzzy", "name": None, "best": None}
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from app.catalog import Catalog, CatalogItem
+from app.index import SuggestionIndex
+from app.text import normalize
+
+
+def top(index: SuggestionIndex, query: str, count: int = 3, fuzzy: bool = True) -> List[Tuple[str, str]]:
+    candidates = sorted(index.search(normalize(query), fuzzy=fuzzy), key=lambda c: (-c.similarity, c.item_id))
+    return [(index.item(candidate.item_id).name, candidate.match) for candidate in candidates[:count]]
+
+
+def small_index() -> SuggestionIndex:
+    names = ["Cheddar Cheese", "Coconut Milk (Canned)", "Milk (2%)", "Plantain (Ripe/Green)", "Rice (Long Grain)"]
+    items = [
+        CatalogItem(
+            item_id=item_id,
+            name=name,
+            label=name,
+            category="pantry",
+            aliases=("coconut cream",) if name.startswith("Coconut") else (),
+            regions=("us",),
+            tags=(),
+            source="test",
+        )
+        for item_id, name in enumerate(names)
+    ]
+    return SuggestionIndex(Catalog(items=tuple(items), version="test"))
+
+
+def test_exact_name_and_alias_hits():
+    index = small_index()
+    assert top(index, "Milk", 2) == [("Milk (2%)", "exact"), ("Coconut Milk (Canned)", "exact")]
+    assert top(index, "coconut cream", 1) == [("Coconut Milk (Canned)", "exact")]
+
+
+def test_typos_are_corrected_as_fuzzy_hits():
+    index = small_index()
+    assert top(index, "chedar", 1) == [("Cheddar Cheese", "fuzzy")]
+    assert top(index, "plantian", 1) == [("Plantain (Ripe/Green)", "fuzzy")]
+
+
+def test_unknown_query_has_no_hits():
+    assert small_index().search(normalize("xyzzy")) == []
+
+
+def test_catalog_exact_hits_rank_first(shards):
+    index = shards.shared
+    assert top(index, "milk", 1) == [("Milk (2%)", "exact")]
+    assert top(index, "coconut milk", 1) == [("Coconut Milk (Canned)", "exact")]
+
+
+def test_catalog_fuzzy_hits(shards):
+    index = shards.shared
+    assert index.needs_fuzzy(normalize("chedar"))
+    assert top(index, "chedar", 2) == [("Cheddar Cheese", "fuzzy"), ("Cheddar (White)", "fuzzy")]
+    assert [name for name, _ in top(index, "plantian", 2)] == ["Plantain (Green for Cooking)", "Plantain (Ripe/Green)"]
+
+
+def test_exact_words_skip_typo_correction(shards):
+    index = shards.shared
+    assert not index.needs_fuzzy(normalize("milk"))
+    assert index.search(normalize("milk"), fuzzy=False) == index.search(normalize("milk"))
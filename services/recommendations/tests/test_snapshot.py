@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.snapshot import load_indexes, save_indexes
+from app.text import normalize
+
+QUERIES = ["milk", "chedar", "coconut milk", "plantian", "jerk sauce", "m", "xyzzy", "pawpaw", "café"]
+
+
+@pytest.fixture(scope="module")
+def loaded(indexes, tmp_path_factory):
+    path = tmp_path_factory.mktemp("snapshot") / "suggestion-index.bin"
+    save_indexes(path, *indexes)
+    return load_indexes(path)
+
+
+def test_every_shard_searches_like_the_built_one(shards, loaded):
+    mapped = loaded[0]
+    assert mapped.stats() == shards.stats()
+    assert mapped.version == shards.version
+    for built, read in zip(shards, mapped):
+        assert [read.item(item_id) for item_id in range(len(read))] == [
+            built.item(item_id) for item_id in range(len(built))
+        ]
+        for query in QUERIES:
+            assert read.search(normalize(query)) == built.search(normalize(query))
+
+
+def test_autocomplete_matches(indexes, loaded):
+    for prefix in ["mil", "coco", "p", "zz"]:
+        assert [item.item_id for item in loaded[1].complete(prefix, 10)] == [
+            item.item_id for item in indexes[1].complete(prefix, 10)
+        ]
+
+
+def test_classifier_matches(shards, loaded):
+    lines = ["Grace Baked Beans 300g", "chiken brest", "ackee in brine", "whole milk 1 gal", ""]
+    assert loaded[0].classifier.classify_many(lines, 4) == shards.classifier.classify_many(lines, 4)
+
+
+def test_price_store_matches(indexes, loaded):
+    built, read = indexes[2], loaded[2]
+    assert read.stats() == built.stats()
+    item_ids = np.arange(-1, len(indexes[0].shared))
+    for region in ["jm", "us", "cn", "xx"]:
+        assert np.array_equal(read.best(item_ids, region), built.best(item_ids, region))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import List
+
+import orjson
+import pytest
+
+from app.main import rank_routed
+from app.metrics import StageTimer
+from app.text import normalize
+
+
+def confidences(suggestions: List[dict]) -> List[float]:
+    return [suggestion["confidence"] for suggestion in suggestions]
+
+
+def assert_ranked(suggestions: List[dict], limit: int = 8) -> None:
+    assert len(suggestions) <= limit
+    assert confidences(suggestions) == sorted(confidences(suggestions), reverse=True)
+    labels = [suggestion["label"] for suggestion in suggestions]
+    assert len(labels) == len(set(labels))
+
+
+def test_shared_shard_top_up_is_merged_by_confidence(client):
+    suggestions = client.post("/suggest", json={"query": "milk", "locale": "en-JM"}).json()["suggestions"]
+    assert_ranked(suggestions)
+    assert (suggestions[0]["label"], suggestions[0]["metadata"]["match"]) == ("Milk (2%)", "exact")
+    assert all(suggestion["metadata"]["locale"] == "en-JM" for suggestion in suggestions)
+
+
+@pytest.mark.parametrize("query", ["milk", "café", "pawpaw", "chedar", "coconut milk", "jerk sauce"])
+@pytest.mark.parametrize("locale", [None, "en-JM", "en-US", "zh-Hans-CN"])
+def test_routed_suggestions_are_ranked(client, query, locale):
+    suggestions = client.post("/suggest", json={"query": query, "locale": locale}).json()["suggestions"]
+    assert_ranked(suggestions)
+
+
+def test_regional_names_win_in_their_region(client):
+    suggestions = client.post("/suggest", json={"query": "pawpaw", "locale": "en-JM"}).json()["suggestions"]
+    assert suggestions[0]["label"] == "Pawpaw (Papaya)"
+
+
+def test_batch_entries_match_single_requests(client):
+    queries = [{"query": "milk", "locale": "en-JM"}, {"query": "café", "locale": "en-US"}, {"query": "chedar"}]
+    results = client.post("/suggest/batch", json={"queries": queries}).json()["results"]
+    for query, result in zip(queries, results):
+        assert_ranked(result["suggestions"])
+        single = client.post("/suggest", json=query).json()["suggestions"]
+        assert result["suggestions"] == single
+
+
+def test_streamed_ranked_event_matches_suggest(client):
+    request = {"query": "milk", "locale": "en-JM", "context_items": [{"label": "bread"}]}
+    lines = [orjson.loads(line) for line in client.post("/suggest/stream", json=request).text.splitlines()]
+    assert [line["phase"] for line in lines] == ["exact", "ranked"]
+    assert all(suggestion["metadata"]["match"] == "exact" for suggestion in lines[0]["suggestions"])
+    assert_ranked(lines[0]["suggestions"])
+    assert lines[1]["complete"]
+    assert lines[1]["suggestions"] == client.post("/suggest", json=request).json()["suggestions"]
+
+
+def test_rank_routed_tops_up_short_regional_results(shards):
+    regional = shards.regions["jm"]
+    regional_names = {regional.item(candidate.item_id).name for candidate in regional.search(normalize("milk"))}
+    assert len(regional_names) < 8
+    assert "Milk (2%)" not in regional_names
+    routed = orjson.loads(rank_routed(shards, normalize("milk"), (), "en-JM", 8, StageTimer()))
+    assert len(routed) == 8
+    assert_ranked(routed)
+    assert routed[0]["label"] == "Milk (2%)"
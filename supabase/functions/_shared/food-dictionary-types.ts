@@ -20,6 +20,9 @@ export type FoodDictionaryEntry = {
   packaging: string[];
 };
 
+// Region columns of the western dictionary CSV tables (docs/data/food-dictionary-western-part*.md).
+export type DictionaryRegion = 'JM' | 'TT' | 'PR' | 'DO' | 'HT' | 'US' | 'CA' | 'MX' | 'BR' | 'CO';
+
 export type SeedConfig = {
   product: string;
   brand?: string;
@@ -28,6 +31,8 @@ export type SeedConfig = {
   tags?: string[];
   packaging?: string[];
   aliases?: string[];
+  /** The local name per region column; every value is also listed in `aliases`. */
+  regionalAliases?: Partial<Record<DictionaryRegion, string>>;
 };
 
 export type ExpandableSeed = SeedConfig & { category: FoodCategoryId };
@@ -2461,6 +2461,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "bakery",
     product: "Pita Bread",
     aliases: ["pita", "pita", "pita", "pita", "pan árabe", "pão sírio", "pão sírio"],
+    regionalAliases: {
+      TT: "pita",
+      DO: "pita",
+      US: "pita",
+      CA: "pita",
+      MX: "pan árabe",
+      BR: "pão sírio",
+      CO: "pão sírio"
+    },
     variants: ["White", "Whole Wheat"],
     packaging: ["bag"],
     tags: ["bakery", "western-v0.2", "white", "whole wheat"],
@@ -2497,6 +2506,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "bakery",
     product: "Tortillas (Corn)",
     aliases: ["tortilla", "tortilla", "tortilla", "tortilla", "tortilla de maíz", "tortilla", "tortilla"],
+    regionalAliases: {
+      PR: "tortilla",
+      DO: "tortilla",
+      US: "tortilla",
+      CA: "tortilla",
+      MX: "tortilla de maíz",
+      BR: "tortilla",
+      CO: "tortilla"
+    },
     variants: ["White", "Yellow"],
     packaging: ["bag"],
     tags: ["bakery", "western-v0.2", "white", "yellow"],
@@ -2505,6 +2523,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "bakery",
     product: "Tortillas (Flour)",
     aliases: ["tortilla", "tortilla", "tortilla", "tortilla", "tortilla de harina", "tortilla", "tortilla"],
+    regionalAliases: {
+      PR: "tortilla",
+      DO: "tortilla",
+      US: "tortilla",
+      CA: "tortilla",
+      MX: "tortilla de harina",
+      BR: "tortilla",
+      CO: "tortilla"
+    },
     variants: ["8in", "10in"],
     packaging: ["bag"],
     tags: ["10in", "8in", "bakery", "western-v0.2"],
@@ -2527,6 +2554,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Agua de Jamaica (Hibiscus)",
     aliases: ["sorrel", "sorrel", "agua de jamaica", "flor de jamaica", "te zaboka", "hibiscus tea", "hibiscus tea", "agua de jamaica", "chá de hibisco", "agua de jamaica"],
+    regionalAliases: {
+      JM: "sorrel",
+      TT: "sorrel",
+      PR: "agua de jamaica",
+      DO: "flor de jamaica",
+      HT: "te zaboka",
+      US: "hibiscus tea",
+      CA: "hibiscus tea",
+      MX: "agua de jamaica",
+      BR: "chá de hibisco",
+      CO: "agua de jamaica"
+    },
     variants: ["Sweetened", "Unsweetened"],
     packaging: ["bottle"],
     tags: ["beverages", "sweetened", "unsweetened", "western-v0.2"],
@@ -2549,6 +2588,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Coconut Water",
     aliases: ["jelly water", "coconut water", "agua de coco", "agua de coco", "dlo kokoye", "coconut water", "coconut water", "agua de coco", "água de coco", "agua de coco"],
+    regionalAliases: {
+      JM: "jelly water",
+      TT: "coconut water",
+      PR: "agua de coco",
+      DO: "agua de coco",
+      HT: "dlo kokoye",
+      US: "coconut water",
+      CA: "coconut water",
+      MX: "agua de coco",
+      BR: "água de coco",
+      CO: "agua de coco"
+    },
     variants: ["Pulp", "No pulp"],
     packaging: ["bottle", "Tetra"],
     tags: ["beverages", "no pulp", "pulp", "western-v0.2"],
@@ -2557,6 +2608,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Coffee (Ground)",
     aliases: ["coffee", "coffee", "café", "café"],
+    regionalAliases: {
+      US: "coffee",
+      CA: "coffee",
+      MX: "café",
+      BR: "café",
+      CO: "café"
+    },
     variants: ["café"],
     packaging: ["Light", "Medium", "Dark roast"],
     tags: ["beverages", "café", "western-v0.2"],
@@ -2565,6 +2623,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Energy Drink",
     aliases: ["energy drink", "energy drink", "bebida energética", "energético"],
+    regionalAliases: {
+      US: "energy drink",
+      CA: "energy drink",
+      MX: "bebida energética",
+      BR: "energético",
+      CO: "bebida energética"
+    },
     variants: ["bebida energética"],
     packaging: ["Regular", "Sugar-free"],
     tags: ["bebida energética", "beverages", "western-v0.2"],
@@ -2573,6 +2638,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Ginger Beer",
     aliases: ["ginger beer", "ginger beer", "refresco de jengibre", "refresco de jengibre", "ji bier", "ginger beer", "ginger beer", "refresco de jengibre", "refrigerante de gengibre", "refresco de jengibre"],
+    regionalAliases: {
+      JM: "ginger beer",
+      TT: "ginger beer",
+      PR: "refresco de jengibre",
+      DO: "refresco de jengibre",
+      HT: "ji bier",
+      US: "ginger beer",
+      CA: "ginger beer",
+      MX: "refresco de jengibre",
+      BR: "refrigerante de gengibre",
+      CO: "refresco de jengibre"
+    },
     variants: ["Traditional", "Diet"],
     packaging: ["bottle", "can"],
     tags: ["beverages", "diet", "traditional", "western-v0.2"],
@@ -2581,6 +2658,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Grape Juice",
     aliases: ["grape juice", "grape juice", "jugo de uva", "Suco de uva"],
+    regionalAliases: {
+      US: "grape juice",
+      CA: "grape juice",
+      MX: "jugo de uva",
+      BR: "Suco de uva",
+      CO: "jugo de uva"
+    },
     variants: ["jugo de uva"],
     packaging: ["Concord", "White"],
     tags: ["beverages", "jugo de uva", "western-v0.2"],
@@ -2589,6 +2673,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Iced Tea (Bottled)",
     aliases: ["iced tea", "iced tea", "té helado", "chá gelado"],
+    regionalAliases: {
+      US: "iced tea",
+      CA: "iced tea",
+      MX: "té helado",
+      BR: "chá gelado",
+      CO: "té helado"
+    },
     variants: ["té helado"],
     packaging: ["Lemon", "Peach", "Unsweet"],
     tags: ["beverages", "té helado", "western-v0.2"],
@@ -2597,6 +2688,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Kola Champagne Soda",
     aliases: ["kola champagne", "kola champagne", "kola champagne", "kola champagne", "kola champagne", "kola champagne", "refresco kola champagne", "refrigerante", "refresco"],
+    regionalAliases: {
+      JM: "kola champagne",
+      TT: "kola champagne",
+      PR: "kola champagne",
+      DO: "kola champagne",
+      US: "kola champagne",
+      CA: "kola champagne",
+      MX: "refresco kola champagne",
+      BR: "refrigerante",
+      CO: "refresco"
+    },
     variants: ["Sweet", "Diet"],
     packaging: ["bottle"],
     tags: ["beverages", "diet", "sweet", "western-v0.2"],
@@ -2605,6 +2707,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Lemonade",
     aliases: ["lemonade", "lemonade", "limonada", "limonada"],
+    regionalAliases: {
+      US: "lemonade",
+      CA: "lemonade",
+      MX: "limonada",
+      BR: "limonada",
+      CO: "limonada"
+    },
     variants: ["limonada"],
     packaging: ["Still", "Sparkling"],
     tags: ["beverages", "limonada", "western-v0.2"],
@@ -2613,6 +2722,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Malta (Malt Beverage)",
     aliases: ["malta", "malta", "malta", "malta", "malta", "malta", "malta", "malta", "malta", "malta"],
+    regionalAliases: {
+      JM: "malta",
+      TT: "malta",
+      PR: "malta",
+      DO: "malta",
+      HT: "malta",
+      US: "malta",
+      CA: "malta",
+      MX: "malta",
+      BR: "malta",
+      CO: "malta"
+    },
     variants: ["Original", "Ginger"],
     packaging: ["bottle"],
     tags: ["beverages", "ginger", "original", "western-v0.2"],
@@ -2621,6 +2742,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Orange Juice",
     aliases: ["orange juice", "orange juice", "jugo de naranja", "suco de laranja"],
+    regionalAliases: {
+      US: "orange juice",
+      CA: "orange juice",
+      MX: "jugo de naranja",
+      BR: "suco de laranja",
+      CO: "jugo de naranja"
+    },
     variants: ["jugo de naranja"],
     packaging: ["Pulp", "No pulp"],
     tags: ["beverages", "jugo de naranja", "western-v0.2"],
@@ -2629,6 +2757,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Soda (Cola)",
     aliases: ["pop/cola", "cola", "refresco/cola", "refrigerante/cola", "gaseosa/cola"],
+    regionalAliases: {
+      US: "pop/cola",
+      CA: "cola",
+      MX: "refresco/cola",
+      BR: "refrigerante/cola",
+      CO: "gaseosa/cola"
+    },
     variants: ["Regular", "Diet"],
     packaging: ["bottle", "can"],
     tags: ["beverages", "diet", "regular", "western-v0.2"],
@@ -2637,6 +2772,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Sports Drink",
     aliases: ["sports drink", "sports drink", "bebida deportiva", "isotônico"],
+    regionalAliases: {
+      US: "sports drink",
+      CA: "sports drink",
+      MX: "bebida deportiva",
+      BR: "isotônico",
+      CO: "bebida deportiva"
+    },
     variants: ["bebida deportiva"],
     packaging: ["Lemon-lime", "Fruit punch"],
     tags: ["bebida deportiva", "beverages", "western-v0.2"],
@@ -2645,6 +2787,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "beverages",
     product: "Tamarind Juice",
     aliases: ["tamarind", "tamarindo", "tamarindo", "tamarin", "tamarind", "tamarind", "tamarindo", "tamarindo", "tamarindo"],
+    regionalAliases: {
+      TT: "tamarind",
+      PR: "tamarindo",
+      DO: "tamarindo",
+      HT: "tamarin",
+      US: "tamarind",
+      CA: "tamarind",
+      MX: "tamarindo",
+      BR: "tamarindo",
+      CO: "tamarindo"
+    },
     variants: ["Sweetened", "Unsweetened"],
     packaging: ["bottle"],
     tags: ["beverages", "sweetened", "unsweetened", "western-v0.2"],
@@ -2653,6 +2806,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bagged Granola",
     aliases: ["granola", "granola", "granola", "granola"],
+    regionalAliases: {
+      US: "granola",
+      CA: "granola",
+      MX: "granola",
+      BR: "granola",
+      CO: "granola"
+    },
     variants: ["granola"],
     packaging: ["Honey", "Chocolate"],
     tags: ["breakfast & cereal", "granola", "western-v0.2"],
@@ -2661,6 +2821,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bran Cereal (Flakes)",
     aliases: ["bran flakes", "bran flakes", "hojuelas de salvado", "flocos de farelo"],
+    regionalAliases: {
+      US: "bran flakes",
+      CA: "bran flakes",
+      MX: "hojuelas de salvado",
+      BR: "flocos de farelo",
+      CO: "hojuelas de salvado"
+    },
     variants: ["hojuelas de salvado"],
     packaging: ["With raisins", "Plain"],
     tags: ["breakfast & cereal", "hojuelas de salvado", "western-v0.2"],
@@ -2669,6 +2836,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Corn Flakes",
     aliases: ["corn flakes", "corn flakes", "hojuelas de maíz", "flocos de milho"],
+    regionalAliases: {
+      US: "corn flakes",
+      CA: "corn flakes",
+      MX: "hojuelas de maíz",
+      BR: "flocos de milho",
+      CO: "hojuelas de maíz"
+    },
     variants: ["hojuelas de maíz"],
     packaging: ["Original", "Gluten-free"],
     tags: ["breakfast & cereal", "hojuelas de maíz", "western-v0.2"],
@@ -2677,6 +2851,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cream of Wheat (Farina)",
     aliases: ["farina", "farina", "crema de trigo", "crema de trigo", "farin", "cream of wheat", "cream of wheat", "crema de trigo", "creme de trigo", "crema de trigo"],
+    regionalAliases: {
+      JM: "farina",
+      TT: "farina",
+      PR: "crema de trigo",
+      DO: "crema de trigo",
+      HT: "farin",
+      US: "cream of wheat",
+      CA: "cream of wheat",
+      MX: "crema de trigo",
+      BR: "creme de trigo",
+      CO: "crema de trigo"
+    },
     variants: ["Original", "Quick"],
     packaging: ["box"],
     tags: ["breakfast & cereal", "original", "quick", "western-v0.2"],
@@ -2693,6 +2879,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Instant Oatmeal Packs",
     aliases: ["instant oatmeal", "instant oatmeal", "avena instantánea", "aveia instantânea"],
+    regionalAliases: {
+      US: "instant oatmeal",
+      CA: "instant oatmeal",
+      MX: "avena instantánea",
+      BR: "aveia instantânea",
+      CO: "avena instantánea"
+    },
     variants: ["avena instantánea"],
     packaging: ["Maple", "Plain"],
     tags: ["avena instantánea", "breakfast & cereal", "western-v0.2"],
@@ -2701,6 +2894,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Muesli",
     aliases: ["muesli", "muesli", "muesli", "muesli"],
+    regionalAliases: {
+      US: "muesli",
+      CA: "muesli",
+      MX: "muesli",
+      BR: "muesli",
+      CO: "muesli"
+    },
     variants: ["muesli"],
     packaging: ["Classic", "Fruit", "Nut"],
     tags: ["breakfast & cereal", "muesli", "western-v0.2"],
@@ -2709,6 +2909,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Old-Fashioned Oats",
     aliases: ["rolled oats", "rolled oats", "avena hojuelas", "avena hojuelas", "avena", "rolled oats", "rolled oats", "avena", "aveia", "avena"],
+    regionalAliases: {
+      JM: "rolled oats",
+      TT: "rolled oats",
+      PR: "avena hojuelas",
+      DO: "avena hojuelas",
+      HT: "avena",
+      US: "rolled oats",
+      CA: "rolled oats",
+      MX: "avena",
+      BR: "aveia",
+      CO: "avena"
+    },
     variants: ["Regular", "Gluten-free"],
     packaging: ["bag", "tub"],
     tags: ["breakfast & cereal", "gluten-free", "regular", "western-v0.2"],
@@ -2717,6 +2929,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pancake Mix",
     aliases: ["pancake mix", "pancake mix", "harina para panqueques", "mistura para panqueca"],
+    regionalAliases: {
+      US: "pancake mix",
+      CA: "pancake mix",
+      MX: "harina para panqueques",
+      BR: "mistura para panqueca",
+      CO: "harina para panqueques"
+    },
     variants: ["harina para panqueques"],
     packaging: ["Buttermilk", "Protein"],
     tags: ["breakfast & cereal", "harina para panqueques", "western-v0.2"],
@@ -2725,6 +2944,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Waffle Mix",
     aliases: ["waffle mix", "waffle mix", "mezcla para waffles", "mistura para waffle"],
+    regionalAliases: {
+      US: "waffle mix",
+      CA: "waffle mix",
+      MX: "mezcla para waffles",
+      BR: "mistura para waffle",
+      CO: "mezcla para waffles"
+    },
     variants: ["mezcla para waffles"],
     packaging: ["Classic", "Belgian"],
     tags: ["breakfast & cereal", "mezcla para waffles", "western-v0.2"],
@@ -2733,6 +2959,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Anchovies in Oil",
     aliases: ["anchovies", "anchovies", "anchoas", "anchovas"],
+    regionalAliases: {
+      US: "anchovies",
+      CA: "anchovies",
+      MX: "anchoas",
+      BR: "anchovas",
+      CO: "anchoas"
+    },
     variants: ["anchoas"],
     packaging: ["Fillets", "Paste"],
     tags: ["anchoas", "canned & jarred", "western-v0.2"],
@@ -2741,6 +2974,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Baked Beans",
     aliases: ["baked beans", "baked beans", "frijoles horneados", "feijão doce"],
+    regionalAliases: {
+      US: "baked beans",
+      CA: "baked beans",
+      MX: "frijoles horneados",
+      BR: "feijão doce",
+      CO: "frijoles horneados"
+    },
     variants: ["frijoles horneados"],
     packaging: ["Original", "Maple"],
     tags: ["canned & jarred", "frijoles horneados", "western-v0.2"],
@@ -2749,6 +2989,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Black Beans (Canned)",
     aliases: ["black bean (canned)", "frijoles negros", "habichuelas negras", "pwa nwa", "black beans", "black beans", "frijoles negros", "feijão preto", "fríjol negro"],
+    regionalAliases: {
+      TT: "black bean (canned)",
+      PR: "frijoles negros",
+      DO: "habichuelas negras",
+      HT: "pwa nwa",
+      US: "black beans",
+      CA: "black beans",
+      MX: "frijoles negros",
+      BR: "feijão preto",
+      CO: "fríjol negro"
+    },
     variants: ["Low-sodium", "Seasoned"],
     packaging: ["can"],
     tags: ["canned & jarred", "low-sodium", "seasoned", "western-v0.2"],
@@ -2757,6 +3008,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chickpeas (Canned)",
     aliases: ["channa (canned)", "garbanzos", "garbanzos", "pois chiche", "garbanzo", "chickpeas", "garbanzos", "grão-de-bico", "garbanzo"],
+    regionalAliases: {
+      TT: "channa (canned)",
+      PR: "garbanzos",
+      DO: "garbanzos",
+      HT: "pois chiche",
+      US: "garbanzo",
+      CA: "chickpeas",
+      MX: "garbanzos",
+      BR: "grão-de-bico",
+      CO: "garbanzo"
+    },
     variants: ["Low-sodium"],
     packaging: ["can"],
     tags: ["canned & jarred", "low-sodium", "western-v0.2"],
@@ -2765,6 +3027,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Coconut Milk (Canned)",
     aliases: ["lait kokoye", "leche de coco", "leche de coco", "lèt kokoye", "coconut milk", "coconut milk", "leche de coco", "leite de coco", "leche de coco"],
+    regionalAliases: {
+      JM: "lait kokoye",
+      PR: "leche de coco",
+      DO: "leche de coco",
+      HT: "lèt kokoye",
+      US: "coconut milk",
+      CA: "coconut milk",
+      MX: "leche de coco",
+      BR: "leite de coco",
+      CO: "leche de coco"
+    },
     variants: ["Regular", "Light"],
     packaging: ["can"],
     tags: ["canned & jarred", "light", "regular", "western-v0.2"],
@@ -2773,6 +3046,14 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Condensed Milk (Sweetened)",
     aliases: ["lèt kondanse", "condensed milk", "condensed milk", "leche condensada", "leite condensado", "leche condensada"],
+    regionalAliases: {
+      HT: "lèt kondanse",
+      US: "condensed milk",
+      CA: "condensed milk",
+      MX: "leche condensada",
+      BR: "leite condensado",
+      CO: "leche condensada"
+    },
     variants: ["Whole", "Skim"],
     packaging: ["can"],
     tags: ["canned & jarred", "skim", "western-v0.2", "whole"],
@@ -2781,6 +3062,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Corn (Whole Kernel)",
     aliases: ["corn (canned)", "maíz enlatado", "maíz enlatado", "mayi an bwat", "corn", "corn", "maíz", "milho", "maíz"],
+    regionalAliases: {
+      TT: "corn (canned)",
+      PR: "maíz enlatado",
+      DO: "maíz enlatado",
+      HT: "mayi an bwat",
+      US: "corn",
+      CA: "corn",
+      MX: "maíz",
+      BR: "milho",
+      CO: "maíz"
+    },
     variants: ["Whole kernel", "Creamed"],
     packaging: ["can"],
     tags: ["canned & jarred", "creamed", "western-v0.2", "whole kernel"],
@@ -2789,6 +3081,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Crushed Tomatoes",
     aliases: ["crushed tomatoes", "crushed tomatoes", "tomate triturado", "tomate pelado"],
+    regionalAliases: {
+      US: "crushed tomatoes",
+      CA: "crushed tomatoes",
+      MX: "tomate triturado",
+      BR: "tomate pelado",
+      CO: "Tomate triturado"
+    },
     variants: ["Tomate triturado"],
     packaging: ["With basil", "Plain"],
     tags: ["canned & jarred", "tomate triturado", "western-v0.2"],
@@ -2797,6 +3096,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Diced Tomatoes",
     aliases: ["diced tomatoes", "diced tomatoes", "tomate en cubos", "tomate em cubos"],
+    regionalAliases: {
+      US: "diced tomatoes",
+      CA: "diced tomatoes",
+      MX: "tomate en cubos",
+      BR: "tomate em cubos",
+      CO: "tomate en cubos"
+    },
     variants: ["tomate en cubos"],
     packaging: ["No-salt", "Fire-roasted"],
     tags: ["canned & jarred", "tomate en cubos", "western-v0.2"],
@@ -2805,6 +3111,14 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Evaporated Milk",
     aliases: ["lèt evapore", "evaporated milk", "evaporated milk", "leche evaporada", "leite evaporado", "leche evaporada"],
+    regionalAliases: {
+      HT: "lèt evapore",
+      US: "evaporated milk",
+      CA: "evaporated milk",
+      MX: "leche evaporada",
+      BR: "leite evaporado",
+      CO: "leche evaporada"
+    },
     variants: ["Whole", "Low-fat"],
     packaging: ["can"],
     tags: ["canned & jarred", "low-fat", "western-v0.2", "whole"],
@@ -2813,6 +3127,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Green Peas (Petit Pois)",
     aliases: ["petit pois", "petit pois", "guisantes", "petit pois", "piti pwa", "green peas", "green peas", "chícharos", "ervilha", "arveja"],
+    regionalAliases: {
+      JM: "petit pois",
+      TT: "petit pois",
+      PR: "guisantes",
+      DO: "petit pois",
+      HT: "piti pwa",
+      US: "green peas",
+      CA: "green peas",
+      MX: "chícharos",
+      BR: "ervilha",
+      CO: "arveja"
+    },
     variants: ["Regular", "No-salt"],
     packaging: ["can"],
     tags: ["canned & jarred", "no-salt", "regular", "western-v0.2"],
@@ -2821,6 +3147,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Kidney Beans (Canned)",
     aliases: ["red peas", "habichuelas rojas", "habichuelas rojas", "pwa wouj", "kidney beans", "kidney beans", "frijol rojo", "feijão carioca ", "frijol rojo"],
+    regionalAliases: {
+      JM: "red peas",
+      PR: "habichuelas rojas",
+      DO: "habichuelas rojas",
+      HT: "pwa wouj",
+      US: "kidney beans",
+      CA: "kidney beans",
+      MX: "frijol rojo",
+      BR: "feijão carioca ",
+      CO: "frijol rojo"
+    },
     variants: ["Light", "Dark red"],
     packaging: ["can"],
     tags: ["canned & jarred", "dark red", "light", "western-v0.2"],
@@ -2829,6 +3166,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Olives (Green/Black)",
     aliases: ["olives", "olives", "aceitunas", "azeitonas"],
+    regionalAliases: {
+      US: "olives",
+      CA: "olives",
+      MX: "aceitunas",
+      BR: "azeitonas",
+      CO: "aceitunas"
+    },
     variants: ["aceitunas"],
     packaging: ["Pitted", "Stuffed"],
     tags: ["aceitunas", "canned & jarred", "western-v0.2"],
@@ -2837,6 +3181,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pickles (Dill Spears)",
     aliases: ["dill pickles", "dill pickles", "pepinillos en vinagre", "picles"],
+    regionalAliases: {
+      US: "dill pickles",
+      CA: "dill pickles",
+      MX: "pepinillos en vinagre",
+      BR: "picles",
+      CO: "pickles"
+    },
     variants: ["pickles"],
     packaging: ["Dill", "Sweet"],
     tags: ["canned & jarred", "pickles", "western-v0.2"],
@@ -2845,6 +3196,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pigeon Peas (Canned)",
     aliases: ["gungo peas", "gungo peas", "gandules", "gandules", "pwa kongo", "pigeon peas", "pigeon peas", "gandules", "feijão guandu", "fríjol caupí"],
+    regionalAliases: {
+      JM: "gungo peas",
+      TT: "gungo peas",
+      PR: "gandules",
+      DO: "gandules",
+      HT: "pwa kongo",
+      US: "pigeon peas",
+      CA: "pigeon peas",
+      MX: "gandules",
+      BR: "feijão guandu",
+      CO: "fríjol caupí"
+    },
     variants: ["Regular", "Seasoned"],
     packaging: ["can"],
     tags: ["canned & jarred", "regular", "seasoned", "western-v0.2"],
@@ -2853,6 +3216,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pineapple Slices (Canned)",
     aliases: ["pineapple slices", "pineapple slices", "piña en rodajas", "abacaxi em rodelas"],
+    regionalAliases: {
+      US: "pineapple slices",
+      CA: "pineapple slices",
+      MX: "piña en rodajas",
+      BR: "abacaxi em rodelas",
+      CO: "piña en rodajas"
+    },
     variants: ["piña en rodajas"],
     packaging: ["In juice", "In syrup"],
     tags: ["canned & jarred", "piña en rodajas", "western-v0.2"],
@@ -2861,6 +3231,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Sardines in Oil",
     aliases: ["sardines", "sardines", "sardinas", "sardinhas"],
+    regionalAliases: {
+      US: "sardines",
+      CA: "sardines",
+      MX: "sardinas",
+      BR: "sardinhas",
+      CO: "sardinas"
+    },
     variants: ["sardinas"],
     packaging: ["With pepper", "Plain"],
     tags: ["canned & jarred", "sardinas", "western-v0.2"],
@@ -2869,6 +3246,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tomato Paste (Can/Tube)",
     aliases: ["tomato paste", "tomato paste", "pasta de tomate", "extrato de tomate"],
+    regionalAliases: {
+      US: "tomato paste",
+      CA: "tomato paste",
+      MX: "pasta de tomate",
+      BR: "extrato de tomate",
+      CO: "pasta de tomate"
+    },
     variants: ["pasta de tomate"],
     packaging: ["No-salt", "Regular"],
     tags: ["canned & jarred", "pasta de tomate", "western-v0.2"],
@@ -2877,6 +3261,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tuna (Canned)",
     aliases: ["tuna", "tuna", "atún", "atum"],
+    regionalAliases: {
+      US: "tuna",
+      CA: "tuna",
+      MX: "atún",
+      BR: "atum",
+      CO: "atún"
+    },
     variants: ["atún"],
     packaging: ["Chunk light", "Albacore"],
     tags: ["atún", "canned & jarred", "western-v0.2"],
@@ -2885,6 +3276,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Adobo Seasoning (Blend)",
     aliases: ["adobo", "adobo", "adobo", "tempero adobo"],
+    regionalAliases: {
+      US: "adobo",
+      CA: "adobo",
+      MX: "adobo",
+      BR: "tempero adobo",
+      CO: "adobo"
+    },
     variants: ["adobo"],
     packaging: ["With pepper", "Without"],
     tags: ["adobo", "condiments & sauces", "western-v0.2"],
@@ -2893,6 +3291,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Barbecue Sauce",
     aliases: ["BBQ sauce", "BBQ sauce", "salsa barbacoa", "molho barbecue"],
+    regionalAliases: {
+      US: "BBQ sauce",
+      CA: "BBQ sauce",
+      MX: "salsa barbacoa",
+      BR: "molho barbecue",
+      CO: "salsa BBQ"
+    },
     variants: ["salsa BBQ"],
     packaging: ["Original", "Honey", "Spicy"],
     tags: ["condiments & sauces", "salsa bbq", "western-v0.2"],
@@ -2925,6 +3330,14 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chutney (Mango)",
     aliases: ["chatni", "mango chutney", "mango chutney", "chatney de mango", "chatney de manga", "chatney de mango"],
+    regionalAliases: {
+      HT: "chatni",
+      US: "mango chutney",
+      CA: "mango chutney",
+      MX: "chatney de mango",
+      BR: "chatney de manga",
+      CO: "chatney de mango"
+    },
     variants: ["Sweet", "Spicy"],
     packaging: ["jar"],
     tags: ["condiments & sauces", "spicy", "sweet", "western-v0.2"],
@@ -2933,6 +3346,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fish Sauce",
     aliases: ["fish sauce", "fish sauce", "salsa de pescado", "molho de peixe"],
+    regionalAliases: {
+      US: "fish sauce",
+      CA: "fish sauce",
+      MX: "salsa de pescado",
+      BR: "molho de peixe",
+      CO: "salsa de pescado"
+    },
     variants: ["salsa de pescado"],
     packaging: ["Standard", "Premium"],
     tags: ["condiments & sauces", "salsa de pescado", "western-v0.2"],
@@ -2955,6 +3375,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Hot Pepper Sauce (Scotch Bonnet)",
     aliases: ["pepper sauce", "pepper sauce", "ají picante", "salsa picante", "sòs piman", "hot sauce", "hot sauce", "salsa picante", "molho picante", "salsa picante"],
+    regionalAliases: {
+      JM: "pepper sauce",
+      TT: "pepper sauce",
+      PR: "ají picante",
+      DO: "salsa picante",
+      HT: "sòs piman",
+      US: "hot sauce",
+      CA: "hot sauce",
+      MX: "salsa picante",
+      BR: "molho picante",
+      CO: "salsa picante"
+    },
     variants: ["Mild", "Hot"],
     packaging: ["bottle"],
     tags: ["condiments & sauces", "hot", "mild", "western-v0.2"],
@@ -2963,6 +3395,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jerk Marinade",
     aliases: ["jerk marinade", "jerk marinade", "marinado jerk", "marinado jerk", "sòs jerk", "jerk marinade", "jerk marinade", "marinado jerk", "marinada jerk", "marinado jerk"],
+    regionalAliases: {
+      JM: "jerk marinade",
+      TT: "jerk marinade",
+      PR: "marinado jerk",
+      DO: "marinado jerk",
+      HT: "sòs jerk",
+      US: "jerk marinade",
+      CA: "jerk marinade",
+      MX: "marinado jerk",
+      BR: "marinada jerk",
+      CO: "marinado jerk"
+    },
     variants: ["Mild", "Hot"],
     packaging: ["bottle", "jar"],
     tags: ["condiments & sauces", "hot", "mild", "western-v0.2"],
@@ -2971,6 +3415,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ketchup",
     aliases: ["catsup", "catsup", "ketchup", "ketchup", "catsup", "ketchup", "ketchup"],
+    regionalAliases: {
+      PR: "catsup",
+      DO: "catsup",
+      US: "ketchup",
+      CA: "ketchup",
+      MX: "catsup",
+      BR: "ketchup",
+      CO: "ketchup"
+    },
     variants: ["Regular", "No-sugar"],
     packaging: ["bottle"],
     tags: ["condiments & sauces", "no-sugar", "regular", "western-v0.2"],
@@ -2979,6 +3432,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mayonnaise",
     aliases: ["mayonnaise", "mayonnaise", "mayonesa", "maionese"],
+    regionalAliases: {
+      US: "mayonnaise",
+      CA: "mayonnaise",
+      MX: "mayonesa",
+      BR: "maionese",
+      CO: "mayonesa"
+    },
     variants: ["mayonesa"],
     packaging: ["Regular", "Light"],
     tags: ["condiments & sauces", "mayonesa", "western-v0.2"],
@@ -2987,6 +3447,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mustard (Dijon)",
     aliases: ["Dijon mustard", "Dijon mustard", "mostaza Dijon", "mostarda Dijon"],
+    regionalAliases: {
+      US: "Dijon mustard",
+      CA: "Dijon mustard",
+      MX: "mostaza Dijon",
+      BR: "mostarda Dijon",
+      CO: "mostaza Dijon"
+    },
     variants: ["mostaza Dijon"],
     packaging: ["Smooth", "Whole grain"],
     tags: ["condiments & sauces", "mostaza dijon", "western-v0.2"],
@@ -2995,6 +3462,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mustard (Yellow)",
     aliases: ["yellow mustard", "yellow mustard", "mostaza amarilla", "mostarda amarela"],
+    regionalAliases: {
+      US: "yellow mustard",
+      CA: "yellow mustard",
+      MX: "mostaza amarilla",
+      BR: "mostarda amarela",
+      CO: "mostaza amarilla"
+    },
     variants: ["mostaza amarilla"],
     packaging: ["Classic", "Spicy"],
     tags: ["condiments & sauces", "mostaza amarilla", "western-v0.2"],
@@ -3003,6 +3477,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Relish (Sweet)",
     aliases: ["sweet relish", "sweet relish", "relish dulce", "relish doce"],
+    regionalAliases: {
+      US: "sweet relish",
+      CA: "sweet relish",
+      MX: "relish dulce",
+      BR: "relish doce",
+      CO: "relish dulce"
+    },
     variants: ["relish dulce"],
     packaging: ["Dill", "Sweet"],
     tags: ["condiments & sauces", "relish dulce", "western-v0.2"],
@@ -3011,6 +3492,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Salsa (Red)",
     aliases: ["salsa roja", "salsa roja", "salsa roja", "molho de salsa"],
+    regionalAliases: {
+      US: "salsa roja",
+      CA: "salsa roja",
+      MX: "salsa roja",
+      BR: "molho de salsa",
+      CO: "salsa roja"
+    },
     variants: ["salsa roja"],
     packaging: ["Mild", "Medium", "Hot"],
     tags: ["condiments & sauces", "salsa roja", "western-v0.2"],
@@ -3019,6 +3507,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Soy Sauce",
     aliases: ["soy sauce", "soy sauce", "salsa de soya", "molho de soja"],
+    regionalAliases: {
+      US: "soy sauce",
+      CA: "soy sauce",
+      MX: "salsa de soya",
+      BR: "molho de soja",
+      CO: "salsa de soya"
+    },
     variants: ["salsa de soya"],
     packaging: ["Light", "Reduced-sodium"],
     tags: ["condiments & sauces", "salsa de soya", "western-v0.2"],
@@ -3027,6 +3522,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Sriracha",
     aliases: ["sriracha", "sriracha", "sriracha", "sriracha"],
+    regionalAliases: {
+      US: "sriracha",
+      CA: "sriracha",
+      MX: "sriracha",
+      BR: "sriracha",
+      CO: "sriracha"
+    },
     variants: ["sriracha"],
     packaging: ["Regular", "Extra hot"],
     tags: ["condiments & sauces", "sriracha", "western-v0.2"],
@@ -3035,6 +3537,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Teriyaki Sauce",
     aliases: ["teriyaki sauce", "teriyaki sauce", "salsa teriyaki", "molho teriyaki"],
+    regionalAliases: {
+      US: "teriyaki sauce",
+      CA: "teriyaki sauce",
+      MX: "salsa teriyaki",
+      BR: "molho teriyaki",
+      CO: "salsa teriyaki"
+    },
     variants: ["salsa teriyaki"],
     packaging: ["Regular", "Low-sodium"],
     tags: ["condiments & sauces", "salsa teriyaki", "western-v0.2"],
@@ -3043,6 +3552,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Worcestershire Sauce",
     aliases: ["worcestershire", "worcestershire", "salsa inglesa", "molho inglês"],
+    regionalAliases: {
+      US: "worcestershire",
+      CA: "worcestershire",
+      MX: "salsa inglesa",
+      BR: "molho inglês",
+      CO: "salsa inglesa"
+    },
     variants: ["salsa inglesa"],
     packaging: ["Classic", "Vegetarian"],
     tags: ["condiments & sauces", "salsa inglesa", "western-v0.2"],
@@ -3051,6 +3567,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Butter (Salted/Unsalted)",
     aliases: ["butter", "butter", "mantequilla", "manteiga"],
+    regionalAliases: {
+      US: "butter",
+      CA: "butter",
+      MX: "mantequilla",
+      BR: "manteiga",
+      CO: "mantequilla"
+    },
     variants: ["mantequilla"],
     packaging: ["Sticks", "Tub"],
     tags: ["dairy & eggs", "mantequilla", "western-v0.2"],
@@ -3059,6 +3582,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Cheddar Cheese",
     aliases: ["cheddar", "cheddar", "queso cheddar", "queijo cheddar"],
+    regionalAliases: {
+      US: "cheddar",
+      CA: "cheddar",
+      MX: "queso cheddar",
+      BR: "queijo cheddar",
+      CO: "queso cheddar"
+    },
     variants: ["queso cheddar"],
     packaging: ["Mild", "Sharp", "Extra sharp"],
     tags: ["dairy & eggs", "queso cheddar", "western-v0.2"],
@@ -3067,6 +3597,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Cottage Cheese",
     aliases: ["cottage cheese", "cottage cheese", "requesón", "queijo cottage"],
+    regionalAliases: {
+      US: "cottage cheese",
+      CA: "cottage cheese",
+      MX: "requesón",
+      BR: "queijo cottage",
+      CO: "queso cottage"
+    },
     variants: ["queso cottage"],
     packaging: ["Small curd", "Large curd"],
     tags: ["dairy & eggs", "queso cottage", "western-v0.2"],
@@ -3075,6 +3612,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Cream Cheese",
     aliases: ["cream cheese", "cream cheese", "queso crema", "cream cheese"],
+    regionalAliases: {
+      US: "cream cheese",
+      CA: "cream cheese",
+      MX: "queso crema",
+      BR: "cream cheese",
+      CO: "queso crema"
+    },
     variants: ["queso crema"],
     packaging: ["Regular", "Whipped", "Light"],
     tags: ["dairy & eggs", "queso crema", "western-v0.2"],
@@ -3083,6 +3627,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Eggs (Large)",
     aliases: ["eggs", "eggs", "huevos", "ovos"],
+    regionalAliases: {
+      US: "eggs",
+      CA: "eggs",
+      MX: "huevos",
+      BR: "ovos",
+      CO: "huevos"
+    },
     variants: ["huevos"],
     packaging: ["White", "Brown", "Cage-free"],
     tags: ["dairy & eggs", "huevos", "western-v0.2"],
@@ -3091,6 +3642,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Feta Cheese",
     aliases: ["feta", "feta", "queso feta", "queijo feta"],
+    regionalAliases: {
+      US: "feta",
+      CA: "feta",
+      MX: "queso feta",
+      BR: "queijo feta",
+      CO: "queso feta"
+    },
     variants: ["queso feta"],
     packaging: ["Block", "Crumble"],
     tags: ["dairy & eggs", "queso feta", "western-v0.2"],
@@ -3099,6 +3657,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Half & Half",
     aliases: ["half & half", "half & half", "media crema", "creme de leite leve"],
+    regionalAliases: {
+      US: "half & half",
+      CA: "half & half",
+      MX: "media crema",
+      BR: "creme de leite leve",
+      CO: "media crema"
+    },
     variants: ["media crema"],
     packaging: ["Regular", "Fat-free"],
     tags: ["dairy & eggs", "media crema", "western-v0.2"],
@@ -3107,6 +3672,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Milk (2%)",
     aliases: ["milk 2%", "milk 2%", "leche 2%", "leite 2%"],
+    regionalAliases: {
+      US: "milk 2%",
+      CA: "milk 2%",
+      MX: "leche 2%",
+      BR: "leite 2%",
+      CO: "leche 2%"
+    },
     variants: ["leche 2%"],
     packaging: ["Whole", "2%", "1%", "Skim"],
     tags: ["dairy & eggs", "leche 2%", "western-v0.2"],
@@ -3115,6 +3687,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Mozzarella",
     aliases: ["mozzarella", "mozzarella", "mozzarella", "muçarela"],
+    regionalAliases: {
+      US: "mozzarella",
+      CA: "mozzarella",
+      MX: "mozzarella",
+      BR: "muçarela",
+      CO: "mozzarella"
+    },
     variants: ["mozzarella"],
     packaging: ["Low-moisture", "Fresh"],
     tags: ["dairy & eggs", "mozzarella", "western-v0.2"],
@@ -3123,6 +3702,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Parmesan (Parmigiano)",
     aliases: ["parmesan", "parmesan", "parmesano", "parmesão"],
+    regionalAliases: {
+      US: "parmesan",
+      CA: "parmesan",
+      MX: "parmesano",
+      BR: "parmesão",
+      CO: "parmesano"
+    },
     variants: ["parmesano"],
     packaging: ["Wedge", "Shredded"],
     tags: ["dairy & eggs", "parmesano", "western-v0.2"],
@@ -3131,6 +3717,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Ricotta",
     aliases: ["ricotta", "ricotta", "ricotta", "ricota"],
+    regionalAliases: {
+      US: "ricotta",
+      CA: "ricotta",
+      MX: "ricotta",
+      BR: "ricota",
+      CO: "ricotta"
+    },
     variants: ["ricotta"],
     packaging: ["Whole", "Part-skim"],
     tags: ["dairy & eggs", "ricotta", "western-v0.2"],
@@ -3139,6 +3732,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Sour Cream",
     aliases: ["sour cream", "sour cream", "crema agria", "creme azedo"],
+    regionalAliases: {
+      US: "sour cream",
+      CA: "sour cream",
+      MX: "crema agria",
+      BR: "creme azedo",
+      CO: "crema agria"
+    },
     variants: ["crema agria"],
     packaging: ["Regular", "Light"],
     tags: ["crema agria", "dairy & eggs", "western-v0.2"],
@@ -3147,6 +3747,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "dairy",
     product: "Yogurt (Plain)",
     aliases: ["yogurt", "yogurt", "yogur", "iogurte"],
+    regionalAliases: {
+      US: "yogurt",
+      CA: "yogurt",
+      MX: "yogur",
+      BR: "iogurte",
+      CO: "yogur"
+    },
     variants: ["yogur"],
     packaging: ["Greek", "Regular", "Skyr"],
     tags: ["dairy & eggs", "western-v0.2", "yogur"],
@@ -3155,6 +3762,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Beef Patties (Jamaican)",
     aliases: ["Jamaican patties", "Jamaican patties", "empanadas jamaicanas ", "pâté jamaïcain ", "beef patties", "beef patties", "empanadas jamaicanas", "empada jamaicana", "empanadas jamaiquinas"],
+    regionalAliases: {
+      JM: "Jamaican patties",
+      TT: "Jamaican patties",
+      PR: "empanadas jamaicanas ",
+      HT: "pâté jamaïcain ",
+      US: "beef patties",
+      CA: "beef patties",
+      MX: "empanadas jamaicanas",
+      BR: "empada jamaicana",
+      CO: "empanadas jamaiquinas"
+    },
     variants: ["Beef", "Chicken", "Veggie"],
     packaging: ["box"],
     tags: ["beef", "chicken", "frozen foods", "veggie", "western-v0.2"],
@@ -3163,6 +3781,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Frozen Berries (Mixed)",
     aliases: ["mixed berries", "mixed berries", "bayas mixtas", "frutas vermelhas"],
+    regionalAliases: {
+      US: "mixed berries",
+      CA: "mixed berries",
+      MX: "bayas mixtas",
+      BR: "frutas vermelhas",
+      CO: "frutas vermelhas"
+    },
     variants: ["frutas vermelhas"],
     packaging: ["Strawberry", "Blueberry", "Raspberry"],
     tags: ["frozen foods", "frutas vermelhas", "western-v0.2"],
@@ -3171,6 +3796,14 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Frozen French Fries",
     aliases: ["chips (≈ UK)", "french fries", "french fries", "papas fritas", "batata frita", "papas fritas"],
+    regionalAliases: {
+      TT: "chips (≈ UK)",
+      US: "french fries",
+      CA: "french fries",
+      MX: "papas fritas",
+      BR: "batata frita",
+      CO: "papas fritas"
+    },
     variants: ["Shoestring", "Crinkle"],
     packaging: ["bag"],
     tags: ["crinkle", "frozen foods", "shoestring", "western-v0.2"],
@@ -3179,6 +3812,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Frozen Mixed Vegetables",
     aliases: ["mixed vegetables", "mixed vegetables", "verduras mixtas", "legumes mistos"],
+    regionalAliases: {
+      US: "mixed vegetables",
+      CA: "mixed vegetables",
+      MX: "verduras mixtas",
+      BR: "legumes mistos",
+      CO: "verduras mixtas"
+    },
     variants: ["verduras mixtas"],
     packaging: ["Peas-Carrots-Corn"],
     tags: ["frozen foods", "verduras mixtas", "western-v0.2"],
@@ -3187,6 +3827,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Frozen Pizza",
     aliases: ["frozen pizza", "frozen pizza", "pizza congelada", "pizza congelada"],
+    regionalAliases: {
+      US: "frozen pizza",
+      CA: "frozen pizza",
+      MX: "pizza congelada",
+      BR: "pizza congelada",
+      CO: "pizza congelada"
+    },
     variants: ["pizza congelada"],
     packaging: ["Pepperoni", "Cheese"],
     tags: ["frozen foods", "pizza congelada", "western-v0.2"],
@@ -3195,6 +3842,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Ice Cream (Vanilla)",
     aliases: ["ice cream", "ice cream", "helado", "sorvete"],
+    regionalAliases: {
+      US: "ice cream",
+      CA: "ice cream",
+      MX: "helado",
+      BR: "sorvete",
+      CO: "helado"
+    },
     variants: ["helado"],
     packaging: ["Regular", "No sugar added"],
     tags: ["frozen foods", "helado", "western-v0.2"],
@@ -3203,6 +3857,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Nuggets (Chicken)",
     aliases: ["chicken nuggets", "chicken nuggets", "nuggets de pollo", "nuggets de frango"],
+    regionalAliases: {
+      US: "chicken nuggets",
+      CA: "chicken nuggets",
+      MX: "nuggets de pollo",
+      BR: "nuggets de frango",
+      CO: "nuggets de pollo"
+    },
     variants: ["nuggets de pollo"],
     packaging: ["Classic", "Spicy"],
     tags: ["frozen foods", "nuggets de pollo", "western-v0.2"],
@@ -3211,6 +3872,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "frozen",
     product: "Waffles (Frozen)",
     aliases: ["frozen waffles", "frozen waffles", "waffles congelados", "waffles congelados"],
+    regionalAliases: {
+      US: "frozen waffles",
+      CA: "frozen waffles",
+      MX: "waffles congelados",
+      BR: "waffles congelados",
+      CO: "waffles congelados"
+    },
     variants: ["waffles congelados"],
     packaging: ["Homestyle", "Buttermilk"],
     tags: ["frozen foods", "waffles congelados", "western-v0.2"],
@@ -3219,6 +3887,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Barley (Pearled)",
     aliases: ["barley", "barley", "cebada", "cebada", "lòj", "barley", "barley", "cebada", "cevada", "cebada"],
+    regionalAliases: {
+      JM: "barley",
+      TT: "barley",
+      PR: "cebada",
+      DO: "cebada",
+      HT: "lòj",
+      US: "barley",
+      CA: "barley",
+      MX: "cebada",
+      BR: "cevada",
+      CO: "cebada"
+    },
     variants: ["Pearled", "Hulled"],
     packaging: ["bag"],
     tags: ["grains", "hulled", "pearled", "western-v0.2"],
@@ -3227,6 +3907,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Basmati Rice",
     aliases: ["basmati rice", "basmati rice", "arroz basmati", "arroz basmati"],
+    regionalAliases: {
+      US: "basmati rice",
+      CA: "basmati rice",
+      MX: "arroz basmati",
+      BR: "arroz basmati",
+      CO: "arroz basmati"
+    },
     variants: ["arroz basmati"],
     packaging: ["White", "Brown"],
     tags: ["arroz basmati", "grains", "western-v0.2"],
@@ -3235,6 +3922,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Brown Rice",
     aliases: ["brown rice", "brown rice", "arroz integral", "arroz integral"],
+    regionalAliases: {
+      US: "brown rice",
+      CA: "brown rice",
+      MX: "arroz integral",
+      BR: "arroz integral",
+      CO: "arroz integral"
+    },
     variants: ["arroz integral"],
     packaging: ["Long", "Short grain"],
     tags: ["arroz integral", "grains", "western-v0.2"],
@@ -3243,6 +3937,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bulgur Wheat",
     aliases: ["bulgur", "bulgur", "bulgur", "triguilho"],
+    regionalAliases: {
+      US: "bulgur",
+      CA: "bulgur",
+      MX: "bulgur",
+      BR: "triguilho",
+      CO: "bulgur"
+    },
     variants: ["bulgur"],
     packaging: ["Fine", "Coarse"],
     tags: ["bulgur", "grains", "western-v0.2"],
@@ -3251,6 +3952,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Couscous",
     aliases: ["couscous", "couscous", "cuscús", "cuscuz"],
+    regionalAliases: {
+      US: "couscous",
+      CA: "couscous",
+      MX: "cuscús",
+      BR: "cuscuz",
+      CO: "cuscús"
+    },
     variants: ["cuscús"],
     packaging: ["Regular", "Whole wheat"],
     tags: ["cuscús", "grains", "western-v0.2"],
@@ -3259,6 +3967,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jasmine Rice",
     aliases: ["jasmine rice", "jasmine rice", "arroz jazmín", "arroz jasmim"],
+    regionalAliases: {
+      US: "jasmine rice",
+      CA: "jasmine rice",
+      MX: "arroz jazmín",
+      BR: "arroz jasmim",
+      CO: "arroz jazmín"
+    },
     variants: ["arroz jazmín"],
     packaging: ["White", "Brown"],
     tags: ["arroz jazmín", "grains", "western-v0.2"],
@@ -3267,6 +3982,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Lentils (Green/Brown)",
     aliases: ["dhal (≈ split peas)", "lentejas", "lentejas", "lantil", "lentils", "lentils", "lentejas", "lentilha", "lenteja"],
+    regionalAliases: {
+      TT: "dhal (≈ split peas)",
+      PR: "lentejas",
+      DO: "lentejas",
+      HT: "lantil",
+      US: "lentils",
+      CA: "lentils",
+      MX: "lentejas",
+      BR: "lentilha",
+      CO: "lenteja"
+    },
     variants: ["Whole", "Split"],
     packaging: ["bag"],
     tags: ["grains", "split", "western-v0.2", "whole"],
@@ -3275,6 +4001,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Macaroni (Elbow)",
     aliases: ["macaroni", "macaroni", "macarrones", "macarrão"],
+    regionalAliases: {
+      US: "macaroni",
+      CA: "macaroni",
+      MX: "macarrones",
+      BR: "macarrão",
+      CO: "macarrones"
+    },
     variants: ["macarrones"],
     packaging: ["Regular", "Whole wheat"],
     tags: ["grains", "macarrones", "western-v0.2"],
@@ -3283,6 +4016,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Oats (Steel-Cut)",
     aliases: ["steel-cut oats", "steel-cut oats", "avena irlandesa", "avena irlandesa", "avena", "steel-cut oats", "steel-cut oats", "avena irlandesa", "aveia cortada", "avena cortada"],
+    regionalAliases: {
+      JM: "steel-cut oats",
+      TT: "steel-cut oats",
+      PR: "avena irlandesa",
+      DO: "avena irlandesa",
+      HT: "avena",
+      US: "steel-cut oats",
+      CA: "steel-cut oats",
+      MX: "avena irlandesa",
+      BR: "aveia cortada",
+      CO: "avena cortada"
+    },
     variants: ["Steel-cut", "Quick"],
     packaging: ["bag", "tin"],
     tags: ["grains", "quick", "steel-cut", "western-v0.2"],
@@ -3291,6 +4036,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pasta (Penne)",
     aliases: ["penne", "penne", "penne", "penne"],
+    regionalAliases: {
+      US: "penne",
+      CA: "penne",
+      MX: "penne",
+      BR: "penne",
+      CO: "penne"
+    },
     variants: ["penne"],
     packaging: ["Regular", "Gluten-free"],
     tags: ["grains", "penne", "western-v0.2"],
@@ -3299,6 +4051,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pasta (Spaghetti)",
     aliases: ["spaghetti", "spaghetti", "espagueti", "espaguete"],
+    regionalAliases: {
+      US: "spaghetti",
+      CA: "spaghetti",
+      MX: "espagueti",
+      BR: "espaguete",
+      CO: "espagueti"
+    },
     variants: ["espagueti"],
     packaging: ["Regular", "Whole wheat"],
     tags: ["espagueti", "grains", "western-v0.2"],
@@ -3307,6 +4066,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Polenta (Corn Grits)",
     aliases: ["turn cornmeal", "coo coo ", "polenta", "funche ", "mayi moulen ", "polenta", "polenta", "polenta", "polenta", "polenta"],
+    regionalAliases: {
+      JM: "turn cornmeal",
+      TT: "coo coo ",
+      PR: "polenta",
+      DO: "funche ",
+      HT: "mayi moulen ",
+      US: "polenta",
+      CA: "polenta",
+      MX: "polenta",
+      BR: "polenta",
+      CO: "polenta"
+    },
     variants: ["Instant", "Coarse"],
     packaging: ["bag"],
     tags: ["coarse", "grains", "instant", "western-v0.2"],
@@ -3315,6 +4086,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Quinoa",
     aliases: ["quinoa", "quinoa", "quinua", "quinoa"],
+    regionalAliases: {
+      US: "quinoa",
+      CA: "quinoa",
+      MX: "quinua",
+      BR: "quinoa",
+      CO: "quinua"
+    },
     variants: ["quinua"],
     packaging: ["White", "Red", "Black"],
     tags: ["grains", "quinua", "western-v0.2"],
@@ -3323,6 +4101,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Rice (Parboiled)",
     aliases: ["parboiled rice", "parboiled", "arroz parboil", "arroz parbolizado", "diri tranpe ", "converted rice", "converted rice", "arroz parbolizado", "arroz parboilizado", "arroz parbolizado"],
+    regionalAliases: {
+      JM: "parboiled rice",
+      TT: "parboiled",
+      PR: "arroz parboil",
+      DO: "arroz parbolizado",
+      HT: "diri tranpe ",
+      US: "converted rice",
+      CA: "converted rice",
+      MX: "arroz parbolizado",
+      BR: "arroz parboilizado",
+      CO: "arroz parbolizado"
+    },
     variants: ["Long", "Medium"],
     packaging: ["bag"],
     tags: ["grains", "long", "medium", "western-v0.2"],
@@ -3331,6 +4121,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Rice Noodles (Flat)",
     aliases: ["rice noodles", "rice noodles", "fideos de arroz", "macarrão de arroz"],
+    regionalAliases: {
+      US: "rice noodles",
+      CA: "rice noodles",
+      MX: "fideos de arroz",
+      BR: "macarrão de arroz",
+      CO: "fideos de arroz"
+    },
     variants: ["fideos de arroz"],
     packaging: ["Pad-Thai", "Thin"],
     tags: ["fideos de arroz", "grains", "western-v0.2"],
@@ -3339,6 +4136,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tortilla Chips",
     aliases: ["tortilla chips", "tortilla chips", "totopos", "totopos"],
+    regionalAliases: {
+      US: "tortilla chips",
+      CA: "tortilla chips",
+      MX: "totopos",
+      BR: "totopos",
+      CO: "totopos"
+    },
     variants: ["totopos"],
     packaging: ["Salted", "Lime"],
     tags: ["grains", "totopos", "western-v0.2"],
@@ -3347,6 +4151,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Achiote/Annatto Paste",
     aliases: ["annatto", "roucou", "achiote", "bija", "roukou", "annatto", "annatto", "achiote", "urucum", "color"],
+    regionalAliases: {
+      JM: "annatto",
+      TT: "roucou",
+      PR: "achiote",
+      DO: "bija",
+      HT: "roukou",
+      US: "annatto",
+      CA: "annatto",
+      MX: "achiote",
+      BR: "urucum",
+      CO: "color"
+    },
     variants: ["Seeds", "Paste"],
     packaging: ["brick", "jar"],
     tags: ["international & latin", "paste", "seeds", "western-v0.2"],
@@ -3355,6 +4171,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Arepa Flour (Masarepa)",
     aliases: ["arepa flour", "masarepa", "masarepa", "arepa flour", "arepa flour", "masarepa", "farinha de milho pré-cozida", "masarepa"],
+    regionalAliases: {
+      JM: "arepa flour",
+      PR: "masarepa",
+      DO: "masarepa",
+      US: "arepa flour",
+      CA: "arepa flour",
+      MX: "masarepa",
+      BR: "farinha de milho pré-cozida",
+      CO: "masarepa"
+    },
     variants: ["White", "Yellow"],
     packaging: ["bag"],
     tags: ["international & latin", "western-v0.2", "white", "yellow"],
@@ -3363,6 +4189,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Culantro (Chadon Beni)",
     aliases: ["culantro", "chadon beni", "recao", "cilantro coyote ", "culantro", "culantro", "culantro", "coentro largo", "cilantro cimarrón"],
+    regionalAliases: {
+      JM: "culantro",
+      TT: "chadon beni",
+      PR: "recao",
+      DO: "cilantro coyote ",
+      US: "culantro",
+      CA: "culantro",
+      MX: "culantro",
+      BR: "coentro largo",
+      CO: "cilantro cimarrón"
+    },
     variants: ["Fresh"],
     packaging: ["bunch"],
     tags: ["fresh", "international & latin", "western-v0.2"],
@@ -3371,6 +4208,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Dulce de Leche",
     aliases: ["dulce de leche", "dulce de leche", "dulce de leche", "doce de leite", "arequipe"],
+    regionalAliases: {
+      US: "dulce de leche",
+      CA: "dulce de leche",
+      MX: "dulce de leche",
+      BR: "doce de leite",
+      CO: "arequipe"
+    },
     variants: ["Spread", "Thick"],
     packaging: ["jar"],
     tags: ["international & latin", "spread", "thick", "western-v0.2"],
@@ -3379,6 +4223,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Goya Adobo",
     aliases: ["adobo", "adobo", "adobo", "adobo"],
+    regionalAliases: {
+      US: "adobo",
+      CA: "adobo",
+      MX: "adobo",
+      BR: "adobo",
+      CO: "adobo"
+    },
     variants: ["adobo"],
     packaging: ["With pepper", "Without"],
     tags: ["adobo", "international & latin", "western-v0.2"],
@@ -3387,6 +4238,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Masa Harina",
     aliases: ["masa harina", "masa harina", "harina de maíz nixtamalizada", "farinha de milho nixtamalizada"],
+    regionalAliases: {
+      US: "masa harina",
+      CA: "masa harina",
+      MX: "harina de maíz nixtamalizada",
+      BR: "farinha de milho nixtamalizada",
+      CO: "harina de maíz"
+    },
     variants: ["harina de maíz"],
     packaging: ["White", "Yellow"],
     tags: ["harina de maíz", "international & latin", "western-v0.2"],
@@ -3395,6 +4253,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mole Sauce (Jarred)",
     aliases: ["mole", "mole", "mole", "molé (pt)"],
+    regionalAliases: {
+      US: "mole",
+      CA: "mole",
+      MX: "mole",
+      BR: "molé (pt)",
+      CO: "mole"
+    },
     variants: ["mole"],
     packaging: ["Poblano", "Negro"],
     tags: ["international & latin", "mole", "western-v0.2"],
@@ -3403,6 +4268,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Sazón (Seasoning)",
     aliases: ["sazón", "sazón", "sazón", "sazón"],
+    regionalAliases: {
+      US: "sazón",
+      CA: "sazón",
+      MX: "sazón",
+      BR: "sazón",
+      CO: "sazón"
+    },
     variants: ["sazón"],
     packaging: ["With", "Without annatto"],
     tags: ["international & latin", "sazón", "western-v0.2"],
@@ -3411,6 +4283,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tajín (Chili-Lime)",
     aliases: ["tajin", "tajin", "tajín", "tajín"],
+    regionalAliases: {
+      US: "tajin",
+      CA: "tajin",
+      MX: "tajín",
+      BR: "tajín",
+      CO: "tajín"
+    },
     variants: ["tajín"],
     packaging: ["Classic", "Low sodium"],
     tags: ["international & latin", "tajín", "western-v0.2"],
@@ -3419,6 +4298,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Yuca Flour (Cassava)",
     aliases: ["cassava flour", "harina de yuca", "harina de yuca", "cassava flour", "cassava flour", "harina de yuca", "farinha de mandioca", "harina de yuca"],
+    regionalAliases: {
+      JM: "cassava flour",
+      PR: "harina de yuca",
+      DO: "harina de yuca",
+      US: "cassava flour",
+      CA: "cassava flour",
+      MX: "harina de yuca",
+      BR: "farinha de mandioca",
+      CO: "harina de yuca"
+    },
     variants: ["Fine", "Coarse"],
     packaging: ["bag"],
     tags: ["coarse", "fine", "international & latin", "western-v0.2"],
@@ -3427,6 +4316,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Bacon (Pork)",
     aliases: ["bacon", "bacon", "tocino", "bacon"],
+    regionalAliases: {
+      US: "bacon",
+      CA: "bacon",
+      MX: "tocino",
+      BR: "bacon",
+      CO: "tocino"
+    },
     variants: ["tocino"],
     packaging: ["Regular", "Thick cut"],
     tags: ["meat & poultry", "tocino", "western-v0.2"],
@@ -3435,6 +4331,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Beef (Ground 80/20)",
     aliases: ["minced beef", "minced beef", "carne molida", "res molida", "vyann bèf moulen", "ground beef", "ground beef", "carne molida", "carne moída", "carne molida"],
+    regionalAliases: {
+      JM: "minced beef",
+      TT: "minced beef",
+      PR: "carne molida",
+      DO: "res molida",
+      HT: "vyann bèf moulen",
+      US: "ground beef",
+      CA: "ground beef",
+      MX: "carne molida",
+      BR: "carne moída",
+      CO: "carne molida"
+    },
     variants: ["80/20", "90/10"],
     packaging: ["tray"],
     tags: ["80/20", "90/10", "meat & poultry", "western-v0.2"],
@@ -3443,6 +4351,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Beef Brisket",
     aliases: ["brisket", "brisket", "pecho", "res peito"],
+    regionalAliases: {
+      US: "brisket",
+      CA: "brisket",
+      MX: "pecho",
+      BR: "res peito",
+      CO: "pecho"
+    },
     variants: ["pecho"],
     packaging: ["Flat", "Point"],
     tags: ["meat & poultry", "pecho", "western-v0.2"],
@@ -3451,6 +4366,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Beef Oxtail",
     aliases: ["oxtail", "oxtail", "rabo de res", "rabo de res", "ke bèf", "oxtail", "oxtail", "rabo de res", "rabo bovino", "rabo de res"],
+    regionalAliases: {
+      JM: "oxtail",
+      TT: "oxtail",
+      PR: "rabo de res",
+      DO: "rabo de res",
+      HT: "ke bèf",
+      US: "oxtail",
+      CA: "oxtail",
+      MX: "rabo de res",
+      BR: "rabo bovino",
+      CO: "rabo de res"
+    },
     variants: ["Fresh", "Frozen"],
     packaging: ["tray"],
     tags: ["fresh", "frozen", "meat & poultry", "western-v0.2"],
@@ -3459,6 +4386,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Chicken (Breast)",
     aliases: ["Chicken breast", "Chicken breast", "pechuga", "pechuga", "blan poul", "boneless skinless chicken breast", "boneless chicken breast", "pechuga", "peito de frango", "pechuga"],
+    regionalAliases: {
+      JM: "Chicken breast",
+      TT: "Chicken breast",
+      PR: "pechuga",
+      DO: "pechuga",
+      HT: "blan poul",
+      US: "boneless skinless chicken breast",
+      CA: "boneless chicken breast",
+      MX: "pechuga",
+      BR: "peito de frango",
+      CO: "pechuga"
+    },
     variants: ["Boneless", "Bone-in"],
     packaging: ["tray"],
     tags: ["bone-in", "boneless", "meat & poultry", "western-v0.2"],
@@ -3467,6 +4406,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Chicken (Drumsticks)",
     aliases: ["drumsticks", "drumsticks", "muslos", "muslos", "janm poul", "drumsticks", "drumsticks", "muslos", "coxa", "muslos"],
+    regionalAliases: {
+      JM: "drumsticks",
+      TT: "drumsticks",
+      PR: "muslos",
+      DO: "muslos",
+      HT: "janm poul",
+      US: "drumsticks",
+      CA: "drumsticks",
+      MX: "muslos",
+      BR: "coxa",
+      CO: "muslos"
+    },
     variants: ["Fresh", "Frozen"],
     packaging: ["tray"],
     tags: ["fresh", "frozen", "meat & poultry", "western-v0.2"],
@@ -3475,6 +4426,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Chicken (Thighs)",
     aliases: ["thighs", "thighs", "muslos", "muslos", "kwis poul", "thighs", "thighs", "muslos", "coxa", "muslos"],
+    regionalAliases: {
+      JM: "thighs",
+      TT: "thighs",
+      PR: "muslos",
+      DO: "muslos",
+      HT: "kwis poul",
+      US: "thighs",
+      CA: "thighs",
+      MX: "muslos",
+      BR: "coxa",
+      CO: "muslos"
+    },
     variants: ["Boneless", "Bone-in"],
     packaging: ["tray"],
     tags: ["bone-in", "boneless", "meat & poultry", "western-v0.2"],
@@ -3483,6 +4446,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Goat (Curry Cuts)",
     aliases: ["mutton (goat)", "mutton (goat)", "chivo", "cabra", "kabrit", "mutton/goat", "goat", "carne de chivo", "cabrito", "carne de chivo"],
+    regionalAliases: {
+      JM: "mutton (goat)",
+      TT: "mutton (goat)",
+      PR: "chivo",
+      DO: "cabra",
+      HT: "kabrit",
+      US: "mutton/goat",
+      CA: "goat",
+      MX: "carne de chivo",
+      BR: "cabrito",
+      CO: "carne de chivo"
+    },
     variants: ["Bone-in", "Boneless"],
     packaging: ["tray"],
     tags: ["bone-in", "boneless", "meat & poultry", "western-v0.2"],
@@ -3491,6 +4466,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Ham (Sliced Deli)",
     aliases: ["ham", "ham", "jamón", "presunto"],
+    regionalAliases: {
+      US: "ham",
+      CA: "ham",
+      MX: "jamón",
+      BR: "presunto",
+      CO: "jamón"
+    },
     variants: ["jamón"],
     packaging: ["Smoked", "Honey"],
     tags: ["jamón", "meat & poultry", "western-v0.2"],
@@ -3499,6 +4481,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Pork Chops",
     aliases: ["pork chops", "pork chops", "chuletas de cerdo", "bisteca suína"],
+    regionalAliases: {
+      US: "pork chops",
+      CA: "pork chops",
+      MX: "chuletas de cerdo",
+      BR: "bisteca suína",
+      CO: "chuletas"
+    },
     variants: ["chuletas"],
     packaging: ["Bone-in", "Boneless"],
     tags: ["chuletas", "meat & poultry", "western-v0.2"],
@@ -3507,6 +4496,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Pork Shoulder (Boston Butt)",
     aliases: ["pork shoulder", "pork shoulder", "espaldilla", "pernil"],
+    regionalAliases: {
+      US: "pork shoulder",
+      CA: "pork shoulder",
+      MX: "espaldilla",
+      BR: "pernil",
+      CO: "pernil"
+    },
     variants: ["pernil"],
     packaging: ["Bone-in", "Boneless"],
     tags: ["meat & poultry", "pernil", "western-v0.2"],
@@ -3515,6 +4511,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Sausage (Italian)",
     aliases: ["Italian sausage", "Italian sausage", "salchicha italiana", "linguiça italiana"],
+    regionalAliases: {
+      US: "Italian sausage",
+      CA: "Italian sausage",
+      MX: "salchicha italiana",
+      BR: "linguiça italiana",
+      CO: "salchicha italiana"
+    },
     variants: ["salchicha italiana"],
     packaging: ["Sweet", "Hot"],
     tags: ["meat & poultry", "salchicha italiana", "western-v0.2"],
@@ -3523,6 +4526,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Turkey (Ground)",
     aliases: ["ground turkey", "ground turkey", "pavo molido", "peru moído"],
+    regionalAliases: {
+      US: "ground turkey",
+      CA: "ground turkey",
+      MX: "pavo molido",
+      BR: "peru moído",
+      CO: "pavo molido"
+    },
     variants: ["pavo molido"],
     packaging: ["93%", "99% lean"],
     tags: ["meat & poultry", "pavo molido", "western-v0.2"],
@@ -3531,6 +4541,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Turkey Breast (Deli)",
     aliases: ["turkey breast", "turkey breast", "pechuga de pavo", "peito de peru"],
+    regionalAliases: {
+      US: "turkey breast",
+      CA: "turkey breast",
+      MX: "pechuga de pavo",
+      BR: "peito de peru",
+      CO: "pechuga de pavo"
+    },
     variants: ["pechuga de pavo"],
     packaging: ["Oven roasted", "Smoked"],
     tags: ["meat & poultry", "pechuga de pavo", "western-v0.2"],
@@ -3539,6 +4556,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Almonds",
     aliases: ["almonds", "almonds", "almendras", "amêndoas"],
+    regionalAliases: {
+      US: "almonds",
+      CA: "almonds",
+      MX: "almendras",
+      BR: "amêndoas",
+      CO: "almendras"
+    },
     variants: ["almendras"],
     packaging: ["Raw", "Roasted"],
     tags: ["almendras", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3547,6 +4571,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Brazil Nuts",
     aliases: ["Brazil nuts", "Brazil nuts", "nueces de Brasil", "castanha-do-pará"],
+    regionalAliases: {
+      US: "Brazil nuts",
+      CA: "Brazil nuts",
+      MX: "nueces de Brasil",
+      BR: "castanha-do-pará",
+      CO: "nuez de Brasil"
+    },
     variants: ["nuez de Brasil"],
     packaging: ["Raw", "Roasted"],
     tags: ["nuez de brasil", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3555,6 +4586,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cashews",
     aliases: ["cashews", "cashews", "anacardos", "caju"],
+    regionalAliases: {
+      US: "cashews",
+      CA: "cashews",
+      MX: "anacardos",
+      BR: "caju",
+      CO: "anacardo"
+    },
     variants: ["anacardo"],
     packaging: ["Raw", "Roasted"],
     tags: ["anacardo", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3563,6 +4601,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chia Seeds",
     aliases: ["chia seeds", "chia seeds", "semillas de chía", "semente de chia"],
+    regionalAliases: {
+      US: "chia seeds",
+      CA: "chia seeds",
+      MX: "semillas de chía",
+      BR: "semente de chia",
+      CO: "semillas de chía"
+    },
     variants: ["semillas de chía"],
     packaging: ["Black", "White"],
     tags: ["nuts/seeds/dried fruit", "semillas de chía", "western-v0.2"],
@@ -3571,6 +4616,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cranberries (Dried)",
     aliases: ["dried cranberries", "dried cranberries", "arándanos secos", "cranberry seco"],
+    regionalAliases: {
+      US: "dried cranberries",
+      CA: "dried cranberries",
+      MX: "arándanos secos",
+      BR: "cranberry seco",
+      CO: "arándano seco"
+    },
     variants: ["arándano seco"],
     packaging: ["Sweetened", "Unsweetened"],
     tags: ["arándano seco", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3579,6 +4631,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Dates (Medjool)",
     aliases: ["dates", "dates", "dátiles", "tâmaras"],
+    regionalAliases: {
+      US: "dates",
+      CA: "dates",
+      MX: "dátiles",
+      BR: "tâmaras",
+      CO: "dátil"
+    },
     variants: ["dátil"],
     packaging: ["Pitted", "Whole"],
     tags: ["dátil", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3587,6 +4646,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Flaxseed (Linseed)",
     aliases: ["flaxseed", "flaxseed", "linaza", "linhaça"],
+    regionalAliases: {
+      US: "flaxseed",
+      CA: "flaxseed",
+      MX: "linaza",
+      BR: "linhaça",
+      CO: "linaza"
+    },
     variants: ["linaza"],
     packaging: ["Whole", "Ground"],
     tags: ["linaza", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3595,6 +4661,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Peanuts",
     aliases: ["peanuts", "peanuts", "maní", "maní", "pistach (no)", "peanuts", "peanuts", "cacahuates", "amendoim", "maní"],
+    regionalAliases: {
+      JM: "peanuts",
+      TT: "peanuts",
+      PR: "maní",
+      DO: "maní",
+      HT: "pistach (no)",
+      US: "peanuts",
+      CA: "peanuts",
+      MX: "cacahuates",
+      BR: "amendoim",
+      CO: "maní"
+    },
     variants: ["Salted", "Unsalted"],
     packaging: ["jar", "bag"],
     tags: ["nuts/seeds/dried fruit", "salted", "unsalted", "western-v0.2"],
@@ -3603,6 +4681,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pistachios",
     aliases: ["pistachios", "pistachios", "pistaches", "pistache"],
+    regionalAliases: {
+      US: "pistachios",
+      CA: "pistachios",
+      MX: "pistaches",
+      BR: "pistache",
+      CO: "pistacho"
+    },
     variants: ["pistacho"],
     packaging: ["In-shell", "Shelled"],
     tags: ["nuts/seeds/dried fruit", "pistacho", "western-v0.2"],
@@ -3611,6 +4696,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Raisins",
     aliases: ["raisins", "raisins", "pasas", "passas"],
+    regionalAliases: {
+      US: "raisins",
+      CA: "raisins",
+      MX: "pasas",
+      BR: "passas",
+      CO: "pasas"
+    },
     variants: ["pasas"],
     packaging: ["Thompson", "Golden"],
     tags: ["nuts/seeds/dried fruit", "pasas", "western-v0.2"],
@@ -3619,6 +4711,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Sunflower Seeds",
     aliases: ["sunflower seeds", "sunflower seeds", "semillas de girasol", "sementes de girassol"],
+    regionalAliases: {
+      US: "sunflower seeds",
+      CA: "sunflower seeds",
+      MX: "semillas de girasol",
+      BR: "sementes de girassol",
+      CO: "semillas de girasol"
+    },
     variants: ["semillas de girasol"],
     packaging: ["In-shell", "Kernels"],
     tags: ["nuts/seeds/dried fruit", "semillas de girasol", "western-v0.2"],
@@ -3627,6 +4726,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Walnuts",
     aliases: ["walnuts", "walnuts", "nueces", "nogue"],
+    regionalAliases: {
+      US: "walnuts",
+      CA: "walnuts",
+      MX: "nueces",
+      BR: "nogue",
+      CO: "nuez"
+    },
     variants: ["nuez"],
     packaging: ["Halves", "pieces"],
     tags: ["nuez", "nuts/seeds/dried fruit", "western-v0.2"],
@@ -3635,6 +4741,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Apple Cider Vinegar",
     aliases: ["ACV", "ACV", "vinagre de sidra", "vinagre de sidra", "vineg sid", "apple cider vinegar", "vinagre de manzana", "vinagre de maçã", "vinagre de maçã"],
+    regionalAliases: {
+      JM: "ACV",
+      TT: "ACV",
+      PR: "vinagre de sidra",
+      DO: "vinagre de sidra",
+      HT: "vineg sid",
+      CA: "apple cider vinegar",
+      MX: "vinagre de manzana",
+      BR: "vinagre de maçã",
+      CO: "vinagre de maçã"
+    },
     variants: ["With mother", "Filtered"],
     packaging: ["bottle"],
     tags: ["filtered", "oils & vinegars", "western-v0.2", "with mother"],
@@ -3643,6 +4760,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Avocado Oil",
     aliases: ["avocado oil", "avocado oil", "aceite de aguacate", "óleo de abacate"],
+    regionalAliases: {
+      US: "avocado oil",
+      CA: "avocado oil",
+      MX: "aceite de aguacate",
+      BR: "óleo de abacate",
+      CO: "aceite de aguacate"
+    },
     variants: ["aceite de aguacate"],
     packaging: ["Refined", "Unrefined"],
     tags: ["aceite de aguacate", "oils & vinegars", "western-v0.2"],
@@ -3651,6 +4775,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Canola Oil",
     aliases: ["canola oil", "canola oil", "aceite de canola", "óleo de canola"],
+    regionalAliases: {
+      US: "canola oil",
+      CA: "canola oil",
+      MX: "aceite de canola",
+      BR: "óleo de canola",
+      CO: "aceite de canola"
+    },
     variants: ["aceite de canola"],
     packaging: ["Standard", "High-oleic"],
     tags: ["aceite de canola", "oils & vinegars", "western-v0.2"],
@@ -3659,6 +4790,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Coconut Oil",
     aliases: ["coconut oil", "coconut oil", "aceite de coco", "óleo de coco"],
+    regionalAliases: {
+      US: "coconut oil",
+      CA: "coconut oil",
+      MX: "aceite de coco",
+      BR: "óleo de coco",
+      CO: "aceite de coco"
+    },
     variants: ["aceite de coco"],
     packaging: ["Virgin", "Refined"],
     tags: ["aceite de coco", "oils & vinegars", "western-v0.2"],
@@ -3667,6 +4805,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Extra Virgin Olive Oil",
     aliases: ["EVOO", "EVOO", "aceite de oliva virgen", "aceite oliva virgen", "huile d’olive", "olive oil", "olive oil", "aceite de oliva", "azeite de oliva", "aceite de oliva"],
+    regionalAliases: {
+      JM: "EVOO",
+      TT: "EVOO",
+      PR: "aceite de oliva virgen",
+      DO: "aceite oliva virgen",
+      HT: "huile d’olive",
+      US: "olive oil",
+      CA: "olive oil",
+      MX: "aceite de oliva",
+      BR: "azeite de oliva",
+      CO: "aceite de oliva"
+    },
     variants: ["Cold-pressed", "Unfiltered"],
     packaging: ["bottle", "tin"],
     tags: ["cold-pressed", "oils & vinegars", "unfiltered", "western-v0.2"],
@@ -3675,6 +4825,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Rice Vinegar",
     aliases: ["rice vinegar", "rice vinegar", "vinagre de arroz", "vinagre de arroz"],
+    regionalAliases: {
+      US: "rice vinegar",
+      CA: "rice vinegar",
+      MX: "vinagre de arroz",
+      BR: "vinagre de arroz",
+      CO: "vinagre de arroz"
+    },
     variants: ["vinagre de arroz"],
     packaging: ["Seasoned", "Unseasoned"],
     tags: ["oils & vinegars", "vinagre de arroz", "western-v0.2"],
@@ -3683,6 +4840,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Vegetable Oil (Blend)",
     aliases: ["vegetable oil", "vegetable oil", "aceite vegetal", "óleo vegetal"],
+    regionalAliases: {
+      US: "vegetable oil",
+      CA: "vegetable oil",
+      MX: "aceite vegetal",
+      BR: "óleo vegetal",
+      CO: "aceite vegetal"
+    },
     variants: ["aceite vegetal"],
     packaging: ["Standard", "Canola blend"],
     tags: ["aceite vegetal", "oils & vinegars", "western-v0.2"],
@@ -3691,6 +4855,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "White Distilled Vinegar",
     aliases: ["white vinegar", "white vinegar", "vinagre blanco", "vinagre branco"],
+    regionalAliases: {
+      US: "white vinegar",
+      CA: "white vinegar",
+      MX: "vinagre blanco",
+      BR: "vinagre branco",
+      CO: "vinagre blanco"
+    },
     variants: ["vinagre blanco"],
     packaging: ["5%", "Cleaning"],
     tags: ["oils & vinegars", "vinagre blanco", "western-v0.2"],
@@ -3699,6 +4870,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Fuji)",
     aliases: ["Fuji apple", "Fuji apple", "manzana Fuji", "maçã Fuji"],
+    regionalAliases: {
+      US: "Fuji apple",
+      CA: "Fuji apple",
+      MX: "manzana Fuji",
+      BR: "maçã Fuji",
+      CO: "manzana Fuji"
+    },
     variants: ["manzana Fuji"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana fuji", "produce", "produce>fruits", "western-v0.2"],
@@ -3707,6 +4885,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Granny Smith)",
     aliases: ["Granny Smith apple", "Granny Smith apple", "manzana verde", "maçã verde"],
+    regionalAliases: {
+      US: "Granny Smith apple",
+      CA: "Granny Smith apple",
+      MX: "manzana verde",
+      BR: "maçã verde",
+      CO: "manzana verde"
+    },
     variants: ["manzana verde"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana verde", "produce", "produce>fruits", "western-v0.2"],
@@ -3715,6 +4900,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apricot",
     aliases: ["apricot", "apricot", "albaricoque", "damasco"],
+    regionalAliases: {
+      US: "apricot",
+      CA: "apricot",
+      MX: "albaricoque",
+      BR: "damasco",
+      CO: "albaricoque"
+    },
     variants: ["albaricoque"],
     packaging: ["Fresh", "Dried"],
     tags: ["albaricoque", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3723,6 +4915,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Banana (Ripe)",
     aliases: ["banana", "banana", "plátano (maduro)", "banana"],
+    regionalAliases: {
+      US: "banana",
+      CA: "banana",
+      MX: "plátano (maduro)",
+      BR: "banana",
+      CO: "banano (maduro)"
+    },
     variants: ["banano (maduro)"],
     packaging: ["Cavendish", "Apple banana"],
     tags: ["banano (maduro)", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3731,6 +4930,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Blackberries",
     aliases: ["blackberries", "blackberries", "zarzamoras", "amoras"],
+    regionalAliases: {
+      US: "blackberries",
+      CA: "blackberries",
+      MX: "zarzamoras",
+      BR: "amoras",
+      CO: "zarzamoras"
+    },
     variants: ["zarzamoras"],
     packaging: ["Fresh"],
     tags: ["fruits", "produce", "produce>fruits", "western-v0.2", "zarzamoras"],
@@ -3739,6 +4945,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Blueberries",
     aliases: ["blueberries", "blueberries", "arándanos", "mirtillos"],
+    regionalAliases: {
+      US: "blueberries",
+      CA: "blueberries",
+      MX: "arándanos",
+      BR: "mirtillos",
+      CO: "arándanos"
+    },
     variants: ["arándanos"],
     packaging: ["Fresh"],
     tags: ["arándanos", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3747,6 +4960,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cantaloupe",
     aliases: ["cantaloupe", "cantaloupe", "melón", "melão"],
+    regionalAliases: {
+      US: "cantaloupe",
+      CA: "cantaloupe",
+      MX: "melón",
+      BR: "melão",
+      CO: "melón"
+    },
     variants: ["melón"],
     packaging: ["Whole", "Cut"],
     tags: ["fruits", "melón", "produce", "produce>fruits", "western-v0.2"],
@@ -3755,6 +4975,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cherry (Sweet)",
     aliases: ["cherries", "cherries", "cerezas", "cerejas"],
+    regionalAliases: {
+      US: "cherries",
+      CA: "cherries",
+      MX: "cerezas",
+      BR: "cerejas",
+      CO: "cerezas"
+    },
     variants: ["cerezas"],
     packaging: ["Bing", "Rainier"],
     tags: ["cerezas", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3763,6 +4990,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Coconut (Brown/Dry)",
     aliases: ["coconut", "coconut", "coco", "coco"],
+    regionalAliases: {
+      US: "coconut",
+      CA: "coconut",
+      MX: "coco",
+      BR: "coco",
+      CO: "coco"
+    },
     variants: ["coco"],
     packaging: ["Dry", "Green"],
     tags: ["coco", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3771,6 +5005,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Dates (Fresh)",
     aliases: ["dates", "dates", "dátiles", "tâmaras"],
+    regionalAliases: {
+      US: "dates",
+      CA: "dates",
+      MX: "dátiles",
+      BR: "tâmaras",
+      CO: "dátiles"
+    },
     variants: ["dátiles"],
     packaging: ["Medjool", "Barhi"],
     tags: ["dátiles", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3779,6 +5020,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Dragon Fruit (Pitaya)",
     aliases: ["pitaya", "pitahaya", "pitahaya", "dragon fruit", "dragon fruit", "pitaya", "pitaya", "pitaya"],
+    regionalAliases: {
+      TT: "pitaya",
+      PR: "pitahaya",
+      DO: "pitahaya",
+      US: "dragon fruit",
+      CA: "dragon fruit",
+      MX: "pitaya",
+      BR: "pitaya",
+      CO: "pitaya"
+    },
     variants: ["White", "Red flesh"],
     packaging: ["loose"],
     tags: ["fruits", "produce", "produce>fruits", "red flesh", "western-v0.2", "white"],
@@ -3787,6 +5038,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Grapefruit",
     aliases: ["grapefruit", "grapefruit", "toronja", "toranja"],
+    regionalAliases: {
+      US: "grapefruit",
+      CA: "grapefruit",
+      MX: "toronja",
+      BR: "toranja",
+      CO: "toronja"
+    },
     variants: ["toronja"],
     packaging: ["Ruby", "White"],
     tags: ["fruits", "produce", "produce>fruits", "toronja", "western-v0.2"],
@@ -3795,6 +5053,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Grapes (Red Seedless)",
     aliases: ["red grapes", "red grapes", "uvas rojas", "uvas vermelhas"],
+    regionalAliases: {
+      US: "red grapes",
+      CA: "red grapes",
+      MX: "uvas rojas",
+      BR: "uvas vermelhas",
+      CO: "uvas rojas"
+    },
     variants: ["uvas rojas"],
     packaging: ["Seedless"],
     tags: ["fruits", "produce", "produce>fruits", "uvas rojas", "western-v0.2"],
@@ -3803,6 +5068,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Grapes (Green Seedless)",
     aliases: ["green grapes", "green grapes", "uvas verdes", "uvas verdes"],
+    regionalAliases: {
+      US: "green grapes",
+      CA: "green grapes",
+      MX: "uvas verdes",
+      BR: "uvas verdes",
+      CO: "uvas verdes"
+    },
     variants: ["uvas verdes"],
     packaging: ["Seedless"],
     tags: ["fruits", "produce", "produce>fruits", "uvas verdes", "western-v0.2"],
@@ -3811,6 +5083,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Guava",
     aliases: ["guava", "guava", "guayaba", "guayaba", "goyab", "guava", "guava", "guayaba", "goiaba", "guayaba"],
+    regionalAliases: {
+      JM: "guava",
+      TT: "guava",
+      PR: "guayaba",
+      DO: "guayaba",
+      HT: "goyab",
+      US: "guava",
+      CA: "guava",
+      MX: "guayaba",
+      BR: "goiaba",
+      CO: "guayaba"
+    },
     variants: ["Pink", "White"],
     packaging: ["loose"],
     tags: ["fruits", "pink", "produce", "produce>fruits", "western-v0.2", "white"],
@@ -3819,6 +5103,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Honeydew",
     aliases: ["honeydew", "honeydew", "melón verde", "melão verde"],
+    regionalAliases: {
+      US: "honeydew",
+      CA: "honeydew",
+      MX: "melón verde",
+      BR: "melão verde",
+      CO: "melón verde"
+    },
     variants: ["melón verde"],
     packaging: ["Whole", "Cut"],
     tags: ["fruits", "melón verde", "produce", "produce>fruits", "western-v0.2"],
@@ -3827,6 +5118,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Jackfruit (Ripe Pods)",
     aliases: ["jackfruit", "jackfruit", "yaca", "jaca"],
+    regionalAliases: {
+      US: "jackfruit",
+      CA: "jackfruit",
+      MX: "yaca",
+      BR: "jaca",
+      CO: "yaca"
+    },
     variants: ["yaca"],
     packaging: ["Whole", "Cut pods"],
     tags: ["fruits", "produce", "produce>fruits", "western-v0.2", "yaca"],
@@ -3835,6 +5133,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Kiwi (Green)",
     aliases: ["kiwi", "kiwi", "kiwi", "kiwi"],
+    regionalAliases: {
+      US: "kiwi",
+      CA: "kiwi",
+      MX: "kiwi",
+      BR: "kiwi",
+      CO: "kiwi"
+    },
     variants: ["kiwi"],
     packaging: ["Green", "Gold"],
     tags: ["fruits", "kiwi", "produce", "produce>fruits", "western-v0.2"],
@@ -3843,6 +5148,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Lemon",
     aliases: ["lemon", "lemon", "limón", "limão"],
+    regionalAliases: {
+      US: "lemon",
+      CA: "lemon",
+      MX: "limón",
+      BR: "limão",
+      CO: "limón"
+    },
     variants: ["limón"],
     packaging: ["Fresh"],
     tags: ["fruits", "limón", "produce", "produce>fruits", "western-v0.2"],
@@ -3851,6 +5163,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Lime (Persian/Key)",
     aliases: ["lime", "lime", "lima", "limão"],
+    regionalAliases: {
+      US: "lime",
+      CA: "lime",
+      MX: "lima",
+      BR: "limão",
+      CO: "lima"
+    },
     variants: ["lima"],
     packaging: ["Persian", "Key"],
     tags: ["fruits", "lima", "produce", "produce>fruits", "western-v0.2"],
@@ -3859,6 +5178,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mango (Julie/Tommy/Keitt)",
     aliases: ["mango", "mango", "mango", "mango", "mango", "mango", "mango", "mango", "manga", "mango"],
+    regionalAliases: {
+      JM: "mango",
+      TT: "mango",
+      PR: "mango",
+      DO: "mango",
+      HT: "mango",
+      US: "mango",
+      CA: "mango",
+      MX: "mango",
+      BR: "manga",
+      CO: "mango"
+    },
     variants: ["Variety-specific"],
     packaging: ["loose"],
     tags: ["fruits", "produce", "produce>fruits", "variety-specific", "western-v0.2"],
@@ -3867,6 +5198,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Navel Orange",
     aliases: ["orange", "orange", "naranja", "laranja"],
+    regionalAliases: {
+      US: "orange",
+      CA: "orange",
+      MX: "naranja",
+      BR: "laranja",
+      CO: "naranja"
+    },
     variants: ["naranja"],
     packaging: ["Navel", "Valencia"],
     tags: ["fruits", "naranja", "produce", "produce>fruits", "western-v0.2"],
@@ -3875,6 +5213,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Papaya",
     aliases: ["pawpaw", "papaya", "lechosa", "lechosa", "papay", "papaya", "papaya", "papaya", "mamão", "papaya"],
+    regionalAliases: {
+      JM: "pawpaw",
+      TT: "papaya",
+      PR: "lechosa",
+      DO: "lechosa",
+      HT: "papay",
+      US: "papaya",
+      CA: "papaya",
+      MX: "papaya",
+      BR: "mamão",
+      CO: "papaya"
+    },
     variants: ["Red", "Yellow flesh"],
     packaging: ["loose"],
     tags: ["fruits", "produce", "produce>fruits", "red", "western-v0.2", "yellow flesh"],
@@ -3883,6 +5233,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Passion Fruit",
     aliases: ["passion fruit", "passion fruit", "parcha", "chinola", "grenadia", "passion fruit", "passion fruit", "maracuyá", "maracujá", "maracuyá"],
+    regionalAliases: {
+      JM: "passion fruit",
+      TT: "passion fruit",
+      PR: "parcha",
+      DO: "chinola",
+      HT: "grenadia",
+      US: "passion fruit",
+      CA: "passion fruit",
+      MX: "maracuyá",
+      BR: "maracujá",
+      CO: "maracuyá"
+    },
     variants: ["Purple", "Yellow"],
     packaging: ["loose"],
     tags: ["fruits", "produce", "produce>fruits", "purple", "western-v0.2", "yellow"],
@@ -3891,6 +5253,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Peach",
     aliases: ["peach", "peach", "durazno", "pêssego"],
+    regionalAliases: {
+      US: "peach",
+      CA: "peach",
+      MX: "durazno",
+      BR: "pêssego",
+      CO: "durazno"
+    },
     variants: ["durazno"],
     packaging: ["Yellow", "White"],
     tags: ["durazno", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3899,6 +5268,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pear (Anjou/Bosc)",
     aliases: ["pear", "pear", "pera", "pêra"],
+    regionalAliases: {
+      US: "pear",
+      CA: "pear",
+      MX: "pera",
+      BR: "pêra",
+      CO: "pera"
+    },
     variants: ["pera"],
     packaging: ["Anjou", "Bosc"],
     tags: ["fruits", "pera", "produce", "produce>fruits", "western-v0.2"],
@@ -3912,6 +5288,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pineapple",
     aliases: ["piña", "piña", "ananas", "pineapple", "pineapple", "piña", "abacaxi", "piña"],
+    regionalAliases: {
+      PR: "piña",
+      DO: "piña",
+      HT: "ananas",
+      US: "pineapple",
+      CA: "pineapple",
+      MX: "piña",
+      BR: "abacaxi",
+      CO: "piña"
+    },
     variants: ["Whole", "Peeled"],
     packaging: ["loose"],
     tags: ["fruits", "peeled", "produce", "produce>fruits", "western-v0.2", "whole"],
@@ -3920,6 +5306,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Plantain (Ripe/Green)",
     aliases: ["plantain", "plantain", "plátano", "maduro/plátano", "fig", "big banana", "plantain", "plátano", "banana da terra", "plátano"],
+    regionalAliases: {
+      JM: "plantain",
+      TT: "plantain",
+      PR: "plátano",
+      DO: "maduro/plátano",
+      HT: "fig",
+      US: "big banana",
+      CA: "plantain",
+      MX: "plátano",
+      BR: "banana da terra",
+      CO: "plátano"
+    },
     variants: ["Green", "Maduro"],
     packaging: ["loose"],
     tags: ["fruits", "green", "maduro", "produce", "produce>fruits", "western-v0.2"],
@@ -3928,6 +5326,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Plum",
     aliases: ["plum", "plum", "ciruela", "ameixa"],
+    regionalAliases: {
+      US: "plum",
+      CA: "plum",
+      MX: "ciruela",
+      BR: "ameixa",
+      CO: "ciruela"
+    },
     variants: ["ciruela"],
     packaging: ["Black", "Red"],
     tags: ["ciruela", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3936,6 +5341,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pomegranate",
     aliases: ["pomegranate", "pomegranate", "granada", "romã"],
+    regionalAliases: {
+      US: "pomegranate",
+      CA: "pomegranate",
+      MX: "granada",
+      BR: "romã",
+      CO: "granada"
+    },
     variants: ["granada"],
     packaging: ["Whole", "Arils"],
     tags: ["fruits", "granada", "produce", "produce>fruits", "western-v0.2"],
@@ -3944,6 +5356,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Soursop (Graviola)",
     aliases: ["soursop", "soursop", "guanábana", "guanábana", "korosòl", "soursop", "soursop", "guanábana", "graviola", "guanábana"],
+    regionalAliases: {
+      JM: "soursop",
+      TT: "soursop",
+      PR: "guanábana",
+      DO: "guanábana",
+      HT: "korosòl",
+      US: "soursop",
+      CA: "soursop",
+      MX: "guanábana",
+      BR: "graviola",
+      CO: "guanábana"
+    },
     variants: ["Fresh", "Pulp"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "pulp", "western-v0.2"],
@@ -3952,6 +5376,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Starfruit (Carambola)",
     aliases: ["carambola", "carambola", "carambola", "carambola", "karanbòl", "starfruit", "starfruit", "carambola", "carambola", "carambola"],
+    regionalAliases: {
+      JM: "carambola",
+      TT: "carambola",
+      PR: "carambola",
+      DO: "carambola",
+      HT: "karanbòl",
+      US: "starfruit",
+      CA: "starfruit",
+      MX: "carambola",
+      BR: "carambola",
+      CO: "carambola"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3960,6 +5396,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Strawberries",
     aliases: ["strawberries", "strawberries", "fresas", "morangos"],
+    regionalAliases: {
+      US: "strawberries",
+      CA: "strawberries",
+      MX: "fresas",
+      BR: "morangos",
+      CO: "fresas"
+    },
     variants: ["fresas"],
     packaging: ["Fresh"],
     tags: ["fresas", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -3968,6 +5411,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Tamarind (Pods)",
     aliases: ["tamarind", "tamarind", "tamarindo", "tamarindo", "tamarin", "tamarind", "tamarind", "tamarindo", "tamarindo", "tamarindo"],
+    regionalAliases: {
+      JM: "tamarind",
+      TT: "tamarind",
+      PR: "tamarindo",
+      DO: "tamarindo",
+      HT: "tamarin",
+      US: "tamarind",
+      CA: "tamarind",
+      MX: "tamarindo",
+      BR: "tamarindo",
+      CO: "tamarindo"
+    },
     variants: ["Pods", "Pulp block"],
     packaging: ["loose", "brick"],
     tags: ["fruits", "pods", "produce", "produce>fruits", "pulp block", "western-v0.2"],
@@ -3976,6 +5431,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Watermelon (Seedless)",
     aliases: ["watermelon", "watermelon", "sandía", "melancia"],
+    regionalAliases: {
+      US: "watermelon",
+      CA: "watermelon",
+      MX: "sandía",
+      BR: "melancia",
+      CO: "sandía"
+    },
     variants: ["sandía"],
     packaging: ["Seedless", "Seeded"],
     tags: ["fruits", "produce", "produce>fruits", "sandía", "western-v0.2"],
@@ -3984,6 +5446,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Basil (Sweet)",
     aliases: ["basil", "basil", "albahaca", "manjericão"],
+    regionalAliases: {
+      US: "basil",
+      CA: "basil",
+      MX: "albahaca",
+      BR: "manjericão",
+      CO: "albahaca"
+    },
     variants: ["albahaca"],
     packaging: ["Fresh"],
     tags: ["albahaca", "herbs", "produce", "produce>herbs", "western-v0.2"],
@@ -3992,6 +5461,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Bay Leaves (Fresh)",
     aliases: ["bay leaves", "bay leaves", "laurel", "louro"],
+    regionalAliases: {
+      US: "bay leaves",
+      CA: "bay leaves",
+      MX: "laurel",
+      BR: "louro",
+      CO: "laurel"
+    },
     variants: ["laurel"],
     packaging: ["Fresh", "Dried"],
     tags: ["herbs", "laurel", "produce", "produce>herbs", "western-v0.2"],
@@ -4000,6 +5476,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cilantro (Coriander Leaf)",
     aliases: ["coriander leaf", "coriander leaf", "cilantro", "cilantro", "koriyand", "cilantro", "cilantro", "coentro", "cilantro"],
+    regionalAliases: {
+      JM: "coriander leaf",
+      TT: "coriander leaf",
+      PR: "cilantro",
+      DO: "cilantro",
+      HT: "koriyand",
+      CA: "cilantro",
+      MX: "cilantro",
+      BR: "coentro",
+      CO: "cilantro"
+    },
     variants: ["Fresh"],
     packaging: ["bunch"],
     tags: ["fresh", "herbs", "produce", "produce>herbs", "western-v0.2"],
@@ -4008,6 +5495,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Culantro (Chadon Beni)",
     aliases: ["culantro", "chadon beni", "recao", "cilantro coyote", "culantro", "culantro", "culantro", "coentro-largo", "cilantro cimarrón"],
+    regionalAliases: {
+      JM: "culantro",
+      TT: "chadon beni",
+      PR: "recao",
+      DO: "cilantro coyote",
+      US: "culantro",
+      CA: "culantro",
+      MX: "culantro",
+      BR: "coentro-largo",
+      CO: "cilantro cimarrón"
+    },
     variants: ["Fresh"],
     packaging: ["bunch"],
     tags: ["fresh", "herbs", "produce", "produce>herbs", "western-v0.2"],
@@ -4016,6 +5514,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Dill",
     aliases: ["dill", "dill", "eneldo", "endro"],
+    regionalAliases: {
+      US: "dill",
+      CA: "dill",
+      MX: "eneldo",
+      BR: "endro",
+      CO: "eneldo"
+    },
     variants: ["eneldo"],
     packaging: ["Fresh"],
     tags: ["eneldo", "herbs", "produce", "produce>herbs", "western-v0.2"],
@@ -4024,6 +5529,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Garlic (Bulb)",
     aliases: ["garlic", "garlic", "ajo", "alho"],
+    regionalAliases: {
+      US: "garlic",
+      CA: "garlic",
+      MX: "ajo",
+      BR: "alho",
+      CO: "ajo"
+    },
     variants: ["ajo"],
     packaging: ["Hardneck", "Softneck"],
     tags: ["ajo", "herbs", "produce", "produce>herbs", "western-v0.2"],
@@ -4032,6 +5544,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Ginger Root",
     aliases: ["ginger", "ginger", "jengibre", "gengibre"],
+    regionalAliases: {
+      US: "ginger",
+      CA: "ginger",
+      MX: "jengibre",
+      BR: "gengibre",
+      CO: "jengibre"
+    },
     variants: ["jengibre"],
     packaging: ["Fresh", "Young"],
     tags: ["herbs", "jengibre", "produce", "produce>herbs", "western-v0.2"],
@@ -4040,6 +5559,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mint (Spearmint)",
     aliases: ["mint", "mint", "menta", "hortelã"],
+    regionalAliases: {
+      US: "mint",
+      CA: "mint",
+      MX: "menta",
+      BR: "hortelã",
+      CO: "menta"
+    },
     variants: ["menta"],
     packaging: ["Fresh"],
     tags: ["herbs", "menta", "produce", "produce>herbs", "western-v0.2"],
@@ -4048,6 +5574,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Oregano",
     aliases: ["oregano", "oregano", "orégano", "orégano"],
+    regionalAliases: {
+      US: "oregano",
+      CA: "oregano",
+      MX: "orégano",
+      BR: "orégano",
+      CO: "orégano"
+    },
     variants: ["orégano"],
     packaging: ["Fresh"],
     tags: ["herbs", "orégano", "produce", "produce>herbs", "western-v0.2"],
@@ -4056,6 +5589,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Parsley (Curly/Flat)",
     aliases: ["parsley", "parsley", "perejil", "salsinha"],
+    regionalAliases: {
+      US: "parsley",
+      CA: "parsley",
+      MX: "perejil",
+      BR: "salsinha",
+      CO: "perejil"
+    },
     variants: ["perejil"],
     packaging: ["Curly", "Italian"],
     tags: ["herbs", "perejil", "produce", "produce>herbs", "western-v0.2"],
@@ -4064,6 +5604,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Rosemary",
     aliases: ["rosemary", "rosemary", "romero", "alecrim"],
+    regionalAliases: {
+      US: "rosemary",
+      CA: "rosemary",
+      MX: "romero",
+      BR: "alecrim",
+      CO: "romero"
+    },
     variants: ["romero"],
     packaging: ["Fresh"],
     tags: ["herbs", "produce", "produce>herbs", "romero", "western-v0.2"],
@@ -4072,6 +5619,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Scallion (Green Onion)",
     aliases: ["escallion", "scallion", "cebolleta", "cebollín", "zonyon vèt", "green onion", "green onion", "cebollita", "cebolinha", "cebolla larga"],
+    regionalAliases: {
+      JM: "escallion",
+      TT: "scallion",
+      PR: "cebolleta",
+      DO: "cebollín",
+      HT: "zonyon vèt",
+      US: "green onion",
+      CA: "green onion",
+      MX: "cebollita",
+      BR: "cebolinha",
+      CO: "cebolla larga"
+    },
     variants: ["Fresh"],
     packaging: ["bunch"],
     tags: ["fresh", "herbs", "produce", "produce>herbs", "western-v0.2"],
@@ -4080,6 +5639,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Thyme",
     aliases: ["thyme", "thyme", "tomillo", "tomilho"],
+    regionalAliases: {
+      US: "thyme",
+      CA: "thyme",
+      MX: "tomillo",
+      BR: "tomilho",
+      CO: "tomillo"
+    },
     variants: ["tomillo"],
     packaging: ["Fresh"],
     tags: ["herbs", "produce", "produce>herbs", "tomillo", "western-v0.2"],
@@ -4088,6 +5654,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Artichoke",
     aliases: ["artichoke", "artichoke", "alcachofa", "alcachofra"],
+    regionalAliases: {
+      US: "artichoke",
+      CA: "artichoke",
+      MX: "alcachofa",
+      BR: "alcachofra",
+      CO: "alcachofa"
+    },
     variants: ["alcachofa"],
     packaging: ["Globe", "Baby"],
     tags: ["alcachofa", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4096,6 +5669,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Asparagus",
     aliases: ["asparagus", "asparagus", "espárragos", "aspargos"],
+    regionalAliases: {
+      US: "asparagus",
+      CA: "asparagus",
+      MX: "espárragos",
+      BR: "aspargos",
+      CO: "espárragos"
+    },
     variants: ["espárragos"],
     packaging: ["Green", "White"],
     tags: ["espárragos", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4104,6 +5684,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Beet (Beetroot)",
     aliases: ["beetroot", "beetroot", "remolacha", "remolacha", "betrav", "beets", "beets", "betabel", "beterraba", "remolacha"],
+    regionalAliases: {
+      JM: "beetroot",
+      TT: "beetroot",
+      PR: "remolacha",
+      DO: "remolacha",
+      HT: "betrav",
+      US: "beets",
+      CA: "beets",
+      MX: "betabel",
+      BR: "beterraba",
+      CO: "remolacha"
+    },
     variants: ["Red", "Golden"],
     packaging: ["bunch"],
     tags: ["golden", "produce", "produce>vegetables", "red", "vegetables", "western-v0.2"],
@@ -4112,6 +5704,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Bell Pepper (Green/Red)",
     aliases: ["sweet pepper", "sweet pepper", "pimiento morrón", "ají morrón", "piman dous", "bell pepper", "bell pepper", "pimiento", "pimentão", "pimentón"],
+    regionalAliases: {
+      JM: "sweet pepper",
+      TT: "sweet pepper",
+      PR: "pimiento morrón",
+      DO: "ají morrón",
+      HT: "piman dous",
+      US: "bell pepper",
+      CA: "bell pepper",
+      MX: "pimiento",
+      BR: "pimentão",
+      CO: "pimentón"
+    },
     variants: ["Green", "Red", "Yellow"],
     packaging: ["tray"],
     tags: ["green", "produce", "produce>vegetables", "red", "vegetables", "western-v0.2", "yellow"],
@@ -4120,6 +5724,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Bok Choy (Pak Choi)",
     aliases: ["pak choi", "pak choi", "bok choy", "bok choy", "bok choy", "bok choy", "bok choy", "acelga chinesa", "bok choy"],
+    regionalAliases: {
+      JM: "pak choi",
+      TT: "pak choi",
+      PR: "bok choy",
+      DO: "bok choy",
+      US: "bok choy",
+      CA: "bok choy",
+      MX: "bok choy",
+      BR: "acelga chinesa",
+      CO: "bok choy"
+    },
     variants: ["Baby", "Full"],
     packaging: ["loose"],
     tags: ["baby", "full", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4128,6 +5743,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Broccoli",
     aliases: ["broccoli", "broccoli", "brócoli", "brócolis"],
+    regionalAliases: {
+      US: "broccoli",
+      CA: "broccoli",
+      MX: "brócoli",
+      BR: "brócolis",
+      CO: "brócoli"
+    },
     variants: ["brócoli"],
     packaging: ["Crowns", "Florets"],
     tags: ["brócoli", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4136,6 +5758,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Brussels Sprouts",
     aliases: ["brussels sprouts", "brussels sprouts", "coles de bruselas", "couve-de-bruxelas"],
+    regionalAliases: {
+      US: "brussels sprouts",
+      CA: "brussels sprouts",
+      MX: "coles de bruselas",
+      BR: "couve-de-bruxelas",
+      CO: "col de bruselas"
+    },
     variants: ["col de bruselas"],
     packaging: ["Whole", "Trimmed"],
     tags: ["col de bruselas", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4144,6 +5773,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cabbage (Green)",
     aliases: ["cabbage", "cabbage", "repollo", "repolo"],
+    regionalAliases: {
+      US: "cabbage",
+      CA: "cabbage",
+      MX: "repollo",
+      BR: "repolo",
+      CO: "repollo"
+    },
     variants: ["repollo"],
     packaging: ["Green", "Red", "Napa"],
     tags: ["produce", "produce>vegetables", "repollo", "vegetables", "western-v0.2"],
@@ -4152,6 +5788,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Carrot",
     aliases: ["carrot", "carrot", "zanahoria", "cenoura"],
+    regionalAliases: {
+      US: "carrot",
+      CA: "carrot",
+      MX: "zanahoria",
+      BR: "cenoura",
+      CO: "zanahoria"
+    },
     variants: ["zanahoria"],
     packaging: ["Whole", "Baby"],
     tags: ["produce", "produce>vegetables", "vegetables", "western-v0.2", "zanahoria"],
@@ -4160,6 +5803,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cauliflower",
     aliases: ["cauliflower", "cauliflower", "coliflor", "couve-flor"],
+    regionalAliases: {
+      US: "cauliflower",
+      CA: "cauliflower",
+      MX: "coliflor",
+      BR: "couve-flor",
+      CO: "coliflor"
+    },
     variants: ["coliflor"],
     packaging: ["White", "Romanesco"],
     tags: ["coliflor", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4168,6 +5818,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Celery",
     aliases: ["celery", "celery", "apio", "salsão"],
+    regionalAliases: {
+      US: "celery",
+      CA: "celery",
+      MX: "apio",
+      BR: "salsão",
+      CO: "apio"
+    },
     variants: ["apio"],
     packaging: ["Stalk", "Hearts"],
     tags: ["apio", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4176,6 +5833,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Chayote (Chocho)",
     aliases: ["chocho", "chocho", "chayote", "chinayote", "chocho", "chayote", "chayote", "chayote", "chuchu", "chayote"],
+    regionalAliases: {
+      JM: "chocho",
+      TT: "chocho",
+      PR: "chayote",
+      DO: "chinayote",
+      HT: "chocho",
+      US: "chayote",
+      CA: "chayote",
+      MX: "chayote",
+      BR: "chuchu",
+      CO: "chayote"
+    },
     variants: ["Green", "White"],
     packaging: ["loose"],
     tags: ["green", "produce", "produce>vegetables", "vegetables", "western-v0.2", "white"],
@@ -4184,6 +5853,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Corn (Sweet)",
     aliases: ["maíz dulce", "maíz dulce", "sweet corn", "sweet corn", "elote", "milho verde", "mazorca"],
+    regionalAliases: {
+      PR: "maíz dulce",
+      DO: "maíz dulce",
+      US: "sweet corn",
+      CA: "sweet corn",
+      MX: "elote",
+      BR: "milho verde",
+      CO: "mazorca"
+    },
     variants: ["On the cob", "Kernels"],
     packaging: ["tray", "bag"],
     tags: ["kernels", "on the cob", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4192,6 +5870,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cucumber",
     aliases: ["cucumber", "cucumber", "pepino", "pepino"],
+    regionalAliases: {
+      US: "cucumber",
+      CA: "cucumber",
+      MX: "pepino",
+      BR: "pepino",
+      CO: "pepino"
+    },
     variants: ["pepino"],
     packaging: ["Slicing", "English"],
     tags: ["pepino", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4200,6 +5885,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Eggplant (Aubergine)",
     aliases: ["eggplant", "baigan", "berenjena", "berenjena", "berejèn", "eggplant", "eggplant", "berenjena", "berinjela", "berenjena"],
+    regionalAliases: {
+      JM: "eggplant",
+      TT: "baigan",
+      PR: "berenjena",
+      DO: "berenjena",
+      HT: "berejèn",
+      US: "eggplant",
+      CA: "eggplant",
+      MX: "berenjena",
+      BR: "berinjela",
+      CO: "berenjena"
+    },
     variants: ["Globe", "Asian"],
     packaging: ["loose"],
     tags: ["asian", "globe", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4208,6 +5905,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Green Beans",
     aliases: ["string beans", "bodi (long bean ≠)", "ejotes", "habichuelas verdes", "pwa vèt", "green beans", "green beans", "ejotes", "vagem", "habichuela"],
+    regionalAliases: {
+      JM: "string beans",
+      TT: "bodi (long bean ≠)",
+      PR: "ejotes",
+      DO: "habichuelas verdes",
+      HT: "pwa vèt",
+      US: "green beans",
+      CA: "green beans",
+      MX: "ejotes",
+      BR: "vagem",
+      CO: "habichuela"
+    },
     variants: ["Whole", "Trimmed"],
     packaging: ["bag"],
     tags: ["produce", "produce>vegetables", "trimmed", "vegetables", "western-v0.2", "whole"],
@@ -4216,6 +5925,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Jalapeño",
     aliases: ["jalapeño", "jalapeño", "jalapeño", "jalapeño"],
+    regionalAliases: {
+      US: "jalapeño",
+      CA: "jalapeño",
+      MX: "jalapeño",
+      BR: "jalapeño",
+      CO: "ají"
+    },
     variants: ["ají"],
     packaging: ["Fresh"],
     tags: ["ají", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4224,6 +5940,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Kale",
     aliases: ["kale", "kale", "col rizada", "couve"],
+    regionalAliases: {
+      US: "kale",
+      CA: "kale",
+      MX: "col rizada",
+      BR: "couve",
+      CO: "col rizada"
+    },
     variants: ["col rizada"],
     packaging: ["Curly", "Lacinato"],
     tags: ["col rizada", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4232,6 +5955,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Leek",
     aliases: ["leek", "leek", "poro", "alho-poró"],
+    regionalAliases: {
+      US: "leek",
+      CA: "leek",
+      MX: "poro",
+      BR: "alho-poró",
+      CO: "poro"
+    },
     variants: ["poro"],
     packaging: ["Fresh"],
     tags: ["poro", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4240,6 +5970,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Lettuce (Iceberg)",
     aliases: ["iceberg lettuce", "iceberg lettuce", "lechuga iceberg", "alface americana"],
+    regionalAliases: {
+      US: "iceberg lettuce",
+      CA: "iceberg lettuce",
+      MX: "lechuga iceberg",
+      BR: "alface americana",
+      CO: "lechuga iceberg"
+    },
     variants: ["lechuga iceberg"],
     packaging: ["Whole", "Pre-cut"],
     tags: ["lechuga iceberg", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4248,6 +5985,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Lettuce (Romaine)",
     aliases: ["romaine lettuce", "romaine lettuce", "lechuga romana", "alface romana"],
+    regionalAliases: {
+      US: "romaine lettuce",
+      CA: "romaine lettuce",
+      MX: "lechuga romana",
+      BR: "alface romana",
+      CO: "lechuga romana"
+    },
     variants: ["lechuga romana"],
     packaging: ["Hearts", "Whole"],
     tags: ["lechuga romana", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4256,6 +6000,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Okra (Ochro)",
     aliases: ["ochro", "okra", "quimbombó", "quimbombó", "kalalou", "okra", "okra", "quimbombó", "quiabo", "quimbombó"],
+    regionalAliases: {
+      JM: "ochro",
+      TT: "okra",
+      PR: "quimbombó",
+      DO: "quimbombó",
+      HT: "kalalou",
+      US: "okra",
+      CA: "okra",
+      MX: "quimbombó",
+      BR: "quiabo",
+      CO: "quimbombó"
+    },
     variants: ["Fresh", "Frozen"],
     packaging: ["tray", "bag"],
     tags: ["fresh", "frozen", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4264,6 +6020,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Onion (Red)",
     aliases: ["red onion", "red onion", "cebolla roja", "cebola roxa"],
+    regionalAliases: {
+      US: "red onion",
+      CA: "red onion",
+      MX: "cebolla roja",
+      BR: "cebola roxa",
+      CO: "cebolla roja"
+    },
     variants: ["cebolla roja"],
     packaging: ["Fresh"],
     tags: ["cebolla roja", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4272,6 +6035,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Onion (Yellow)",
     aliases: ["yellow onion", "yellow onion", "cebolla amarilla", "cebola amarela"],
+    regionalAliases: {
+      US: "yellow onion",
+      CA: "yellow onion",
+      MX: "cebolla amarilla",
+      BR: "cebola amarela",
+      CO: "cebolla amarilla"
+    },
     variants: ["cebolla amarilla"],
     packaging: ["Fresh"],
     tags: ["cebolla amarilla", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4280,6 +6050,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Plantain (Green for Cooking)",
     aliases: ["cooking banana", "plantain", "plátano verde", "plátano verde", "fig vè", "plantain", "plantain", "plátano verde", "banana da terra", "plátano verde"],
+    regionalAliases: {
+      JM: "cooking banana",
+      TT: "plantain",
+      PR: "plátano verde",
+      DO: "plátano verde",
+      HT: "fig vè",
+      US: "plantain",
+      CA: "plantain",
+      MX: "plátano verde",
+      BR: "banana da terra",
+      CO: "plátano verde"
+    },
     variants: ["Green"],
     packaging: ["loose"],
     tags: ["green", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4288,6 +6070,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Potato (Red)",
     aliases: ["red potato", "red potato", "papa roja", "batata vermelha"],
+    regionalAliases: {
+      US: "red potato",
+      CA: "red potato",
+      MX: "papa roja",
+      BR: "batata vermelha",
+      CO: "papa roja"
+    },
     variants: ["papa roja"],
     packaging: ["Red", "White"],
     tags: ["papa roja", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4296,6 +6085,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Potato (Russet)",
     aliases: ["russet potato", "russet potato", "papa russet", "batata inglesa"],
+    regionalAliases: {
+      US: "russet potato",
+      CA: "russet potato",
+      MX: "papa russet",
+      BR: "batata inglesa",
+      CO: "papa russet"
+    },
     variants: ["papa russet"],
     packaging: ["Baking", "Mashed"],
     tags: ["papa russet", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4304,6 +6100,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pumpkin (Calabaza)",
     aliases: ["pumpkin", "calabaza", "calabaza", "auyama", "joumou", "pumpkin", "pumpkin", "calabaza", "abóbora", "ahuyama"],
+    regionalAliases: {
+      JM: "pumpkin",
+      TT: "calabaza",
+      PR: "calabaza",
+      DO: "auyama",
+      HT: "joumou",
+      US: "pumpkin",
+      CA: "pumpkin",
+      MX: "calabaza",
+      BR: "abóbora",
+      CO: "ahuyama"
+    },
     variants: ["Whole", "Cut"],
     packaging: ["tray"],
     tags: ["cut", "produce", "produce>vegetables", "vegetables", "western-v0.2", "whole"],
@@ -4312,6 +6120,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Radish",
     aliases: ["radish", "radish", "rabano", "rábano"],
+    regionalAliases: {
+      US: "radish",
+      CA: "radish",
+      MX: "rabano",
+      BR: "rábano",
+      CO: "rábano"
+    },
     variants: ["rábano"],
     packaging: ["Red", "Daikon"],
     tags: ["produce", "produce>vegetables", "rábano", "vegetables", "western-v0.2"],
@@ -4320,6 +6135,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Scotch Bonnet Pepper (Fresh)",
     aliases: ["scotchie", "bonnet pepper", "ají cachucha ", "ají chombo (PA)", "piman skoch", "scotch bonnet", "scotch bonnet", "pimenta scotch bonnet"],
+    regionalAliases: {
+      JM: "scotchie",
+      TT: "bonnet pepper",
+      PR: "ají cachucha ",
+      DO: "ají chombo (PA)",
+      HT: "piman skoch",
+      US: "scotch bonnet",
+      CA: "scotch bonnet",
+      BR: "pimenta scotch bonnet"
+    },
     variants: ["Fresh", "Dried"],
     packaging: ["bag"],
     tags: ["dried", "fresh", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4328,6 +6153,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Spinach",
     aliases: ["spinach", "spinach", "espinaca", "espinafre"],
+    regionalAliases: {
+      US: "spinach",
+      CA: "spinach",
+      MX: "espinaca",
+      BR: "espinafre",
+      CO: "espinaca"
+    },
     variants: ["espinaca"],
     packaging: ["Bunched", "Baby"],
     tags: ["espinaca", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4336,6 +6168,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Spring Mix (Greens)",
     aliases: ["spring mix", "spring mix", "mezcla primavera", "mix de folhas"],
+    regionalAliases: {
+      US: "spring mix",
+      CA: "spring mix",
+      MX: "mezcla primavera",
+      BR: "mix de folhas",
+      CO: "mezcla primavera"
+    },
     variants: ["mezcla primavera"],
     packaging: ["Mixed greens"],
     tags: ["mezcla primavera", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4344,6 +6183,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Sweet Potato",
     aliases: ["batata (white)", "batata (white)", "batata (white)", "patat dous", "sweet potato", "sweet potato", "camote", "batata doce", "batata (white)"],
+    regionalAliases: {
+      JM: "batata (white)",
+      PR: "batata (white)",
+      DO: "batata (white)",
+      HT: "patat dous",
+      US: "sweet potato",
+      CA: "sweet potato",
+      MX: "camote",
+      BR: "batata doce",
+      CO: "batata (white)"
+    },
     variants: ["Orange", "White"],
     packaging: ["bag", "loose"],
     tags: ["orange", "produce", "produce>vegetables", "vegetables", "western-v0.2", "white"],
@@ -4352,6 +6202,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Tomatillo",
     aliases: ["tomate verde", "tomatillo", "tomatillo", "tomatillo", "tomatillo", "mil tomate", "tomatillo"],
+    regionalAliases: {
+      PR: "tomate verde",
+      DO: "tomatillo",
+      US: "tomatillo",
+      CA: "tomatillo",
+      MX: "tomatillo",
+      BR: "mil tomate",
+      CO: "tomatillo"
+    },
     variants: ["Fresh"],
     packaging: ["bag"],
     tags: ["fresh", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4360,6 +6219,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Tomato (Roma)",
     aliases: ["Roma tomato", "Roma tomato", "tomate Roma", "tomate italiano"],
+    regionalAliases: {
+      US: "Roma tomato",
+      CA: "Roma tomato",
+      MX: "tomate Roma",
+      BR: "tomate italiano",
+      CO: "tomate chonto"
+    },
     variants: ["tomate chonto"],
     packaging: ["Fresh"],
     tags: ["produce", "produce>vegetables", "tomate chonto", "vegetables", "western-v0.2"],
@@ -4368,6 +6234,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Yam (White)",
     aliases: ["white yam", "ñame", "ñame", "inyam", "white yam", "white yam", "ñame", "inhame", "ñame"],
+    regionalAliases: {
+      JM: "white yam",
+      PR: "ñame",
+      DO: "ñame",
+      HT: "inyam",
+      US: "white yam",
+      CA: "white yam",
+      MX: "ñame",
+      BR: "inhame",
+      CO: "ñame"
+    },
     variants: ["Whole", "Cut"],
     packaging: ["tray"],
     tags: ["cut", "produce", "produce>vegetables", "vegetables", "western-v0.2", "whole"],
@@ -4376,6 +6253,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Yam (Yellow)",
     aliases: ["yellow yam", "ñame amarillo", "ñame amarillo", "inyam jòn", "yellow yam", "yellow yam", "ñame amarillo", "inhame amarelo", "ñame amarillo"],
+    regionalAliases: {
+      JM: "yellow yam",
+      PR: "ñame amarillo",
+      DO: "ñame amarillo",
+      HT: "inyam jòn",
+      US: "yellow yam",
+      CA: "yellow yam",
+      MX: "ñame amarillo",
+      BR: "inhame amarelo",
+      CO: "ñame amarillo"
+    },
     variants: ["Whole", "Cut"],
     packaging: ["tray"],
     tags: ["cut", "produce", "produce>vegetables", "vegetables", "western-v0.2", "whole"],
@@ -4384,6 +6272,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Yuca/Cassava Root",
     aliases: ["yuca/cassava", "yuca/cassava", "yuca", "yuca", "kasav", "cassava", "yuca", "yuca", "mandioca", "yuca"],
+    regionalAliases: {
+      JM: "yuca/cassava",
+      TT: "yuca/cassava",
+      PR: "yuca",
+      DO: "yuca",
+      HT: "kasav",
+      US: "cassava",
+      CA: "yuca",
+      MX: "yuca",
+      BR: "mandioca",
+      CO: "yuca"
+    },
     variants: ["Fresh", "Peeled"],
     packaging: ["loose", "bag"],
     tags: ["fresh", "peeled", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -4392,6 +6292,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Bacalao (Salted Cod)",
     aliases: ["saltfish", "saltfish", "bacalao", "bacalao", "morue salée", "salted cod", "salted cod", "bacalao", "bacalhau", "bacalao"],
+    regionalAliases: {
+      JM: "saltfish",
+      TT: "saltfish",
+      PR: "bacalao",
+      DO: "bacalao",
+      HT: "morue salée",
+      US: "salted cod",
+      CA: "salted cod",
+      MX: "bacalao",
+      BR: "bacalhau",
+      CO: "bacalao"
+    },
     variants: ["Boneless", "With bone"],
     packaging: ["pack"],
     tags: ["boneless", "seafood", "western-v0.2", "with bone"],
@@ -4400,6 +6312,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Catfish (Fillet)",
     aliases: ["catfish", "catfish", "bagre", "bagre"],
+    regionalAliases: {
+      US: "catfish",
+      CA: "catfish",
+      MX: "bagre",
+      BR: "bagre",
+      CO: "bagre"
+    },
     variants: ["bagre"],
     packaging: ["Fresh", "Frozen"],
     tags: ["bagre", "seafood", "western-v0.2"],
@@ -4408,6 +6327,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Cod (Atlantic/Pacific)",
     aliases: ["cod", "cod", "bacalao", "bacalhau"],
+    regionalAliases: {
+      US: "cod",
+      CA: "cod",
+      MX: "bacalao",
+      BR: "bacalhau",
+      CO: "bacalao"
+    },
     variants: ["bacalao"],
     packaging: ["Fillet", "Loins"],
     tags: ["bacalao", "seafood", "western-v0.2"],
@@ -4416,6 +6342,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Kingfish (Steaks)",
     aliases: ["kingfish", "kingfish", "carite ", "carite ", "king mackerel", "king mackerel", "carite", "cavala", "cavala"],
+    regionalAliases: {
+      JM: "kingfish",
+      TT: "kingfish",
+      PR: "carite ",
+      DO: "carite ",
+      US: "king mackerel",
+      CA: "king mackerel",
+      MX: "carite",
+      BR: "cavala",
+      CO: "cavala"
+    },
     variants: ["Steaks", "Fillet"],
     packaging: ["tray"],
     tags: ["fillet", "seafood", "steaks", "western-v0.2"],
@@ -4424,6 +6361,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Mahi-Mahi (Dorado)",
     aliases: ["mahi-mahi", "mahi-mahi", "dorado", "dourado"],
+    regionalAliases: {
+      US: "mahi-mahi",
+      CA: "mahi-mahi",
+      MX: "dorado",
+      BR: "dourado",
+      CO: "dorado"
+    },
     variants: ["dorado"],
     packaging: ["Fillet", "Steak"],
     tags: ["dorado", "seafood", "western-v0.2"],
@@ -4432,6 +6376,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Salmon (Atlantic)",
     aliases: ["salmon", "salmon", "salmón", "salmão"],
+    regionalAliases: {
+      US: "salmon",
+      CA: "salmon",
+      MX: "salmón",
+      BR: "salmão",
+      CO: "salmón"
+    },
     variants: ["salmón"],
     packaging: ["Fillet", "Portions"],
     tags: ["salmón", "seafood", "western-v0.2"],
@@ -4440,6 +6391,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Snapper (Red)",
     aliases: ["red snapper", "red snapper", "pargo", "pargo"],
+    regionalAliases: {
+      US: "red snapper",
+      CA: "red snapper",
+      MX: "pargo",
+      BR: "pargo",
+      CO: "pargo"
+    },
     variants: ["pargo"],
     packaging: ["Whole", "Fillet"],
     tags: ["pargo", "seafood", "western-v0.2"],
@@ -4448,6 +6406,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Tilapia (Fillet)",
     aliases: ["tilapia", "tilapia", "tilapia", "tilápia"],
+    regionalAliases: {
+      US: "tilapia",
+      CA: "tilapia",
+      MX: "tilapia",
+      BR: "tilápia",
+      CO: "tilapia"
+    },
     variants: ["tilapia"],
     packaging: ["Fresh", "Frozen"],
     tags: ["seafood", "tilapia", "western-v0.2"],
@@ -4456,6 +6421,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Tuna (Yellowfin/Ahi)",
     aliases: ["tuna", "tuna", "atún", "atum"],
+    regionalAliases: {
+      US: "tuna",
+      CA: "tuna",
+      MX: "atún",
+      BR: "atum",
+      CO: "atún"
+    },
     variants: ["atún"],
     packaging: ["Steaks", "Saku"],
     tags: ["atún", "seafood", "western-v0.2"],
@@ -4464,6 +6436,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Chocolate Bar (Milk)",
     aliases: ["milk chocolate bar", "milk chocolate bar", "barra de chocolate", "barra de chocolate"],
+    regionalAliases: {
+      US: "milk chocolate bar",
+      CA: "milk chocolate bar",
+      MX: "barra de chocolate",
+      BR: "barra de chocolate",
+      CO: "barra de chocolate"
+    },
     variants: ["barra de chocolate"],
     packaging: ["Milk", "Dark"],
     tags: ["barra de chocolate", "snacks", "western-v0.2"],
@@ -4472,6 +6451,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Crackers (Saltine)",
     aliases: ["saltine crackers", "saltine crackers", "galletas de soda", "bolacha de água e sal"],
+    regionalAliases: {
+      US: "saltine crackers",
+      CA: "saltine crackers",
+      MX: "galletas de soda",
+      BR: "bolacha de água e sal",
+      CO: "galleta de soda"
+    },
     variants: ["galleta de soda"],
     packaging: ["Unsalted", "Regular"],
     tags: ["galleta de soda", "snacks", "western-v0.2"],
@@ -4480,6 +6466,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Fruit Snacks",
     aliases: ["fruit snacks", "fruit snacks", "bocadillos de fruta", "balas de fruta"],
+    regionalAliases: {
+      US: "fruit snacks",
+      CA: "fruit snacks",
+      MX: "bocadillos de fruta",
+      BR: "balas de fruta",
+      CO: "bocadillos de fruta"
+    },
     variants: ["bocadillos de fruta"],
     packaging: ["Mixed flavors"],
     tags: ["bocadillos de fruta", "snacks", "western-v0.2"],
@@ -4488,6 +6481,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Granola Bars",
     aliases: ["granola bars", "granola bars", "barras de granola", "barras de granola"],
+    regionalAliases: {
+      US: "granola bars",
+      CA: "granola bars",
+      MX: "barras de granola",
+      BR: "barras de granola",
+      CO: "barras de granola"
+    },
     variants: ["barras de granola"],
     packaging: ["Chocolate chip", "Peanut"],
     tags: ["barras de granola", "snacks", "western-v0.2"],
@@ -4496,6 +6496,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Plantain Chips",
     aliases: ["plantain chips", "plantain chips", "platanutres", "platanitos", "chips bannann", "plantain chips", "plantain chips", "totopos de plátano", "chips de banana", "platanitos"],
+    regionalAliases: {
+      JM: "plantain chips",
+      TT: "plantain chips",
+      PR: "platanutres",
+      DO: "platanitos",
+      HT: "chips bannann",
+      US: "plantain chips",
+      CA: "plantain chips",
+      MX: "totopos de plátano",
+      BR: "chips de banana",
+      CO: "platanitos"
+    },
     variants: ["Salted", "Chile-lime"],
     packaging: ["bag"],
     tags: ["chile-lime", "salted", "snacks", "western-v0.2"],
@@ -4504,6 +6516,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Popcorn (Ready-to-eat)",
     aliases: ["popcorn", "popcorn", "palomitas", "pipoca"],
+    regionalAliases: {
+      US: "popcorn",
+      CA: "popcorn",
+      MX: "palomitas",
+      BR: "pipoca",
+      CO: "palomitas"
+    },
     variants: ["palomitas"],
     packaging: ["Butter", "Kettle"],
     tags: ["palomitas", "snacks", "western-v0.2"],
@@ -4512,6 +6531,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Potato Chips",
     aliases: ["potato chips", "potato chips", "papas fritas", "batata chips"],
+    regionalAliases: {
+      US: "potato chips",
+      CA: "potato chips",
+      MX: "papas fritas",
+      BR: "batata chips",
+      CO: "papas fritas"
+    },
     variants: ["papas fritas"],
     packaging: ["Classic", "Rippled"],
     tags: ["papas fritas", "snacks", "western-v0.2"],
@@ -4520,6 +6546,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Pretzels",
     aliases: ["pretzels", "pretzels", "pretzels", "pretzels"],
+    regionalAliases: {
+      US: "pretzels",
+      CA: "pretzels",
+      MX: "pretzels",
+      BR: "pretzels",
+      CO: "pretzels"
+    },
     variants: ["pretzels"],
     packaging: ["Twists", "Sticks"],
     tags: ["pretzels", "snacks", "western-v0.2"],
@@ -4528,6 +6561,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Tortilla Chips",
     aliases: ["tortilla chips", "tortilla chips", "totopos", "totopos"],
+    regionalAliases: {
+      US: "tortilla chips",
+      CA: "tortilla chips",
+      MX: "totopos",
+      BR: "totopos",
+      CO: "totopos"
+    },
     variants: ["totopos"],
     packaging: ["Salted", "Lime"],
     tags: ["snacks", "totopos", "western-v0.2"],
@@ -4536,6 +6576,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Trail Mix",
     aliases: ["trail mix", "trail mix", "mezcla de frutos secos", "mix de nuts"],
+    regionalAliases: {
+      US: "trail mix",
+      CA: "trail mix",
+      MX: "mezcla de frutos secos",
+      BR: "mix de nuts",
+      CO: "mezcla de frutos secos"
+    },
     variants: ["mezcla de frutos secos"],
     packaging: ["Sweet", "salty", "Nut heavy"],
     tags: ["mezcla de frutos secos", "snacks", "western-v0.2"],
@@ -4544,6 +6591,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Allspice (Pimento)",
     aliases: ["pimento", "pimento", "pimienta de Jamaica", "pimienta dioica", "piman peyi", "allspice", "allspice", "pimienta gorda", "pimenta-da-jamaica", "pimienta gorda"],
+    regionalAliases: {
+      JM: "pimento",
+      TT: "pimento",
+      PR: "pimienta de Jamaica",
+      DO: "pimienta dioica",
+      HT: "piman peyi",
+      US: "allspice",
+      CA: "allspice",
+      MX: "pimienta gorda",
+      BR: "pimenta-da-jamaica",
+      CO: "pimienta gorda"
+    },
     variants: ["Whole", "Ground"],
     packaging: ["jar", "pouch"],
     tags: ["ground", "spices & seasonings", "western-v0.2", "whole"],
@@ -4552,6 +6611,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ancho Chili Powder",
     aliases: ["ancho chili powder", "ancho chili powder", "chile ancho en polvo", "pimenta ancho em pó"],
+    regionalAliases: {
+      US: "ancho chili powder",
+      CA: "ancho chili powder",
+      MX: "chile ancho en polvo",
+      BR: "pimenta ancho em pó",
+      CO: "chile ancho en polvo"
+    },
     variants: ["chile ancho en polvo"],
     packaging: ["Ground"],
     tags: ["chile ancho en polvo", "spices & seasonings", "western-v0.2"],
@@ -4560,6 +6626,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bay Leaves (Dried)",
     aliases: ["bay leaves", "bay leaves", "hojas de laurel", "folhas de louro"],
+    regionalAliases: {
+      US: "bay leaves",
+      CA: "bay leaves",
+      MX: "hojas de laurel",
+      BR: "folhas de louro",
+      CO: "hojas de laurel"
+    },
     variants: ["hojas de laurel"],
     packaging: ["Whole"],
     tags: ["hojas de laurel", "spices & seasonings", "western-v0.2"],
@@ -4568,6 +6641,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Black Pepper (Ground)",
     aliases: ["black pepper", "black pepper", "pimienta negra", "pimenta-do-reino"],
+    regionalAliases: {
+      US: "black pepper",
+      CA: "black pepper",
+      MX: "pimienta negra",
+      BR: "pimenta-do-reino",
+      CO: "pimienta negra"
+    },
     variants: ["pimienta negra"],
     packaging: ["Fine", "Coarse"],
     tags: ["pimienta negra", "spices & seasonings", "western-v0.2"],
@@ -4576,6 +6656,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cayenne Pepper",
     aliases: ["cayenne", "cayenne", "pimienta cayena", "pimenta caiena"],
+    regionalAliases: {
+      US: "cayenne",
+      CA: "cayenne",
+      MX: "pimienta cayena",
+      BR: "pimenta caiena",
+      CO: "pimienta cayena"
+    },
     variants: ["pimienta cayena"],
     packaging: ["Ground"],
     tags: ["pimienta cayena", "spices & seasonings", "western-v0.2"],
@@ -4584,6 +6671,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chili Powder (Blend)",
     aliases: ["chili powder", "chili powder", "chile en polvo", "tempero chili"],
+    regionalAliases: {
+      US: "chili powder",
+      CA: "chili powder",
+      MX: "chile en polvo",
+      BR: "tempero chili",
+      CO: "chile en polvo"
+    },
     variants: ["chile en polvo"],
     packaging: ["Mild", "Hot"],
     tags: ["chile en polvo", "spices & seasonings", "western-v0.2"],
@@ -4592,6 +6686,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chinese Five-Spice",
     aliases: ["five-spice", "five-spice", "cinco especias", "cinco especiarias"],
+    regionalAliases: {
+      US: "five-spice",
+      CA: "five-spice",
+      MX: "cinco especias",
+      BR: "cinco especiarias",
+      CO: "cinco especias"
+    },
     variants: ["cinco especias"],
     packaging: ["Blend"],
     tags: ["cinco especias", "spices & seasonings", "western-v0.2"],
@@ -4600,6 +6701,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cinnamon (Ground)",
     aliases: ["cinnamon", "cinnamon", "canela", "canela"],
+    regionalAliases: {
+      US: "cinnamon",
+      CA: "cinnamon",
+      MX: "canela",
+      BR: "canela",
+      CO: "canela"
+    },
     variants: ["canela"],
     packaging: ["Cassia", "Ceylon"],
     tags: ["canela", "spices & seasonings", "western-v0.2"],
@@ -4608,6 +6716,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cloves (Whole)",
     aliases: ["cloves", "cloves", "clavos", "cravo-da-índia"],
+    regionalAliases: {
+      US: "cloves",
+      CA: "cloves",
+      MX: "clavos",
+      BR: "cravo-da-índia",
+      CO: "clavos"
+    },
     variants: ["clavos"],
     packaging: ["Whole", "Ground"],
     tags: ["clavos", "spices & seasonings", "western-v0.2"],
@@ -4616,6 +6731,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Coriander (Seed)",
     aliases: ["coriander seed", "coriander seed", "semilla de cilantro", "sementes de coentro"],
+    regionalAliases: {
+      US: "coriander seed",
+      CA: "coriander seed",
+      MX: "semilla de cilantro",
+      BR: "sementes de coentro",
+      CO: "semilla de cilantro"
+    },
     variants: ["semilla de cilantro"],
     packaging: ["Whole", "Ground"],
     tags: ["semilla de cilantro", "spices & seasonings", "western-v0.2"],
@@ -4624,6 +6746,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cumin (Ground)",
     aliases: ["cumin", "cumin", "comino", "cominho"],
+    regionalAliases: {
+      US: "cumin",
+      CA: "cumin",
+      MX: "comino",
+      BR: "cominho",
+      CO: "comino"
+    },
     variants: ["comino"],
     packaging: ["Ground", "Whole"],
     tags: ["comino", "spices & seasonings", "western-v0.2"],
@@ -4632,6 +6761,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Curry Powder (Caribbean)",
     aliases: ["curry powder", "curry powder", "curry", "curry"],
+    regionalAliases: {
+      US: "curry powder",
+      CA: "curry powder",
+      MX: "curry",
+      BR: "curry",
+      CO: "curry"
+    },
     variants: ["curry"],
     packaging: ["Mild", "Hot"],
     tags: ["curry", "spices & seasonings", "western-v0.2"],
@@ -4640,6 +6776,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Garlic Powder",
     aliases: ["garlic powder", "garlic powder", "ajo en polvo", "alho em pó"],
+    regionalAliases: {
+      US: "garlic powder",
+      CA: "garlic powder",
+      MX: "ajo en polvo",
+      BR: "alho em pó",
+      CO: "ajo en polvo"
+    },
     variants: ["ajo en polvo"],
     packaging: ["Granulated", "Powder"],
     tags: ["ajo en polvo", "spices & seasonings", "western-v0.2"],
@@ -4648,6 +6791,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ginger (Ground)",
     aliases: ["ground ginger", "ground ginger", "jengibre en polvo", "gengibre em pó"],
+    regionalAliases: {
+      US: "ground ginger",
+      CA: "ground ginger",
+      MX: "jengibre en polvo",
+      BR: "gengibre em pó",
+      CO: "jengibre en polvo"
+    },
     variants: ["jengibre en polvo"],
     packaging: ["Ground"],
     tags: ["jengibre en polvo", "spices & seasonings", "western-v0.2"],
@@ -4656,6 +6806,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Italian Seasoning",
     aliases: ["Italian seasoning", "Italian seasoning", "condimento italiano", "tempero italiano"],
+    regionalAliases: {
+      US: "Italian seasoning",
+      CA: "Italian seasoning",
+      MX: "condimento italiano",
+      BR: "tempero italiano",
+      CO: "condimento italiano"
+    },
     variants: ["condimento italiano"],
     packaging: ["Blend"],
     tags: ["condimento italiano", "spices & seasonings", "western-v0.2"],
@@ -4664,6 +6821,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jerk Seasoning (Dry)",
     aliases: ["jerk seasoning", "jerk seasoning", "condimento jerk", "condimento jerk", "sèl jerk", "jerk seasoning", "jerk seasoning", "condimento jerk", "tempero jerk", "condimento jerk"],
+    regionalAliases: {
+      JM: "jerk seasoning",
+      TT: "jerk seasoning",
+      PR: "condimento jerk",
+      DO: "condimento jerk",
+      HT: "sèl jerk",
+      US: "jerk seasoning",
+      CA: "jerk seasoning",
+      MX: "condimento jerk",
+      BR: "tempero jerk",
+      CO: "condimento jerk"
+    },
     variants: ["Mild", "Hot"],
     packaging: ["pouch", "jar"],
     tags: ["hot", "mild", "spices & seasonings", "western-v0.2"],
@@ -4672,6 +6841,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Nutmeg (Whole)",
     aliases: ["nutmeg", "nutmeg", "nuez moscada", "noz-moscada"],
+    regionalAliases: {
+      US: "nutmeg",
+      CA: "nutmeg",
+      MX: "nuez moscada",
+      BR: "noz-moscada",
+      CO: "nuez moscada"
+    },
     variants: ["nuez moscada"],
     packaging: ["Whole", "Ground"],
     tags: ["nuez moscada", "spices & seasonings", "western-v0.2"],
@@ -4680,6 +6856,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Onion Powder",
     aliases: ["onion powder", "onion powder", "cebolla en polvo", "cebola em pó"],
+    regionalAliases: {
+      US: "onion powder",
+      CA: "onion powder",
+      MX: "cebolla en polvo",
+      BR: "cebola em pó",
+      CO: "cebolla en polvo"
+    },
     variants: ["cebolla en polvo"],
     packaging: ["Granulated", "Powder"],
     tags: ["cebolla en polvo", "spices & seasonings", "western-v0.2"],
@@ -4688,6 +6871,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Oregano (Dried)",
     aliases: ["oregano", "oregano", "orégano", "orégano"],
+    regionalAliases: {
+      US: "oregano",
+      CA: "oregano",
+      MX: "orégano",
+      BR: "orégano",
+      CO: "orégano"
+    },
     variants: ["orégano"],
     packaging: ["Greek", "Mexican"],
     tags: ["orégano", "spices & seasonings", "western-v0.2"],
@@ -4696,6 +6886,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Paprika (Smoked/Sweet)",
     aliases: ["paprika", "paprika", "pimentón colorau", "páprica"],
+    regionalAliases: {
+      US: "paprika",
+      CA: "paprika",
+      MX: "pimentón colorau",
+      BR: "páprica",
+      CO: "pimentón"
+    },
     variants: ["pimentón"],
     packaging: ["Smoked", "Sweet"],
     tags: ["pimentón", "spices & seasonings", "western-v0.2"],
@@ -4704,6 +6901,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Parsley (Dried)",
     aliases: ["parsley", "parsley", "perejil seco", "salsinha seca"],
+    regionalAliases: {
+      US: "parsley",
+      CA: "parsley",
+      MX: "perejil seco",
+      BR: "salsinha seca",
+      CO: "perejil seco"
+    },
     variants: ["perejil seco"],
     packaging: ["Flakes"],
     tags: ["perejil seco", "spices & seasonings", "western-v0.2"],
@@ -4712,6 +6916,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Rosemary (Dried)",
     aliases: ["rosemary", "rosemary", "romero seco", "alecrim seco"],
+    regionalAliases: {
+      US: "rosemary",
+      CA: "rosemary",
+      MX: "romero seco",
+      BR: "alecrim seco",
+      CO: "romero seco"
+    },
     variants: ["romero seco"],
     packaging: ["Leaves"],
     tags: ["romero seco", "spices & seasonings", "western-v0.2"],
@@ -4720,6 +6931,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Thyme (Dried)",
     aliases: ["thyme", "thyme", "tomillo seco", "tomilho seco"],
+    regionalAliases: {
+      US: "thyme",
+      CA: "thyme",
+      MX: "tomillo seco",
+      BR: "tomilho seco",
+      CO: "tomillo seco"
+    },
     variants: ["tomillo seco"],
     packaging: ["Leaves"],
     tags: ["spices & seasonings", "tomillo seco", "western-v0.2"],
@@ -4728,6 +6946,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Turmeric (Ground)",
     aliases: ["turmeric", "turmeric", "cúrcuma", "cúrcuma"],
+    regionalAliases: {
+      US: "turmeric",
+      CA: "turmeric",
+      MX: "cúrcuma",
+      BR: "cúrcuma",
+      CO: "cúrcuma"
+    },
     variants: ["cúrcuma"],
     packaging: ["Ground"],
     tags: ["cúrcuma", "spices & seasonings", "western-v0.2"],
@@ -4736,6 +6961,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Brownie Mix",
     aliases: ["brownie mix", "brownie mix", "mezcla para brownies", "mistura para brownie"],
+    regionalAliases: {
+      US: "brownie mix",
+      CA: "brownie mix",
+      MX: "mezcla para brownies",
+      BR: "mistura para brownie",
+      CO: "mezcla para brownie"
+    },
     variants: ["mezcla para brownie"],
     packaging: ["Fudge", "Double chocolate"],
     tags: ["mezcla para brownie", "sweets & desserts", "western-v0.2"],
@@ -4744,6 +6976,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Chocolate Syrup",
     aliases: ["chocolate syrup", "chocolate syrup", "jarabe de chocolate", "xarope de chocolate"],
+    regionalAliases: {
+      US: "chocolate syrup",
+      CA: "chocolate syrup",
+      MX: "jarabe de chocolate",
+      BR: "xarope de chocolate",
+      CO: "jarabe de chocolate"
+    },
     variants: ["jarabe de chocolate"],
     packaging: ["Regular", "No-sugar"],
     tags: ["jarabe de chocolate", "sweets & desserts", "western-v0.2"],
@@ -4752,6 +6991,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Cookies (Chocolate Chip)",
     aliases: ["choc chip cookies", "choc chip cookies", "galletas con chispas", "cookies com gotas"],
+    regionalAliases: {
+      US: "choc chip cookies",
+      CA: "choc chip cookies",
+      MX: "galletas con chispas",
+      BR: "cookies com gotas",
+      CO: "galletas con chispas"
+    },
     variants: ["galletas con chispas"],
     packaging: ["Soft", "Crisp"],
     tags: ["galletas con chispas", "sweets & desserts", "western-v0.2"],
@@ -4760,6 +7006,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Gelatin Dessert (Flavored)",
     aliases: ["jelly ", "gelatina", "gelatina", "jèlatin", "jello", "gelatin", "gelatina", "gelatina", "gelatina"],
+    regionalAliases: {
+      JM: "jelly ",
+      PR: "gelatina",
+      DO: "gelatina",
+      HT: "jèlatin",
+      US: "jello",
+      CA: "gelatin",
+      MX: "gelatina",
+      BR: "gelatina",
+      CO: "gelatina"
+    },
     variants: ["Strawberry", "Lime"],
     packaging: ["box"],
     tags: ["lime", "strawberry", "sweets & desserts", "western-v0.2"],
@@ -4768,6 +7025,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Graham Crackers",
     aliases: ["graham crackers", "graham crackers", "galletas graham", "biscoito maisena "],
+    regionalAliases: {
+      US: "graham crackers",
+      CA: "graham crackers",
+      MX: "galletas graham",
+      BR: "biscoito maisena ",
+      CO: "galletas maria "
+    },
     variants: ["galletas maria (≈)"],
     packaging: ["Honey", "Cinnamon"],
     tags: ["galletas maria (≈)", "sweets & desserts", "western-v0.2"],
@@ -4776,6 +7040,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Ice Cream Cones",
     aliases: ["ice cream cones", "ice cream cones", "conos de helado", "cones de sorvete"],
+    regionalAliases: {
+      US: "ice cream cones",
+      CA: "ice cream cones",
+      MX: "conos de helado",
+      BR: "cones de sorvete",
+      CO: "conos de helado"
+    },
     variants: ["conos de helado"],
     packaging: ["Sugar", "Waffle"],
     tags: ["conos de helado", "sweets & desserts", "western-v0.2"],
@@ -4784,6 +7055,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Marshmallows",
     aliases: ["marshmallows", "marshmallows", "malvaviscos", "marshmallow"],
+    regionalAliases: {
+      US: "marshmallows",
+      CA: "marshmallows",
+      MX: "malvaviscos",
+      BR: "marshmallow",
+      CO: "malvaviscos"
+    },
     variants: ["malvaviscos"],
     packaging: ["Regular", "Mini"],
     tags: ["malvaviscos", "sweets & desserts", "western-v0.2"],
@@ -4792,6 +7070,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Pudding Cups (Chocolate/Vanilla)",
     aliases: ["pudding cups", "pudding cups", "postres en vaso", "pudim em copo"],
+    regionalAliases: {
+      US: "pudding cups",
+      CA: "pudding cups",
+      MX: "postres en vaso",
+      BR: "pudim em copo",
+      CO: "postres en vaso"
+    },
     variants: ["postres en vaso"],
     packaging: ["Regular", "Low-fat"],
     tags: ["postres en vaso", "sweets & desserts", "western-v0.2"],
@@ -4800,6 +7085,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Whipped Topping",
     aliases: ["whipped topping", "whipped topping", "crema batida", "cobertura batida"],
+    regionalAliases: {
+      US: "whipped topping",
+      CA: "whipped topping",
+      MX: "crema batida",
+      BR: "cobertura batida",
+      CO: "crema batida"
+    },
     variants: ["crema batida"],
     packaging: ["Aerosol", "Tub"],
     tags: ["crema batida", "sweets & desserts", "western-v0.2"],
@@ -4808,6 +7100,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Acerola (Barbados Cherry)",
     aliases: ["acerola", "acerola", "acerola", "acerola", "seriz", "acerola", "acerola", "acerola", "acerola", "acerola"],
+    regionalAliases: {
+      JM: "acerola",
+      TT: "acerola",
+      PR: "acerola",
+      DO: "acerola",
+      HT: "seriz",
+      US: "acerola",
+      CA: "acerola",
+      MX: "acerola",
+      BR: "acerola",
+      CO: "acerola"
+    },
     variants: ["Fresh", "Pulp"],
     packaging: ["clamshell"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "pulp", "western-v0.2"],
@@ -4816,6 +7120,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "African Star Apple (Caimito Africano)",
     aliases: ["african star apple", "african star apple", "aguaymanto africano ", "abiu "],
+    regionalAliases: {
+      US: "african star apple",
+      CA: "african star apple",
+      MX: "aguaymanto africano ",
+      BR: "abiu ",
+      CO: "níspero africano "
+    },
     variants: ["níspero africano (≈)"],
     packaging: ["Fresh"],
     tags: ["fruits", "níspero africano (≈)", "produce", "produce>fruits", "western-v0.2"],
@@ -4824,6 +7135,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Ambarella (June Plum)",
     aliases: ["June plum", "June plum", "jobos indios", "jobo", "zanmannok", "ambarella", "ambarella", "ciruela de java", "umbú ", "ciruela de java"],
+    regionalAliases: {
+      JM: "June plum",
+      TT: "June plum",
+      PR: "jobos indios",
+      DO: "jobo",
+      HT: "zanmannok",
+      US: "ambarella",
+      CA: "ambarella",
+      MX: "ciruela de java",
+      BR: "umbú ",
+      CO: "ciruela de java"
+    },
     variants: ["Green", "Ripe"],
     packaging: ["loose"],
     tags: ["fruits", "green", "produce", "produce>fruits", "ripe", "western-v0.2"],
@@ -4832,6 +7155,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Ambrosia)",
     aliases: ["Ambrosia apple", "Ambrosia apple", "manzana Ambrosia", "maçã Ambrosia"],
+    regionalAliases: {
+      US: "Ambrosia apple",
+      CA: "Ambrosia apple",
+      MX: "manzana Ambrosia",
+      BR: "maçã Ambrosia",
+      CO: "manzana Ambrosia"
+    },
     variants: ["manzana Ambrosia"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana ambrosia", "produce", "produce>fruits", "western-v0.2"],
@@ -4840,6 +7170,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Envy)",
     aliases: ["Envy apple", "Envy apple", "manzana Envy", "maçã Envy"],
+    regionalAliases: {
+      US: "Envy apple",
+      CA: "Envy apple",
+      MX: "manzana Envy",
+      BR: "maçã Envy",
+      CO: "manzana Envy"
+    },
     variants: ["manzana Envy"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana envy", "produce", "produce>fruits", "western-v0.2"],
@@ -4848,6 +7185,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Gala)",
     aliases: ["Gala apple", "Gala apple", "manzana Gala", "maçã Gala"],
+    regionalAliases: {
+      US: "Gala apple",
+      CA: "Gala apple",
+      MX: "manzana Gala",
+      BR: "maçã Gala",
+      CO: "manzana Gala"
+    },
     variants: ["manzana Gala"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana gala", "produce", "produce>fruits", "western-v0.2"],
@@ -4856,6 +7200,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Honeycrisp)",
     aliases: ["Honeycrisp apple", "Honeycrisp apple", "manzana Honeycrisp", "maçã Honeycrisp"],
+    regionalAliases: {
+      US: "Honeycrisp apple",
+      CA: "Honeycrisp apple",
+      MX: "manzana Honeycrisp",
+      BR: "maçã Honeycrisp",
+      CO: "manzana Honeycrisp"
+    },
     variants: ["manzana Honeycrisp"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana honeycrisp", "produce", "produce>fruits", "western-v0.2"],
@@ -4864,6 +7215,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Apple (Pink Lady)",
     aliases: ["Pink Lady apple", "Pink Lady apple", "manzana Pink Lady", "maçã Pink Lady"],
+    regionalAliases: {
+      US: "Pink Lady apple",
+      CA: "Pink Lady apple",
+      MX: "manzana Pink Lady",
+      BR: "maçã Pink Lady",
+      CO: "manzana Pink Lady"
+    },
     variants: ["manzana Pink Lady"],
     packaging: ["Fresh"],
     tags: ["fruits", "manzana pink lady", "produce", "produce>fruits", "western-v0.2"],
@@ -4872,6 +7230,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Asian Pear",
     aliases: ["asian pear", "asian pear", "pera asiática", "pêra asiática"],
+    regionalAliases: {
+      US: "asian pear",
+      CA: "asian pear",
+      MX: "pera asiática",
+      BR: "pêra asiática",
+      CO: "pera asiática"
+    },
     variants: ["pera asiática"],
     packaging: ["Fresh"],
     tags: ["fruits", "pera asiática", "produce", "produce>fruits", "western-v0.2"],
@@ -4880,6 +7245,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Atemoya",
     aliases: ["atemoya", "atemoya", "atemoya", "atemoya", "atemoya", "atemoya", "atemóia", "atemoya"],
+    regionalAliases: {
+      TT: "atemoya",
+      PR: "atemoya",
+      DO: "atemoya",
+      US: "atemoya",
+      CA: "atemoya",
+      MX: "atemoya",
+      BR: "atemóia",
+      CO: "atemoya"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4888,6 +7263,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Banana Apple (Manzano)",
     aliases: ["apple banana", "apple banana", "plátano manzano", "banana maçã"],
+    regionalAliases: {
+      US: "apple banana",
+      CA: "apple banana",
+      MX: "plátano manzano",
+      BR: "banana maçã",
+      CO: "banano manzano"
+    },
     variants: ["banano manzano"],
     packaging: ["Fresh"],
     tags: ["banano manzano", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4896,6 +7278,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Berries (Mixed)",
     aliases: ["mixed berries", "mixed berries", "frutos rojos", "frutas vermelhas"],
+    regionalAliases: {
+      US: "mixed berries",
+      CA: "mixed berries",
+      MX: "frutos rojos",
+      BR: "frutas vermelhas",
+      CO: "frutos rojos"
+    },
     variants: ["frutos rojos"],
     packaging: ["Strawberry", "Blueberry", "Raspberry"],
     tags: ["fruits", "frutos rojos", "produce", "produce>fruits", "western-v0.2"],
@@ -4904,6 +7293,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Black Currants",
     aliases: ["black currants", "black currants", "grosellas negras", "groselha preta"],
+    regionalAliases: {
+      US: "black currants",
+      CA: "black currants",
+      MX: "grosellas negras",
+      BR: "groselha preta",
+      CO: "grosella negra"
+    },
     variants: ["grosella negra"],
     packaging: ["Fresh", "Dried"],
     tags: ["fruits", "grosella negra", "produce", "produce>fruits", "western-v0.2"],
@@ -4912,6 +7308,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Blood Orange",
     aliases: ["blood orange", "blood orange", "naranja sanguina", "laranja sanguínea"],
+    regionalAliases: {
+      US: "blood orange",
+      CA: "blood orange",
+      MX: "naranja sanguina",
+      BR: "laranja sanguínea",
+      CO: "naranja sanguina"
+    },
     variants: ["naranja sanguina"],
     packaging: ["Fresh"],
     tags: ["fruits", "naranja sanguina", "produce", "produce>fruits", "western-v0.2"],
@@ -4920,6 +7323,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Boysenberry",
     aliases: ["boysenberry", "boysenberry", "zarzamora boysen", "amora boysen"],
+    regionalAliases: {
+      US: "boysenberry",
+      CA: "boysenberry",
+      MX: "zarzamora boysen",
+      BR: "amora boysen",
+      CO: "zarzamora boysen"
+    },
     variants: ["zarzamora boysen"],
     packaging: ["Fresh"],
     tags: ["fruits", "produce", "produce>fruits", "western-v0.2", "zarzamora boysen"],
@@ -4928,6 +7338,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Breadnut (Maya Nut)",
     aliases: ["breadnut", "breadnut", "ramón", "ramón", "breadnut", "breadnut", "ramón", "castanha de ramón", "ramón"],
+    regionalAliases: {
+      JM: "breadnut",
+      TT: "breadnut",
+      PR: "ramón",
+      DO: "ramón",
+      US: "breadnut",
+      CA: "breadnut",
+      MX: "ramón",
+      BR: "castanha de ramón",
+      CO: "ramón"
+    },
     variants: ["Fresh"],
     packaging: ["bag"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4936,6 +7357,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cactus Pear (Prickly Pear)",
     aliases: ["tuna (fruit)", "tuna", "tuna", "fig frans", "tuna", "prickly pear", "tuna", "figo da índia", "tuna"],
+    regionalAliases: {
+      JM: "tuna (fruit)",
+      PR: "tuna",
+      DO: "tuna",
+      HT: "fig frans",
+      US: "tuna",
+      CA: "prickly pear",
+      MX: "tuna",
+      BR: "figo da índia",
+      CO: "tuna"
+    },
     variants: ["Green", "Red"],
     packaging: ["clamshell"],
     tags: ["fruits", "green", "produce", "produce>fruits", "red", "western-v0.2"],
@@ -4944,6 +7376,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Canistel (Eggfruit)",
     aliases: ["eggfruit", "eggfruit", "canistel", "canistel", "kenistèl", "canistel", "canistel", "canistel", "canistel", "canistel"],
+    regionalAliases: {
+      JM: "eggfruit",
+      TT: "eggfruit",
+      PR: "canistel",
+      DO: "canistel",
+      HT: "kenistèl",
+      US: "canistel",
+      CA: "canistel",
+      MX: "canistel",
+      BR: "canistel",
+      CO: "canistel"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4952,6 +7396,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cape Gooseberry (Physalis)",
     aliases: ["physalis", "alquequenje", "uvilla", "zoranj peyi", "groundcherry", "groundcherry", "physalis", "physalis", "uchuva"],
+    regionalAliases: {
+      TT: "physalis",
+      PR: "alquequenje",
+      DO: "uvilla",
+      HT: "zoranj peyi",
+      US: "groundcherry",
+      CA: "groundcherry",
+      MX: "physalis",
+      BR: "physalis",
+      CO: "uchuva"
+    },
     variants: ["Husked", "Dewaxed"],
     packaging: ["clam"],
     tags: ["dewaxed", "fruits", "husked", "produce", "produce>fruits", "western-v0.2"],
@@ -4965,6 +7420,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Clementine",
     aliases: ["clementine", "clementine", "clementina", "clementina"],
+    regionalAliases: {
+      US: "clementine",
+      CA: "clementine",
+      MX: "clementina",
+      BR: "clementina",
+      CO: "clementina"
+    },
     variants: ["clementina"],
     packaging: ["Seedless"],
     tags: ["clementina", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4973,6 +7435,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Cranberries (Fresh)",
     aliases: ["cranberries", "cranberries", "arándanos rojos", "oxicoco"],
+    regionalAliases: {
+      US: "cranberries",
+      CA: "cranberries",
+      MX: "arándanos rojos",
+      BR: "oxicoco",
+      CO: "arándanos rojos"
+    },
     variants: ["arándanos rojos"],
     packaging: ["Fresh", "Frozen"],
     tags: ["arándanos rojos", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4981,6 +7450,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Custard Apple",
     aliases: ["sweetsop ", "anón", "anón", "custard apple", "custard apple", "anón", "fruta-do-conde", "anón"],
+    regionalAliases: {
+      JM: "sweetsop ",
+      PR: "anón",
+      DO: "anón",
+      US: "custard apple",
+      CA: "custard apple",
+      MX: "anón",
+      BR: "fruta-do-conde",
+      CO: "anón"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4989,6 +7468,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Dates (Deglet Noor)",
     aliases: ["dates", "dates", "dátiles", "tâmaras"],
+    regionalAliases: {
+      US: "dates",
+      CA: "dates",
+      MX: "dátiles",
+      BR: "tâmaras",
+      CO: "dátiles"
+    },
     variants: ["dátiles"],
     packaging: ["Deglet Noor"],
     tags: ["dátiles", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -4997,6 +7483,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Dates (Halawi)",
     aliases: ["dates", "dates", "dátiles", "tâmaras"],
+    regionalAliases: {
+      US: "dates",
+      CA: "dates",
+      MX: "dátiles",
+      BR: "tâmaras",
+      CO: "dátiles"
+    },
     variants: ["dátiles"],
     packaging: ["Halawi"],
     tags: ["dátiles", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5005,6 +7498,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Feijoa (Pineapple Guava)",
     aliases: ["feijoa", "feijoa", "feijoa", "feijoa", "feijoa", "feijoa", "feijoa", "feijoa", "feijoa"],
+    regionalAliases: {
+      JM: "feijoa",
+      TT: "feijoa",
+      PR: "feijoa",
+      DO: "feijoa",
+      US: "feijoa",
+      CA: "feijoa",
+      MX: "feijoa",
+      BR: "feijoa",
+      CO: "feijoa"
+    },
     variants: ["Fresh"],
     packaging: ["clamshell"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5013,6 +7517,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Goji Berry",
     aliases: ["goji", "goji", "bayas goji", "goji"],
+    regionalAliases: {
+      US: "goji",
+      CA: "goji",
+      MX: "bayas goji",
+      BR: "goji",
+      CO: "goji"
+    },
     variants: ["goji"],
     packaging: ["Dried", "Fresh"],
     tags: ["fruits", "goji", "produce", "produce>fruits", "western-v0.2"],
@@ -5021,6 +7532,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Gooseberries (Green)",
     aliases: ["gooseberries", "gooseberries", "grosellas verdes", "groselhas"],
+    regionalAliases: {
+      US: "gooseberries",
+      CA: "gooseberries",
+      MX: "grosellas verdes",
+      BR: "groselhas",
+      CO: "grosella"
+    },
     variants: ["grosella"],
     packaging: ["Fresh"],
     tags: ["fruits", "grosella", "produce", "produce>fruits", "western-v0.2"],
@@ -5029,6 +7547,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Goldenberries",
     aliases: ["goldenberry", "aguaymanto", "aguaymanto", "goldenberry", "goldenberry", "aguaymanto", "physalis", "uchuva"],
+    regionalAliases: {
+      TT: "goldenberry",
+      PR: "aguaymanto",
+      DO: "aguaymanto",
+      US: "goldenberry",
+      CA: "goldenberry",
+      MX: "aguaymanto",
+      BR: "physalis",
+      CO: "uchuva"
+    },
     variants: ["Fresh"],
     packaging: ["clamshell"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5037,6 +7565,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Grapes (Black Seedless)",
     aliases: ["black grapes", "black grapes", "uvas negras", "uvas pretas"],
+    regionalAliases: {
+      US: "black grapes",
+      CA: "black grapes",
+      MX: "uvas negras",
+      BR: "uvas pretas",
+      CO: "uvas negras"
+    },
     variants: ["uvas negras"],
     packaging: ["Seedless"],
     tags: ["fruits", "produce", "produce>fruits", "uvas negras", "western-v0.2"],
@@ -5045,6 +7580,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Grapes (Cotton Candy)",
     aliases: ["cotton candy grapes", "cotton candy grapes", "uvas cotton candy", "uvas cotton candy"],
+    regionalAliases: {
+      US: "cotton candy grapes",
+      CA: "cotton candy grapes",
+      MX: "uvas cotton candy",
+      BR: "uvas cotton candy",
+      CO: "uvas cotton candy"
+    },
     variants: ["uvas cotton candy"],
     packaging: ["Seedless"],
     tags: ["fruits", "produce", "produce>fruits", "uvas cotton candy", "western-v0.2"],
@@ -5053,6 +7595,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Grenadilla (Sweet Passionfruit)",
     aliases: ["grenadilla", "granadilla", "granadilla", "grenadilla", "grenadilla", "granadilla", "granadilla", "granadilla"],
+    regionalAliases: {
+      TT: "grenadilla",
+      PR: "granadilla",
+      DO: "granadilla",
+      US: "grenadilla",
+      CA: "grenadilla",
+      MX: "granadilla",
+      BR: "granadilla",
+      CO: "granadilla"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5061,6 +7613,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Guinep (Spanish Lime)",
     aliases: ["guinep", "chenet", "quenepa", "quenepa", "kenèp", "spanish lime", "spanish lime", "limoncillo", "limão caiena ", "mamoncillo"],
+    regionalAliases: {
+      JM: "guinep",
+      TT: "chenet",
+      PR: "quenepa",
+      DO: "quenepa",
+      HT: "kenèp",
+      US: "spanish lime",
+      CA: "spanish lime",
+      MX: "limoncillo",
+      BR: "limão caiena ",
+      CO: "mamoncillo"
+    },
     variants: ["Fresh"],
     packaging: ["bunch"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5074,6 +7638,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Jabuticaba",
     aliases: ["jabuticaba", "jabuticaba", "jabuticaba", "jabuticaba"],
+    regionalAliases: {
+      US: "jabuticaba",
+      CA: "jabuticaba",
+      MX: "jabuticaba",
+      BR: "jabuticaba",
+      CO: "jabuticaba"
+    },
     variants: ["jabuticaba"],
     packaging: ["Fresh"],
     tags: ["fruits", "jabuticaba", "produce", "produce>fruits", "western-v0.2"],
@@ -5082,6 +7653,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Jamaican Apple (Otaheite)",
     aliases: ["otaheite apple", "otaheite", "manzana malaya", "manzana malaya", "pòm wouj", "malay apple", "malay apple", "manzana malaya", "jambo", "manzana de agua"],
+    regionalAliases: {
+      JM: "otaheite apple",
+      TT: "otaheite",
+      PR: "manzana malaya",
+      DO: "manzana malaya",
+      HT: "pòm wouj",
+      US: "malay apple",
+      CA: "malay apple",
+      MX: "manzana malaya",
+      BR: "jambo",
+      CO: "manzana de agua"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5090,6 +7673,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Jujube (Chinese Date)",
     aliases: ["jujube", "jujube", "azufaifa", "jujuba"],
+    regionalAliases: {
+      US: "jujube",
+      CA: "jujube",
+      MX: "azufaifa",
+      BR: "jujuba",
+      CO: "azufaifa"
+    },
     variants: ["azufaifa"],
     packaging: ["Fresh", "Dried"],
     tags: ["azufaifa", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5098,6 +7688,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Kiwiberry",
     aliases: ["kiwiberry", "kiwiberry", "kiwiberry", "kiwiberry"],
+    regionalAliases: {
+      US: "kiwiberry",
+      CA: "kiwiberry",
+      MX: "kiwiberry",
+      BR: "kiwiberry",
+      CO: "kiwiberry"
+    },
     variants: ["kiwiberry"],
     packaging: ["Fresh"],
     tags: ["fruits", "kiwiberry", "produce", "produce>fruits", "western-v0.2"],
@@ -5106,6 +7703,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Kumquat",
     aliases: ["kumquat", "kumquat", "cumquat", "quincã"],
+    regionalAliases: {
+      US: "kumquat",
+      CA: "kumquat",
+      MX: "cumquat",
+      BR: "quincã",
+      CO: "kumquat"
+    },
     variants: ["kumquat"],
     packaging: ["Fresh"],
     tags: ["fruits", "kumquat", "produce", "produce>fruits", "western-v0.2"],
@@ -5114,6 +7718,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Longan",
     aliases: ["longan", "longan", "longan", "longan"],
+    regionalAliases: {
+      US: "longan",
+      CA: "longan",
+      MX: "longan",
+      BR: "longan",
+      CO: "longan"
+    },
     variants: ["longan"],
     packaging: ["Fresh"],
     tags: ["fruits", "longan", "produce", "produce>fruits", "western-v0.2"],
@@ -5122,6 +7733,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Lychee",
     aliases: ["lychee", "lychee", "liche", "lichia"],
+    regionalAliases: {
+      US: "lychee",
+      CA: "lychee",
+      MX: "liche",
+      BR: "lichia",
+      CO: "liche"
+    },
     variants: ["liche"],
     packaging: ["Fresh"],
     tags: ["fruits", "liche", "produce", "produce>fruits", "western-v0.2"],
@@ -5130,6 +7748,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mandarin (Easy Peeler)",
     aliases: ["mandarin", "mandarin", "mandarina", "mandarina"],
+    regionalAliases: {
+      US: "mandarin",
+      CA: "mandarin",
+      MX: "mandarina",
+      BR: "mandarina",
+      CO: "mandarina"
+    },
     variants: ["mandarina"],
     packaging: ["Seedless"],
     tags: ["fruits", "mandarina", "produce", "produce>fruits", "western-v0.2"],
@@ -5138,6 +7763,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mamey Sapote",
     aliases: ["sapote", "sapote", "mamey", "mamey", "mamey", "sapote", "sapote", "mamey", "sapoti", "mamey"],
+    regionalAliases: {
+      JM: "sapote",
+      TT: "sapote",
+      PR: "mamey",
+      DO: "mamey",
+      HT: "mamey",
+      US: "sapote",
+      CA: "sapote",
+      MX: "mamey",
+      BR: "sapoti",
+      CO: "mamey"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5146,6 +7783,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mangosteen",
     aliases: ["mangosteen", "mangosteen", "mangostán", "mangostão"],
+    regionalAliases: {
+      US: "mangosteen",
+      CA: "mangosteen",
+      MX: "mangostán",
+      BR: "mangostão",
+      CO: "mangostán"
+    },
     variants: ["mangostán"],
     packaging: ["Fresh"],
     tags: ["fruits", "mangostán", "produce", "produce>fruits", "western-v0.2"],
@@ -5154,6 +7798,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mineral Banana (Burro)",
     aliases: ["burro", "plátano burro", "guineo burro", "burro banana", "burro banana", "plátano burro", "banana pão", "banano topocho"],
+    regionalAliases: {
+      TT: "burro",
+      PR: "plátano burro",
+      DO: "guineo burro",
+      US: "burro banana",
+      CA: "burro banana",
+      MX: "plátano burro",
+      BR: "banana pão",
+      CO: "banano topocho"
+    },
     variants: ["Green", "Ripe"],
     packaging: ["bunch"],
     tags: ["fruits", "green", "produce", "produce>fruits", "ripe", "western-v0.2"],
@@ -5162,6 +7816,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Nance",
     aliases: ["nance", "nance", "nance", "nance"],
+    regionalAliases: {
+      US: "nance",
+      CA: "nance",
+      MX: "nance",
+      BR: "nance",
+      CO: "nance"
+    },
     variants: ["nance"],
     packaging: ["Fresh", "Jarred"],
     tags: ["fruits", "nance", "produce", "produce>fruits", "western-v0.2"],
@@ -5170,6 +7831,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Nectarine",
     aliases: ["nectarine", "nectarine", "nectarina", "nectarina"],
+    regionalAliases: {
+      US: "nectarine",
+      CA: "nectarine",
+      MX: "nectarina",
+      BR: "nectarina",
+      CO: "nectarina"
+    },
     variants: ["nectarina"],
     packaging: ["Yellow", "White"],
     tags: ["fruits", "nectarina", "produce", "produce>fruits", "western-v0.2"],
@@ -5178,6 +7846,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Orange (Blood)",
     aliases: ["blood orange", "blood orange", "naranja sanguina", "laranja sanguínea"],
+    regionalAliases: {
+      US: "blood orange",
+      CA: "blood orange",
+      MX: "naranja sanguina",
+      BR: "laranja sanguínea",
+      CO: "naranja sanguina"
+    },
     variants: ["naranja sanguina"],
     packaging: ["Fresh"],
     tags: ["fruits", "naranja sanguina", "produce", "produce>fruits", "western-v0.2"],
@@ -5186,6 +7861,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pear (Asian)",
     aliases: ["asian pear", "asian pear", "pera asiática", "pêra asiática"],
+    regionalAliases: {
+      US: "asian pear",
+      CA: "asian pear",
+      MX: "pera asiática",
+      BR: "pêra asiática",
+      CO: "pera asiática"
+    },
     variants: ["pera asiática"],
     packaging: ["Fresh"],
     tags: ["fruits", "pera asiática", "produce", "produce>fruits", "western-v0.2"],
@@ -5194,6 +7876,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Persimmon (Fuyu)",
     aliases: ["persimmon", "persimmon", "caqui", "caqui"],
+    regionalAliases: {
+      US: "persimmon",
+      CA: "persimmon",
+      MX: "caqui",
+      BR: "caqui",
+      CO: "caqui"
+    },
     variants: ["caqui"],
     packaging: ["Fuyu", "Hachiya"],
     tags: ["caqui", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5202,6 +7891,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pineberry",
     aliases: ["pineberry", "pineberry", "fresa blanca", "morango branco"],
+    regionalAliases: {
+      US: "pineberry",
+      CA: "pineberry",
+      MX: "fresa blanca",
+      BR: "morango branco",
+      CO: "fresa blanca"
+    },
     variants: ["fresa blanca"],
     packaging: ["Fresh"],
     tags: ["fresa blanca", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5215,6 +7911,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pluot",
     aliases: ["pluot", "pluot", "pluot", "pluote "],
+    regionalAliases: {
+      US: "pluot",
+      CA: "pluot",
+      MX: "pluot",
+      BR: "pluote ",
+      CO: "pluot"
+    },
     variants: ["pluot"],
     packaging: ["Fresh"],
     tags: ["fruits", "pluot", "produce", "produce>fruits", "western-v0.2"],
@@ -5223,6 +7926,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pomelo",
     aliases: ["pomelo", "pomelo", "toronja", "pomelo"],
+    regionalAliases: {
+      US: "pomelo",
+      CA: "pomelo",
+      MX: "toronja",
+      BR: "pomelo",
+      CO: "toronja"
+    },
     variants: ["toronja"],
     packaging: ["Fresh"],
     tags: ["fruits", "produce", "produce>fruits", "toronja", "western-v0.2"],
@@ -5236,6 +7946,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Quince",
     aliases: ["quince", "quince", "membrillo", "marmeleiro"],
+    regionalAliases: {
+      US: "quince",
+      CA: "quince",
+      MX: "membrillo",
+      BR: "marmeleiro",
+      CO: "membrillo"
+    },
     variants: ["membrillo"],
     packaging: ["Fresh"],
     tags: ["fruits", "membrillo", "produce", "produce>fruits", "western-v0.2"],
@@ -5244,6 +7961,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Rambutan",
     aliases: ["rambutan", "rambutan", "rambután", "rambutã"],
+    regionalAliases: {
+      US: "rambutan",
+      CA: "rambutan",
+      MX: "rambután",
+      BR: "rambutã",
+      CO: "rambután"
+    },
     variants: ["rambután"],
     packaging: ["Fresh"],
     tags: ["fruits", "produce", "produce>fruits", "rambután", "western-v0.2"],
@@ -5252,6 +7976,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Sapodilla (Naseberry)",
     aliases: ["naseberry", "naseberry", "sapodilla", "sapote", "nazbèri", "sapodilla", "sapodilla", "níspero", "sapoti", "níspero"],
+    regionalAliases: {
+      JM: "naseberry",
+      TT: "naseberry",
+      PR: "sapodilla",
+      DO: "sapote",
+      HT: "nazbèri",
+      US: "sapodilla",
+      CA: "sapodilla",
+      MX: "níspero",
+      BR: "sapoti",
+      CO: "níspero"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5260,6 +7996,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Satsuma",
     aliases: ["satsuma", "satsuma", "satsuma", "satsuma"],
+    regionalAliases: {
+      US: "satsuma",
+      CA: "satsuma",
+      MX: "satsuma",
+      BR: "satsuma",
+      CO: "satsuma"
+    },
     variants: ["satsuma"],
     packaging: ["Seedless"],
     tags: ["fruits", "produce", "produce>fruits", "satsuma", "western-v0.2"],
@@ -5268,6 +8011,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Sugar Apple (Sweetsop)",
     aliases: ["sweetsop", "sweetsop", "anón", "anón", "zanmann", "sugar apple", "sugar apple", "anón", "fruta-do-conde", "anón"],
+    regionalAliases: {
+      JM: "sweetsop",
+      TT: "sweetsop",
+      PR: "anón",
+      DO: "anón",
+      HT: "zanmann",
+      US: "sugar apple",
+      CA: "sugar apple",
+      MX: "anón",
+      BR: "fruta-do-conde",
+      CO: "anón"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5276,6 +8031,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Tangelo",
     aliases: ["tangelo", "tangelo", "tangelo", "tangelo"],
+    regionalAliases: {
+      US: "tangelo",
+      CA: "tangelo",
+      MX: "tangelo",
+      BR: "tangelo",
+      CO: "tangelo"
+    },
     variants: ["tangelo"],
     packaging: ["Minneola", "Orlando"],
     tags: ["fruits", "produce", "produce>fruits", "tangelo", "western-v0.2"],
@@ -5284,6 +8046,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Tangerine",
     aliases: ["tangerine", "tangerine", "mandarina", "tangerina"],
+    regionalAliases: {
+      US: "tangerine",
+      CA: "tangerine",
+      MX: "mandarina",
+      BR: "tangerina",
+      CO: "mandarina"
+    },
     variants: ["mandarina"],
     packaging: ["Seedless"],
     tags: ["fruits", "mandarina", "produce", "produce>fruits", "western-v0.2"],
@@ -5292,6 +8061,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Ugli Fruit (Jamaican Tangelo)",
     aliases: ["ugli fruit", "ugli fruit", "toronja ugli", "toronja ugli", "ugli", "fresh tangelo", "fresh tangelo", "ugli", "ugli", "ugli"],
+    regionalAliases: {
+      JM: "ugli fruit",
+      TT: "ugli fruit",
+      PR: "toronja ugli",
+      DO: "toronja ugli",
+      HT: "ugli",
+      US: "fresh tangelo",
+      CA: "fresh tangelo",
+      MX: "ugli",
+      BR: "ugli",
+      CO: "ugli"
+    },
     variants: ["Fresh"],
     packaging: ["loose"],
     tags: ["fresh", "fruits", "produce", "produce>fruits", "western-v0.2"],
@@ -5300,6 +8081,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "White Sapote",
     aliases: ["white sapote", "white sapote", "zapote blanco", "sapote branco"],
+    regionalAliases: {
+      US: "white sapote",
+      CA: "white sapote",
+      MX: "zapote blanco",
+      BR: "sapote branco",
+      CO: "zapote blanco"
+    },
     variants: ["zapote blanco"],
     packaging: ["Fresh"],
     tags: ["fruits", "produce", "produce>fruits", "western-v0.2", "zapote blanco"],
@@ -5308,6 +8096,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Yali Pear",
     aliases: ["yali pear", "yali pear", "pera yali", "pêra yali"],
+    regionalAliases: {
+      US: "yali pear",
+      CA: "yali pear",
+      MX: "pera yali",
+      BR: "pêra yali",
+      CO: "pera yali"
+    },
     variants: ["pera yali"],
     packaging: ["Fresh"],
     tags: ["fruits", "pera yali", "produce", "produce>fruits", "western-v0.2"],
@@ -5316,6 +8111,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Acorn Squash",
     aliases: ["acorn squash", "acorn squash", "calabaza bellota", "abóbora bolota"],
+    regionalAliases: {
+      US: "acorn squash",
+      CA: "acorn squash",
+      MX: "calabaza bellota",
+      BR: "abóbora bolota",
+      CO: "calabaza bellota"
+    },
     variants: ["calabaza bellota"],
     packaging: ["Whole", "Half"],
     tags: ["calabaza bellota", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5324,6 +8126,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Anaheim Pepper",
     aliases: ["anaheim pepper", "anaheim pepper", "chile anaheim", "pimenta anaheim"],
+    regionalAliases: {
+      US: "anaheim pepper",
+      CA: "anaheim pepper",
+      MX: "chile anaheim",
+      BR: "pimenta anaheim",
+      CO: "chile anaheim"
+    },
     variants: ["chile anaheim"],
     packaging: ["Fresh"],
     tags: ["chile anaheim", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5332,6 +8141,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Arugula (Rocket)",
     aliases: ["arugula", "arugula", "rúcula", "rúcula"],
+    regionalAliases: {
+      US: "arugula",
+      CA: "arugula",
+      MX: "rúcula",
+      BR: "rúcula",
+      CO: "rúcula"
+    },
     variants: ["rúcula"],
     packaging: ["Baby", "Wild"],
     tags: ["produce", "produce>vegetables", "rúcula", "vegetables", "western-v0.2"],
@@ -5340,6 +8156,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Bean Sprouts (Mung)",
     aliases: ["bean sprouts", "bean sprouts", "brotes de soya", "broto de feijão"],
+    regionalAliases: {
+      US: "bean sprouts",
+      CA: "bean sprouts",
+      MX: "brotes de soya",
+      BR: "broto de feijão",
+      CO: "brotes de soya"
+    },
     variants: ["brotes de soya"],
     packaging: ["Fresh"],
     tags: ["brotes de soya", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5348,6 +8171,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Bitter Melon",
     aliases: ["cerasee (≠ herb)", "karaila", "melón amargo", "melón amargo", "melon anmè", "bitter melon", "bitter melon", "melón amargo", "melão amargo", "melón amargo"],
+    regionalAliases: {
+      JM: "cerasee (≠ herb)",
+      TT: "karaila",
+      PR: "melón amargo",
+      DO: "melón amargo",
+      HT: "melon anmè",
+      US: "bitter melon",
+      CA: "bitter melon",
+      MX: "melón amargo",
+      BR: "melão amargo",
+      CO: "melón amargo"
+    },
     variants: ["Fresh"],
     packaging: ["bag"],
     tags: ["fresh", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5356,6 +8191,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Butternut Squash",
     aliases: ["butternut squash", "butternut squash", "calabaza butternut", "abóbora-menina"],
+    regionalAliases: {
+      US: "butternut squash",
+      CA: "butternut squash",
+      MX: "calabaza butternut",
+      BR: "abóbora-menina",
+      CO: "calabaza butternut"
+    },
     variants: ["calabaza butternut"],
     packaging: ["Whole", "Cubed"],
     tags: ["calabaza butternut", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5364,6 +8206,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Celeriac (Celery Root)",
     aliases: ["celeriac", "celeriac", "apionabo", "aipo-rábano"],
+    regionalAliases: {
+      US: "celeriac",
+      CA: "celeriac",
+      MX: "apionabo",
+      BR: "aipo-rábano",
+      CO: "apionabo"
+    },
     variants: ["apionabo"],
     packaging: ["Whole"],
     tags: ["apionabo", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5372,6 +8221,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Chili Pepper (Habanero)",
     aliases: ["habanero", "habanero", "chile habanero", "pimenta habanero"],
+    regionalAliases: {
+      US: "habanero",
+      CA: "habanero",
+      MX: "chile habanero",
+      BR: "pimenta habanero",
+      CO: "chile habanero"
+    },
     variants: ["chile habanero"],
     packaging: ["Fresh"],
     tags: ["chile habanero", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5380,6 +8236,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Chili Pepper (Poblano)",
     aliases: ["poblano", "poblano", "chile poblano", "pimenta poblano"],
+    regionalAliases: {
+      US: "poblano",
+      CA: "poblano",
+      MX: "chile poblano",
+      BR: "pimenta poblano",
+      CO: "chile poblano"
+    },
     variants: ["chile poblano"],
     packaging: ["Fresh"],
     tags: ["chile poblano", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5388,6 +8251,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Chili Pepper (Serrano)",
     aliases: ["serrano", "serrano", "chile serrano", "pimenta serrano"],
+    regionalAliases: {
+      US: "serrano",
+      CA: "serrano",
+      MX: "chile serrano",
+      BR: "pimenta serrano",
+      CO: "chile serrano"
+    },
     variants: ["chile serrano"],
     packaging: ["Fresh"],
     tags: ["chile serrano", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5396,6 +8266,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Collard Greens",
     aliases: ["collaloo (≈ amaranth)", "collard greens", "coles", "coles", "collard greens", "collard greens", "coles", "couve", "coles"],
+    regionalAliases: {
+      JM: "collaloo (≈ amaranth)",
+      TT: "collard greens",
+      PR: "coles",
+      DO: "coles",
+      US: "collard greens",
+      CA: "collard greens",
+      MX: "coles",
+      BR: "couve",
+      CO: "coles"
+    },
     variants: ["Bunch"],
     packaging: ["banded"],
     tags: ["bunch", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5404,6 +8285,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Daikon Radish",
     aliases: ["daikon", "daikon", "daikon", "daikon"],
+    regionalAliases: {
+      US: "daikon",
+      CA: "daikon",
+      MX: "daikon",
+      BR: "daikon",
+      CO: "daikon"
+    },
     variants: ["daikon"],
     packaging: ["Whole"],
     tags: ["daikon", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5412,6 +8300,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Edamame (Soybean)",
     aliases: ["edamame", "edamame", "edamame", "edamame"],
+    regionalAliases: {
+      US: "edamame",
+      CA: "edamame",
+      MX: "edamame",
+      BR: "edamame",
+      CO: "edamame"
+    },
     variants: ["edamame"],
     packaging: ["Pods", "Shelled"],
     tags: ["edamame", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5420,6 +8315,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Endive (Belgian)",
     aliases: ["endive", "endive", "endivia", "endívia"],
+    regionalAliases: {
+      US: "endive",
+      CA: "endive",
+      MX: "endivia",
+      BR: "endívia",
+      CO: "endivia"
+    },
     variants: ["endivia"],
     packaging: ["Whole"],
     tags: ["endivia", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5428,6 +8330,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Fennel Bulb",
     aliases: ["fennel", "fennel", "hinojo", "funcho"],
+    regionalAliases: {
+      US: "fennel",
+      CA: "fennel",
+      MX: "hinojo",
+      BR: "funcho",
+      CO: "hinojo"
+    },
     variants: ["hinojo"],
     packaging: ["Whole", "Sliced"],
     tags: ["hinojo", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5436,6 +8345,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Garlic Scapes",
     aliases: ["garlic scapes", "garlic scapes", "brotes de ajo", "broto de alho"],
+    regionalAliases: {
+      US: "garlic scapes",
+      CA: "garlic scapes",
+      MX: "brotes de ajo",
+      BR: "broto de alho",
+      CO: "brotes de ajo"
+    },
     variants: ["brotes de ajo"],
     packaging: ["Fresh"],
     tags: ["brotes de ajo", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5444,6 +8360,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Horseradish Root",
     aliases: ["horseradish", "horseradish", "rábano picante", "raiz-forte"],
+    regionalAliases: {
+      US: "horseradish",
+      CA: "horseradish",
+      MX: "rábano picante",
+      BR: "raiz-forte",
+      CO: "rábano picante"
+    },
     variants: ["rábano picante"],
     packaging: ["Fresh", "Prepared"],
     tags: ["produce", "produce>vegetables", "rábano picante", "vegetables", "western-v0.2"],
@@ -5452,6 +8375,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Jicama",
     aliases: ["jicama", "jicama", "jícama", "jícama"],
+    regionalAliases: {
+      US: "jicama",
+      CA: "jicama",
+      MX: "jícama",
+      BR: "jícama",
+      CO: "jícama"
+    },
     variants: ["jícama"],
     packaging: ["Whole", "Sticks"],
     tags: ["jícama", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5460,6 +8390,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Kohlrabi",
     aliases: ["kohlrabi", "kohlrabi", "colirrábano", "couve-rábano"],
+    regionalAliases: {
+      US: "kohlrabi",
+      CA: "kohlrabi",
+      MX: "colirrábano",
+      BR: "couve-rábano",
+      CO: "colinabo"
+    },
     variants: ["colinabo"],
     packaging: ["Green", "Purple"],
     tags: ["colinabo", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5468,6 +8405,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Malanga (Yautía)",
     aliases: ["malanga", "malanga", "yautía", "yautía", "malanga", "malanga", "malanga", "yautía", "inhame-cará", "ñame"],
+    regionalAliases: {
+      JM: "malanga",
+      TT: "malanga",
+      PR: "yautía",
+      DO: "yautía",
+      HT: "malanga",
+      US: "malanga",
+      CA: "malanga",
+      MX: "yautía",
+      BR: "inhame-cará",
+      CO: "ñame"
+    },
     variants: ["White", "Lila"],
     packaging: ["bag"],
     tags: ["lila", "produce", "produce>vegetables", "vegetables", "western-v0.2", "white"],
@@ -5476,6 +8425,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mushroom (Button)",
     aliases: ["white mushrooms", "white mushrooms", "champiñón", "champignon"],
+    regionalAliases: {
+      US: "white mushrooms",
+      CA: "white mushrooms",
+      MX: "champiñón",
+      BR: "champignon",
+      CO: "champiñón"
+    },
     variants: ["champiñón"],
     packaging: ["Whole", "Sliced"],
     tags: ["champiñón", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5484,6 +8440,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mushroom (Cremini)",
     aliases: ["cremini", "cremini", "cremini", "cremini"],
+    regionalAliases: {
+      US: "cremini",
+      CA: "cremini",
+      MX: "cremini",
+      BR: "cremini",
+      CO: "cremini"
+    },
     variants: ["cremini"],
     packaging: ["Whole", "Sliced"],
     tags: ["cremini", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5492,6 +8455,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mushroom (Oyster)",
     aliases: ["oyster mushrooms", "oyster mushrooms", "seta", "shimeji "],
+    regionalAliases: {
+      US: "oyster mushrooms",
+      CA: "oyster mushrooms",
+      MX: "seta",
+      BR: "shimeji ",
+      CO: "seta"
+    },
     variants: ["seta"],
     packaging: ["Whole"],
     tags: ["produce", "produce>vegetables", "seta", "vegetables", "western-v0.2"],
@@ -5500,6 +8470,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mushroom (Portobello)",
     aliases: ["portobello", "portobello", "portobello", "portobello"],
+    regionalAliases: {
+      US: "portobello",
+      CA: "portobello",
+      MX: "portobello",
+      BR: "portobello",
+      CO: "portobello"
+    },
     variants: ["portobello"],
     packaging: ["Cap", "Sliced"],
     tags: ["portobello", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5508,6 +8485,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mushroom (Shiitake)",
     aliases: ["shiitake", "shiitake", "shiitake", "shiitake"],
+    regionalAliases: {
+      US: "shiitake",
+      CA: "shiitake",
+      MX: "shiitake",
+      BR: "shiitake",
+      CO: "shiitake"
+    },
     variants: ["shiitake"],
     packaging: ["Fresh", "Dried"],
     tags: ["produce", "produce>vegetables", "shiitake", "vegetables", "western-v0.2"],
@@ -5516,6 +8500,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Mustard Greens",
     aliases: ["mustard greens", "mustard greens", "mostaza", "mostarda"],
+    regionalAliases: {
+      US: "mustard greens",
+      CA: "mustard greens",
+      MX: "mostaza",
+      BR: "mostarda",
+      CO: "mostaza"
+    },
     variants: ["mostaza"],
     packaging: ["Bunch"],
     tags: ["mostaza", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5524,6 +8515,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Napa Cabbage",
     aliases: ["napa cabbage", "napa cabbage", "col china", "acelga chinesa "],
+    regionalAliases: {
+      US: "napa cabbage",
+      CA: "napa cabbage",
+      MX: "col china",
+      BR: "acelga chinesa ",
+      CO: "col china"
+    },
     variants: ["col china"],
     packaging: ["Whole"],
     tags: ["col china", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5532,6 +8530,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Nopal (Cactus Pads)",
     aliases: ["nopales", "nopales", "nopal", "nopales"],
+    regionalAliases: {
+      US: "nopales",
+      CA: "nopales",
+      MX: "nopal",
+      BR: "nopales",
+      CO: "nopal"
+    },
     variants: ["nopal"],
     packaging: ["Whole", "Sliced"],
     tags: ["nopal", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5540,6 +8545,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Parsnip",
     aliases: ["parsnip", "parsnip", "chirivía", "pastinaca"],
+    regionalAliases: {
+      US: "parsnip",
+      CA: "parsnip",
+      MX: "chirivía",
+      BR: "pastinaca",
+      CO: "chirivía"
+    },
     variants: ["chirivía"],
     packaging: ["Whole"],
     tags: ["chirivía", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5548,6 +8560,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Peas (Snow)",
     aliases: ["snow peas", "snow peas", "ejote chino", "ervilha torta"],
+    regionalAliases: {
+      US: "snow peas",
+      CA: "snow peas",
+      MX: "ejote chino",
+      BR: "ervilha torta",
+      CO: "arveja china"
+    },
     variants: ["arveja china"],
     packaging: ["Fresh"],
     tags: ["arveja china", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5556,6 +8575,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Peas (Sugar Snap)",
     aliases: ["sugar snap peas", "sugar snap peas", "arvejas tortas", "ervilha torta "],
+    regionalAliases: {
+      US: "sugar snap peas",
+      CA: "sugar snap peas",
+      MX: "arvejas tortas",
+      BR: "ervilha torta ",
+      CO: "arvejas tortas"
+    },
     variants: ["arvejas tortas"],
     packaging: ["Fresh"],
     tags: ["arvejas tortas", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5564,6 +8590,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Peppers (Shishito)",
     aliases: ["shishito", "shishito", "shishito", "shishito"],
+    regionalAliases: {
+      US: "shishito",
+      CA: "shishito",
+      MX: "shishito",
+      BR: "shishito",
+      CO: "shishito"
+    },
     variants: ["shishito"],
     packaging: ["Fresh"],
     tags: ["produce", "produce>vegetables", "shishito", "vegetables", "western-v0.2"],
@@ -5572,6 +8605,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Pickling Cucumbers (Kirby)",
     aliases: ["kirby cucumbers", "kirby cucumbers", "pepino para encurtido", "pepino japonês"],
+    regionalAliases: {
+      US: "kirby cucumbers",
+      CA: "kirby cucumbers",
+      MX: "pepino para encurtido",
+      BR: "pepino japonês",
+      CO: "pepino para encurtido"
+    },
     variants: ["pepino para encurtido"],
     packaging: ["Fresh"],
     tags: ["pepino para encurtido", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5580,6 +8620,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Radicchio",
     aliases: ["radicchio", "radicchio", "radicchio", "radicchio"],
+    regionalAliases: {
+      US: "radicchio",
+      CA: "radicchio",
+      MX: "radicchio",
+      BR: "radicchio",
+      CO: "radicchio"
+    },
     variants: ["radicchio"],
     packaging: ["Whole", "Quartered"],
     tags: ["produce", "produce>vegetables", "radicchio", "vegetables", "western-v0.2"],
@@ -5588,6 +8635,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Shallots",
     aliases: ["shallots", "shallots", "chalotes", "chalotas"],
+    regionalAliases: {
+      US: "shallots",
+      CA: "shallots",
+      MX: "chalotes",
+      BR: "chalotas",
+      CO: "chalotas"
+    },
     variants: ["chalotas"],
     packaging: ["Net", "Loose"],
     tags: ["chalotas", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5596,6 +8650,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Spaghetti Squash",
     aliases: ["spaghetti squash", "spaghetti squash", "calabaza espagueti", "abóbora espaguete"],
+    regionalAliases: {
+      US: "spaghetti squash",
+      CA: "spaghetti squash",
+      MX: "calabaza espagueti",
+      BR: "abóbora espaguete",
+      CO: "calabaza espagueti"
+    },
     variants: ["calabaza espagueti"],
     packaging: ["Whole"],
     tags: ["calabaza espagueti", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5604,6 +8665,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Swiss Chard",
     aliases: ["swiss chard", "swiss chard", "acelga", "acelga"],
+    regionalAliases: {
+      US: "swiss chard",
+      CA: "swiss chard",
+      MX: "acelga",
+      BR: "acelga",
+      CO: "acelga"
+    },
     variants: ["acelga"],
     packaging: ["Bunch"],
     tags: ["acelga", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5612,6 +8680,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Turnip",
     aliases: ["turnip", "turnip", "nabo", "nabo"],
+    regionalAliases: {
+      US: "turnip",
+      CA: "turnip",
+      MX: "nabo",
+      BR: "nabo",
+      CO: "nabo"
+    },
     variants: ["nabo"],
     packaging: ["Whole"],
     tags: ["nabo", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5620,6 +8695,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Watercress",
     aliases: ["watercress", "watercress", "berros", "agrião"],
+    regionalAliases: {
+      US: "watercress",
+      CA: "watercress",
+      MX: "berros",
+      BR: "agrião",
+      CO: "berros"
+    },
     variants: ["berros"],
     packaging: ["Bunch"],
     tags: ["berros", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5628,6 +8710,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Yellow Squash (Summer)",
     aliases: ["yellow squash", "yellow squash", "calabacita amarilla", "abobrinha amarela"],
+    regionalAliases: {
+      US: "yellow squash",
+      CA: "yellow squash",
+      MX: "calabacita amarilla",
+      BR: "abobrinha amarela",
+      CO: "calabacín amarillo"
+    },
     variants: ["calabacín amarillo"],
     packaging: ["Whole"],
     tags: ["calabacín amarillo", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5636,6 +8725,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "produce",
     product: "Zucchini (Courgette)",
     aliases: ["zucchini", "zucchini", "calabacín", "abobrinha"],
+    regionalAliases: {
+      US: "zucchini",
+      CA: "zucchini",
+      MX: "calabacín",
+      BR: "abobrinha",
+      CO: "calabacín"
+    },
     variants: ["calabacín"],
     packaging: ["Whole"],
     tags: ["calabacín", "produce", "produce>vegetables", "vegetables", "western-v0.2"],
@@ -5644,6 +8740,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Asiago",
     aliases: ["asiago", "asiago", "asiago", "asiago"],
+    regionalAliases: {
+      US: "asiago",
+      CA: "asiago",
+      MX: "asiago",
+      BR: "asiago",
+      CO: "asiago"
+    },
     variants: ["asiago"],
     packaging: ["Fresh", "Aged"],
     tags: ["asiago", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5652,6 +8755,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Blue Cheese (Gorgonzola/Blue)",
     aliases: ["blue cheese", "blue cheese", "queso azul", "queijo azul"],
+    regionalAliases: {
+      US: "blue cheese",
+      CA: "blue cheese",
+      MX: "queso azul",
+      BR: "queijo azul",
+      CO: "queso azul"
+    },
     variants: ["queso azul"],
     packaging: ["Wedge", "Crumbles"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso azul", "western-v0.2"],
@@ -5660,6 +8770,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Brie",
     aliases: ["brie", "brie", "brie", "brie"],
+    regionalAliases: {
+      US: "brie",
+      CA: "brie",
+      MX: "brie",
+      BR: "brie",
+      CO: "brie"
+    },
     variants: ["brie"],
     packaging: ["Double cream", "Triple cream"],
     tags: ["brie", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5668,6 +8785,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Burrata",
     aliases: ["burrata", "burrata", "burrata", "burrata"],
+    regionalAliases: {
+      US: "burrata",
+      CA: "burrata",
+      MX: "burrata",
+      BR: "burrata",
+      CO: "burrata"
+    },
     variants: ["burrata"],
     packaging: ["Fresh"],
     tags: ["burrata", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5676,6 +8800,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Camembert",
     aliases: ["camembert", "camembert", "camembert", "camembert"],
+    regionalAliases: {
+      US: "camembert",
+      CA: "camembert",
+      MX: "camembert",
+      BR: "camembert",
+      CO: "camembert"
+    },
     variants: ["camembert"],
     packaging: ["Wheel", "Wedge"],
     tags: ["camembert", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5684,6 +8815,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cheddar (White)",
     aliases: ["white cheddar", "white cheddar", "cheddar blanco", "cheddar branco"],
+    regionalAliases: {
+      US: "white cheddar",
+      CA: "white cheddar",
+      MX: "cheddar blanco",
+      BR: "cheddar branco",
+      CO: "cheddar blanco"
+    },
     variants: ["cheddar blanco"],
     packaging: ["Mild", "Sharp"],
     tags: ["cheddar blanco", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5692,6 +8830,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Colby",
     aliases: ["colby", "colby", "colby", "colby"],
+    regionalAliases: {
+      US: "colby",
+      CA: "colby",
+      MX: "colby",
+      BR: "colby",
+      CO: "colby"
+    },
     variants: ["colby"],
     packaging: ["Block", "Slices"],
     tags: ["cheese", "colby", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5700,6 +8845,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Colby Jack",
     aliases: ["colby jack", "colby jack", "queso colby jack", "queijo colby jack"],
+    regionalAliases: {
+      US: "colby jack",
+      CA: "colby jack",
+      MX: "queso colby jack",
+      BR: "queijo colby jack",
+      CO: "queso colby jack"
+    },
     variants: ["queso colby jack"],
     packaging: ["Block", "Slices"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso colby jack", "western-v0.2"],
@@ -5708,6 +8860,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cotija",
     aliases: ["cotija", "cotija", "cotija", "cotija"],
+    regionalAliases: {
+      US: "cotija",
+      CA: "cotija",
+      MX: "cotija",
+      BR: "cotija",
+      CO: "cotija"
+    },
     variants: ["cotija"],
     packaging: ["Aged", "Fresh"],
     tags: ["cheese", "cotija", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5716,6 +8875,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Edam",
     aliases: ["edam", "edam", "edam", "edam"],
+    regionalAliases: {
+      US: "edam",
+      CA: "edam",
+      MX: "edam",
+      BR: "edam",
+      CO: "edam"
+    },
     variants: ["edam"],
     packaging: ["Ball", "Wedge"],
     tags: ["cheese", "dairy", "dairy>cheese", "edam", "western-v0.2"],
@@ -5724,6 +8890,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Emmental",
     aliases: ["emmental", "emmental", "emmental", "emmental"],
+    regionalAliases: {
+      US: "emmental",
+      CA: "emmental",
+      MX: "emmental",
+      BR: "emmental",
+      CO: "emmental"
+    },
     variants: ["emmental"],
     packaging: ["Wedge", "Slices"],
     tags: ["cheese", "dairy", "dairy>cheese", "emmental", "western-v0.2"],
@@ -5732,6 +8905,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fior di Latte Mozzarella",
     aliases: ["fresh mozzarella", "fresh mozzarella", "mozzarella fresca", "muçarela fresca"],
+    regionalAliases: {
+      US: "fresh mozzarella",
+      CA: "fresh mozzarella",
+      MX: "mozzarella fresca",
+      BR: "muçarela fresca",
+      CO: "mozzarella fresca"
+    },
     variants: ["mozzarella fresca"],
     packaging: ["Balls", "Log"],
     tags: ["cheese", "dairy", "dairy>cheese", "mozzarella fresca", "western-v0.2"],
@@ -5740,6 +8920,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fontina",
     aliases: ["fontina", "fontina", "fontina", "fontina"],
+    regionalAliases: {
+      US: "fontina",
+      CA: "fontina",
+      MX: "fontina",
+      BR: "fontina",
+      CO: "fontina"
+    },
     variants: ["fontina"],
     packaging: ["Block", "Wedge"],
     tags: ["cheese", "dairy", "dairy>cheese", "fontina", "western-v0.2"],
@@ -5748,6 +8935,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Goat Cheese (Chèvre)",
     aliases: ["goat cheese", "goat cheese", "queso de cabra", "queijo de cabra"],
+    regionalAliases: {
+      US: "goat cheese",
+      CA: "goat cheese",
+      MX: "queso de cabra",
+      BR: "queijo de cabra",
+      CO: "queso de cabra"
+    },
     variants: ["queso de cabra"],
     packaging: ["Plain", "Herbed"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso de cabra", "western-v0.2"],
@@ -5756,6 +8950,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Gouda (Young/Aged)",
     aliases: ["gouda", "gouda", "gouda", "gouda"],
+    regionalAliases: {
+      US: "gouda",
+      CA: "gouda",
+      MX: "gouda",
+      BR: "gouda",
+      CO: "gouda"
+    },
     variants: ["gouda"],
     packaging: ["Young", "Aged"],
     tags: ["cheese", "dairy", "dairy>cheese", "gouda", "western-v0.2"],
@@ -5764,6 +8965,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Gruyère",
     aliases: ["gruyère", "gruyère", "gruyere", "gruyère"],
+    regionalAliases: {
+      US: "gruyère",
+      CA: "gruyère",
+      MX: "gruyere",
+      BR: "gruyère",
+      CO: "gruyere"
+    },
     variants: ["gruyere"],
     packaging: ["Wedge", "Shredded"],
     tags: ["cheese", "dairy", "dairy>cheese", "gruyere", "western-v0.2"],
@@ -5772,6 +8980,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Halloumi",
     aliases: ["halloumi", "halloumi", "halloumi", "haloumi"],
+    regionalAliases: {
+      US: "halloumi",
+      CA: "halloumi",
+      MX: "halloumi",
+      BR: "haloumi",
+      CO: "haloumi"
+    },
     variants: ["haloumi"],
     packaging: ["Grilling", "Plain"],
     tags: ["cheese", "dairy", "dairy>cheese", "haloumi", "western-v0.2"],
@@ -5780,6 +8995,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Havarti",
     aliases: ["havarti", "havarti", "havarti", "havarti"],
+    regionalAliases: {
+      US: "havarti",
+      CA: "havarti",
+      MX: "havarti",
+      BR: "havarti",
+      CO: "havarti"
+    },
     variants: ["havarti"],
     packaging: ["Plain", "Dill"],
     tags: ["cheese", "dairy", "dairy>cheese", "havarti", "western-v0.2"],
@@ -5788,6 +9010,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jarlsberg",
     aliases: ["jarlsberg", "jarlsberg", "jarlsberg", "jarlsberg"],
+    regionalAliases: {
+      US: "jarlsberg",
+      CA: "jarlsberg",
+      MX: "jarlsberg",
+      BR: "jarlsberg",
+      CO: "jarlsberg"
+    },
     variants: ["jarlsberg"],
     packaging: ["Wedge", "Slices"],
     tags: ["cheese", "dairy", "dairy>cheese", "jarlsberg", "western-v0.2"],
@@ -5796,6 +9025,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Manchego",
     aliases: ["manchego", "manchego", "manchego", "manchego"],
+    regionalAliases: {
+      US: "manchego",
+      CA: "manchego",
+      MX: "manchego",
+      BR: "manchego",
+      CO: "manchego"
+    },
     variants: ["manchego"],
     packaging: ["Semicurado", "Curado"],
     tags: ["cheese", "dairy", "dairy>cheese", "manchego", "western-v0.2"],
@@ -5804,6 +9040,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mascarpone",
     aliases: ["mascarpone", "mascarpone", "mascarpone", "mascarpone"],
+    regionalAliases: {
+      US: "mascarpone",
+      CA: "mascarpone",
+      MX: "mascarpone",
+      BR: "mascarpone",
+      CO: "mascarpone"
+    },
     variants: ["mascarpone"],
     packaging: ["Fresh"],
     tags: ["cheese", "dairy", "dairy>cheese", "mascarpone", "western-v0.2"],
@@ -5812,6 +9055,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Monterey Jack",
     aliases: ["monterey jack", "monterey jack", "queso jack", "queijo prato "],
+    regionalAliases: {
+      US: "monterey jack",
+      CA: "monterey jack",
+      MX: "queso jack",
+      BR: "queijo prato ",
+      CO: "queso jack"
+    },
     variants: ["queso jack"],
     packaging: ["Block", "Shred"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso jack", "western-v0.2"],
@@ -5820,6 +9070,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Muenster",
     aliases: ["muenster", "muenster", "muenster", "muenster"],
+    regionalAliases: {
+      US: "muenster",
+      CA: "muenster",
+      MX: "muenster",
+      BR: "muenster",
+      CO: "muenster"
+    },
     variants: ["muenster"],
     packaging: ["Block", "Slices"],
     tags: ["cheese", "dairy", "dairy>cheese", "muenster", "western-v0.2"],
@@ -5828,6 +9085,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Oaxaca (Quesillo)",
     aliases: ["oaxaca", "oaxaca", "quesillo", "queijo oaxaca"],
+    regionalAliases: {
+      US: "oaxaca",
+      CA: "oaxaca",
+      MX: "quesillo",
+      BR: "queijo oaxaca",
+      CO: "quesillo"
+    },
     variants: ["quesillo"],
     packaging: ["Braid", "Ball"],
     tags: ["cheese", "dairy", "dairy>cheese", "quesillo", "western-v0.2"],
@@ -5836,6 +9100,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Paneer",
     aliases: ["paneer", "paneer", "paneer", "paneer"],
+    regionalAliases: {
+      US: "paneer",
+      CA: "paneer",
+      MX: "paneer",
+      BR: "paneer",
+      CO: "paneer"
+    },
     variants: ["paneer"],
     packaging: ["Fresh"],
     tags: ["cheese", "dairy", "dairy>cheese", "paneer", "western-v0.2"],
@@ -5844,6 +9115,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Parmesan (Grana Padano)",
     aliases: ["parmesan", "parmesan", "parmesano", "parmesão"],
+    regionalAliases: {
+      US: "parmesan",
+      CA: "parmesan",
+      MX: "parmesano",
+      BR: "parmesão",
+      CO: "parmesano"
+    },
     variants: ["parmesano"],
     packaging: ["Wedge", "Shredded"],
     tags: ["cheese", "dairy", "dairy>cheese", "parmesano", "western-v0.2"],
@@ -5852,6 +9130,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pecorino Romano",
     aliases: ["pecorino", "pecorino", "pecorino", "pecorino"],
+    regionalAliases: {
+      US: "pecorino",
+      CA: "pecorino",
+      MX: "pecorino",
+      BR: "pecorino",
+      CO: "pecorino"
+    },
     variants: ["pecorino"],
     packaging: ["Wedge", "Grated"],
     tags: ["cheese", "dairy", "dairy>cheese", "pecorino", "western-v0.2"],
@@ -5860,6 +9145,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pepper Jack",
     aliases: ["pepper jack", "pepper jack", "queso pepper jack", "queijo pepper jack"],
+    regionalAliases: {
+      US: "pepper jack",
+      CA: "pepper jack",
+      MX: "queso pepper jack",
+      BR: "queijo pepper jack",
+      CO: "queso pepper jack"
+    },
     variants: ["queso pepper jack"],
     packaging: ["Block", "Slices"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso pepper jack", "western-v0.2"],
@@ -5868,6 +9160,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Provolone",
     aliases: ["provolone", "provolone", "provolone", "provolone"],
+    regionalAliases: {
+      US: "provolone",
+      CA: "provolone",
+      MX: "provolone",
+      BR: "provolone",
+      CO: "provolone"
+    },
     variants: ["provolone"],
     packaging: ["Sharp", "Mild"],
     tags: ["cheese", "dairy", "dairy>cheese", "provolone", "western-v0.2"],
@@ -5876,6 +9175,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Queso Blanco",
     aliases: ["queso blanco", "queso blanco", "queso blanco", "queijo branco"],
+    regionalAliases: {
+      US: "queso blanco",
+      CA: "queso blanco",
+      MX: "queso blanco",
+      BR: "queijo branco",
+      CO: "queso blanco"
+    },
     variants: ["queso blanco"],
     packaging: ["Fresh"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso blanco", "western-v0.2"],
@@ -5884,6 +9190,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Queso Fresco",
     aliases: ["queso fresco", "queso fresco", "queso fresco", "queijo fresco"],
+    regionalAliases: {
+      US: "queso fresco",
+      CA: "queso fresco",
+      MX: "queso fresco",
+      BR: "queijo fresco",
+      CO: "queso fresco"
+    },
     variants: ["queso fresco"],
     packaging: ["Fresh"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso fresco", "western-v0.2"],
@@ -5892,6 +9205,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Queso para Freír (Frying)",
     aliases: ["grilling cheese", "grilling cheese", "queso de freír", "queso de freír", "fromaj fri", "white frying cheese", "white frying cheese", "queso de freír", "queijo de fritar", "queso de freír"],
+    regionalAliases: {
+      JM: "grilling cheese",
+      TT: "grilling cheese",
+      PR: "queso de freír",
+      DO: "queso de freír",
+      HT: "fromaj fri",
+      US: "white frying cheese",
+      CA: "white frying cheese",
+      MX: "queso de freír",
+      BR: "queijo de fritar",
+      CO: "queso de freír"
+    },
     variants: ["Block"],
     packaging: ["block"],
     tags: ["block", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -5900,6 +9225,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ricotta Salata",
     aliases: ["ricotta salata", "ricotta salata", "ricotta salata", "ricota salata"],
+    regionalAliases: {
+      US: "ricotta salata",
+      CA: "ricotta salata",
+      MX: "ricotta salata",
+      BR: "ricota salata",
+      CO: "ricotta salata"
+    },
     variants: ["ricotta salata"],
     packaging: ["Block", "Crumbled"],
     tags: ["cheese", "dairy", "dairy>cheese", "ricotta salata", "western-v0.2"],
@@ -5908,6 +9240,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Romano",
     aliases: ["romano", "romano", "romano", "romano"],
+    regionalAliases: {
+      US: "romano",
+      CA: "romano",
+      MX: "romano",
+      BR: "romano",
+      CO: "romano"
+    },
     variants: ["romano"],
     packaging: ["Wedge", "Grated"],
     tags: ["cheese", "dairy", "dairy>cheese", "romano", "western-v0.2"],
@@ -5916,6 +9255,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Swiss (Baby Swiss)",
     aliases: ["swiss cheese", "swiss cheese", "queso suizo", "queijo suíço"],
+    regionalAliases: {
+      US: "swiss cheese",
+      CA: "swiss cheese",
+      MX: "queso suizo",
+      BR: "queijo suíço",
+      CO: "queso suizo"
+    },
     variants: ["queso suizo"],
     packaging: ["Slices", "Wedge"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso suizo", "western-v0.2"],
@@ -5924,6 +9270,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Anchovy (Fresh/Frozen)",
     aliases: ["anchovy", "anchovy", "anchoa", "anchova"],
+    regionalAliases: {
+      US: "anchovy",
+      CA: "anchovy",
+      MX: "anchoa",
+      BR: "anchova",
+      CO: "anchoa"
+    },
     variants: ["anchoa"],
     packaging: ["Whole", "Fillets"],
     tags: ["anchoa", "seafood", "western-v0.2"],
@@ -5932,6 +9285,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Arctic Char",
     aliases: ["arctic char", "arctic char", "trucha ártica", "truta ártica"],
+    regionalAliases: {
+      US: "arctic char",
+      CA: "arctic char",
+      MX: "trucha ártica",
+      BR: "truta ártica",
+      CO: "trucha ártica"
+    },
     variants: ["trucha ártica"],
     packaging: ["Fillet"],
     tags: ["seafood", "trucha ártica", "western-v0.2"],
@@ -5940,6 +9300,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Barramundi",
     aliases: ["barramundi", "barramundi", "barramundi", "barramundi"],
+    regionalAliases: {
+      US: "barramundi",
+      CA: "barramundi",
+      MX: "barramundi",
+      BR: "barramundi",
+      CO: "barramundi"
+    },
     variants: ["barramundi"],
     packaging: ["Fillet", "Portions"],
     tags: ["barramundi", "seafood", "western-v0.2"],
@@ -5948,6 +9315,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Blue Crab (Clusters)",
     aliases: ["blue crab", "blue crab", "cangrejo azul", "cangrejo azul", "blue crab", "blue crab", "cangrejo azul", "caranguejo azul", "cangrejo azul"],
+    regionalAliases: {
+      JM: "blue crab",
+      TT: "blue crab",
+      PR: "cangrejo azul",
+      DO: "cangrejo azul",
+      US: "blue crab",
+      CA: "blue crab",
+      MX: "cangrejo azul",
+      BR: "caranguejo azul",
+      CO: "cangrejo azul"
+    },
     variants: ["Clusters", "Meat"],
     packaging: ["bag"],
     tags: ["clusters", "meat", "seafood", "western-v0.2"],
@@ -5956,6 +9334,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Clams (Littleneck)",
     aliases: ["clams", "clams", "almejas", "amêijoas"],
+    regionalAliases: {
+      US: "clams",
+      CA: "clams",
+      MX: "almejas",
+      BR: "amêijoas",
+      CO: "almejas"
+    },
     variants: ["almejas"],
     packaging: ["Live", "Shucked"],
     tags: ["almejas", "seafood", "western-v0.2"],
@@ -5964,6 +9349,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Conch (Lambi)",
     aliases: ["conch", "lambi", "caracol", "lambí", "lanbi", "conch", "conch", "caracol", "concha ", "caracol"],
+    regionalAliases: {
+      JM: "conch",
+      TT: "lambi",
+      PR: "caracol",
+      DO: "lambí",
+      HT: "lanbi",
+      US: "conch",
+      CA: "conch",
+      MX: "caracol",
+      BR: "concha ",
+      CO: "caracol"
+    },
     variants: ["Stew", "Fritters"],
     packaging: ["pack"],
     tags: ["fritters", "seafood", "stew", "western-v0.2"],
@@ -5972,6 +9369,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Crab Meat (Lump)",
     aliases: ["crab meat", "crab meat", "cangrejo en trozos", "carne de caranguejo"],
+    regionalAliases: {
+      US: "crab meat",
+      CA: "crab meat",
+      MX: "cangrejo en trozos",
+      BR: "carne de caranguejo",
+      CO: "cangrejo"
+    },
     variants: ["cangrejo"],
     packaging: ["Backfin", "Lump"],
     tags: ["cangrejo", "seafood", "western-v0.2"],
@@ -5980,6 +9384,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Crawfish (Crayfish)",
     aliases: ["crawfish", "crawfish", "cangrejo de río", "lagostim"],
+    regionalAliases: {
+      US: "crawfish",
+      CA: "crawfish",
+      MX: "cangrejo de río",
+      BR: "lagostim",
+      CO: "langostino de río"
+    },
     variants: ["langostino de río"],
     packaging: ["Whole", "Tail"],
     tags: ["langostino de río", "seafood", "western-v0.2"],
@@ -5988,6 +9399,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Flounder",
     aliases: ["flounder", "flounder", "platija", "linguado"],
+    regionalAliases: {
+      US: "flounder",
+      CA: "flounder",
+      MX: "platija",
+      BR: "linguado",
+      CO: "platija"
+    },
     variants: ["platija"],
     packaging: ["Fillet"],
     tags: ["platija", "seafood", "western-v0.2"],
@@ -5996,6 +9414,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Haddock",
     aliases: ["haddock", "haddock", "eglefino", "arinca"],
+    regionalAliases: {
+      US: "haddock",
+      CA: "haddock",
+      MX: "eglefino",
+      BR: "arinca",
+      CO: "eglefino"
+    },
     variants: ["eglefino"],
     packaging: ["Fillet"],
     tags: ["eglefino", "seafood", "western-v0.2"],
@@ -6004,6 +9429,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Halibut",
     aliases: ["halibut", "halibut", "fletán", "alabote"],
+    regionalAliases: {
+      US: "halibut",
+      CA: "halibut",
+      MX: "fletán",
+      BR: "alabote",
+      CO: "fletán"
+    },
     variants: ["fletán"],
     packaging: ["Fillet", "Steaks"],
     tags: ["fletán", "seafood", "western-v0.2"],
@@ -6012,6 +9444,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Herring (Pickled/Smoked)",
     aliases: ["herring", "herring", "arenque", "arenque"],
+    regionalAliases: {
+      US: "herring",
+      CA: "herring",
+      MX: "arenque",
+      BR: "arenque",
+      CO: "arenque"
+    },
     variants: ["arenque"],
     packaging: ["Pickled", "Smoked"],
     tags: ["arenque", "seafood", "western-v0.2"],
@@ -6020,6 +9459,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Lobster (American)",
     aliases: ["lobster", "lobster", "langosta", "langosta", "langòs", "american lobster", "american lobster", "langosta", "lagosta", "langosta"],
+    regionalAliases: {
+      JM: "lobster",
+      TT: "lobster",
+      PR: "langosta",
+      DO: "langosta",
+      HT: "langòs",
+      US: "american lobster",
+      CA: "american lobster",
+      MX: "langosta",
+      BR: "lagosta",
+      CO: "langosta"
+    },
     variants: ["Live", "Tails"],
     packaging: ["bag"],
     tags: ["live", "seafood", "tails", "western-v0.2"],
@@ -6028,6 +9479,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Lobster (Caribbean Spiny)",
     aliases: ["spiny lobster", "crayfish ", "langosta espinosa", "langosta", "langosta", "spiny lobster", "spiny lobster", "langosta", "lagosta", "langosta"],
+    regionalAliases: {
+      JM: "spiny lobster",
+      TT: "crayfish ",
+      PR: "langosta espinosa",
+      DO: "langosta",
+      HT: "langosta",
+      US: "spiny lobster",
+      CA: "spiny lobster",
+      MX: "langosta",
+      BR: "lagosta",
+      CO: "langosta"
+    },
     variants: ["Tails", "Whole"],
     packaging: ["bag"],
     tags: ["seafood", "tails", "western-v0.2", "whole"],
@@ -6036,6 +9499,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Mackerel (Atlantic)",
     aliases: ["mackerel", "mackerel", "caballa", "cavala"],
+    regionalAliases: {
+      US: "mackerel",
+      CA: "mackerel",
+      MX: "caballa",
+      BR: "cavala",
+      CO: "caballa"
+    },
     variants: ["caballa"],
     packaging: ["Whole", "Fillet"],
     tags: ["caballa", "seafood", "western-v0.2"],
@@ -6044,6 +9514,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Mussels",
     aliases: ["mussels", "mussels", "mejillones", "mexilhão"],
+    regionalAliases: {
+      US: "mussels",
+      CA: "mussels",
+      MX: "mejillones",
+      BR: "mexilhão",
+      CO: "mejillón"
+    },
     variants: ["mejillón"],
     packaging: ["Live", "Vac-pack"],
     tags: ["mejillón", "seafood", "western-v0.2"],
@@ -6052,6 +9529,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Octopus",
     aliases: ["octopus", "octopus", "pulpo", "polvo"],
+    regionalAliases: {
+      US: "octopus",
+      CA: "octopus",
+      MX: "pulpo",
+      BR: "polvo",
+      CO: "pulpo"
+    },
     variants: ["pulpo"],
     packaging: ["Whole", "Tentacles"],
     tags: ["pulpo", "seafood", "western-v0.2"],
@@ -6060,6 +9544,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Oysters",
     aliases: ["oysters", "oysters", "ostras", "ostras"],
+    regionalAliases: {
+      US: "oysters",
+      CA: "oysters",
+      MX: "ostras",
+      BR: "ostras",
+      CO: "ostras"
+    },
     variants: ["ostras"],
     packaging: ["Live", "Shucked"],
     tags: ["ostras", "seafood", "western-v0.2"],
@@ -6068,6 +9559,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Pollock (Alaska)",
     aliases: ["pollock", "pollock", "abadejo", "abadejo"],
+    regionalAliases: {
+      US: "pollock",
+      CA: "pollock",
+      MX: "abadejo",
+      BR: "abadejo",
+      CO: "abadejo"
+    },
     variants: ["abadejo"],
     packaging: ["Fillet", "Blocks"],
     tags: ["abadejo", "seafood", "western-v0.2"],
@@ -6076,6 +9574,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Redfish (Ocean Perch)",
     aliases: ["redfish", "redfish", "perca oceánica", "perca oceânica"],
+    regionalAliases: {
+      US: "redfish",
+      CA: "redfish",
+      MX: "perca oceánica",
+      BR: "perca oceânica",
+      CO: "perca oceánica"
+    },
     variants: ["perca oceánica"],
     packaging: ["Fillet"],
     tags: ["perca oceánica", "seafood", "western-v0.2"],
@@ -6084,6 +9589,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Sablefish (Black Cod)",
     aliases: ["sablefish", "sablefish", "bacalao negro", "peixe-carvão"],
+    regionalAliases: {
+      US: "sablefish",
+      CA: "sablefish",
+      MX: "bacalao negro",
+      BR: "peixe-carvão",
+      CO: "bacalao negro"
+    },
     variants: ["bacalao negro"],
     packaging: ["Fillet"],
     tags: ["bacalao negro", "seafood", "western-v0.2"],
@@ -6092,6 +9604,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Scallops (Sea/Bay)",
     aliases: ["scallops", "scallops", "vieiras", "vieiras"],
+    regionalAliases: {
+      US: "scallops",
+      CA: "scallops",
+      MX: "vieiras",
+      BR: "vieiras",
+      CO: "vieiras"
+    },
     variants: ["vieiras"],
     packaging: ["Sea", "Bay"],
     tags: ["seafood", "vieiras", "western-v0.2"],
@@ -6100,6 +9619,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Sea Bass (Chilean)",
     aliases: ["chilean sea bass", "chilean sea bass", "merluza negra", "peixe-sabonete"],
+    regionalAliases: {
+      US: "chilean sea bass",
+      CA: "chilean sea bass",
+      MX: "merluza negra",
+      BR: "peixe-sabonete",
+      CO: "merluza negra"
+    },
     variants: ["merluza negra"],
     packaging: ["Fillet"],
     tags: ["merluza negra", "seafood", "western-v0.2"],
@@ -6108,6 +9634,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Smoked Salmon (Lox)",
     aliases: ["smoked salmon", "smoked salmon", "salmón ahumado", "salmão defumado"],
+    regionalAliases: {
+      US: "smoked salmon",
+      CA: "smoked salmon",
+      MX: "salmón ahumado",
+      BR: "salmão defumado",
+      CO: "salmón ahumado"
+    },
     variants: ["salmón ahumado"],
     packaging: ["Nova", "Lox"],
     tags: ["salmón ahumado", "seafood", "western-v0.2"],
@@ -6116,6 +9649,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Squid (Calamari)",
     aliases: ["calamari", "calamari", "calamares", "lula"],
+    regionalAliases: {
+      US: "calamari",
+      CA: "calamari",
+      MX: "calamares",
+      BR: "lula",
+      CO: "calamares"
+    },
     variants: ["calamares"],
     packaging: ["Rings", "Tubes"],
     tags: ["calamares", "seafood", "western-v0.2"],
@@ -6124,6 +9664,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Swordfish",
     aliases: ["swordfish", "swordfish", "pez espada", "peixe-espada"],
+    regionalAliases: {
+      US: "swordfish",
+      CA: "swordfish",
+      MX: "pez espada",
+      BR: "peixe-espada",
+      CO: "pez espada"
+    },
     variants: ["pez espada"],
     packaging: ["Steaks"],
     tags: ["pez espada", "seafood", "western-v0.2"],
@@ -6132,6 +9679,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Trout (Rainbow)",
     aliases: ["rainbow trout", "rainbow trout", "trucha arcoíris", "truta arco-íris"],
+    regionalAliases: {
+      US: "rainbow trout",
+      CA: "rainbow trout",
+      MX: "trucha arcoíris",
+      BR: "truta arco-íris",
+      CO: "trucha arcoíris"
+    },
     variants: ["trucha arcoíris"],
     packaging: ["Whole", "Fillet"],
     tags: ["seafood", "trucha arcoíris", "western-v0.2"],
@@ -6140,6 +9694,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Whiting",
     aliases: ["whiting", "whiting", "merluza", "merluza", "whiting", "whiting", "merluza", "pescada", "merluza"],
+    regionalAliases: {
+      JM: "whiting",
+      TT: "whiting",
+      PR: "merluza",
+      DO: "merluza",
+      US: "whiting",
+      CA: "whiting",
+      MX: "merluza",
+      BR: "pescada",
+      CO: "merluza"
+    },
     variants: ["Whole", "Fillet"],
     packaging: ["bag"],
     tags: ["fillet", "seafood", "western-v0.2", "whole"],
@@ -6148,6 +9713,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Wahoo (Caribbean)",
     aliases: ["wahoo", "wahoo", "carite ", "carite ", "wahoo", "wahoo", "wahoo", "serra", "wahoo"],
+    regionalAliases: {
+      JM: "wahoo",
+      TT: "wahoo",
+      PR: "carite ",
+      DO: "carite ",
+      US: "wahoo",
+      CA: "wahoo",
+      MX: "wahoo",
+      BR: "serra",
+      CO: "wahoo"
+    },
     variants: ["Fillet", "Steaks"],
     packaging: ["pack"],
     tags: ["fillet", "seafood", "steaks", "western-v0.2"],
@@ -6156,6 +9732,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Aioli (Garlic Mayo)",
     aliases: ["aioli", "aioli", "alioli", "aioli"],
+    regionalAliases: {
+      US: "aioli",
+      CA: "aioli",
+      MX: "alioli",
+      BR: "aioli",
+      CO: "alioli"
+    },
     variants: ["alioli"],
     packaging: ["Classic", "Roasted garlic"],
     tags: ["alioli", "condiments", "western-v0.2"],
@@ -6164,6 +9747,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ají Amarillo Paste",
     aliases: ["aji amarillo", "aji amarillo", "ají amarillo", "aji amarelo"],
+    regionalAliases: {
+      US: "aji amarillo",
+      CA: "aji amarillo",
+      MX: "ají amarillo",
+      BR: "aji amarelo",
+      CO: "ají amarillo"
+    },
     variants: ["ají amarillo"],
     packaging: ["Jar", "Pouch"],
     tags: ["ají amarillo", "condiments", "western-v0.2"],
@@ -6172,6 +9762,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Alfredo Sauce (Jarred)",
     aliases: ["alfredo sauce", "alfredo sauce", "salsa alfredo", "molho alfredo"],
+    regionalAliases: {
+      US: "alfredo sauce",
+      CA: "alfredo sauce",
+      MX: "salsa alfredo",
+      BR: "molho alfredo",
+      CO: "salsa alfredo"
+    },
     variants: ["salsa alfredo"],
     packaging: ["Classic", "Light"],
     tags: ["condiments", "salsa alfredo", "western-v0.2"],
@@ -6180,6 +9777,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Berbere Paste",
     aliases: ["berbere", "berbere", "berbere", "berbere"],
+    regionalAliases: {
+      US: "berbere",
+      CA: "berbere",
+      MX: "berbere",
+      BR: "berbere",
+      CO: "berbere"
+    },
     variants: ["berbere"],
     packaging: ["Spicy paste"],
     tags: ["berbere", "condiments", "western-v0.2"],
@@ -6188,6 +9792,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chadon Beni Sauce (Green)",
     aliases: ["chadon beni sauce", "recao sauce", "cilantro ancho", "green seasoning", "green seasoning", "recao", "coentro", "recao"],
+    regionalAliases: {
+      TT: "chadon beni sauce",
+      PR: "recao sauce",
+      DO: "cilantro ancho",
+      US: "green seasoning",
+      CA: "green seasoning",
+      MX: "recao",
+      BR: "coentro",
+      CO: "recao"
+    },
     variants: ["Original", "Hot"],
     packaging: ["bottle"],
     tags: ["condiments", "hot", "original", "western-v0.2"],
@@ -6196,6 +9810,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chimichurri",
     aliases: ["chimichurri", "chimichurri", "chimichurri", "chimichurri"],
+    regionalAliases: {
+      US: "chimichurri",
+      CA: "chimichurri",
+      MX: "chimichurri",
+      BR: "chimichurri",
+      CO: "chimichurri"
+    },
     variants: ["chimichurri"],
     packaging: ["Classic", "Spicy"],
     tags: ["chimichurri", "condiments", "western-v0.2"],
@@ -6204,6 +9825,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chipotle in Adobo",
     aliases: ["chipotle in adobo", "chipotle in adobo", "chipotle en adobo", "chipotle em adobo"],
+    regionalAliases: {
+      US: "chipotle in adobo",
+      CA: "chipotle in adobo",
+      MX: "chipotle en adobo",
+      BR: "chipotle em adobo",
+      CO: "chipotle en adobo"
+    },
     variants: ["chipotle en adobo"],
     packaging: ["Whole", "Sauce"],
     tags: ["chipotle en adobo", "condiments", "western-v0.2"],
@@ -6212,6 +9840,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Gochujang (Korean Chili Paste)",
     aliases: ["gochujang", "gochujang", "gochujang", "gochujang"],
+    regionalAliases: {
+      US: "gochujang",
+      CA: "gochujang",
+      MX: "gochujang",
+      BR: "gochujang",
+      CO: "gochujang"
+    },
     variants: ["gochujang"],
     packaging: ["Hot", "Mild"],
     tags: ["condiments", "gochujang", "western-v0.2"],
@@ -6228,6 +9863,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Harissa",
     aliases: ["harissa", "harissa", "harissa", "harissa"],
+    regionalAliases: {
+      US: "harissa",
+      CA: "harissa",
+      MX: "harissa",
+      BR: "harissa",
+      CO: "harissa"
+    },
     variants: ["harissa"],
     packaging: ["Hot", "Mild"],
     tags: ["condiments", "harissa", "western-v0.2"],
@@ -6236,6 +9878,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Hoisin Sauce",
     aliases: ["hoisin", "hoisin", "hoisin", "hoisin"],
+    regionalAliases: {
+      US: "hoisin",
+      CA: "hoisin",
+      MX: "hoisin",
+      BR: "hoisin",
+      CO: "hoisin"
+    },
     variants: ["hoisin"],
     packaging: ["Classic"],
     tags: ["condiments", "hoisin", "western-v0.2"],
@@ -6244,6 +9893,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Hummus (Dip)",
     aliases: ["hummus", "hummus", "hummus", "homus"],
+    regionalAliases: {
+      US: "hummus",
+      CA: "hummus",
+      MX: "hummus",
+      BR: "homus",
+      CO: "hummus"
+    },
     variants: ["hummus"],
     packaging: ["Classic", "Roasted red pepper"],
     tags: ["condiments", "hummus", "western-v0.2"],
@@ -6252,6 +9908,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jamaican Pickapeppa Sauce",
     aliases: ["pickapeppa", "pickapeppa", "pickapeppa", "pickapeppa", "salsa pickapeppa", "pickapeppa", "salsa pickapeppa"],
+    regionalAliases: {
+      JM: "pickapeppa",
+      TT: "pickapeppa",
+      US: "pickapeppa",
+      CA: "pickapeppa",
+      MX: "salsa pickapeppa",
+      BR: "pickapeppa",
+      CO: "salsa pickapeppa"
+    },
     variants: ["Original"],
     packaging: ["bottle"],
     tags: ["condiments", "original", "western-v0.2"],
@@ -6260,6 +9925,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Kewpie Mayonnaise",
     aliases: ["kewpie mayo", "kewpie mayo", "mayonesa kewpie", "maionese kewpie"],
+    regionalAliases: {
+      US: "kewpie mayo",
+      CA: "kewpie mayo",
+      MX: "mayonesa kewpie",
+      BR: "maionese kewpie",
+      CO: "mayonesa kewpie"
+    },
     variants: ["mayonesa kewpie"],
     packaging: ["Original", "Spicy"],
     tags: ["condiments", "mayonesa kewpie", "western-v0.2"],
@@ -6268,6 +9940,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mirin (Cooking Wine)",
     aliases: ["mirin", "mirin", "mirin", "mirin"],
+    regionalAliases: {
+      US: "mirin",
+      CA: "mirin",
+      MX: "mirin",
+      BR: "mirin",
+      CO: "mirin"
+    },
     variants: ["mirin"],
     packaging: ["Hon", "Aji"],
     tags: ["condiments", "mirin", "western-v0.2"],
@@ -6276,6 +9955,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Miso Paste",
     aliases: ["miso", "miso", "miso", "missô"],
+    regionalAliases: {
+      US: "miso",
+      CA: "miso",
+      MX: "miso",
+      BR: "missô",
+      CO: "miso"
+    },
     variants: ["miso"],
     packaging: ["White", "Red"],
     tags: ["condiments", "miso", "western-v0.2"],
@@ -6284,6 +9970,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pesto (Basil)",
     aliases: ["pesto", "pesto", "pesto", "pesto"],
+    regionalAliases: {
+      US: "pesto",
+      CA: "pesto",
+      MX: "pesto",
+      BR: "pesto",
+      CO: "pesto"
+    },
     variants: ["pesto"],
     packaging: ["Classic", "Vegan"],
     tags: ["condiments", "pesto", "western-v0.2"],
@@ -6292,6 +9985,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pickled Ginger",
     aliases: ["pickled ginger", "pickled ginger", "jengibre encurtido", "gengibre em conserva"],
+    regionalAliases: {
+      US: "pickled ginger",
+      CA: "pickled ginger",
+      MX: "jengibre encurtido",
+      BR: "gengibre em conserva",
+      CO: "jengibre encurtido"
+    },
     variants: ["jengibre encurtido"],
     packaging: ["Pink", "White"],
     tags: ["condiments", "jengibre encurtido", "western-v0.2"],
@@ -6300,6 +10000,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pickled Onions (Red)",
     aliases: ["pickled onions", "pickled onions", "cebollas encurtidas", "cebola em conserva"],
+    regionalAliases: {
+      US: "pickled onions",
+      CA: "pickled onions",
+      MX: "cebollas encurtidas",
+      BR: "cebola em conserva",
+      CO: "cebollas encurtidas"
+    },
     variants: ["cebollas encurtidas"],
     packaging: ["Thin", "Whole"],
     tags: ["cebollas encurtidas", "condiments", "western-v0.2"],
@@ -6308,6 +10015,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Salsa Verde (Tomatillo)",
     aliases: ["salsa verde", "salsa verde", "salsa verde", "molho verde"],
+    regionalAliases: {
+      US: "salsa verde",
+      CA: "salsa verde",
+      MX: "salsa verde",
+      BR: "molho verde",
+      CO: "salsa verde"
+    },
     variants: ["salsa verde"],
     packaging: ["Mild", "Hot"],
     tags: ["condiments", "salsa verde", "western-v0.2"],
@@ -6316,6 +10030,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Sofrito (PR)",
     aliases: ["sofrito", "sofrito", "sofrito", "sofrito", "sofrito", "tempero base", "sofrito"],
+    regionalAliases: {
+      PR: "sofrito",
+      DO: "sofrito",
+      US: "sofrito",
+      CA: "sofrito",
+      MX: "sofrito",
+      BR: "tempero base",
+      CO: "sofrito"
+    },
     variants: ["Classic", "Recaito"],
     packaging: ["tub"],
     tags: ["classic", "condiments", "recaito", "western-v0.2"],
@@ -6324,6 +10047,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tahini",
     aliases: ["tahini", "tahini", "tahini", "tahine"],
+    regionalAliases: {
+      US: "tahini",
+      CA: "tahini",
+      MX: "tahini",
+      BR: "tahine",
+      CO: "tahini"
+    },
     variants: ["tahini"],
     packaging: ["Jar"],
     tags: ["condiments", "tahini", "western-v0.2"],
@@ -6332,6 +10062,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tartar Sauce",
     aliases: ["tartar sauce", "tartar sauce", "salsa tártara", "molho tártaro"],
+    regionalAliases: {
+      US: "tartar sauce",
+      CA: "tartar sauce",
+      MX: "salsa tártara",
+      BR: "molho tártaro",
+      CO: "salsa tártara"
+    },
     variants: ["salsa tártara"],
     packaging: ["Classic"],
     tags: ["condiments", "salsa tártara", "western-v0.2"],
@@ -6340,6 +10077,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tikka Masala Simmer Sauce",
     aliases: ["tikka masala sauce", "tikka masala sauce", "salsa tikka masala", "molho tikka masala"],
+    regionalAliases: {
+      US: "tikka masala sauce",
+      CA: "tikka masala sauce",
+      MX: "salsa tikka masala",
+      BR: "molho tikka masala",
+      CO: "salsa tikka masala"
+    },
     variants: ["salsa tikka masala"],
     packaging: ["Jar"],
     tags: ["condiments", "salsa tikka masala", "western-v0.2"],
@@ -6348,6 +10092,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tzatziki (Yogurt Dip)",
     aliases: ["tzatziki", "tzatziki", "tzatziki", "coalhada temperada "],
+    regionalAliases: {
+      US: "tzatziki",
+      CA: "tzatziki",
+      MX: "tzatziki",
+      BR: "coalhada temperada ",
+      CO: "tzatziki"
+    },
     variants: ["tzatziki"],
     packaging: ["Classic"],
     tags: ["condiments", "tzatziki", "western-v0.2"],
@@ -6356,6 +10107,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Banana Chips (JM)",
     aliases: ["banana chips", "banana chips", "platanitos", "platanitos", "chips bannann", "banana chips", "banana chips", "platanitos", "chips de banana", "platanitos"],
+    regionalAliases: {
+      JM: "banana chips",
+      TT: "banana chips",
+      PR: "platanitos",
+      DO: "platanitos",
+      HT: "chips bannann",
+      US: "banana chips",
+      CA: "banana chips",
+      MX: "platanitos",
+      BR: "chips de banana",
+      CO: "platanitos"
+    },
     variants: ["Salted", "Ripe sweet"],
     packaging: ["bag"],
     tags: ["ripe sweet", "salted", "snacks", "western-v0.2"],
@@ -6364,6 +10127,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Beef Jerky",
     aliases: ["beef jerky", "beef jerky", "cecina", "jerky de carne"],
+    regionalAliases: {
+      US: "beef jerky",
+      CA: "beef jerky",
+      MX: "cecina",
+      BR: "jerky de carne",
+      CO: "cecina"
+    },
     variants: ["cecina"],
     packaging: ["Original", "Peppered"],
     tags: ["cecina", "snacks", "western-v0.2"],
@@ -6372,6 +10142,15 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Bun & Cheese (JM)",
     aliases: ["bun & cheese", "pan de pasas con queso ", "bun and cheese", "bun and cheese", "pan dulce con queso", "pão doce com queijo", "pan con queso"],
+    regionalAliases: {
+      JM: "bun & cheese",
+      DO: "pan de pasas con queso ",
+      US: "bun and cheese",
+      CA: "bun and cheese",
+      MX: "pan dulce con queso",
+      BR: "pão doce com queijo",
+      CO: "pan con queso"
+    },
     variants: ["Single", "Twin pack"],
     packaging: ["wrap"],
     tags: ["single", "snacks", "twin pack", "western-v0.2"],
@@ -6380,6 +10159,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Cheese Balls",
     aliases: ["cheese balls", "cheese balls", "bolitas de queso", "bolinhas de queijo"],
+    regionalAliases: {
+      US: "cheese balls",
+      CA: "cheese balls",
+      MX: "bolitas de queso",
+      BR: "bolinhas de queijo",
+      CO: "bolitas de queso"
+    },
     variants: ["bolitas de queso"],
     packaging: ["Classic"],
     tags: ["bolitas de queso", "snacks", "western-v0.2"],
@@ -6388,6 +10174,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Cheese Puffs",
     aliases: ["cheese puffs", "cheese puffs", "cheetos ", "salgadinhos de queijo"],
+    regionalAliases: {
+      US: "cheese puffs",
+      CA: "cheese puffs",
+      MX: "cheetos ",
+      BR: "salgadinhos de queijo",
+      CO: "cheetos "
+    },
     variants: ["cheetos (≈)"],
     packaging: ["Classic"],
     tags: ["cheetos (≈)", "snacks", "western-v0.2"],
@@ -6396,6 +10189,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Chocolate Wafer Bars",
     aliases: ["wafer bars", "wafer bars", "obleas con chocolate", "wafer de chocolate"],
+    regionalAliases: {
+      US: "wafer bars",
+      CA: "wafer bars",
+      MX: "obleas con chocolate",
+      BR: "wafer de chocolate",
+      CO: "obleas con chocolate"
+    },
     variants: ["obleas con chocolate"],
     packaging: ["Milk", "Dark"],
     tags: ["obleas con chocolate", "snacks", "western-v0.2"],
@@ -6404,6 +10204,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Corn Nuts",
     aliases: ["corn nuts", "corn nuts", "maíz tostado", "milho torrado"],
+    regionalAliases: {
+      US: "corn nuts",
+      CA: "corn nuts",
+      MX: "maíz tostado",
+      BR: "milho torrado",
+      CO: "maíz tostado"
+    },
     variants: ["maíz tostado"],
     packaging: ["Original", "Chile-lime"],
     tags: ["maíz tostado", "snacks", "western-v0.2"],
@@ -6412,6 +10219,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Digestive Biscuits",
     aliases: ["digestive biscuits", "digestive biscuits", "galletas digestivas", "biscoito digestivo"],
+    regionalAliases: {
+      US: "digestive biscuits",
+      CA: "digestive biscuits",
+      MX: "galletas digestivas",
+      BR: "biscoito digestivo",
+      CO: "galletas digestivas"
+    },
     variants: ["galletas digestivas"],
     packaging: ["Plain", "Chocolate"],
     tags: ["galletas digestivas", "snacks", "western-v0.2"],
@@ -6420,6 +10234,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Energy Bar (Protein)",
     aliases: ["protein bar", "protein bar", "barra de proteína", "barra de proteína"],
+    regionalAliases: {
+      US: "protein bar",
+      CA: "protein bar",
+      MX: "barra de proteína",
+      BR: "barra de proteína",
+      CO: "barra de proteína"
+    },
     variants: ["barra de proteína"],
     packaging: ["Chocolate", "Peanut"],
     tags: ["barra de proteína", "snacks", "western-v0.2"],
@@ -6428,6 +10249,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Gummy Candy (Mixed)",
     aliases: ["gummy candy", "gummy candy", "gomitas", "balas de gelatina"],
+    regionalAliases: {
+      US: "gummy candy",
+      CA: "gummy candy",
+      MX: "gomitas",
+      BR: "balas de gelatina",
+      CO: "gomitas"
+    },
     variants: ["gomitas"],
     packaging: ["Fruit mix"],
     tags: ["gomitas", "snacks", "western-v0.2"],
@@ -6436,6 +10264,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Kettle Potato Chips",
     aliases: ["kettle chips", "kettle chips", "papas kettle", "batata kettle"],
+    regionalAliases: {
+      US: "kettle chips",
+      CA: "kettle chips",
+      MX: "papas kettle",
+      BR: "batata kettle",
+      CO: "papas kettle"
+    },
     variants: ["papas kettle"],
     packaging: ["Sea salt", "BBQ"],
     tags: ["papas kettle", "snacks", "western-v0.2"],
@@ -6452,6 +10287,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Peanut Brittle",
     aliases: ["peanut brittle", "peanut brittle", "praliné de maní", "quebra-queixo"],
+    regionalAliases: {
+      US: "peanut brittle",
+      CA: "peanut brittle",
+      MX: "praliné de maní",
+      BR: "quebra-queixo",
+      CO: "praliné de maní"
+    },
     variants: ["praliné de maní"],
     packaging: ["Classic"],
     tags: ["praliné de maní", "snacks", "western-v0.2"],
@@ -6460,6 +10302,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Pork Rinds (Chicharrones)",
     aliases: ["pork rinds", "pork rinds", "chicharrones", "torresmo"],
+    regionalAliases: {
+      US: "pork rinds",
+      CA: "pork rinds",
+      MX: "chicharrones",
+      BR: "torresmo",
+      CO: "chicharrones"
+    },
     variants: ["chicharrones"],
     packaging: ["Plain", "Hot"],
     tags: ["chicharrones", "snacks", "western-v0.2"],
@@ -6468,6 +10317,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Pop-Tarts (Toaster Pastries)",
     aliases: ["pop-tarts", "pop-tarts", "panquecillos tostadores ", "biscoito recheado "],
+    regionalAliases: {
+      US: "pop-tarts",
+      CA: "pop-tarts",
+      MX: "panquecillos tostadores ",
+      BR: "biscoito recheado ",
+      CO: "ponqués tostadores "
+    },
     variants: ["ponqués tostadores (≈)"],
     packaging: ["Strawberry", "Brown sugar"],
     tags: ["ponqués tostadores (≈)", "snacks", "western-v0.2"],
@@ -6476,6 +10332,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Rice Cakes",
     aliases: ["rice cakes", "rice cakes", "pasteles de arroz", "bolos de arroz"],
+    regionalAliases: {
+      US: "rice cakes",
+      CA: "rice cakes",
+      MX: "pasteles de arroz",
+      BR: "bolos de arroz",
+      CO: "galletas de arroz"
+    },
     variants: ["galletas de arroz"],
     packaging: ["Plain", "Caramel"],
     tags: ["galletas de arroz", "snacks", "western-v0.2"],
@@ -6484,6 +10347,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Sesame Snaps",
     aliases: ["sesame snaps", "sesame snaps", "ajonjolí crocante", "doce de gergelim"],
+    regionalAliases: {
+      US: "sesame snaps",
+      CA: "sesame snaps",
+      MX: "ajonjolí crocante",
+      BR: "doce de gergelim",
+      CO: "ajonjolí crocante"
+    },
     variants: ["ajonjolí crocante"],
     packaging: ["Classic"],
     tags: ["ajonjolí crocante", "snacks", "western-v0.2"],
@@ -6492,6 +10362,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Shirley Biscuits (Caribbean)",
     aliases: ["Shirley biscuits", "Shirley biscuits", "galletas Shirley", "galletas Shirley", "biskit Shirley", "Shirley biscuits", "Shirley biscuits", "galletas Shirley", "biscoito Shirley", "galletas Shirley"],
+    regionalAliases: {
+      JM: "Shirley biscuits",
+      TT: "Shirley biscuits",
+      PR: "galletas Shirley",
+      DO: "galletas Shirley",
+      HT: "biskit Shirley",
+      US: "Shirley biscuits",
+      CA: "Shirley biscuits",
+      MX: "galletas Shirley",
+      BR: "biscoito Shirley",
+      CO: "galletas Shirley"
+    },
     variants: ["Original"],
     packaging: ["pack"],
     tags: ["original", "snacks", "western-v0.2"],
@@ -6500,6 +10382,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Sorrel Candy (Hibiscus)",
     aliases: ["sorrel candy", "sorrel candy", "caramelo de jamaica", "caramelo de jamaica", "bònbon siwo zoranj", "hibiscus candy", "hibiscus candy", "caramelo de jamaica", "bala de hibisco", "caramelo de jamaica"],
+    regionalAliases: {
+      JM: "sorrel candy",
+      TT: "sorrel candy",
+      PR: "caramelo de jamaica",
+      DO: "caramelo de jamaica",
+      HT: "bònbon siwo zoranj",
+      US: "hibiscus candy",
+      CA: "hibiscus candy",
+      MX: "caramelo de jamaica",
+      BR: "bala de hibisco",
+      CO: "caramelo de jamaica"
+    },
     variants: ["Hard candy"],
     packaging: ["bag"],
     tags: ["hard candy", "snacks", "western-v0.2"],
@@ -6508,6 +10402,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Sweet Biscuits (Tea)",
     aliases: ["tea biscuits", "tea biscuits", "galletas tipo té", "biscoito de chá"],
+    regionalAliases: {
+      US: "tea biscuits",
+      CA: "tea biscuits",
+      MX: "galletas tipo té",
+      BR: "biscoito de chá",
+      CO: "galletas tipo té"
+    },
     variants: ["galletas tipo té"],
     packaging: ["Plain", "Marie"],
     tags: ["galletas tipo té", "snacks", "western-v0.2"],
@@ -6516,6 +10417,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Trail Mix (Tropical)",
     aliases: ["tropical trail mix", "tropical trail mix", "mezcla tropical", "mix tropical"],
+    regionalAliases: {
+      US: "tropical trail mix",
+      CA: "tropical trail mix",
+      MX: "mezcla tropical",
+      BR: "mix tropical",
+      CO: "mezcla tropical"
+    },
     variants: ["mezcla tropical"],
     packaging: ["With pineapple", "With mango"],
     tags: ["mezcla tropical", "snacks", "western-v0.2"],
@@ -6524,6 +10432,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Antipasto Salad",
     aliases: ["antipasto salad", "antipasto salad", "ensalada antipasto", "antepasto"],
+    regionalAliases: {
+      US: "antipasto salad",
+      CA: "antipasto salad",
+      MX: "ensalada antipasto",
+      BR: "antepasto",
+      CO: "ensalada antipasto"
+    },
     variants: ["ensalada antipasto"],
     packaging: ["Olive-heavy", "Meat-heavy"],
     tags: ["deli & prepared", "ensalada antipasto", "western-v0.2"],
@@ -6532,6 +10447,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Baba Ghanoush",
     aliases: ["baba ghanoush", "baba ghanoush", "berenjena asada", "pasta de berinjela"],
+    regionalAliases: {
+      US: "baba ghanoush",
+      CA: "baba ghanoush",
+      MX: "berenjena asada",
+      BR: "pasta de berinjela",
+      CO: "berenjena"
+    },
     variants: ["berenjena"],
     packaging: ["Classic", "Smoky"],
     tags: ["berenjena", "deli & prepared", "western-v0.2"],
@@ -6540,6 +10462,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bean Salad (Three-Bean)",
     aliases: ["three-bean salad", "three-bean salad", "ensalada de tres frijoles", "salada de três feijões"],
+    regionalAliases: {
+      US: "three-bean salad",
+      CA: "three-bean salad",
+      MX: "ensalada de tres frijoles",
+      BR: "salada de três feijões",
+      CO: "ensalada de tres frijoles"
+    },
     variants: ["ensalada de tres frijoles"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada de tres frijoles", "western-v0.2"],
@@ -6548,6 +10477,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beet Salad (Vinaigrette)",
     aliases: ["beet salad", "beet salad", "ensalada de remolacha", "salada de beterraba"],
+    regionalAliases: {
+      US: "beet salad",
+      CA: "beet salad",
+      MX: "ensalada de remolacha",
+      BR: "salada de beterraba",
+      CO: "ensalada de remolacha"
+    },
     variants: ["ensalada de remolacha"],
     packaging: ["With feta", "No cheese"],
     tags: ["deli & prepared", "ensalada de remolacha", "western-v0.2"],
@@ -6556,6 +10492,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Broccoli Slaw",
     aliases: ["broccoli slaw", "broccoli slaw", "ensalada de brócoli", "salada de brócolis"],
+    regionalAliases: {
+      US: "broccoli slaw",
+      CA: "broccoli slaw",
+      MX: "ensalada de brócoli",
+      BR: "salada de brócolis",
+      CO: "ensalada de brócoli"
+    },
     variants: ["ensalada de brócoli"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada de brócoli", "western-v0.2"],
@@ -6564,6 +10507,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cabbage Slaw (Coleslaw)",
     aliases: ["coleslaw", "coleslaw", "ensalada de repollo", "ensalada de repollo", "slaw", "coleslaw", "coleslaw", "ensalada de col", "salada de repolho", "ensalada de repollo"],
+    regionalAliases: {
+      JM: "coleslaw",
+      TT: "coleslaw",
+      PR: "ensalada de repollo",
+      DO: "ensalada de repollo",
+      HT: "slaw",
+      US: "coleslaw",
+      CA: "coleslaw",
+      MX: "ensalada de col",
+      BR: "salada de repolho",
+      CO: "ensalada de repollo"
+    },
     variants: ["Creamy", "Vinegar"],
     packaging: ["tub"],
     tags: ["creamy", "deli & prepared", "vinegar", "western-v0.2"],
@@ -6572,6 +10527,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Caprese Salad",
     aliases: ["caprese salad", "caprese salad", "ensalada caprese", "salada caprese"],
+    regionalAliases: {
+      US: "caprese salad",
+      CA: "caprese salad",
+      MX: "ensalada caprese",
+      BR: "salada caprese",
+      CO: "ensalada caprese"
+    },
     variants: ["ensalada caprese"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada caprese", "western-v0.2"],
@@ -6580,6 +10542,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Caesar Salad (Grab & Go)",
     aliases: ["chicken caesar", "chicken caesar", "ensalada césar con pollo", "salada césar com frango"],
+    regionalAliases: {
+      US: "chicken caesar",
+      CA: "chicken caesar",
+      MX: "ensalada césar con pollo",
+      BR: "salada césar com frango",
+      CO: "ensalada césar con pollo"
+    },
     variants: ["ensalada césar con pollo"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada césar con pollo", "western-v0.2"],
@@ -6588,6 +10557,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Salad (Deli)",
     aliases: ["chicken salad", "chicken salad", "ensalada de pollo", "salada de frango"],
+    regionalAliases: {
+      US: "chicken salad",
+      CA: "chicken salad",
+      MX: "ensalada de pollo",
+      BR: "salada de frango",
+      CO: "ensalada de pollo"
+    },
     variants: ["ensalada de pollo"],
     packaging: ["Classic", "Cranberry"],
     tags: ["deli & prepared", "ensalada de pollo", "western-v0.2"],
@@ -6596,6 +10572,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chickpea Salad (Garbanzo)",
     aliases: ["chickpea salad", "chickpea salad", "ensalada de garbanzo", "salada de grão-de-bico"],
+    regionalAliases: {
+      US: "chickpea salad",
+      CA: "chickpea salad",
+      MX: "ensalada de garbanzo",
+      BR: "salada de grão-de-bico",
+      CO: "ensalada de garbanzo"
+    },
     variants: ["ensalada de garbanzo"],
     packaging: ["Herbed", "Curried"],
     tags: ["deli & prepared", "ensalada de garbanzo", "western-v0.2"],
@@ -6604,6 +10587,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Couscous Salad (Pearl)",
     aliases: ["couscous salad", "couscous salad", "ensalada de cuscús", "salada de cuscuz"],
+    regionalAliases: {
+      US: "couscous salad",
+      CA: "couscous salad",
+      MX: "ensalada de cuscús",
+      BR: "salada de cuscuz",
+      CO: "ensalada de cuscús"
+    },
     variants: ["ensalada de cuscús"],
     packaging: ["With veg", "With feta"],
     tags: ["deli & prepared", "ensalada de cuscús", "western-v0.2"],
@@ -6612,6 +10602,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Crudités Platter",
     aliases: ["veggie tray", "veggie tray", "bandeja de vegetales", "tabua de legumes"],
+    regionalAliases: {
+      US: "veggie tray",
+      CA: "veggie tray",
+      MX: "bandeja de vegetales",
+      BR: "tabua de legumes",
+      CO: "bandeja de vegetales"
+    },
     variants: ["bandeja de vegetales"],
     packaging: ["Ranch", "Hummus"],
     tags: ["bandeja de vegetales", "deli & prepared", "western-v0.2"],
@@ -6620,6 +10617,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Deviled Eggs",
     aliases: ["deviled eggs", "deviled eggs", "huevos rellenos", "ovos recheados"],
+    regionalAliases: {
+      US: "deviled eggs",
+      CA: "deviled eggs",
+      MX: "huevos rellenos",
+      BR: "ovos recheados",
+      CO: "huevos rellenos"
+    },
     variants: ["huevos rellenos"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "huevos rellenos", "western-v0.2"],
@@ -6628,6 +10632,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Falafel (Deli)",
     aliases: ["falafel", "falafel", "falafel", "falafel"],
+    regionalAliases: {
+      US: "falafel",
+      CA: "falafel",
+      MX: "falafel",
+      BR: "falafel",
+      CO: "falafel"
+    },
     variants: ["falafel"],
     packaging: ["Classic", "Spicy"],
     tags: ["deli & prepared", "falafel", "western-v0.2"],
@@ -6636,6 +10647,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fruit Cup (Mixed)",
     aliases: ["mixed fruit cup", "mixed fruit cup", "vaso de frutas", "copo de frutas"],
+    regionalAliases: {
+      US: "mixed fruit cup",
+      CA: "mixed fruit cup",
+      MX: "vaso de frutas",
+      BR: "copo de frutas",
+      CO: "vaso de frutas"
+    },
     variants: ["vaso de frutas"],
     packaging: ["Seasonal"],
     tags: ["deli & prepared", "vaso de frutas", "western-v0.2"],
@@ -6644,6 +10662,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Greek Salad",
     aliases: ["greek salad", "greek salad", "ensalada griega", "salada grega"],
+    regionalAliases: {
+      US: "greek salad",
+      CA: "greek salad",
+      MX: "ensalada griega",
+      BR: "salada grega",
+      CO: "ensalada griega"
+    },
     variants: ["ensalada griega"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada griega", "western-v0.2"],
@@ -6652,6 +10677,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Hummus (Deli)",
     aliases: ["hummus", "hummus", "hummus", "homus"],
+    regionalAliases: {
+      US: "hummus",
+      CA: "hummus",
+      MX: "hummus",
+      BR: "homus",
+      CO: "hummus"
+    },
     variants: ["hummus"],
     packaging: ["Classic", "Red pepper"],
     tags: ["deli & prepared", "hummus", "western-v0.2"],
@@ -6660,6 +10692,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jerk Chicken (Hot Bar)",
     aliases: ["jerk chicken", "jerk chicken", "pollo jerk", "pollo jerk", "poul jerk", "jerk chicken", "jerk chicken", "pollo jerk", "frango jerk", "pollo jerk"],
+    regionalAliases: {
+      JM: "jerk chicken",
+      TT: "jerk chicken",
+      PR: "pollo jerk",
+      DO: "pollo jerk",
+      HT: "poul jerk",
+      US: "jerk chicken",
+      CA: "jerk chicken",
+      MX: "pollo jerk",
+      BR: "frango jerk",
+      CO: "pollo jerk"
+    },
     variants: ["Quarter", "Half"],
     packaging: ["hot case"],
     tags: ["deli & prepared", "half", "quarter", "western-v0.2"],
@@ -6668,6 +10712,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Macaroni Salad",
     aliases: ["macaroni salad", "macaroni salad", "ensalada de coditos", "salada de macarrão"],
+    regionalAliases: {
+      US: "macaroni salad",
+      CA: "macaroni salad",
+      MX: "ensalada de coditos",
+      BR: "salada de macarrão",
+      CO: "ensalada de coditos"
+    },
     variants: ["ensalada de coditos"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada de coditos", "western-v0.2"],
@@ -6676,6 +10727,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mediterranean Platter",
     aliases: ["mediterranean platter", "mediterranean platter", "tabla mediterránea", "tábua mediterrânea"],
+    regionalAliases: {
+      US: "mediterranean platter",
+      CA: "mediterranean platter",
+      MX: "tabla mediterránea",
+      BR: "tábua mediterrânea",
+      CO: "tabla mediterránea"
+    },
     variants: ["tabla mediterránea"],
     packaging: ["Hummus", "Dolmas"],
     tags: ["deli & prepared", "tabla mediterránea", "western-v0.2"],
@@ -6684,6 +10742,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pasta Salad (Italian)",
     aliases: ["pasta salad", "pasta salad", "ensalada de pasta", "salada de macarrão"],
+    regionalAliases: {
+      US: "pasta salad",
+      CA: "pasta salad",
+      MX: "ensalada de pasta",
+      BR: "salada de macarrão",
+      CO: "ensalada de pasta"
+    },
     variants: ["ensalada de pasta"],
     packaging: ["Italian", "Creamy"],
     tags: ["deli & prepared", "ensalada de pasta", "western-v0.2"],
@@ -6692,6 +10757,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Potato Salad (Deli)",
     aliases: ["potato salad", "potato salad", "ensalada de papa", "salada de batata"],
+    regionalAliases: {
+      US: "potato salad",
+      CA: "potato salad",
+      MX: "ensalada de papa",
+      BR: "salada de batata",
+      CO: "ensalada de papa"
+    },
     variants: ["ensalada de papa"],
     packaging: ["Country", "Mustard"],
     tags: ["deli & prepared", "ensalada de papa", "western-v0.2"],
@@ -6700,6 +10772,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Quinoa Salad (Herbed)",
     aliases: ["quinoa salad", "quinoa salad", "ensalada de quinua", "salada de quinoa"],
+    regionalAliases: {
+      US: "quinoa salad",
+      CA: "quinoa salad",
+      MX: "ensalada de quinua",
+      BR: "salada de quinoa",
+      CO: "ensalada de quinua"
+    },
     variants: ["ensalada de quinua"],
     packaging: ["With veg", "With beans"],
     tags: ["deli & prepared", "ensalada de quinua", "western-v0.2"],
@@ -6708,6 +10787,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Rotisserie Chicken (Whole)",
     aliases: ["rotisserie chicken", "rotisserie chicken", "pollo rostizado", "frango assado"],
+    regionalAliases: {
+      US: "rotisserie chicken",
+      CA: "rotisserie chicken",
+      MX: "pollo rostizado",
+      BR: "frango assado",
+      CO: "pollo rostizado"
+    },
     variants: ["pollo rostizado"],
     packaging: ["Lemon pepper", "Herb"],
     tags: ["deli & prepared", "pollo rostizado", "western-v0.2"],
@@ -6716,6 +10802,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Salsa Fresca (Pico de Gallo)",
     aliases: ["pico de gallo", "pico de gallo", "pico de gallo", "vinagrete "],
+    regionalAliases: {
+      US: "pico de gallo",
+      CA: "pico de gallo",
+      MX: "pico de gallo",
+      BR: "vinagrete ",
+      CO: "pico de gallo"
+    },
     variants: ["pico de gallo"],
     packaging: ["Mild", "Hot"],
     tags: ["deli & prepared", "pico de gallo", "western-v0.2"],
@@ -6724,6 +10817,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Shrimp Cocktail (Tray)",
     aliases: ["shrimp cocktail", "shrimp cocktail", "cóctel de camarón", "coquetel de camarão"],
+    regionalAliases: {
+      US: "shrimp cocktail",
+      CA: "shrimp cocktail",
+      MX: "cóctel de camarón",
+      BR: "coquetel de camarão",
+      CO: "cóctel de camarón"
+    },
     variants: ["cóctel de camarón"],
     packaging: ["Classic"],
     tags: ["cóctel de camarón", "deli & prepared", "western-v0.2"],
@@ -6732,6 +10832,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tabbouleh",
     aliases: ["tabbouleh", "tabbouleh", "tabule", "tabule"],
+    regionalAliases: {
+      US: "tabbouleh",
+      CA: "tabbouleh",
+      MX: "tabule",
+      BR: "tabule",
+      CO: "tabule"
+    },
     variants: ["tabule"],
     packaging: ["Parsley-heavy", "Bulgur-heavy"],
     tags: ["deli & prepared", "tabule", "western-v0.2"],
@@ -6740,6 +10847,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tuna Salad (Deli)",
     aliases: ["tuna salad", "tuna salad", "ensalada de atún", "salada de atum"],
+    regionalAliases: {
+      US: "tuna salad",
+      CA: "tuna salad",
+      MX: "ensalada de atún",
+      BR: "salada de atum",
+      CO: "ensalada de atún"
+    },
     variants: ["ensalada de atún"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "ensalada de atún", "western-v0.2"],
@@ -6748,6 +10862,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Vegetable Samosas (Deli)",
     aliases: ["samosas", "samosas", "empanadas indias ", "samosa"],
+    regionalAliases: {
+      US: "samosas",
+      CA: "samosas",
+      MX: "empanadas indias ",
+      BR: "samosa",
+      CO: "samosa"
+    },
     variants: ["samosa"],
     packaging: ["Classic"],
     tags: ["deli & prepared", "samosa", "western-v0.2"],
@@ -6756,6 +10877,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Baked Ziti (Family Tray)",
     aliases: ["baked ziti", "baked ziti", "horneado de ziti", "macarrão ao forno"],
+    regionalAliases: {
+      US: "baked ziti",
+      CA: "baked ziti",
+      MX: "horneado de ziti",
+      BR: "macarrão ao forno",
+      CO: "pasta al horno"
+    },
     variants: ["pasta al horno"],
     packaging: ["Beef", "Veg"],
     tags: ["pasta al horno", "ready meals", "western-v0.2"],
@@ -6764,6 +10892,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beef Lasagna (Fresh)",
     aliases: ["lasagna", "lasagna", "lasaña", "lasanha"],
+    regionalAliases: {
+      US: "lasagna",
+      CA: "lasagna",
+      MX: "lasaña",
+      BR: "lasanha",
+      CO: "lasaña"
+    },
     variants: ["lasaña"],
     packaging: ["Family", "Single"],
     tags: ["lasaña", "ready meals", "western-v0.2"],
@@ -6772,6 +10907,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bibimbap Bowl",
     aliases: ["bibimbap", "bibimbap", "bibimbap", "bibimbap"],
+    regionalAliases: {
+      US: "bibimbap",
+      CA: "bibimbap",
+      MX: "bibimbap",
+      BR: "bibimbap",
+      CO: "bibimbap"
+    },
     variants: ["bibimbap"],
     packaging: ["Beef", "Veg"],
     tags: ["bibimbap", "ready meals", "western-v0.2"],
@@ -6780,6 +10922,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Butter Chicken with Rice",
     aliases: ["butter chicken", "butter chicken", "pollo a la mantequilla", "frango com manteiga"],
+    regionalAliases: {
+      US: "butter chicken",
+      CA: "butter chicken",
+      MX: "pollo a la mantequilla",
+      BR: "frango com manteiga",
+      CO: "pollo mantequilla"
+    },
     variants: ["pollo mantequilla"],
     packaging: ["Classic"],
     tags: ["pollo mantequilla", "ready meals", "western-v0.2"],
@@ -6788,6 +10937,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Caesar Salad Kit",
     aliases: ["caesar kit", "caesar kit", "kit césar", "kit césar"],
+    regionalAliases: {
+      US: "caesar kit",
+      CA: "caesar kit",
+      MX: "kit césar",
+      BR: "kit césar",
+      CO: "kit césar"
+    },
     variants: ["kit césar"],
     packaging: ["With chicken", "No chicken"],
     tags: ["kit césar", "ready meals", "western-v0.2"],
@@ -6796,6 +10952,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Caribbean Jerk Chicken Bowl",
     aliases: ["jerk bowl", "jerk bowl", "jerk bowl", "jerk bowl", "bol jerk", "jerk bowl", "jerk bowl", "jerk bowl", "jerk bowl", "jerk bowl"],
+    regionalAliases: {
+      JM: "jerk bowl",
+      TT: "jerk bowl",
+      PR: "jerk bowl",
+      DO: "jerk bowl",
+      HT: "bol jerk",
+      US: "jerk bowl",
+      CA: "jerk bowl",
+      MX: "jerk bowl",
+      BR: "jerk bowl",
+      CO: "jerk bowl"
+    },
     variants: ["Rice & peas", "Veg medley"],
     packaging: ["bowl"],
     tags: ["ready meals", "rice & peas", "veg medley", "western-v0.2"],
@@ -6804,6 +10972,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Alfredo Pasta",
     aliases: ["chicken alfredo", "chicken alfredo", "pasta alfredo con pollo", "macarrão alfredo com frango"],
+    regionalAliases: {
+      US: "chicken alfredo",
+      CA: "chicken alfredo",
+      MX: "pasta alfredo con pollo",
+      BR: "macarrão alfredo com frango",
+      CO: "pasta alfredo con pollo"
+    },
     variants: ["pasta alfredo con pollo"],
     packaging: ["Classic"],
     tags: ["pasta alfredo con pollo", "ready meals", "western-v0.2"],
@@ -6812,6 +10987,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Pot Pie (Chilled)",
     aliases: ["chicken pot pie", "chicken pot pie", "pastel de pollo", "empadão de frango"],
+    regionalAliases: {
+      US: "chicken pot pie",
+      CA: "chicken pot pie",
+      MX: "pastel de pollo",
+      BR: "empadão de frango",
+      CO: "pastel de pollo"
+    },
     variants: ["pastel de pollo"],
     packaging: ["6in", "Family"],
     tags: ["pastel de pollo", "ready meals", "western-v0.2"],
@@ -6820,6 +11002,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chili (Beef) — Fresh",
     aliases: ["chili", "chili", "chili con carne", "chili com carne"],
+    regionalAliases: {
+      US: "chili",
+      CA: "chili",
+      MX: "chili con carne",
+      BR: "chili com carne",
+      CO: "chili con carne"
+    },
     variants: ["chili con carne"],
     packaging: ["Mild", "Hot"],
     tags: ["chili con carne", "ready meals", "western-v0.2"],
@@ -6828,6 +11017,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Curry Goat with Rice & Peas",
     aliases: ["curry goat meal", "carne de chivo con arroz", "cabra con arroz", "goat curry meal", "goat curry meal", "carne de chivo con arroz", "curry de cabra", "cabro con arroz"],
+    regionalAliases: {
+      JM: "curry goat meal",
+      PR: "carne de chivo con arroz",
+      DO: "cabra con arroz",
+      US: "goat curry meal",
+      CA: "goat curry meal",
+      MX: "carne de chivo con arroz",
+      BR: "curry de cabra",
+      CO: "cabro con arroz"
+    },
     variants: ["Classic"],
     packaging: ["clamshell"],
     tags: ["classic", "ready meals", "western-v0.2"],
@@ -6836,6 +11035,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Enchiladas (Chicken) — Chilled",
     aliases: ["enchiladas", "enchiladas", "enchiladas", "enchiladas"],
+    regionalAliases: {
+      US: "enchiladas",
+      CA: "enchiladas",
+      MX: "enchiladas",
+      BR: "enchiladas",
+      CO: "enchiladas"
+    },
     variants: ["enchiladas"],
     packaging: ["Green", "Red"],
     tags: ["enchiladas", "ready meals", "western-v0.2"],
@@ -6844,6 +11050,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fajita Kit (Chicken)",
     aliases: ["fajita kit", "fajita kit", "kit fajitas", "kit fajitas"],
+    regionalAliases: {
+      US: "fajita kit",
+      CA: "fajita kit",
+      MX: "kit fajitas",
+      BR: "kit fajitas",
+      CO: "kit fajitas"
+    },
     variants: ["kit fajitas"],
     packaging: ["Chicken", "Steak"],
     tags: ["kit fajitas", "ready meals", "western-v0.2"],
@@ -6852,6 +11065,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Falafel Bowl with Tahini",
     aliases: ["falafel bowl", "falafel bowl", "bol de falafel", "tigela de falafel"],
+    regionalAliases: {
+      US: "falafel bowl",
+      CA: "falafel bowl",
+      MX: "bol de falafel",
+      BR: "tigela de falafel",
+      CO: "bol de falafel"
+    },
     variants: ["bol de falafel"],
     packaging: ["Classic"],
     tags: ["bol de falafel", "ready meals", "western-v0.2"],
@@ -6860,6 +11080,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Greek Gyro Kit",
     aliases: ["gyro kit", "gyro kit", "kit gyro", "kit gyro"],
+    regionalAliases: {
+      US: "gyro kit",
+      CA: "gyro kit",
+      MX: "kit gyro",
+      BR: "kit gyro",
+      CO: "kit gyro"
+    },
     variants: ["kit gyro"],
     packaging: ["Beef-lamb", "Chicken"],
     tags: ["kit gyro", "ready meals", "western-v0.2"],
@@ -6868,6 +11095,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jambalaya (Chilled)",
     aliases: ["jambalaya", "jambalaya", "jambalaya", "jambalaya"],
+    regionalAliases: {
+      US: "jambalaya",
+      CA: "jambalaya",
+      MX: "jambalaya",
+      BR: "jambalaya",
+      CO: "jambalaya"
+    },
     variants: ["jambalaya"],
     packaging: ["Chicken", "sausage"],
     tags: ["jambalaya", "ready meals", "western-v0.2"],
@@ -6876,6 +11110,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mac & Cheese (Family)",
     aliases: ["mac and cheese", "mac and cheese", "macarrones con queso", "mac and cheese"],
+    regionalAliases: {
+      US: "mac and cheese",
+      CA: "mac and cheese",
+      MX: "macarrones con queso",
+      BR: "mac and cheese",
+      CO: "macarrones con queso"
+    },
     variants: ["macarrones con queso"],
     packaging: ["Four cheese", "Bacon"],
     tags: ["macarrones con queso", "ready meals", "western-v0.2"],
@@ -6884,6 +11125,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Meatloaf with Mashed Potatoes",
     aliases: ["meatloaf meal", "meatloaf meal", "albóndiga de carne ", "bolo de carne"],
+    regionalAliases: {
+      US: "meatloaf meal",
+      CA: "meatloaf meal",
+      MX: "albóndiga de carne ",
+      BR: "bolo de carne",
+      CO: "pan de carne"
+    },
     variants: ["pan de carne"],
     packaging: ["Classic"],
     tags: ["pan de carne", "ready meals", "western-v0.2"],
@@ -6892,6 +11140,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pad Thai (Chicken)",
     aliases: ["pad thai", "pad thai", "pad thai", "pad thai"],
+    regionalAliases: {
+      US: "pad thai",
+      CA: "pad thai",
+      MX: "pad thai",
+      BR: "pad thai",
+      CO: "pad thai"
+    },
     variants: ["pad thai"],
     packaging: ["Classic"],
     tags: ["pad thai", "ready meals", "western-v0.2"],
@@ -6900,6 +11155,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Paella (Seafood)",
     aliases: ["paella", "paella", "paella", "paella"],
+    regionalAliases: {
+      US: "paella",
+      CA: "paella",
+      MX: "paella",
+      BR: "paella",
+      CO: "paella"
+    },
     variants: ["paella"],
     packaging: ["Classic"],
     tags: ["paella", "ready meals", "western-v0.2"],
@@ -6908,6 +11170,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pasta Primavera",
     aliases: ["pasta primavera", "pasta primavera", "pasta primavera", "pasta primavera"],
+    regionalAliases: {
+      US: "pasta primavera",
+      CA: "pasta primavera",
+      MX: "pasta primavera",
+      BR: "pasta primavera",
+      CO: "pasta primavera"
+    },
     variants: ["pasta primavera"],
     packaging: ["Classic"],
     tags: ["pasta primavera", "ready meals", "western-v0.2"],
@@ -6916,6 +11185,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Shepherd’s Pie (Cottage Pie)",
     aliases: ["shepherd's pie", "shepherd's pie", "pastel de carne", "escondidinho "],
+    regionalAliases: {
+      US: "shepherd's pie",
+      CA: "shepherd's pie",
+      MX: "pastel de carne",
+      BR: "escondidinho ",
+      CO: "pastel de carne"
+    },
     variants: ["pastel de carne"],
     packaging: ["Family", "Single"],
     tags: ["pastel de carne", "ready meals", "western-v0.2"],
@@ -6924,6 +11200,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Stir-Fry Kit (Veg + Sauce)",
     aliases: ["stir-fry kit", "stir-fry kit", "kit salteado", "kit stir-fry"],
+    regionalAliases: {
+      US: "stir-fry kit",
+      CA: "stir-fry kit",
+      MX: "kit salteado",
+      BR: "kit stir-fry",
+      CO: "kit salteado"
+    },
     variants: ["kit salteado"],
     packaging: ["Teriyaki", "Garlic"],
     tags: ["kit salteado", "ready meals", "western-v0.2"],
@@ -6932,6 +11215,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Stuffed Bell Peppers (2ct)",
     aliases: ["stuffed peppers", "stuffed peppers", "pimientos rellenos", "pimentão recheado"],
+    regionalAliases: {
+      US: "stuffed peppers",
+      CA: "stuffed peppers",
+      MX: "pimientos rellenos",
+      BR: "pimentão recheado",
+      CO: "pimentón relleno"
+    },
     variants: ["pimentón relleno"],
     packaging: ["Beef", "Veg"],
     tags: ["pimentón relleno", "ready meals", "western-v0.2"],
@@ -6940,6 +11230,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Sushi Combo (California + Nigiri)",
     aliases: ["sushi combo", "sushi combo", "sushi combo", "combo sushi"],
+    regionalAliases: {
+      US: "sushi combo",
+      CA: "sushi combo",
+      MX: "sushi combo",
+      BR: "combo sushi",
+      CO: "sushi combo"
+    },
     variants: ["sushi combo"],
     packaging: ["8–16 pc"],
     tags: ["ready meals", "sushi combo", "western-v0.2"],
@@ -6948,6 +11245,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tacos (Al Pastor Kit)",
     aliases: ["al pastor kit", "al pastor kit", "kit al pastor", "kit al pastor"],
+    regionalAliases: {
+      US: "al pastor kit",
+      CA: "al pastor kit",
+      MX: "kit al pastor",
+      BR: "kit al pastor",
+      CO: "kit al pastor"
+    },
     variants: ["kit al pastor"],
     packaging: ["With salsa", "With pineapple"],
     tags: ["kit al pastor", "ready meals", "western-v0.2"],
@@ -6956,6 +11260,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Thai Green Curry (Chicken)",
     aliases: ["green curry", "green curry", "curry verde", "curry verde"],
+    regionalAliases: {
+      US: "green curry",
+      CA: "green curry",
+      MX: "curry verde",
+      BR: "curry verde",
+      CO: "curry verde"
+    },
     variants: ["curry verde"],
     packaging: ["Classic"],
     tags: ["curry verde", "ready meals", "western-v0.2"],
@@ -6964,6 +11275,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tomato Basil Soup (Fresh)",
     aliases: ["tomato soup", "tomato soup", "sopa de tomate", "sopa de tomate"],
+    regionalAliases: {
+      US: "tomato soup",
+      CA: "tomato soup",
+      MX: "sopa de tomate",
+      BR: "sopa de tomate",
+      CO: "sopa de tomate"
+    },
     variants: ["sopa de tomate"],
     packaging: ["Quart", "Pint"],
     tags: ["ready meals", "sopa de tomate", "western-v0.2"],
@@ -6972,6 +11290,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Arancini (Rice Balls)",
     aliases: ["arancini", "arancini", "arancini", "bolinho de arroz"],
+    regionalAliases: {
+      US: "arancini",
+      CA: "arancini",
+      MX: "arancini",
+      BR: "bolinho de arroz",
+      CO: "arancini"
+    },
     variants: ["arancini"],
     packaging: ["Cheese", "Meat"],
     tags: ["arancini", "frozen entrées", "western-v0.2"],
@@ -6980,6 +11305,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Baked Mac & Cheese",
     aliases: ["baked mac", "baked mac", "mac con queso al horno", "mac and cheese forno"],
+    regionalAliases: {
+      US: "baked mac",
+      CA: "baked mac",
+      MX: "mac con queso al horno",
+      BR: "mac and cheese forno",
+      CO: "mac con queso al horno"
+    },
     variants: ["mac con queso al horno"],
     packaging: ["Four cheese", "Bacon"],
     tags: ["frozen entrées", "mac con queso al horno", "western-v0.2"],
@@ -6988,6 +11320,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bangers & Mash",
     aliases: ["bangers & mash", "bangers & mash", "salchichas con puré", "purê com salsichas"],
+    regionalAliases: {
+      US: "bangers & mash",
+      CA: "bangers & mash",
+      MX: "salchichas con puré",
+      BR: "purê com salsichas",
+      CO: "salchichas con puré"
+    },
     variants: ["salchichas con puré"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "salchichas con puré", "western-v0.2"],
@@ -6996,6 +11335,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beef & Broccoli",
     aliases: ["beef and broccoli", "beef and broccoli", "res con brócoli", "carne com brócolis"],
+    regionalAliases: {
+      US: "beef and broccoli",
+      CA: "beef and broccoli",
+      MX: "res con brócoli",
+      BR: "carne com brócolis",
+      CO: "res con brócoli"
+    },
     variants: ["res con brócoli"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "res con brócoli", "western-v0.2"],
@@ -7004,6 +11350,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beef Burritos (Frozen)",
     aliases: ["beef burritos", "beef burritos", "burritos de res", "burritos de carne"],
+    regionalAliases: {
+      US: "beef burritos",
+      CA: "beef burritos",
+      MX: "burritos de res",
+      BR: "burritos de carne",
+      CO: "burritos de res"
+    },
     variants: ["burritos de res"],
     packaging: ["2-pack", "8-pack"],
     tags: ["burritos de res", "frozen entrées", "western-v0.2"],
@@ -7012,6 +11365,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beef Empanadas",
     aliases: ["beef empanadas", "beef empanadas", "empanadas de carne", "empanadas de carne"],
+    regionalAliases: {
+      US: "beef empanadas",
+      CA: "beef empanadas",
+      MX: "empanadas de carne",
+      BR: "empanadas de carne",
+      CO: "empanadas de carne"
+    },
     variants: ["empanadas de carne"],
     packaging: ["Bake", "Fry"],
     tags: ["empanadas de carne", "frozen entrées", "western-v0.2"],
@@ -7020,6 +11380,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beef Enchiladas",
     aliases: ["beef enchiladas", "beef enchiladas", "enchiladas de res", "enchiladas de carne"],
+    regionalAliases: {
+      US: "beef enchiladas",
+      CA: "beef enchiladas",
+      MX: "enchiladas de res",
+      BR: "enchiladas de carne",
+      CO: "enchiladas de res"
+    },
     variants: ["enchiladas de res"],
     packaging: ["Red", "Green"],
     tags: ["enchiladas de res", "frozen entrées", "western-v0.2"],
@@ -7028,6 +11395,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beef Meatballs",
     aliases: ["meatballs", "meatballs", "albóndigas", "almôndegas"],
+    regionalAliases: {
+      US: "meatballs",
+      CA: "meatballs",
+      MX: "albóndigas",
+      BR: "almôndegas",
+      CO: "albóndigas"
+    },
     variants: ["albóndigas"],
     packaging: ["Italian", "Swedish"],
     tags: ["albóndigas", "frozen entrées", "western-v0.2"],
@@ -7036,6 +11410,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Breakfast Sandwich (Sausage)",
     aliases: ["breakfast sandwich", "breakfast sandwich", "sándwich desayuno", "sanduíche matinal"],
+    regionalAliases: {
+      US: "breakfast sandwich",
+      CA: "breakfast sandwich",
+      MX: "sándwich desayuno",
+      BR: "sanduíche matinal",
+      CO: "sándwich desayuno"
+    },
     variants: ["sándwich desayuno"],
     packaging: ["English muffin", "Biscuit"],
     tags: ["frozen entrées", "sándwich desayuno", "western-v0.2"],
@@ -7044,6 +11425,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chana Masala",
     aliases: ["chana masala", "chana masala", "garbanzos masala", "grão-de-bico masala"],
+    regionalAliases: {
+      US: "chana masala",
+      CA: "chana masala",
+      MX: "garbanzos masala",
+      BR: "grão-de-bico masala",
+      CO: "garbanzos masala"
+    },
     variants: ["garbanzos masala"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "garbanzos masala", "western-v0.2"],
@@ -7052,6 +11440,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken & Vegetable Potstickers",
     aliases: ["potstickers", "potstickers", "gyozas", "guioza"],
+    regionalAliases: {
+      US: "potstickers",
+      CA: "potstickers",
+      MX: "gyozas",
+      BR: "guioza",
+      CO: "gyozas"
+    },
     variants: ["gyozas"],
     packaging: ["Pan-fry", "Steam"],
     tags: ["frozen entrées", "gyozas", "western-v0.2"],
@@ -7060,6 +11455,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Alfredo",
     aliases: ["chicken alfredo", "chicken alfredo", "pollo alfredo", "frango alfredo"],
+    regionalAliases: {
+      US: "chicken alfredo",
+      CA: "chicken alfredo",
+      MX: "pollo alfredo",
+      BR: "frango alfredo",
+      CO: "pollo alfredo"
+    },
     variants: ["pollo alfredo"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "pollo alfredo", "western-v0.2"],
@@ -7068,6 +11470,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Fingers",
     aliases: ["chicken fingers", "chicken fingers", "dedos de pollo", "isca de frango"],
+    regionalAliases: {
+      US: "chicken fingers",
+      CA: "chicken fingers",
+      MX: "dedos de pollo",
+      BR: "isca de frango",
+      CO: "dedos de pollo"
+    },
     variants: ["dedos de pollo"],
     packaging: ["Plain", "Spicy"],
     tags: ["dedos de pollo", "frozen entrées", "western-v0.2"],
@@ -7076,6 +11485,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Katsu with Rice",
     aliases: ["chicken katsu", "chicken katsu", "pollo katsu", "frango katsu"],
+    regionalAliases: {
+      US: "chicken katsu",
+      CA: "chicken katsu",
+      MX: "pollo katsu",
+      BR: "frango katsu",
+      CO: "pollo katsu"
+    },
     variants: ["pollo katsu"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "pollo katsu", "western-v0.2"],
@@ -7084,6 +11500,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Tenders (Breaded)",
     aliases: ["chicken tenders", "chicken tenders", "tiritas de pollo", "iscas de frango"],
+    regionalAliases: {
+      US: "chicken tenders",
+      CA: "chicken tenders",
+      MX: "tiritas de pollo",
+      BR: "iscas de frango",
+      CO: "tiritas de pollo"
+    },
     variants: ["tiritas de pollo"],
     packaging: ["Plain", "Spicy"],
     tags: ["frozen entrées", "tiritas de pollo", "western-v0.2"],
@@ -7092,6 +11515,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chicken Tikka Masala",
     aliases: ["tikka masala", "tikka masala", "pollo tikka masala", "frango tikka masala"],
+    regionalAliases: {
+      US: "tikka masala",
+      CA: "tikka masala",
+      MX: "pollo tikka masala",
+      BR: "frango tikka masala",
+      CO: "pollo tikka masala"
+    },
     variants: ["pollo tikka masala"],
     packaging: ["With rice", "Entrée only"],
     tags: ["frozen entrées", "pollo tikka masala", "western-v0.2"],
@@ -7100,6 +11530,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chili Cheese Fries (Loaded)",
     aliases: ["chili cheese fries", "chili cheese fries", "papas con chili y queso", "batata com chili e queijo"],
+    regionalAliases: {
+      US: "chili cheese fries",
+      CA: "chili cheese fries",
+      MX: "papas con chili y queso",
+      BR: "batata com chili e queijo",
+      CO: "papas con chili y queso"
+    },
     variants: ["papas con chili y queso"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "papas con chili y queso", "western-v0.2"],
@@ -7108,6 +11545,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Corn Dogs",
     aliases: ["corn dogs", "corn dogs", "banderillas", "corndog"],
+    regionalAliases: {
+      US: "corn dogs",
+      CA: "corn dogs",
+      MX: "banderillas",
+      BR: "corndog",
+      CO: "banderillas"
+    },
     variants: ["banderillas"],
     packaging: ["Classic"],
     tags: ["banderillas", "frozen entrées", "western-v0.2"],
@@ -7116,6 +11560,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cottage Pie",
     aliases: ["cottage pie", "cottage pie", "pastel de carne", "escondidinho"],
+    regionalAliases: {
+      US: "cottage pie",
+      CA: "cottage pie",
+      MX: "pastel de carne",
+      BR: "escondidinho",
+      CO: "pastel de carne"
+    },
     variants: ["pastel de carne"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "pastel de carne", "western-v0.2"],
@@ -7124,6 +11575,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Crinkle-Cut Fries",
     aliases: ["crinkle fries", "crinkle fries", "papas onduladas", "batata ondulada"],
+    regionalAliases: {
+      US: "crinkle fries",
+      CA: "crinkle fries",
+      MX: "papas onduladas",
+      BR: "batata ondulada",
+      CO: "papas onduladas"
+    },
     variants: ["papas onduladas"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "papas onduladas", "western-v0.2"],
@@ -7132,6 +11590,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Dal Tadka",
     aliases: ["dal tadka", "dal tadka", "dal tadka", "dal tadka"],
+    regionalAliases: {
+      US: "dal tadka",
+      CA: "dal tadka",
+      MX: "dal tadka",
+      BR: "dal tadka",
+      CO: "dal tadka"
+    },
     variants: ["dal tadka"],
     packaging: ["Classic"],
     tags: ["dal tadka", "frozen entrées", "western-v0.2"],
@@ -7140,6 +11605,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Eggplant Parmesan",
     aliases: ["eggplant parm", "eggplant parm", "berenjena a la parmesana", "berinjela à parmegiana"],
+    regionalAliases: {
+      US: "eggplant parm",
+      CA: "eggplant parm",
+      MX: "berenjena a la parmesana",
+      BR: "berinjela à parmegiana",
+      CO: "berenjena a la parmesana"
+    },
     variants: ["berenjena a la parmesana"],
     packaging: ["Classic"],
     tags: ["berenjena a la parmesana", "frozen entrées", "western-v0.2"],
@@ -7148,6 +11620,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fish Fingers (Sticks)",
     aliases: ["fish sticks", "fish sticks", "palitos de pescado", "palitos de peixe"],
+    regionalAliases: {
+      US: "fish sticks",
+      CA: "fish sticks",
+      MX: "palitos de pescado",
+      BR: "palitos de peixe",
+      CO: "palitos de pescado"
+    },
     variants: ["palitos de pescado"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "palitos de pescado", "western-v0.2"],
@@ -7156,6 +11635,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Fried Rice (Chicken)",
     aliases: ["chicken fried rice", "chicken fried rice", "arroz frito con pollo", "arroz frito com frango"],
+    regionalAliases: {
+      US: "chicken fried rice",
+      CA: "chicken fried rice",
+      MX: "arroz frito con pollo",
+      BR: "arroz frito com frango",
+      CO: "arroz frito con pollo"
+    },
     variants: ["arroz frito con pollo"],
     packaging: ["Classic"],
     tags: ["arroz frito con pollo", "frozen entrées", "western-v0.2"],
@@ -7164,6 +11650,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "General Tso’s Chicken",
     aliases: ["general tso", "general tso", "pollo general tso", "frango general tso"],
+    regionalAliases: {
+      US: "general tso",
+      CA: "general tso",
+      MX: "pollo general tso",
+      BR: "frango general tso",
+      CO: "pollo general tso"
+    },
     variants: ["pollo general tso"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "pollo general tso", "western-v0.2"],
@@ -7172,6 +11665,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Gnocchi (Potato)",
     aliases: ["gnocchi", "gnocchi", "ñoquis", "nhoque"],
+    regionalAliases: {
+      US: "gnocchi",
+      CA: "gnocchi",
+      MX: "ñoquis",
+      BR: "nhoque",
+      CO: "ñoquis"
+    },
     variants: ["ñoquis"],
     packaging: ["Plain", "Stuffed"],
     tags: ["frozen entrées", "western-v0.2", "ñoquis"],
@@ -7180,6 +11680,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Jamaican Patties (Assorted)",
     aliases: ["Jamaican patties", "Jamaican patties", "empanadas jamaicanas", "empanadas jamaicanas", "pati jamayiken", "beef/chicken/veg patties", "beef/chicken/veg patties", "empanadas", "empadas", "pastéis"],
+    regionalAliases: {
+      JM: "Jamaican patties",
+      TT: "Jamaican patties",
+      PR: "empanadas jamaicanas",
+      DO: "empanadas jamaicanas",
+      HT: "pati jamayiken",
+      US: "beef/chicken/veg patties",
+      CA: "beef/chicken/veg patties",
+      MX: "empanadas",
+      BR: "empadas",
+      CO: "pastéis"
+    },
     variants: ["Assorted"],
     packaging: ["box"],
     tags: ["assorted", "frozen entrées", "western-v0.2"],
@@ -7188,6 +11700,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Karaage (Japanese Fried Chicken)",
     aliases: ["karaage", "karaage", "karaage", "karaage"],
+    regionalAliases: {
+      US: "karaage",
+      CA: "karaage",
+      MX: "karaage",
+      BR: "karaage",
+      CO: "karaage"
+    },
     variants: ["karaage"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "karaage", "western-v0.2"],
@@ -7196,6 +11715,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Lasagna (Meat)",
     aliases: ["lasagna", "lasagna", "lasaña", "lasanha"],
+    regionalAliases: {
+      US: "lasagna",
+      CA: "lasagna",
+      MX: "lasaña",
+      BR: "lasanha",
+      CO: "lasaña"
+    },
     variants: ["lasaña"],
     packaging: ["Family", "Single"],
     tags: ["frozen entrées", "lasaña", "western-v0.2"],
@@ -7204,6 +11730,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Lo Mein (Chicken)",
     aliases: ["chicken lo mein", "chicken lo mein", "lo mein de pollo", "lo mein de frango"],
+    regionalAliases: {
+      US: "chicken lo mein",
+      CA: "chicken lo mein",
+      MX: "lo mein de pollo",
+      BR: "lo mein de frango",
+      CO: "lo mein de pollo"
+    },
     variants: ["lo mein de pollo"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "lo mein de pollo", "western-v0.2"],
@@ -7212,6 +11745,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mashed Potato (Family)",
     aliases: ["mashed potatoes", "mashed potatoes", "puré de papa", "purê de batata"],
+    regionalAliases: {
+      US: "mashed potatoes",
+      CA: "mashed potatoes",
+      MX: "puré de papa",
+      BR: "purê de batata",
+      CO: "puré de papa"
+    },
     variants: ["puré de papa"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "puré de papa", "western-v0.2"],
@@ -7220,6 +11760,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mozzarella Sticks",
     aliases: ["mozzarella sticks", "mozzarella sticks", "palitos de queso", "bastões de muçarela"],
+    regionalAliases: {
+      US: "mozzarella sticks",
+      CA: "mozzarella sticks",
+      MX: "palitos de queso",
+      BR: "bastões de muçarela",
+      CO: "palitos de queso"
+    },
     variants: ["palitos de queso"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "palitos de queso", "western-v0.2"],
@@ -7228,6 +11775,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pancakes (Buttermilk)",
     aliases: ["frozen pancakes", "frozen pancakes", "panqueques congelados", "panquecas congeladas"],
+    regionalAliases: {
+      US: "frozen pancakes",
+      CA: "frozen pancakes",
+      MX: "panqueques congelados",
+      BR: "panquecas congeladas",
+      CO: "panqueques congelados"
+    },
     variants: ["panqueques congelados"],
     packaging: ["Stacks"],
     tags: ["frozen entrées", "panqueques congelados", "western-v0.2"],
@@ -7236,6 +11790,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Paneer Tikka Masala",
     aliases: ["paneer tikka", "paneer tikka", "paneer tikka", "paneer tikka"],
+    regionalAliases: {
+      US: "paneer tikka",
+      CA: "paneer tikka",
+      MX: "paneer tikka",
+      BR: "paneer tikka",
+      CO: "paneer tikka"
+    },
     variants: ["paneer tikka"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "paneer tikka", "western-v0.2"],
@@ -7244,6 +11805,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pasta Bakes (Assorted)",
     aliases: ["pasta bakes", "pasta bakes", "pastas al horno", "massas ao forno"],
+    regionalAliases: {
+      US: "pasta bakes",
+      CA: "pasta bakes",
+      MX: "pastas al horno",
+      BR: "massas ao forno",
+      CO: "pastas al horno"
+    },
     variants: ["pastas al horno"],
     packaging: ["Assorted"],
     tags: ["frozen entrées", "pastas al horno", "western-v0.2"],
@@ -7252,6 +11820,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pierogi (Potato & Cheese)",
     aliases: ["pierogi", "pierogi", "pierogi", "pirogi"],
+    regionalAliases: {
+      US: "pierogi",
+      CA: "pierogi",
+      MX: "pierogi",
+      BR: "pirogi",
+      CO: "pirogi"
+    },
     variants: ["pirogi"],
     packaging: ["Boil", "Pan-fry"],
     tags: ["frozen entrées", "pirogi", "western-v0.2"],
@@ -7260,6 +11835,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pizza (Four Cheese)",
     aliases: ["four cheese pizza", "four cheese pizza", "pizza cuatro quesos", "pizza quatro queijos"],
+    regionalAliases: {
+      US: "four cheese pizza",
+      CA: "four cheese pizza",
+      MX: "pizza cuatro quesos",
+      BR: "pizza quatro queijos",
+      CO: "pizza cuatro quesos"
+    },
     variants: ["pizza cuatro quesos"],
     packaging: ["12in", "Rising crust"],
     tags: ["frozen entrées", "pizza cuatro quesos", "western-v0.2"],
@@ -7268,6 +11850,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pizza (Pepperoni)",
     aliases: ["pepperoni pizza", "pepperoni pizza", "pizza de pepperoni", "pizza de pepperoni"],
+    regionalAliases: {
+      US: "pepperoni pizza",
+      CA: "pepperoni pizza",
+      MX: "pizza de pepperoni",
+      BR: "pizza de pepperoni",
+      CO: "pizza de pepperoni"
+    },
     variants: ["pizza de pepperoni"],
     packaging: ["12in", "Rising crust"],
     tags: ["frozen entrées", "pizza de pepperoni", "western-v0.2"],
@@ -7276,6 +11865,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pot Pie (Turkey)",
     aliases: ["turkey pot pie", "turkey pot pie", "pastel de pavo", "empadão de peru"],
+    regionalAliases: {
+      US: "turkey pot pie",
+      CA: "turkey pot pie",
+      MX: "pastel de pavo",
+      BR: "empadão de peru",
+      CO: "pastel de pavo"
+    },
     variants: ["pastel de pavo"],
     packaging: ["6in", "Family"],
     tags: ["frozen entrées", "pastel de pavo", "western-v0.2"],
@@ -7292,6 +11888,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Pulled Pork (Heat & Eat)",
     aliases: ["pulled pork", "pulled pork", "cerdo deshebrado", "pernil desfiado"],
+    regionalAliases: {
+      US: "pulled pork",
+      CA: "pulled pork",
+      MX: "cerdo deshebrado",
+      BR: "pernil desfiado",
+      CO: "cerdo desmechado"
+    },
     variants: ["cerdo desmechado"],
     packaging: ["BBQ", "Plain"],
     tags: ["cerdo desmechado", "frozen entrées", "western-v0.2"],
@@ -7300,6 +11903,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ramen Bowl (Shoyu)",
     aliases: ["ramen bowl", "ramen bowl", "ramen", "lamen"],
+    regionalAliases: {
+      US: "ramen bowl",
+      CA: "ramen bowl",
+      MX: "ramen",
+      BR: "lamen",
+      CO: "ramen"
+    },
     variants: ["ramen"],
     packaging: ["Shoyu", "Miso"],
     tags: ["frozen entrées", "ramen", "western-v0.2"],
@@ -7308,6 +11918,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ravioli (Spinach & Ricotta)",
     aliases: ["spinach ravioli", "spinach ravioli", "ravioles de espinaca", "ravioli de espinafre"],
+    regionalAliases: {
+      US: "spinach ravioli",
+      CA: "spinach ravioli",
+      MX: "ravioles de espinaca",
+      BR: "ravioli de espinafre",
+      CO: "ravioles de espinaça"
+    },
     variants: ["ravioles de espinaça"],
     packaging: ["Boil", "Sauced"],
     tags: ["frozen entrées", "ravioles de espinaça", "western-v0.2"],
@@ -7316,6 +11933,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Rice & Peas (Jamaican)",
     aliases: ["rice & peas", "rice & peas", "arroz con gandules ", "moro guandules ", "diri kole ak pwa ", "rice and peas", "rice and peas", "arroz con gandules", "arroz com feijão fradinho ", "arroz con fríjol "],
+    regionalAliases: {
+      JM: "rice & peas",
+      TT: "rice & peas",
+      PR: "arroz con gandules ",
+      DO: "moro guandules ",
+      HT: "diri kole ak pwa ",
+      US: "rice and peas",
+      CA: "rice and peas",
+      MX: "arroz con gandules",
+      BR: "arroz com feijão fradinho ",
+      CO: "arroz con fríjol "
+    },
     variants: ["Classic"],
     packaging: ["bag"],
     tags: ["classic", "frozen entrées", "western-v0.2"],
@@ -7324,6 +11953,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Samosas (Vegetable)",
     aliases: ["samosas", "samosas", "empanadas indias", "samosa"],
+    regionalAliases: {
+      US: "samosas",
+      CA: "samosas",
+      MX: "empanadas indias",
+      BR: "samosa",
+      CO: "samosas"
+    },
     variants: ["samosas"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "samosas", "western-v0.2"],
@@ -7332,6 +11968,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Shepherd’s Pie (Single)",
     aliases: ["shepherd’s pie", "shepherd’s pie", "pastel de carne", "escondidinho"],
+    regionalAliases: {
+      US: "shepherd’s pie",
+      CA: "shepherd’s pie",
+      MX: "pastel de carne",
+      BR: "escondidinho",
+      CO: "pastel de carne"
+    },
     variants: ["pastel de carne"],
     packaging: ["Single"],
     tags: ["frozen entrées", "pastel de carne", "western-v0.2"],
@@ -7340,6 +11983,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Shrimp Alfredo",
     aliases: ["shrimp alfredo", "shrimp alfredo", "alfredo con camarón", "alfredo com camarão"],
+    regionalAliases: {
+      US: "shrimp alfredo",
+      CA: "shrimp alfredo",
+      MX: "alfredo con camarón",
+      BR: "alfredo com camarão",
+      CO: "alfredo con camarón"
+    },
     variants: ["alfredo con camarón"],
     packaging: ["Classic"],
     tags: ["alfredo con camarón", "frozen entrées", "western-v0.2"],
@@ -7348,6 +11998,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Shrimp Fried Rice",
     aliases: ["shrimp fried rice", "shrimp fried rice", "arroz frito con camarón", "arroz frito com camarão"],
+    regionalAliases: {
+      US: "shrimp fried rice",
+      CA: "shrimp fried rice",
+      MX: "arroz frito con camarón",
+      BR: "arroz frito com camarão",
+      CO: "arroz frito con camarón"
+    },
     variants: ["arroz frito con camarón"],
     packaging: ["Classic"],
     tags: ["arroz frito con camarón", "frozen entrées", "western-v0.2"],
@@ -7356,6 +12013,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Spinach & Artichoke Dip (Bake)",
     aliases: ["spinach artichoke dip", "spinach artichoke dip", "espinaca con alcachofa", "espinafre com alcachofra"],
+    regionalAliases: {
+      US: "spinach artichoke dip",
+      CA: "spinach artichoke dip",
+      MX: "espinaca con alcachofa",
+      BR: "espinafre com alcachofra",
+      CO: "espinaca con alcachofa"
+    },
     variants: ["espinaca con alcachofa"],
     packaging: ["Classic"],
     tags: ["espinaca con alcachofa", "frozen entrées", "western-v0.2"],
@@ -7364,6 +12028,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Spring Rolls (Veg)",
     aliases: ["spring rolls", "spring rolls", "rollos primavera", "rolinhos primavera"],
+    regionalAliases: {
+      US: "spring rolls",
+      CA: "spring rolls",
+      MX: "rollos primavera",
+      BR: "rolinhos primavera",
+      CO: "rollos primavera"
+    },
     variants: ["rollos primavera"],
     packaging: ["Air-fry", "Bake"],
     tags: ["frozen entrées", "rollos primavera", "western-v0.2"],
@@ -7372,6 +12043,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tater Tots",
     aliases: ["tater tots", "tater tots", "papas tots", "batata palito "],
+    regionalAliases: {
+      US: "tater tots",
+      CA: "tater tots",
+      MX: "papas tots",
+      BR: "batata palito ",
+      CO: "papas caritas "
+    },
     variants: ["papas caritas (≈)"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "papas caritas (≈)", "western-v0.2"],
@@ -7380,6 +12058,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Thai Basil Chicken",
     aliases: ["thai basil chicken", "thai basil chicken", "pollo albahaca thai", "frango manjericão tailandês"],
+    regionalAliases: {
+      US: "thai basil chicken",
+      CA: "thai basil chicken",
+      MX: "pollo albahaca thai",
+      BR: "frango manjericão tailandês",
+      CO: "pollo albahaca thai"
+    },
     variants: ["pollo albahaca thai"],
     packaging: ["Classic"],
     tags: ["frozen entrées", "pollo albahaca thai", "western-v0.2"],
@@ -7388,6 +12073,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Veggie Burger Patties",
     aliases: ["veggie burgers", "veggie burgers", "hamburguesas vegetales", "hambúrguer vegetal"],
+    regionalAliases: {
+      US: "veggie burgers",
+      CA: "veggie burgers",
+      MX: "hamburguesas vegetales",
+      BR: "hambúrguer vegetal",
+      CO: "hamburguesas vegetales"
+    },
     variants: ["hamburguesas vegetales"],
     packaging: ["Black bean", "Soy"],
     tags: ["frozen entrées", "hamburguesas vegetales", "western-v0.2"],
@@ -7396,6 +12088,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Waffles (Belgian)",
     aliases: ["belgian waffles", "belgian waffles", "waffles belgas", "waffles belgas"],
+    regionalAliases: {
+      US: "belgian waffles",
+      CA: "belgian waffles",
+      MX: "waffles belgas",
+      BR: "waffles belgas",
+      CO: "waffles belgas"
+    },
     variants: ["waffles belgas"],
     packaging: ["4-pack"],
     tags: ["frozen entrées", "waffles belgas", "western-v0.2"],
@@ -7404,6 +12103,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Anchovies (in Oil)",
     aliases: ["anchovies", "anchovies", "anchoas", "anchovas"],
+    regionalAliases: {
+      US: "anchovies",
+      CA: "anchovies",
+      MX: "anchoas",
+      BR: "anchovas",
+      CO: "anchoas"
+    },
     variants: ["anchoas"],
     packaging: ["Flat", "Rolled"],
     tags: ["anchoas", "canned", "seafood", "seafood>canned", "western-v0.2"],
@@ -7420,6 +12126,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Herring (Kippers)",
     aliases: ["kippers", "kippers", "arenque ahumado", "arenque defumado"],
+    regionalAliases: {
+      US: "kippers",
+      CA: "kippers",
+      MX: "arenque ahumado",
+      BR: "arenque defumado",
+      CO: "arenque ahumado"
+    },
     variants: ["arenque ahumado"],
     packaging: ["Classic"],
     tags: ["arenque ahumado", "canned", "seafood", "seafood>canned", "western-v0.2"],
@@ -7428,6 +12141,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Mackerel (Canned in Brine)",
     aliases: ["canned mackerel", "canned mackerel", "caballa enlatada", "cavala em lata"],
+    regionalAliases: {
+      US: "canned mackerel",
+      CA: "canned mackerel",
+      MX: "caballa enlatada",
+      BR: "cavala em lata",
+      CO: "caballa enlatada"
+    },
     variants: ["caballa enlatada"],
     packaging: ["Brine", "Tomato"],
     tags: ["caballa enlatada", "canned", "seafood", "seafood>canned", "western-v0.2"],
@@ -7436,6 +12156,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Mussels (Smoked)",
     aliases: ["smoked mussels", "smoked mussels", "mejillones ahumados", "mexilhão defumado"],
+    regionalAliases: {
+      US: "smoked mussels",
+      CA: "smoked mussels",
+      MX: "mejillones ahumados",
+      BR: "mexilhão defumado",
+      CO: "mejillones ahumados"
+    },
     variants: ["mejillones ahumados"],
     packaging: ["Classic"],
     tags: ["canned", "mejillones ahumados", "seafood", "seafood>canned", "western-v0.2"],
@@ -7444,6 +12171,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Octopus (Canned)",
     aliases: ["octopus", "octopus", "pulpo enlatado", "polvo enlatado"],
+    regionalAliases: {
+      US: "octopus",
+      CA: "octopus",
+      MX: "pulpo enlatado",
+      BR: "polvo enlatado",
+      CO: "pulpo enlatado"
+    },
     variants: ["pulpo enlatado"],
     packaging: ["In olive oil"],
     tags: ["canned", "pulpo enlatado", "seafood", "seafood>canned", "western-v0.2"],
@@ -7452,6 +12186,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Oysters (Smoked)",
     aliases: ["smoked oysters", "smoked oysters", "ostras ahumadas", "ostras defumadas"],
+    regionalAliases: {
+      US: "smoked oysters",
+      CA: "smoked oysters",
+      MX: "ostras ahumadas",
+      BR: "ostras defumadas",
+      CO: "ostras ahumadas"
+    },
     variants: ["ostras ahumadas"],
     packaging: ["Classic"],
     tags: ["canned", "ostras ahumadas", "seafood", "seafood>canned", "western-v0.2"],
@@ -7468,6 +12209,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Sardines (Hot Sauce)",
     aliases: ["sardines hot", "sardines hot", "sardinas en salsa picante", "sardinha apimentada"],
+    regionalAliases: {
+      US: "sardines hot",
+      CA: "sardines hot",
+      MX: "sardinas en salsa picante",
+      BR: "sardinha apimentada",
+      CO: "sardinas picantes"
+    },
     variants: ["sardinas picantes"],
     packaging: ["Hot", "Original"],
     tags: ["canned", "sardinas picantes", "seafood", "seafood>canned", "western-v0.2"],
@@ -7476,6 +12224,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Sardines (Tomato Sauce)",
     aliases: ["sardines tomato", "sardines tomato", "sardinas en tomate", "sardinha no tomate"],
+    regionalAliases: {
+      US: "sardines tomato",
+      CA: "sardines tomato",
+      MX: "sardinas en tomate",
+      BR: "sardinha no tomate",
+      CO: "sardinas en tomate"
+    },
     variants: ["sardinas en tomate"],
     packaging: ["Classic"],
     tags: ["canned", "sardinas en tomate", "seafood", "seafood>canned", "western-v0.2"],
@@ -7484,6 +12239,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "meat_seafood",
     product: "Squid (in Ink)",
     aliases: ["squid in ink", "squid in ink", "calamares en su tinta", "lula na tinta"],
+    regionalAliases: {
+      US: "squid in ink",
+      CA: "squid in ink",
+      MX: "calamares en su tinta",
+      BR: "lula na tinta",
+      CO: "calamares en tinta"
+    },
     variants: ["calamares en tinta"],
     packaging: ["Classic"],
     tags: ["calamares en tinta", "canned", "seafood", "seafood>canned", "western-v0.2"],
@@ -7508,6 +12270,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Appenzeller",
     aliases: ["appenzeller", "appenzeller", "appenzeller", "appenzeller"],
+    regionalAliases: {
+      US: "appenzeller",
+      CA: "appenzeller",
+      MX: "appenzeller",
+      BR: "appenzeller",
+      CO: "appenzeller"
+    },
     variants: ["appenzeller"],
     packaging: ["Classic"],
     tags: ["appenzeller", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7516,6 +12285,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Beaufort",
     aliases: ["beaufort", "beaufort", "beaufort", "beaufort"],
+    regionalAliases: {
+      US: "beaufort",
+      CA: "beaufort",
+      MX: "beaufort",
+      BR: "beaufort",
+      CO: "beaufort"
+    },
     variants: ["beaufort"],
     packaging: ["Classic"],
     tags: ["beaufort", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7524,6 +12300,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bel Paese",
     aliases: ["bel paese", "bel paese", "bel paese", "bel paese"],
+    regionalAliases: {
+      US: "bel paese",
+      CA: "bel paese",
+      MX: "bel paese",
+      BR: "bel paese",
+      CO: "bel paese"
+    },
     variants: ["bel paese"],
     packaging: ["Classic"],
     tags: ["bel paese", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7532,6 +12315,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Caciocavallo",
     aliases: ["caciocavallo", "caciocavallo", "caciocavallo", "caciocavallo"],
+    regionalAliases: {
+      US: "caciocavallo",
+      CA: "caciocavallo",
+      MX: "caciocavallo",
+      BR: "caciocavallo",
+      CO: "caciocavallo"
+    },
     variants: ["caciocavallo"],
     packaging: ["Classic"],
     tags: ["caciocavallo", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7540,6 +12330,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cambozola",
     aliases: ["cambozola", "cambozola", "cambozola", "cambozola"],
+    regionalAliases: {
+      US: "cambozola",
+      CA: "cambozola",
+      MX: "cambozola",
+      BR: "cambozola",
+      CO: "cambozola"
+    },
     variants: ["cambozola"],
     packaging: ["Classic"],
     tags: ["cambozola", "cheese", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7548,6 +12345,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Comté",
     aliases: ["comté", "comté", "comté", "comté"],
+    regionalAliases: {
+      US: "comté",
+      CA: "comté",
+      MX: "comté",
+      BR: "comté",
+      CO: "comté"
+    },
     variants: ["comté"],
     packaging: ["Classic"],
     tags: ["cheese", "comté", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7556,6 +12360,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Drunken Goat (Murcia al Vino)",
     aliases: ["drunken goat", "drunken goat", "queso cabra al vino", "queijo de cabra ao vinho"],
+    regionalAliases: {
+      US: "drunken goat",
+      CA: "drunken goat",
+      MX: "queso cabra al vino",
+      BR: "queijo de cabra ao vinho",
+      CO: "queso de cabra al vino"
+    },
     variants: ["queso de cabra al vino"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso de cabra al vino", "western-v0.2"],
@@ -7564,6 +12375,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Esrom (Danish Port-Salut)",
     aliases: ["esrom", "esrom", "esrom", "esrom"],
+    regionalAliases: {
+      US: "esrom",
+      CA: "esrom",
+      MX: "esrom",
+      BR: "esrom",
+      CO: "esrom"
+    },
     variants: ["esrom"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "esrom", "western-v0.2"],
@@ -7572,6 +12390,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Idiazábal",
     aliases: ["idiazabal", "idiazabal", "idiazábal", "idiazábal"],
+    regionalAliases: {
+      US: "idiazabal",
+      CA: "idiazabal",
+      MX: "idiazábal",
+      BR: "idiazábal",
+      CO: "idiazábal"
+    },
     variants: ["idiazábal"],
     packaging: ["Smoked", "Plain"],
     tags: ["cheese", "dairy", "dairy>cheese", "idiazábal", "western-v0.2"],
@@ -7580,6 +12405,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Kasseri",
     aliases: ["kasseri", "kasseri", "kasseri", "kasseri"],
+    regionalAliases: {
+      US: "kasseri",
+      CA: "kasseri",
+      MX: "kasseri",
+      BR: "kasseri",
+      CO: "kasseri"
+    },
     variants: ["kasseri"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "kasseri", "western-v0.2"],
@@ -7588,6 +12420,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mahon",
     aliases: ["mahon", "mahon", "mahón", "mahón"],
+    regionalAliases: {
+      US: "mahon",
+      CA: "mahon",
+      MX: "mahón",
+      BR: "mahón",
+      CO: "mahón"
+    },
     variants: ["mahón"],
     packaging: ["Curado", "Semicurado"],
     tags: ["cheese", "dairy", "dairy>cheese", "mahón", "western-v0.2"],
@@ -7596,6 +12435,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Manouri",
     aliases: ["manouri", "manouri", "manouri", "manouri"],
+    regionalAliases: {
+      US: "manouri",
+      CA: "manouri",
+      MX: "manouri",
+      BR: "manouri",
+      CO: "manouri"
+    },
     variants: ["manouri"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "manouri", "western-v0.2"],
@@ -7604,6 +12450,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mimolette",
     aliases: ["mimolette", "mimolette", "mimolette", "mimolette"],
+    regionalAliases: {
+      US: "mimolette",
+      CA: "mimolette",
+      MX: "mimolette",
+      BR: "mimolette",
+      CO: "mimolette"
+    },
     variants: ["mimolette"],
     packaging: ["Aged", "Jeune"],
     tags: ["cheese", "dairy", "dairy>cheese", "mimolette", "western-v0.2"],
@@ -7612,6 +12465,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Morbier",
     aliases: ["morbier", "morbier", "morbier", "morbier"],
+    regionalAliases: {
+      US: "morbier",
+      CA: "morbier",
+      MX: "morbier",
+      BR: "morbier",
+      CO: "morbier"
+    },
     variants: ["morbier"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "morbier", "western-v0.2"],
@@ -7620,6 +12480,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Neufchâtel",
     aliases: ["neufchatel", "neufchatel", "neufchâtel", "neufchâtel"],
+    regionalAliases: {
+      US: "neufchatel",
+      CA: "neufchatel",
+      MX: "neufchâtel",
+      BR: "neufchâtel",
+      CO: "neufchâtel"
+    },
     variants: ["neufchâtel"],
     packaging: ["Brick", "Heart"],
     tags: ["cheese", "dairy", "dairy>cheese", "neufchâtel", "western-v0.2"],
@@ -7628,6 +12495,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ossau-Iraty",
     aliases: ["ossau-iraty", "ossau-iraty", "ossau-iraty", "ossau-iraty"],
+    regionalAliases: {
+      US: "ossau-iraty",
+      CA: "ossau-iraty",
+      MX: "ossau-iraty",
+      BR: "ossau-iraty",
+      CO: "ossau-iraty"
+    },
     variants: ["ossau-iraty"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "ossau-iraty", "western-v0.2"],
@@ -7636,6 +12510,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Port Salut",
     aliases: ["port salut", "port salut", "port salut", "port salut"],
+    regionalAliases: {
+      US: "port salut",
+      CA: "port salut",
+      MX: "port salut",
+      BR: "port salut",
+      CO: "port salut"
+    },
     variants: ["port salut"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "port salut", "western-v0.2"],
@@ -7644,6 +12525,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Queso Anejo",
     aliases: ["queso añejo", "queso añejo", "queso añejo", "queijo añejo"],
+    regionalAliases: {
+      US: "queso añejo",
+      CA: "queso añejo",
+      MX: "queso añejo",
+      BR: "queijo añejo",
+      CO: "queso añejo"
+    },
     variants: ["queso añejo"],
     packaging: ["Grated", "Block"],
     tags: ["cheese", "dairy", "dairy>cheese", "queso añejo", "western-v0.2"],
@@ -7652,6 +12540,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Queso Cotija (Aged)",
     aliases: ["cotija", "cotija", "cotija", "cotija"],
+    regionalAliases: {
+      US: "cotija",
+      CA: "cotija",
+      MX: "cotija",
+      BR: "cotija",
+      CO: "cotija"
+    },
     variants: ["cotija"],
     packaging: ["Aged", "Fresh"],
     tags: ["cheese", "cotija", "dairy", "dairy>cheese", "western-v0.2"],
@@ -7660,6 +12555,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Raclette",
     aliases: ["raclette", "raclette", "raclette", "raclette"],
+    regionalAliases: {
+      US: "raclette",
+      CA: "raclette",
+      MX: "raclette",
+      BR: "raclette",
+      CO: "raclette"
+    },
     variants: ["raclette"],
     packaging: ["Wheel", "Slices"],
     tags: ["cheese", "dairy", "dairy>cheese", "raclette", "western-v0.2"],
@@ -7668,6 +12570,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Reblochon",
     aliases: ["reblochon", "reblochon", "reblochon", "reblochon"],
+    regionalAliases: {
+      US: "reblochon",
+      CA: "reblochon",
+      MX: "reblochon",
+      BR: "reblochon",
+      CO: "reblochon"
+    },
     variants: ["reblochon"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "reblochon", "western-v0.2"],
@@ -7676,6 +12585,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Stilton (Blue)",
     aliases: ["stilton", "stilton", "stilton", "stilton"],
+    regionalAliases: {
+      US: "stilton",
+      CA: "stilton",
+      MX: "stilton",
+      BR: "stilton",
+      CO: "stilton"
+    },
     variants: ["stilton"],
     packaging: ["Wheel", "Wedge"],
     tags: ["cheese", "dairy", "dairy>cheese", "stilton", "western-v0.2"],
@@ -7684,6 +12600,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Taleggio",
     aliases: ["taleggio", "taleggio", "taleggio", "taleggio"],
+    regionalAliases: {
+      US: "taleggio",
+      CA: "taleggio",
+      MX: "taleggio",
+      BR: "taleggio",
+      CO: "taleggio"
+    },
     variants: ["taleggio"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "taleggio", "western-v0.2"],
@@ -7692,6 +12615,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Telemea",
     aliases: ["telemea", "telemea", "telemea", "telemea"],
+    regionalAliases: {
+      US: "telemea",
+      CA: "telemea",
+      MX: "telemea",
+      BR: "telemea",
+      CO: "telemea"
+    },
     variants: ["telemea"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "telemea", "western-v0.2"],
@@ -7700,6 +12630,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Tilsit",
     aliases: ["tilsit", "tilsit", "tilsit", "tilsit"],
+    regionalAliases: {
+      US: "tilsit",
+      CA: "tilsit",
+      MX: "tilsit",
+      BR: "tilsit",
+      CO: "tilsit"
+    },
     variants: ["tilsit"],
     packaging: ["Classic"],
     tags: ["cheese", "dairy", "dairy>cheese", "tilsit", "western-v0.2"],
@@ -7708,6 +12645,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Wensleydale",
     aliases: ["wensleydale", "wensleydale", "wensleydale", "wensleydale"],
+    regionalAliases: {
+      US: "wensleydale",
+      CA: "wensleydale",
+      MX: "wensleydale",
+      BR: "wensleydale",
+      CO: "wensleydale"
+    },
     variants: ["wensleydale"],
     packaging: ["With cranberries", "Plain"],
     tags: ["cheese", "dairy", "dairy>cheese", "wensleydale", "western-v0.2"],
@@ -7716,6 +12660,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Aji Verde (Peruvian Green)",
     aliases: ["aji verde", "aji verde", "ají verde", "aji verde"],
+    regionalAliases: {
+      US: "aji verde",
+      CA: "aji verde",
+      MX: "ají verde",
+      BR: "aji verde",
+      CO: "ají verde"
+    },
     variants: ["ají verde"],
     packaging: ["Hot", "Mild"],
     tags: ["ají verde", "condiments", "western-v0.2"],
@@ -7724,6 +12675,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Barbacoa Marinade",
     aliases: ["barbacoa marinade", "barbacoa marinade", "adobo barbacoa", "marinado barbacoa"],
+    regionalAliases: {
+      US: "barbacoa marinade",
+      CA: "barbacoa marinade",
+      MX: "adobo barbacoa",
+      BR: "marinado barbacoa",
+      CO: "adobo barbacoa"
+    },
     variants: ["adobo barbacoa"],
     packaging: ["Classic"],
     tags: ["adobo barbacoa", "condiments", "western-v0.2"],
@@ -7732,6 +12690,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Black Bean Sauce (Chinese)",
     aliases: ["black bean sauce", "black bean sauce", "salsa de frijol negro", "molho de feijão preto"],
+    regionalAliases: {
+      US: "black bean sauce",
+      CA: "black bean sauce",
+      MX: "salsa de frijol negro",
+      BR: "molho de feijão preto",
+      CO: "salsa de frijol negro"
+    },
     variants: ["salsa de frijol negro"],
     packaging: ["Classic"],
     tags: ["condiments", "salsa de frijol negro", "western-v0.2"],
@@ -7740,6 +12705,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Bulldog Tonkatsu Sauce",
     aliases: ["tonkatsu sauce", "tonkatsu sauce", "salsa tonkatsu", "molho tonkatsu"],
+    regionalAliases: {
+      US: "tonkatsu sauce",
+      CA: "tonkatsu sauce",
+      MX: "salsa tonkatsu",
+      BR: "molho tonkatsu",
+      CO: "salsa tonkatsu"
+    },
     variants: ["salsa tonkatsu"],
     packaging: ["Classic"],
     tags: ["condiments", "salsa tonkatsu", "western-v0.2"],
@@ -7748,6 +12720,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Cajun Seasoning (Blend)",
     aliases: ["cajun seasoning", "cajun seasoning", "condimento cajún", "tempero cajun"],
+    regionalAliases: {
+      US: "cajun seasoning",
+      CA: "cajun seasoning",
+      MX: "condimento cajún",
+      BR: "tempero cajun",
+      CO: "condimento cajún"
+    },
     variants: ["condimento cajún"],
     packaging: ["Original", "Hot"],
     tags: ["condimento cajún", "condiments", "western-v0.2"],
@@ -7756,6 +12735,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chili Crisp (Lao Gan Ma)",
     aliases: ["chili crisp", "chili crisp", "aceite con chile", "óleo com pimenta"],
+    regionalAliases: {
+      US: "chili crisp",
+      CA: "chili crisp",
+      MX: "aceite con chile",
+      BR: "óleo com pimenta",
+      CO: "aceite con chile"
+    },
     variants: ["aceite con chile"],
     packaging: ["Spicy"],
     tags: ["aceite con chile", "condiments", "western-v0.2"],
@@ -7764,6 +12750,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Chimichurri Rojo",
     aliases: ["chimichurri rojo", "chimichurri rojo", "chimichurri rojo", "chimichurri vermelho"],
+    regionalAliases: {
+      US: "chimichurri rojo",
+      CA: "chimichurri rojo",
+      MX: "chimichurri rojo",
+      BR: "chimichurri vermelho",
+      CO: "chimichurri rojo"
+    },
     variants: ["chimichurri rojo"],
     packaging: ["Hot", "Mild"],
     tags: ["chimichurri rojo", "condiments", "western-v0.2"],
@@ -7772,6 +12765,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Coconut Aminos",
     aliases: ["coconut aminos", "coconut aminos", "amino de coco", "amino de coco"],
+    regionalAliases: {
+      US: "coconut aminos",
+      CA: "coconut aminos",
+      MX: "amino de coco",
+      BR: "amino de coco",
+      CO: "amino de coco"
+    },
     variants: ["amino de coco"],
     packaging: ["Classic"],
     tags: ["amino de coco", "condiments", "western-v0.2"],
@@ -7780,6 +12780,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Creamy Chipotle Sauce",
     aliases: ["creamy chipotle", "creamy chipotle", "cremosa de chipotle", "creme de chipotle"],
+    regionalAliases: {
+      US: "creamy chipotle",
+      CA: "creamy chipotle",
+      MX: "cremosa de chipotle",
+      BR: "creme de chipotle",
+      CO: "cremosa de chipotle"
+    },
     variants: ["cremosa de chipotle"],
     packaging: ["Classic"],
     tags: ["condiments", "cremosa de chipotle", "western-v0.2"],
@@ -7788,6 +12795,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Elote Seasoning",
     aliases: ["elote seasoning", "elote seasoning", "sazonador para elote", "tempero para elote"],
+    regionalAliases: {
+      US: "elote seasoning",
+      CA: "elote seasoning",
+      MX: "sazonador para elote",
+      BR: "tempero para elote",
+      CO: "sazonador para elote"
+    },
     variants: ["sazonador para elote"],
     packaging: ["Classic"],
     tags: ["condiments", "sazonador para elote", "western-v0.2"],
@@ -7796,6 +12810,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ginger Scallion Sauce",
     aliases: ["ginger scallion", "ginger scallion", "salsa de jengibre y cebollín", "molho gengibre-cebolinha"],
+    regionalAliases: {
+      US: "ginger scallion",
+      CA: "ginger scallion",
+      MX: "salsa de jengibre y cebollín",
+      BR: "molho gengibre-cebolinha",
+      CO: "salsa jengibre-cebollín"
+    },
     variants: ["salsa jengibre-cebollín"],
     packaging: ["Classic"],
     tags: ["condiments", "salsa jengibre-cebollín", "western-v0.2"],
@@ -7804,6 +12825,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Green Mango Chutney",
     aliases: ["green mango chutney", "green mango chutney", "chutney de mango verde", "chutney de manga verde"],
+    regionalAliases: {
+      US: "green mango chutney",
+      CA: "green mango chutney",
+      MX: "chutney de mango verde",
+      BR: "chutney de manga verde",
+      CO: "chutney de mango verde"
+    },
     variants: ["chutney de mango verde"],
     packaging: ["Spicy", "Sweet"],
     tags: ["chutney de mango verde", "condiments", "western-v0.2"],
@@ -7812,6 +12840,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Guasacaca (Venezuelan)",
     aliases: ["guasacaca", "guasacaca", "guasacaca", "guasacaca"],
+    regionalAliases: {
+      US: "guasacaca",
+      CA: "guasacaca",
+      MX: "guasacaca",
+      BR: "guasacaca",
+      CO: "guasacaca"
+    },
     variants: ["guasacaca"],
     packaging: ["Classic"],
     tags: ["condiments", "guasacaca", "western-v0.2"],
@@ -7820,6 +12855,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Japanese Curry Roux",
     aliases: ["curry roux", "curry roux", "roux de curry", "roux de curry"],
+    regionalAliases: {
+      US: "curry roux",
+      CA: "curry roux",
+      MX: "roux de curry",
+      BR: "roux de curry",
+      CO: "roux de curry"
+    },
     variants: ["roux de curry"],
     packaging: ["Mild", "Hot"],
     tags: ["condiments", "roux de curry", "western-v0.2"],
@@ -7828,6 +12870,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Korean BBQ Marinade",
     aliases: ["korean bbq", "korean bbq", "marinado coreano", "marinado coreano"],
+    regionalAliases: {
+      US: "korean bbq",
+      CA: "korean bbq",
+      MX: "marinado coreano",
+      BR: "marinado coreano",
+      CO: "marinado coreano"
+    },
     variants: ["marinado coreano"],
     packaging: ["Bulgogi", "Kalbi"],
     tags: ["condiments", "marinado coreano", "western-v0.2"],
@@ -7836,6 +12885,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Lemon Garlic Marinade",
     aliases: ["lemon garlic marinade", "lemon garlic", "marinado limón-ajo", "marinado limão-alho"],
+    regionalAliases: {
+      US: "lemon garlic marinade",
+      CA: "lemon garlic",
+      MX: "marinado limón-ajo",
+      BR: "marinado limão-alho",
+      CO: "marinado limão-alho"
+    },
     variants: ["marinado limão-alho"],
     packaging: ["Classic"],
     tags: ["condiments", "marinado limão-alho", "western-v0.2"],
@@ -7844,6 +12900,14 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Mango Pepper Sauce (Caribbean)",
     aliases: ["sòs piman mango", "mango pepper sauce", "mango pepper sauce", "salsa de mango picante", "molho de manga picante", "salsa de mango picante"],
+    regionalAliases: {
+      HT: "sòs piman mango",
+      US: "mango pepper sauce",
+      CA: "mango pepper sauce",
+      MX: "salsa de mango picante",
+      BR: "molho de manga picante",
+      CO: "salsa de mango picante"
+    },
     variants: ["Hot", "Mild"],
     packaging: ["bottle"],
     tags: ["condiments", "hot", "mild", "western-v0.2"],
@@ -7852,6 +12916,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Peri-Peri Sauce",
     aliases: ["peri-peri", "peri-peri", "salsa peri-peri", "molho piri-piri"],
+    regionalAliases: {
+      US: "peri-peri",
+      CA: "peri-peri",
+      MX: "salsa peri-peri",
+      BR: "molho piri-piri",
+      CO: "salsa peri-peri"
+    },
     variants: ["salsa peri-peri"],
     packaging: ["Mild", "Hot"],
     tags: ["condiments", "salsa peri-peri", "western-v0.2"],
@@ -7860,6 +12931,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Romesco Sauce",
     aliases: ["romesco", "romesco", "romesco", "romesco"],
+    regionalAliases: {
+      US: "romesco",
+      CA: "romesco",
+      MX: "romesco",
+      BR: "romesco",
+      CO: "romesco"
+    },
     variants: ["romesco"],
     packaging: ["Classic"],
     tags: ["condiments", "romesco", "western-v0.2"],
@@ -7868,6 +12946,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Salsa Macha",
     aliases: ["salsa macha", "salsa macha", "salsa macha", "salsa macha"],
+    regionalAliases: {
+      US: "salsa macha",
+      CA: "salsa macha",
+      MX: "salsa macha",
+      BR: "salsa macha",
+      CO: "salsa macha"
+    },
     variants: ["salsa macha"],
     packaging: ["Peanut", "Almond"],
     tags: ["condiments", "salsa macha", "western-v0.2"],
@@ -7876,6 +12961,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "Ssamjang (Korean Dipping)",
     aliases: ["ssamjang", "ssamjang", "ssamjang", "ssamjang"],
+    regionalAliases: {
+      US: "ssamjang",
+      CA: "ssamjang",
+      MX: "ssamjang",
+      BR: "ssamjang",
+      CO: "ssamjang"
+    },
     variants: ["ssamjang"],
     packaging: ["Classic"],
     tags: ["condiments", "ssamjang", "western-v0.2"],
@@ -7884,6 +12976,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "pantry",
     product: "XO Sauce",
     aliases: ["xo sauce", "xo sauce", "salsa XO", "molho XO"],
+    regionalAliases: {
+      US: "xo sauce",
+      CA: "xo sauce",
+      MX: "salsa XO",
+      BR: "molho XO",
+      CO: "salsa XO"
+    },
     variants: ["salsa XO"],
     packaging: ["Classic"],
     tags: ["condiments", "salsa xo", "western-v0.2"],
@@ -7892,6 +12991,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Bocadillo con Queso (Guava + Cheese)",
     aliases: ["guava paste & cheese", "guava paste & cheese", "bocadillo con queso", "bocadillo con queso", "tablet goyav ak fwomaj", "guava & cheese", "guava & cheese", "bocadillo con queso", "goiabada com queijo", "bocadillo con queso"],
+    regionalAliases: {
+      JM: "guava paste & cheese",
+      TT: "guava paste & cheese",
+      PR: "bocadillo con queso",
+      DO: "bocadillo con queso",
+      HT: "tablet goyav ak fwomaj",
+      US: "guava & cheese",
+      CA: "guava & cheese",
+      MX: "bocadillo con queso",
+      BR: "goiabada com queijo",
+      CO: "bocadillo con queso"
+    },
     variants: ["Classic"],
     packaging: ["pack"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7900,6 +13011,16 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Bun & Cheese (Spice Bun)",
     aliases: ["bun & cheese", "pan dulce con queso ", "pan dulce con queso ", "bun & cheese", "bun & cheese", "pan dulce con queso", "pão doce com queijo", "pan con queso"],
+    regionalAliases: {
+      JM: "bun & cheese",
+      PR: "pan dulce con queso ",
+      DO: "pan dulce con queso ",
+      US: "bun & cheese",
+      CA: "bun & cheese",
+      MX: "pan dulce con queso",
+      BR: "pão doce com queijo",
+      CO: "pan con queso"
+    },
     variants: ["Single", "Twin pack"],
     packaging: ["wrap"],
     tags: ["single", "snacks", "twin pack", "western-v0.2"],
@@ -7916,6 +13037,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Cream Crackers (Caribbean)",
     aliases: ["cream crackers", "cream crackers", "galletas cream", "galletas cream", "biskit krèm", "cream crackers", "cream crackers", "galletas cream", "cream cracker", "galletas cream"],
+    regionalAliases: {
+      JM: "cream crackers",
+      TT: "cream crackers",
+      PR: "galletas cream",
+      DO: "galletas cream",
+      HT: "biskit krèm",
+      US: "cream crackers",
+      CA: "cream crackers",
+      MX: "galletas cream",
+      BR: "cream cracker",
+      CO: "galletas cream"
+    },
     variants: ["Classic"],
     packaging: ["pack"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7924,6 +13057,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Digestive Biscuits (Chocolate)",
     aliases: ["chocolate digestives", "chocolate digestives", "galletas digestivas choco", "biscoito digestivo com chocolate"],
+    regionalAliases: {
+      US: "chocolate digestives",
+      CA: "chocolate digestives",
+      MX: "galletas digestivas choco",
+      BR: "biscoito digestivo com chocolate",
+      CO: "galletas digestivas chocolate"
+    },
     variants: ["galletas digestivas chocolate"],
     packaging: ["Milk", "Dark"],
     tags: ["galletas digestivas chocolate", "snacks", "western-v0.2"],
@@ -7932,6 +13072,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Gizzada (Coconut Tart)",
     aliases: ["gizzada", "gizzada", "quesitos de coco ", "tarta de coco ", "coconut tart", "coconut tart", "quesito", "queijadinha", "tarta de coco"],
+    regionalAliases: {
+      JM: "gizzada",
+      TT: "gizzada",
+      PR: "quesitos de coco ",
+      DO: "tarta de coco ",
+      US: "coconut tart",
+      CA: "coconut tart",
+      MX: "quesito",
+      BR: "queijadinha",
+      CO: "tarta de coco"
+    },
     variants: ["Classic"],
     packaging: ["bakery pack"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7940,6 +13091,17 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Guava Roll (Pastry)",
     aliases: ["guava roll", "guava roll", "brazo de guayaba ", "pastelito de guayaba ", "guava pastry", "guava pastry", "rollo de guayaba", "rocambole de goiabada", "rollo de guayaba"],
+    regionalAliases: {
+      JM: "guava roll",
+      TT: "guava roll",
+      PR: "brazo de guayaba ",
+      DO: "pastelito de guayaba ",
+      US: "guava pastry",
+      CA: "guava pastry",
+      MX: "rollo de guayaba",
+      BR: "rocambole de goiabada",
+      CO: "rollo de guayaba"
+    },
     variants: ["Classic"],
     packaging: ["pack"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7948,6 +13110,12 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Hard Dough Bulla (Spice)",
     aliases: ["bulla", "bulla", "spice bulla", "spice bulla"],
+    regionalAliases: {
+      JM: "bulla",
+      TT: "bulla",
+      US: "spice bulla",
+      CA: "spice bulla"
+    },
     variants: ["Classic"],
     packaging: ["pack"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7956,6 +13124,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Meringue Cookies",
     aliases: ["meringues", "meringues", "merengues", "suspiros"],
+    regionalAliases: {
+      US: "meringues",
+      CA: "meringues",
+      MX: "merengues",
+      BR: "suspiros",
+      CO: "merengues"
+    },
     variants: ["merengues"],
     packaging: ["Vanilla", "Coconut"],
     tags: ["merengues", "snacks", "western-v0.2"],
@@ -7971,6 +13146,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Plantain Tostones (Ready-to-eat)",
     aliases: ["tostones", "tostones", "tostones", "tostones", "banann peze", "tostones", "tostones", "tostones", "banana frita", "tostones"],
+    regionalAliases: {
+      JM: "tostones",
+      TT: "tostones",
+      PR: "tostones",
+      DO: "tostones",
+      HT: "banann peze",
+      US: "tostones",
+      CA: "tostones",
+      MX: "tostones",
+      BR: "banana frita",
+      CO: "tostones"
+    },
     variants: ["Sea salt", "Garlic"],
     packaging: ["bag"],
     tags: ["garlic", "sea salt", "snacks", "western-v0.2"],
@@ -7979,6 +13166,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Rock Cake",
     aliases: ["rock cake", "rock cake", "galleta roca ", "rock cake", "rock cake"],
+    regionalAliases: {
+      JM: "rock cake",
+      TT: "rock cake",
+      PR: "galleta roca ",
+      US: "rock cake",
+      CA: "rock cake"
+    },
     variants: ["Classic"],
     packaging: ["pack"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7987,6 +13181,18 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Tamarind Balls",
     aliases: ["tamarind balls", "tamarind balls", "bolas de tamarindo", "bolas de tamarindo", "boul tamaren", "tamarind balls", "tamarind balls", "bolas de tamarindo", "bolas de tamarindo", "bolas de tamarindo"],
+    regionalAliases: {
+      JM: "tamarind balls",
+      TT: "tamarind balls",
+      PR: "bolas de tamarindo",
+      DO: "bolas de tamarindo",
+      HT: "boul tamaren",
+      US: "tamarind balls",
+      CA: "tamarind balls",
+      MX: "bolas de tamarindo",
+      BR: "bolas de tamarindo",
+      CO: "bolas de tamarindo"
+    },
     variants: ["Classic"],
     packaging: ["bag"],
     tags: ["classic", "snacks", "western-v0.2"],
@@ -7995,6 +13201,13 @@ export const westernPart1Seeds: ExpandableSeed[] = [
     category: "snacks",
     product: "Tunnock’s Caramel Wafer (UK/CA)",
     aliases: ["caramel wafer", "caramel wafer", "barquillo caramelo", "wafer de caramelo"],
+    regionalAliases: {
+      US: "caramel wafer",
+      CA: "caramel wafer",
+      MX: "barquillo caramelo",
+      BR: "wafer de caramelo",
+      CO: "barquillo caramelo"
+    },
     variants: ["barquillo caramelo"],
     packaging: ["Classic"],
     tags: ["barquillo caramelo", "snacks", "western-v0.2"],